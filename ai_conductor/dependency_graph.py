@@ -9,8 +9,13 @@ tailored to the needs of ai_conductor:
 - Provides:
     - `detect_cycle()`
     - `autocorrect_missing_dependencies()`
-    - `attempt_autocorrect_cycle()`
+    - `attempt_autocorrect_cycle()` / `resolve_cycles()`
     - `topological_order()` — for execution ordering in PhaseController.
+    - `topological_levels()` — waves of modules that can run concurrently.
+    - `critical_path_length()` — number of waves (longest dependency chain).
+
+Ordering uses an integer-indexed adjacency (successor lists + in-degree
+array) built once per graph state, so scheduling is O(V + E).
 
 ai_conductor code should import from here instead of directly from ai_graph so
 the underlying implementation can evolve without breaking callers.
@@ -20,8 +25,11 @@ the underlying implementation can evolve without breaking callers.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Iterable, List
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
 
+from ai_cores.dependency_core import CycleResolution
 from ai_cores.dependency_core import DependencyGraph as _GraphImpl
 
 logger = logging.getLogger("ai_conductor.dependency_graph")
@@ -31,6 +39,51 @@ _handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
 logger.addHandler(_handler)
 
 
+@dataclass(frozen=True)
+class _Schedule:
+    """Kahn pass over the indexed graph; ``order`` is None if it has a cycle."""
+
+    modules: List[Dict[str, Any]]
+    order: Optional[List[int]]
+    levels: List[List[int]]
+
+
+def _build_schedule(modules: List[Dict[str, Any]]) -> _Schedule:
+    modules_by_id = {m["module_id"]: m for m in modules}
+    nodes = list(modules_by_id.values())
+    position = {mid: pos for pos, mid in enumerate(modules_by_id)}
+
+    # succ[dep] lists dependents in module order; indegree counts unique deps.
+    succ: List[List[int]] = [[] for _ in nodes]
+    indegree = [0] * len(nodes)
+    for pos, module in enumerate(nodes):
+        for dep in dict.fromkeys(module.get("dependencies", []) or []):
+            dep_pos = position.get(dep)
+            if dep_pos is not None:
+                succ[dep_pos].append(pos)
+                indegree[pos] += 1
+
+    level = [0] * len(nodes)
+    queue = deque(pos for pos, degree in enumerate(indegree) if degree == 0)
+    order: List[int] = []
+    while queue:
+        pos = queue.popleft()
+        order.append(pos)
+        for nxt in succ[pos]:
+            if level[pos] + 1 > level[nxt]:
+                level[nxt] = level[pos] + 1
+            indegree[nxt] -= 1
+            if indegree[nxt] == 0:
+                queue.append(nxt)
+
+    if len(order) != len(nodes):
+        return _Schedule(nodes, None, [[pos] for pos in range(len(nodes))])
+    levels: List[List[int]] = [[] for _ in range(max(level, default=-1) + 1)]
+    for pos in range(len(nodes)):
+        levels[level[pos]].append(pos)
+    return _Schedule(nodes, order, levels)
+
+
 class CoreDependencyGraph:
     """
     Core-facing dependency graph wrapper.
@@ -43,68 +96,67 @@ class CoreDependencyGraph:
     def __init__(self, modules: Iterable[Dict[str, Any]]) -> None:
         self._modules: List[Dict[str, Any]] = list(modules)
         self._impl = _GraphImpl(self._modules)
+        self._schedule: Optional[_Schedule] = None
 
     def detect_cycle(self) -> bool:
         return self._impl.detect_cycle()
 
     def autocorrect_missing_dependencies(self) -> None:
         self._impl.autocorrect_missing_dependencies()
+        self._schedule = None
 
     def attempt_autocorrect_cycle(self) -> bool:
+        self._schedule = None
         return self._impl.attempt_autocorrect_cycle()
 
+    def resolve_cycles(self) -> CycleResolution:
+        self._schedule = None
+        return self._impl.resolve_cycles()
+
+    def _get_schedule(self) -> _Schedule:
+        """Autocorrect missing dependencies once, then build the cached schedule."""
+        if self._schedule is None:
+            self._impl.autocorrect_missing_dependencies()
+            self._schedule = _build_schedule(self._modules)
+            if self._schedule.order is None:
+                logger.warning(
+                    "Unresolved cycle in CoreDependencyGraph; "
+                    "falling back to original order."
+                )
+        return self._schedule
+
     def topological_order(self) -> List[Dict[str, Any]]:
         """
         Return modules in a dependency-safe order for execution.
 
         Strategy:
-        - Use the underlying graph's cycle detection and autocorrect.
+        - Drop dependencies on unknown modules, then run Kahn's algorithm
+          over the indexed graph (FIFO, so ties keep module order).
         - If a cycle cannot be resolved, return modules in their original order
           but log a warning; PhaseController may still choose to run them in
           this degraded mode.
         """
-        self.autocorrect_missing_dependencies()
-        if self.detect_cycle():
-            logger.warning(
-                "Unresolved cycle in CoreDependencyGraph; returning original order."
-            )
+        schedule = self._get_schedule()
+        if schedule.order is None:
             return self._modules
+        return [schedule.modules[pos] for pos in schedule.order]
 
-        # We have to reconstruct order because the underlying implementation
-        # doesn't expose a baked topological sort; we reimplement a small one
-        # here using the cleaned module set.
-
-        modules_by_id = {m["module_id"]: m for m in self._modules}
-        indeg = {mid: 0 for mid in modules_by_id}
-
-        for mid, m in modules_by_id.items():
-            deps = m.get("dependencies", []) or []
-            for d in deps:
-                if d in indeg:
-                    indeg[mid] += 1
-
-        # Kahn's algorithm
-        from collections import deque
-
-        q = deque([mid for mid, d in indeg.items() if d == 0])
-        ordered_ids: List[str] = []
-
-        while q:
-            mid = q.popleft()
-            ordered_ids.append(mid)
-            for dep_mid, m in modules_by_id.items():
-                if mid in (m.get("dependencies", []) or []):
-                    indeg[dep_mid] -= 1
-                    if indeg[dep_mid] == 0:
-                        q.append(dep_mid)
-
-        if len(ordered_ids) != len(modules_by_id):
-            logger.warning(
-                "Topological sort did not cover all modules; falling back to original order."
-            )
-            return self._modules
+    def topological_levels(self) -> List[List[Dict[str, Any]]]:
+        """
+        Return execution waves: every module in a wave depends only on
+        modules in earlier waves, so a wave can run concurrently.
 
-        return [modules_by_id[mid] for mid in ordered_ids]
+        Modules keep their original order within a wave. With an unresolved
+        cycle each module gets its own wave (sequential, original order).
+        """
+        schedule = self._get_schedule()
+        return [[schedule.modules[pos] for pos in wave] for wave in schedule.levels]
 
+    def critical_path_length(self) -> int:
+        """
+        Return the number of modules on the longest dependency chain.
 
-# ----------------------------------------------------------------------
+        This equals the number of waves; ``len(modules) / critical_path_length``
+        is the average parallelism available to a scheduler.
+        """
+        return len(self._get_schedule().levels)
@@ -82,7 +82,9 @@ class ModuleRegistry(ModuleRegistryCore):
             inputs: Optional list of input keys expected in the context.
             outputs: Optional list of output keys added to the context.
             description: Human-readable description.
-            metadata: Arbitrary additional info.
+            metadata: Arbitrary additional info. ``{"executor": "process"}``
+                asks PhaseController's wave mode to run a sync module in a
+                process pool instead of the default thread pool.
         """
         entry = super().register(
             module_id=module_id,
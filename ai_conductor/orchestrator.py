@@ -39,6 +39,7 @@ from ai_monitoring.health_card import (
     write_health_card,
 )
 from ai_monitoring.structured_logger import log_event
+from ai_monitoring.tracing import span
 from ai_validation import (
     apply_incident_metadata,
     build_incident,
@@ -186,6 +187,7 @@ class Orchestrator:
     # ------------------------------------------------------------------ #
     # Public API
     # ------------------------------------------------------------------ #
+    @span("orchestrator.run")
     def run(
         self,
         workflow: Workflow | dict[str, Any],
@@ -239,7 +241,8 @@ class Orchestrator:
             success = True
             failure_details = None
             try:
-                self.phase_controller.run_phase(workflow, phase_id)
+                with span("orchestrator.phase", phase=phase_id):
+                    self.phase_controller.run_phase(workflow, phase_id)
             except Exception as e:
                 success = False
                 failure_details = {
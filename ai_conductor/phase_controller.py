@@ -22,6 +22,23 @@ Contract (MVM):
         ...
 
 - Returned dicts are merged into the workflow context.
+
+Execution modes:
+
+- Sequential (``max_concurrency=1``, the default): modules run one after
+  another in topological order and each sees the results of all earlier
+  modules.
+- Waves (``max_concurrency > 1``, or a phase dict with ``max_concurrency``):
+  modules of the same dependency wave run concurrently on one event loop.
+  Async modules are awaited directly; sync modules run on a bounded thread
+  pool, or a process pool when registered with ``metadata={"executor":
+  "process"}`` (function and context must then be picklable). Each module
+  receives a snapshot of the context taken at the start of its wave, and
+  results are merged after the wave in topological order, so the final
+  context is deterministic.
+
+Per-module wall time is reported in ``phase.module_completed`` events and,
+with the phase totals, in ``PhaseController.last_run``.
 """
 #!/usr/bin/env python3
 
@@ -29,7 +46,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, Iterable, List, Optional
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
 from ai_monitoring.structured_logger import log_event
 
@@ -44,13 +64,45 @@ _handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
 logger.addHandler(_handler)
 
 
+EXECUTOR_HINT_KEY = "executor"
+PROCESS_EXECUTOR = "process"
+
+
+@dataclass
+class PhaseRun:
+    """Timing summary of the most recent ``run_phase`` call."""
+
+    phase_id: str
+    mode: str
+    max_concurrency: int
+    waves: int = 0
+    wall_time_s: float = 0.0
+    module_times_s: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def speedup(self) -> float:
+        """Summed module time over phase wall time (1.0 when sequential)."""
+        if self.wall_time_s <= 0:
+            return 1.0
+        return round(sum(self.module_times_s.values()) / self.wall_time_s, 3)
+
+
 class PhaseController:
     """
     Orchestrates execution of modules within a single phase.
     """
 
-    def __init__(self, module_registry: Optional[ModuleRegistry] = None) -> None:
+    def __init__(
+        self,
+        module_registry: Optional[ModuleRegistry] = None,
+        *,
+        max_concurrency: int = 1,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
         self.module_registry = module_registry or ModuleRegistry()
+        self.max_concurrency = max_concurrency
+        self.last_run: Optional[PhaseRun] = None
 
     # ------------------------------------------------------------------ #
     # Public API
@@ -62,7 +114,8 @@ class PhaseController:
         Steps:
         - Fetch module *configs* for the phase from the workflow.
         - Compute a dependency-safe order via CoreDependencyGraph.
-        - Execute modules in order, updating workflow context.
+        - Execute modules in order (or wave by wave when the phase
+          concurrency limit is above 1), updating workflow context.
         """
         wf_id = workflow.id
         modules = workflow.get_modules_for_phase(phase_id)
@@ -72,83 +125,235 @@ class PhaseController:
             )
             return
 
+        limit = self._phase_concurrency(workflow, phase_id)
         logger.info(
-            "Running phase %s for workflow %s with %d module(s)",
+            "Running phase %s for workflow %s with %d module(s) (concurrency=%d)",
             phase_id,
             wf_id,
             len(modules),
+            limit,
         )
 
         # Build graph and determine execution order
         graph = CoreDependencyGraph(modules)
         ordered_modules = graph.topological_order()
 
-        ctx = workflow.get_context()
+        run = PhaseRun(
+            phase_id=phase_id,
+            mode="sequential" if limit == 1 else "waves",
+            max_concurrency=limit,
+        )
+        started = time.perf_counter()
+        if limit == 1:
+            run.waves = len(ordered_modules)
+            self._run_sequential(workflow, phase_id, ordered_modules, run)
+        else:
+            waves = graph.topological_levels()
+            run.waves = len(waves)
+            rank = {id(module): pos for pos, module in enumerate(ordered_modules)}
+            waves = [sorted(wave, key=lambda m: rank.get(id(m), 0)) for wave in waves]
+            asyncio.run(self._run_waves(workflow, phase_id, waves, limit, run))
+        run.wall_time_s = round(time.perf_counter() - started, 6)
+        self.last_run = run
+
+        log_event(
+            "phase.completed",
+            {
+                "workflow_id": wf_id,
+                "phase": phase_id,
+                "mode": run.mode,
+                "max_concurrency": limit,
+                "waves": run.waves,
+                "wall_time_ms": round(run.wall_time_s * 1000, 3),
+                "module_time_ms": round(sum(run.module_times_s.values()) * 1000, 3),
+                "speedup": run.speedup,
+            },
+        )
 
+    # Potential extension: a future run_phase_async to integrate with
+    # a fully async orchestrator variant.
+
+    # ------------------------------------------------------------------ #
+    # Execution modes
+    # ------------------------------------------------------------------ #
+    def _run_sequential(
+        self,
+        workflow: Workflow,
+        phase_id: str,
+        ordered_modules: List[Dict[str, Any]],
+        run: PhaseRun,
+    ) -> None:
+        ctx = workflow.get_context()
         for mod_def in ordered_modules:
-            module_id = mod_def.get("module_id")
-            if not module_id:
-                logger.warning(
-                    "Skipping malformed module definition (no module_id) in phase %s",
-                    phase_id,
-                )
+            resolved = self._resolve_entry(workflow, phase_id, mod_def)
+            if resolved is None:
                 continue
+            module_id, entry = resolved
 
-            entry = self.module_registry.get(module_id)
-            if entry is None:
-                logger.warning(
-                    "No implementation registered for module %s (phase=%s, wf=%s)",
-                    module_id,
-                    phase_id,
-                    wf_id,
-                )
-                log_event(
-                    "phase.module_missing_impl",
-                    {"workflow_id": wf_id, "phase": phase_id, "module_id": module_id},
-                )
-                continue
+            self._module_started(workflow, phase_id, module_id)
+            started = time.perf_counter()
+            result: Any = None
+            error: Optional[Exception] = None
+            try:
+                result = _execute_module(entry, ctx)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                error = e
+            elapsed = time.perf_counter() - started
+            if isinstance(result, dict):
+                # Merge returned data into context
+                workflow.update_context(result)
+                ctx.update(result)
+            self._module_completed(workflow, phase_id, module_id, elapsed, error, run)
 
+            # For MVM, we keep going even if one module fails; orchestrator
+            # can decide at a higher level whether to treat this as fatal.
+
+    async def _run_waves(
+        self,
+        workflow: Workflow,
+        phase_id: str,
+        waves: List[List[Dict[str, Any]]],
+        limit: int,
+        run: PhaseRun,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(limit)
+        threads = ThreadPoolExecutor(
+            max_workers=limit, thread_name_prefix=f"phase-{phase_id}"
+        )
+        processes: Optional[ProcessPoolExecutor] = None
+
+        async def execute(
+            entry: ModuleEntry, snapshot: Dict[str, Any], pool: Optional[Executor]
+        ) -> Tuple[Any, Optional[Exception], float]:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    if pool is None:
+                        result = await entry.func(snapshot)  # type: ignore[misc]
+                    else:
+                        result = await loop.run_in_executor(pool, entry.func, snapshot)
+                        if asyncio.iscoroutine(result):
+                            result = await result
+                    error = None
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    result, error = None, e
+                return result, error, time.perf_counter() - started
+
+        try:
+            for wave in waves:
+                ctx = workflow.get_context()
+                scheduled: List[Tuple[str, Any]] = []
+                for mod_def in wave:
+                    resolved = self._resolve_entry(workflow, phase_id, mod_def)
+                    if resolved is None:
+                        continue
+                    module_id, entry = resolved
+                    pool: Optional[Executor] = None
+                    if not asyncio.iscoroutinefunction(entry.func):
+                        if entry.metadata.get(EXECUTOR_HINT_KEY) == PROCESS_EXECUTOR:
+                            if processes is None:
+                                processes = ProcessPoolExecutor(max_workers=limit)
+                            pool = processes
+                        else:
+                            pool = threads
+                    self._module_started(workflow, phase_id, module_id)
+                    task = asyncio.ensure_future(execute(entry, dict(ctx), pool))
+                    scheduled.append((module_id, task))
+
+                # Merge in topological order, independent of completion order.
+                for module_id, task in scheduled:
+                    result, error, elapsed = await task
+                    if isinstance(result, dict):
+                        workflow.update_context(result)
+                    self._module_completed(
+                        workflow, phase_id, module_id, elapsed, error, run
+                    )
+        finally:
+            threads.shutdown(wait=True)
+            if processes is not None:
+                processes.shutdown(wait=True)
+
+    # ------------------------------------------------------------------ #
+    # Helpers
+    # ------------------------------------------------------------------ #
+    def _phase_concurrency(self, workflow: Workflow, phase_id: str) -> int:
+        """Return the phase's ``max_concurrency`` override or the default."""
+        for phase in workflow.phases or []:
+            pid = phase.get("id") or phase.get("phase_id") or phase.get("name")
+            if str(pid) == str(phase_id):
+                value = phase.get("max_concurrency")
+                if isinstance(value, int) and not isinstance(value, bool):
+                    return max(1, value)
+                break
+        return self.max_concurrency
+
+    def _resolve_entry(
+        self, workflow: Workflow, phase_id: str, mod_def: Dict[str, Any]
+    ) -> Optional[Tuple[str, ModuleEntry]]:
+        wf_id = workflow.id
+        module_id = mod_def.get("module_id")
+        if not module_id:
+            logger.warning(
+                "Skipping malformed module definition (no module_id) in phase %s",
+                phase_id,
+            )
+            return None
+
+        entry = self.module_registry.get(module_id)
+        if entry is None:
+            logger.warning(
+                "No implementation registered for module %s (phase=%s, wf=%s)",
+                module_id,
+                phase_id,
+                wf_id,
+            )
             log_event(
-                "phase.module_started",
+                "phase.module_missing_impl",
                 {"workflow_id": wf_id, "phase": phase_id, "module_id": module_id},
             )
+            return None
+        return module_id, entry
+
+    @staticmethod
+    def _module_started(workflow: Workflow, phase_id: str, module_id: str) -> None:
+        log_event(
+            "phase.module_started",
+            {"workflow_id": workflow.id, "phase": phase_id, "module_id": module_id},
+        )
 
-            success = True
-            try:
-                result = _execute_module(entry, ctx)
-                if isinstance(result, dict):
-                    # Merge returned data into context
-                    workflow.update_context(result)
-                    ctx.update(result)
-            except Exception as e:
-                success = False
-                logger.error("Module %s in phase %s failed: %s", module_id, phase_id, e)
-                log_event(
-                    "phase.module_error",
-                    {
-                        "workflow_id": wf_id,
-                        "phase": phase_id,
-                        "module_id": module_id,
-                        "error": str(e),
-                    },
-                )
-
+    @staticmethod
+    def _module_completed(
+        workflow: Workflow,
+        phase_id: str,
+        module_id: str,
+        elapsed: float,
+        error: Optional[Exception],
+        run: PhaseRun,
+    ) -> None:
+        wf_id = workflow.id
+        run.module_times_s[module_id] = round(elapsed, 6)
+        if error is not None:
+            logger.error("Module %s in phase %s failed: %s", module_id, phase_id, error)
             log_event(
-                "phase.module_completed",
+                "phase.module_error",
                 {
                     "workflow_id": wf_id,
                     "phase": phase_id,
                     "module_id": module_id,
-                    "success": success,
+                    "error": str(error),
                 },
             )
-
-            # For MVM, we keep going even if one module fails; orchestrator
-            # can decide at a higher level whether to treat this as fatal.
-
-    # Potential extension: a future run_phase_async to integrate with
-    # a fully async orchestrator variant.
-    # For MVM, we stick to a sync interface + async-aware module execution.
+        log_event(
+            "phase.module_completed",
+            {
+                "workflow_id": wf_id,
+                "phase": phase_id,
+                "module_id": module_id,
+                "success": error is None,
+                "duration_ms": round(elapsed * 1000, 3),
+            },
+        )
 
 
 # ---------------------------------------------------------------------- #
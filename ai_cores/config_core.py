@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+ai_cores/config_core.py — Process-wide cache for config/*.yml files.
+
+`ConfigService.load(path, parser)` reads, parses and validates a config
+file once per process and returns the cached value afterwards. Entries are
+keyed by (absolute path, parser) and stamped with the file's
+``(mtime_ns, size)``; the stamp is re-checked at most once per
+``stat_interval`` seconds, so hot paths (one DependencyGraph per phase,
+repeated PDL validation) neither parse YAML nor hit the filesystem for
+configuration that does not change mid-run. Editing a file invalidates its
+entries on the next check; ``invalidate()`` forces a reload.
+
+Cached values are shared: parsers should return immutable objects (the
+typed settings below) or callers must treat the result as read-only.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import yaml
+
+logger = logging.getLogger("ai_cores.config_core")
+
+CONFIG_DIR = Path("config")
+GRAPH_LIMITS_PATH = CONFIG_DIR / "graph_limits.yml"
+RECURSION_CONFIG_PATH = CONFIG_DIR / "recursion.yml"
+TELEMETRY_CONFIG_PATH = CONFIG_DIR / "telemetry.yml"
+DEFAULT_STAT_INTERVAL = 1.0
+
+Parser = Callable[[Any, Path], Any]
+Stamp = Optional[Tuple[int, int]]
+
+__all__ = [
+    "ConfigService",
+    "GraphLimits",
+    "RecursionSettings",
+    "TelemetrySettings",
+    "get_config_service",
+    "parse_graph_limits",
+    "parse_recursion_settings",
+    "parse_telemetry_settings",
+]
+
+
+# ─── Typed settings ──────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class GraphLimits:
+    """Dependency graph size ceiling (config/graph_limits.yml)."""
+
+    max_nodes: int = 1000
+    max_edges: int = 5000
+    enforce: bool = True
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "max_nodes": self.max_nodes,
+            "max_edges": self.max_edges,
+            "enforce": self.enforce,
+        }
+
+
+@dataclass(frozen=True)
+class RecursionSettings:
+    """Recursion settings (config/recursion.yml)."""
+
+    enabled: bool = False
+    max_depth: int = 0
+
+
+@dataclass(frozen=True)
+class TelemetrySettings:
+    """Telemetry settings (config/telemetry.yml)."""
+
+    enabled: bool = False
+    endpoint: str = ""
+
+
+def _section(payload: Any, key: str, path: Path) -> Dict[str, Any]:
+    if not isinstance(payload, dict):
+        raise ValueError(f"{path.name} must contain a mapping at the top level.")
+    section = payload.get(key, {})
+    if not isinstance(section, dict):
+        raise ValueError(f"{key} must be a mapping.")
+    return section
+
+
+def parse_graph_limits(payload: Any, path: Path) -> GraphLimits:
+    """Validate a graph_limits.yml payload."""
+    limits = _section(payload, "graph_limits", path)
+    default = GraphLimits()
+    max_nodes = limits.get("max_nodes", default.max_nodes)
+    max_edges = limits.get("max_edges", default.max_edges)
+    enforce = limits.get("enforce", default.enforce)
+
+    if not isinstance(max_nodes, int) or max_nodes <= 0:
+        raise ValueError("graph_limits.max_nodes must be a positive integer.")
+    if not isinstance(max_edges, int) or max_edges <= 0:
+        raise ValueError("graph_limits.max_edges must be a positive integer.")
+    if not isinstance(enforce, bool):
+        raise ValueError("graph_limits.enforce must be a boolean.")
+    return GraphLimits(max_nodes=max_nodes, max_edges=max_edges, enforce=enforce)
+
+
+def parse_recursion_settings(payload: Any, path: Path) -> RecursionSettings:
+    """Validate a recursion.yml payload."""
+    section = _section(payload, "recursion", path)
+    enabled = section.get("enabled", False)
+    max_depth = section.get("max_depth", 0)
+    if not isinstance(enabled, bool):
+        raise ValueError("recursion.enabled must be a boolean.")
+    if not isinstance(max_depth, int) or max_depth < 0:
+        raise ValueError("recursion.max_depth must be a non-negative integer.")
+    return RecursionSettings(enabled=enabled, max_depth=max_depth)
+
+
+def parse_telemetry_settings(payload: Any, path: Path) -> TelemetrySettings:
+    """Validate a telemetry.yml payload."""
+    section = _section(payload, "telemetry", path)
+    enabled = section.get("enabled", False)
+    endpoint = section.get("endpoint", "")
+    if not isinstance(enabled, bool):
+        raise ValueError("telemetry.enabled must be a boolean.")
+    if not isinstance(endpoint, str):
+        raise ValueError("telemetry.endpoint must be a string.")
+    return TelemetrySettings(enabled=enabled, endpoint=endpoint)
+
+
+def _read_payload(path: Path) -> Any:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".json":
+        return json.loads(text)
+    return yaml.safe_load(text)
+
+
+def _stamp(path: Path) -> Stamp:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# ─── Service ─────────────────────────────────────────────────────
+
+
+@dataclass
+class _Entry:
+    stamp: Stamp
+    value: Any
+    checked_at: float
+
+
+class ConfigService:
+    """Load-once, validate-once config cache with (mtime, size) invalidation."""
+
+    def __init__(self, stat_interval: float = DEFAULT_STAT_INTERVAL) -> None:
+        self.stat_interval = stat_interval
+        self._entries: Dict[Tuple[Path, Optional[Parser]], _Entry] = {}
+        self._absolute: Dict[Tuple[Any, str], Path] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    def load(
+        self,
+        path: Path | str,
+        parser: Optional[Parser] = None,
+        *,
+        default: Any = None,
+    ) -> Any:
+        """
+        Return the parsed (and, with ``parser``, validated) content of ``path``.
+
+        A missing file yields ``default`` (cached until the file appears).
+        Read, YAML/JSON and parser errors propagate and are not cached.
+        """
+        resolved = self._resolve(path)
+        key = (resolved, parser)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry.checked_at < self.stat_interval:
+                self.hits += 1
+                return entry.value
+        stamp = _stamp(resolved)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp == stamp:
+                entry.checked_at = now
+                self.hits += 1
+                return entry.value
+
+        if stamp is None:
+            logger.warning("Config file missing at %s; using defaults.", path)
+            value = default
+        else:
+            payload = _read_payload(resolved)
+            value = parser(payload, resolved) if parser is not None else payload
+        with self._lock:
+            self._entries[key] = _Entry(stamp, value, now)
+            self.loads += 1
+        return value
+
+    def _resolve(self, path: Path | str) -> Path:
+        # Path.absolute() dominates a cache hit, so memoize it per cwd.
+        memo_key = (path, os.getcwd())
+        resolved = self._absolute.get(memo_key)
+        if resolved is None:
+            resolved = self._absolute[memo_key] = Path(path).absolute()
+        return resolved
+
+    def invalidate(self, path: Path | str | None = None) -> None:
+        """Drop cached entries for ``path`` (or all entries)."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            resolved = self._resolve(path)
+            for key in [key for key in self._entries if key[0] == resolved]:
+                del self._entries[key]
+
+    # ── typed accessors ──────────────────────────────────────────
+
+    def graph_limits(self, path: Path | str = GRAPH_LIMITS_PATH) -> GraphLimits:
+        return self.load(path, parse_graph_limits, default=GraphLimits())
+
+    def recursion_settings(
+        self, path: Path | str = RECURSION_CONFIG_PATH
+    ) -> RecursionSettings:
+        return self.load(path, parse_recursion_settings, default=RecursionSettings())
+
+    def telemetry_settings(
+        self, path: Path | str = TELEMETRY_CONFIG_PATH
+    ) -> TelemetrySettings:
+        return self.load(path, parse_telemetry_settings, default=TelemetrySettings())
+
+
+_SERVICE = ConfigService()
+
+
+def get_config_service() -> ConfigService:
+    """Return the process-wide config service."""
+    return _SERVICE
@@ -3,16 +3,22 @@
 ai_cores/dependency_core.py — Canonical dependency graph utilities for sswg-mvm.
 
 Provides deterministic dependency resolution and cycle correction.
+
+Cycle correction is a single pass: Tarjan's algorithm finds every strongly
+connected component (cycle cluster) at once, a feedback-edge set is chosen
+per component in linear time, and all removals are applied in one batch.
+Total work is O(V + E) plus a per-node sort of intra-component edges.
 """
 
 from __future__ import annotations
 
 import logging
 from collections import defaultdict, deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-import yaml
+from ai_cores.config_core import GRAPH_LIMITS_PATH, GraphLimits, get_config_service
 
 logger = logging.getLogger("ai_cores.dependency_core")
 logger.setLevel(logging.INFO)
@@ -20,39 +26,157 @@ _handler = logging.StreamHandler()
 _handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
 logger.addHandler(_handler)
 
-GRAPH_LIMITS_PATH = Path("config/graph_limits.yml")
-DEFAULT_GRAPH_LIMITS = {
-    "max_nodes": 1000,
-    "max_edges": 5000,
-    "enforce": True,
-}
+DEFAULT_GRAPH_LIMITS = GraphLimits().as_dict()
 
 
 def _load_graph_limits(path: Path = GRAPH_LIMITS_PATH) -> Dict[str, Any]:
-    if not path.exists():
-        logger.warning("Graph limits config missing at %s; using defaults.", path)
-        return dict(DEFAULT_GRAPH_LIMITS)
+    """Return graph limits from the process-wide config cache."""
+    return get_config_service().graph_limits(path).as_dict()
+
+
+Edge = Tuple[str, str]  # (module_id, dependency)
+
+
+@dataclass
+class CycleResolution:
+    """Structured report of one cycle-resolution pass."""
+
+    components: List[List[str]] = field(default_factory=list)
+    optional_edges: List[Edge] = field(default_factory=list)
+    feedback_edges: List[Edge] = field(default_factory=list)
+    resolved: bool = True
+
+    @property
+    def removed_edges(self) -> List[Edge]:
+        """All removed edges: optional dependencies first, then feedback edges."""
+        return self.optional_edges + self.feedback_edges
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "components": [list(component) for component in self.components],
+            "removed_edges": [
+                {"module_id": module_id, "dependency": dep, "reason": reason}
+                for reason, edges in (
+                    ("optional", self.optional_edges),
+                    ("feedback", self.feedback_edges),
+                )
+                for module_id, dep in edges
+            ],
+            "resolved": self.resolved,
+        }
+
+
+def _strongly_connected_components(succ: Sequence[Sequence[int]]) -> List[List[int]]:
+    """Iterative Tarjan SCC over an index graph; components in reverse topo order."""
+    count = len(succ)
+    index = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, 0)]
+        while work:
+            node, edge_pos = work[-1]
+            edges = succ[node]
+            if edge_pos < len(edges):
+                work[-1] = (node, edge_pos + 1)
+                nxt = edges[edge_pos]
+                if index[nxt] == -1:
+                    index[nxt] = low[nxt] = counter
+                    counter += 1
+                    stack.append(nxt)
+                    on_stack[nxt] = True
+                    work.append((nxt, 0))
+                elif on_stack[nxt] and index[nxt] < low[node]:
+                    low[node] = index[nxt]
+                continue
 
-    payload = yaml.safe_load(path.read_text(encoding="utf-8"))
-    if not isinstance(payload, dict):
-        raise ValueError("graph_limits.yml must contain a mapping at the top level.")
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+            if low[node] == index[node]:
+                component: List[int] = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+
+def _back_edges(
+    component: Sequence[int], succ: Sequence[Sequence[int]]
+) -> List[Tuple[int, int]]:
+    """
+    Return the back edges of a DFS confined to ``component``.
 
-    limits = payload.get("graph_limits", {})
-    if not isinstance(limits, dict):
-        raise ValueError("graph_limits must be a mapping.")
+    Removing them leaves the component acyclic. Roots and children are
+    visited by listing position, latest first, so results are deterministic.
+    """
+    members = set(component)
+    state: Dict[int, int] = {}  # 1 = on DFS stack, 2 = finished
+    back: List[Tuple[int, int]] = []
+    for root in sorted(component, reverse=True):
+        if root in state:
+            continue
+        state[root] = 1
+        # Pending children are sorted ascending and popped from the end.
+        work = [(root, sorted(n for n in succ[root] if n in members))]
+        while work:
+            node, pending = work[-1]
+            if not pending:
+                state[node] = 2
+                work.pop()
+                continue
+            nxt = pending.pop()
+            seen = state.get(nxt)
+            if seen == 1:
+                back.append((node, nxt))
+            elif seen is None:
+                state[nxt] = 1
+                work.append((nxt, sorted(n for n in succ[nxt] if n in members)))
+    return back
+
+
+def _forward_edges(
+    component: Sequence[int], succ: Sequence[Sequence[int]]
+) -> List[Tuple[int, int]]:
+    """
+    Return edges of ``component`` that point at a later-listed module.
 
-    max_nodes = limits.get("max_nodes", DEFAULT_GRAPH_LIMITS["max_nodes"])
-    max_edges = limits.get("max_edges", DEFAULT_GRAPH_LIMITS["max_edges"])
-    enforce = limits.get("enforce", DEFAULT_GRAPH_LIMITS["enforce"])
+    Removing them leaves only edges to earlier positions, which cannot form
+    a cycle. When modules are listed in dependency order these are exactly
+    the stray references that close the cycles.
+    """
+    members = set(component)
+    return [
+        (node, nxt)
+        for node in component
+        for nxt in succ[node]
+        if nxt >= node and nxt in members
+    ]
 
-    if not isinstance(max_nodes, int) or max_nodes <= 0:
-        raise ValueError("graph_limits.max_nodes must be a positive integer.")
-    if not isinstance(max_edges, int) or max_edges <= 0:
-        raise ValueError("graph_limits.max_edges must be a positive integer.")
-    if not isinstance(enforce, bool):
-        raise ValueError("graph_limits.enforce must be a boolean.")
 
-    return {"max_nodes": max_nodes, "max_edges": max_edges, "enforce": enforce}
+def _feedback_edges(
+    component: Sequence[int], succ: Sequence[Sequence[int]]
+) -> List[Tuple[int, int]]:
+    """Pick the smaller of the two linear-time feedback-edge candidates."""
+    forward = _forward_edges(component, succ)
+    back = _back_edges(component, succ)
+    return forward if len(forward) <= len(back) else back
 
 
 class DependencyGraph:
@@ -65,11 +189,23 @@ class DependencyGraph:
       - dependency_optional: bool (optional flag on dependents)
     """
 
-    def __init__(self, modules: Iterable[Dict[str, Any]]):
+    def __init__(
+        self,
+        modules: Iterable[Dict[str, Any]],
+        *,
+        graph_limits: Optional[Dict[str, Any]] = None,
+    ):
         self.modules: Dict[str, Dict[str, Any]] = {m["module_id"]: m for m in modules}
-        self._graph_limits = _load_graph_limits()
+        self._graph_limits = (
+            dict(graph_limits) if graph_limits is not None else _load_graph_limits()
+        )
         self._enforce_graph_limits()
-        self.adj = defaultdict(list)  # reverse adjacency: dep -> [dependents]
+        self.adj: Dict[str, List[str]] = defaultdict(list)
+        self._rebuild_adjacency()
+
+    def _rebuild_adjacency(self) -> None:
+        """Recompute the reverse adjacency (dep -> [dependents])."""
+        self.adj = defaultdict(list)
         for mid, module in self.modules.items():
             deps = module.get("dependencies", []) or []
             for dep in deps:
@@ -129,6 +265,7 @@ class DependencyGraph:
 
     def autocorrect_missing_dependencies(self) -> None:
         """Remove dependencies that refer to non-existent modules."""
+        changed = False
         for module_id, module in self.modules.items():
             deps = list(module.get("dependencies", []) or [])
             cleaned = [dep for dep in deps if dep in self.modules]
@@ -140,66 +277,128 @@ class DependencyGraph:
                     sorted(removed),
                 )
                 module["dependencies"] = cleaned
-
-    def attempt_autocorrect_cycle(self) -> bool:
+                changed = True
+        if changed:
+            self._rebuild_adjacency()
+
+    def _index_graph(
+        self, skip: Optional[Set[Edge]] = None
+    ) -> Tuple[List[str], List[List[int]]]:
+        ids = list(self.modules)
+        position = {module_id: pos for pos, module_id in enumerate(ids)}
+        succ: List[List[int]] = []
+        for module_id in ids:
+            targets: List[int] = []
+            seen: Set[int] = set()
+            for dep in self.modules[module_id].get("dependencies", []) or []:
+                pos = position.get(dep)
+                if pos is None or pos in seen:
+                    continue
+                if skip and (module_id, dep) in skip:
+                    continue
+                seen.add(pos)
+                targets.append(pos)
+            succ.append(targets)
+        return ids, succ
+
+    def find_cycle_components(self) -> List[List[str]]:
         """
-        Attempt to resolve cycles using simple heuristics:
-
-        1. Try removing dependencies from modules that mark them as optional
-           via dependency_optional=True.
-        2. As a fallback, remove the last-listed dependency from modules until
-           the graph becomes acyclic.
+        Return every cycle cluster (strongly connected component with a cycle).
 
-        Returns:
-            bool: True if a correction succeeded, False otherwise.
+        Each component lists module IDs in module order; components are
+        ordered by their first module.
         """
-        if not self.detect_cycle():
-            return False
-
-        logger.warning(
-            "Cycle detected; attempting autocorrect using optional dependencies."
+        ids, succ = self._index_graph()
+        return [
+            [ids[pos] for pos in component]
+            for component in self._cyclic_components(succ)
+        ]
+
+    @staticmethod
+    def _cyclic_components(succ: Sequence[Sequence[int]]) -> List[List[int]]:
+        cyclic = [
+            sorted(component)
+            for component in _strongly_connected_components(succ)
+            if len(component) > 1 or component[0] in succ[component[0]]
+        ]
+        return sorted(cyclic, key=lambda component: component[0])
+
+    def resolve_cycles(self) -> CycleResolution:
+        """
+        Break every dependency cycle in one pass and report what was removed.
+
+        1. Find all cycle clusters with Tarjan's SCC algorithm.
+        2. Inside each cluster, drop edges to modules flagged
+           ``dependency_optional=True``.
+        3. Drop a feedback-edge set from what remains of each cluster: the
+           edges pointing at later-listed modules or the back edges of one
+           DFS, whichever is smaller (both make the cluster acyclic).
+        4. Apply all removals to the module dicts in a single batch.
+        """
+        ids, succ = self._index_graph()
+        components = self._cyclic_components(succ)
+        report = CycleResolution(
+            components=[[ids[pos] for pos in component] for component in components]
         )
-        for module_id, module in self.modules.items():
-            deps = list(module.get("dependencies", []) or [])
-            if not deps:
+        if not components:
+            return report
+
+        cluster_of: Dict[int, int] = {}
+        for number, component in enumerate(components):
+            for pos in component:
+                cluster_of[pos] = number
+
+        optional: Set[Edge] = set()
+        for pos, targets in enumerate(succ):
+            cluster = cluster_of.get(pos)
+            if cluster is None:
                 continue
-
-            optional_removed = False
-            newdeps: List[str] = []
-            for dep in deps:
-                dep_obj = self.modules.get(dep, {})
-                if dep_obj.get("dependency_optional", False):
-                    logger.info(
-                        "Autocorrect: removing optional dependency %s from %s",
-                        dep,
-                        module_id,
-                    )
-                    optional_removed = True
-                else:
-                    newdeps.append(dep)
-
-            if optional_removed:
-                module["dependencies"] = newdeps
-                if not self.detect_cycle():
-                    logger.info("Cycle resolved by removing optional dependencies.")
-                    return True
-
-        logger.warning(
-            "Optional dependency removal insufficient; trying fallback strategy."
+            for target in targets:
+                if cluster_of.get(target) != cluster:
+                    continue
+                if self.modules[ids[target]].get("dependency_optional", False):
+                    optional.add((ids[pos], ids[target]))
+                    report.optional_edges.append((ids[pos], ids[target]))
+
+        if optional:
+            _, succ = self._index_graph(skip=optional)
+        for component in components:
+            for src, dst in _feedback_edges(component, succ):
+                report.feedback_edges.append((ids[src], ids[dst]))
+
+        removed = set(report.removed_edges)
+        for module_id in {module_id for module_id, _ in removed}:
+            module = self.modules[module_id]
+            module["dependencies"] = [
+                dep
+                for dep in module.get("dependencies", []) or []
+                if (module_id, dep) not in removed
+            ]
+        self._rebuild_adjacency()
+
+        for module_id, dep in report.removed_edges:
+            logger.debug("Autocorrect: removing dependency %s from %s", dep, module_id)
+        report.resolved = not self._cyclic_components(self._index_graph()[1])
+        logger.info(
+            "Cycle resolution: %d cluster(s), removed %d optional and %d "
+            "feedback edge(s); resolved=%s.",
+            len(components),
+            len(report.optional_edges),
+            len(report.feedback_edges),
+            report.resolved,
         )
-        for module_id, module in self.modules.items():
-            deps = list(module.get("dependencies", []) or [])
-            while deps:
-                removed = deps.pop()
-                logger.info(
-                    "Fallback autocorrect: removing dependency %s from %s",
-                    removed,
-                    module_id,
-                )
-                module["dependencies"] = deps
-                if not self.detect_cycle():
-                    logger.info("Cycle resolved via fallback removal.")
-                    return True
+        return report
 
-        logger.error("Autocorrect failed; cycle still present.")
-        return False
+    def attempt_autocorrect_cycle(self) -> bool:
+        """
+        Attempt to resolve all cycles via ``resolve_cycles``.
+
+        Returns:
+            bool: True if cycles were present and removed, False otherwise.
+        """
+        report = self.resolve_cycles()
+        if not report.components:
+            return False
+        if not report.resolved:
+            logger.error("Autocorrect failed; cycle still present.")
+        return report.resolved
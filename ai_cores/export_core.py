@@ -3,28 +3,78 @@
 ai_cores/export_core.py — Shared export serialization utilities.
 
 Provides deterministic JSON/Markdown serialization for workflow exports.
+Every write is atomic (temp file in the target directory + rename), and a
+file whose content hash already matches the new bytes is left untouched, so
+re-exporting an unchanged workflow does no I/O beyond the comparison.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import tempfile
+from contextlib import suppress
 from pathlib import Path
 from typing import Any
 
-__all__ = ["write_json", "write_markdown"]
+__all__ = [
+    "content_digest",
+    "write_bytes",
+    "write_json",
+    "write_markdown",
+]
 
 
-def write_json(payload: Any, out_path: str | Path) -> str:
-    """Serialize payload to JSON at the provided path."""
+def content_digest(data: bytes) -> str:
+    """Return the SHA-256 hex digest used to detect unchanged exports."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _unchanged(path: Path, data: bytes) -> bool:
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return content_digest(path.read_bytes()) == content_digest(data)
+    except OSError:
+        return False
+
+
+def write_bytes(
+    data: bytes, out_path: str | Path, *, skip_unchanged: bool = True
+) -> bool:
+    """
+    Atomically write ``data`` to ``out_path``.
+
+    Returns:
+        True if the file was written, False if it already held identical
+        content and ``skip_unchanged`` is set.
+    """
     path = Path(out_path)
+    if skip_unchanged and _unchanged(path, data):
+        return False
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    return str(path)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+    return True
+
+
+def write_json(payload: Any, out_path: str | Path) -> str:
+    """Serialize payload to JSON at the provided path."""
+    write_bytes(json.dumps(payload, indent=2).encode("utf-8"), out_path)
+    return str(Path(out_path))
 
 
 def write_markdown(content: str, out_path: str | Path) -> str:
     """Write Markdown content to the provided path."""
-    path = Path(out_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
-    return str(path)
+    write_bytes(content.encode("utf-8"), out_path)
+    return str(Path(out_path))
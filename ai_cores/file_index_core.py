@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+ai_cores/file_index_core.py — Persistent content-hash file index for gates.
+
+Repo-wide gates (governance source location, secret scanning, redaction,
+artifact indexing) used to rglob their trees and re-read every file on
+every run. A `FileIndex` keeps, per repository root, a SQLite table
+(``<root>/.sswg_cache/file_index.sqlite3``, WAL mode) of every file under
+the root keyed by relative path with its ``(size, mtime_ns, inode)`` and a
+lazily computed SHA-256 of the content, plus a table of per-gate results
+keyed by ``(gate, content hash)``.
+
+- `files(paths)` walks only the requested subtrees (pruning PRUNE_DIRS such
+  as .git, virtualenvs and caches), refreshes the stat rows under them and
+  returns the files in sorted order, in the form the caller passed them.
+  Rows whose stat changed lose their content hash.
+- `cached(gate, path, compute)` returns the stored result for the file's
+  content hash, calling ``compute(path)`` (and storing its JSON-serialisable
+  result) only for new or changed content. A re-run after a one-file change
+  therefore reads and scans that one file.
+- Like git's racily-clean check, a content hash is only persisted once the
+  file's mtime is older than RACY_NS, so a same-size rewrite within the
+  filesystem's timestamp granularity is never mistaken for unchanged.
+
+Gate keys should include everything the result depends on (see `gate_key`),
+so changing a gate's rules invalidates its cached results. Paths outside the
+root are walked and computed directly, without caching. If the cache
+directory cannot be written the index lives in memory for the process.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+DEFAULT_CACHE_DIR = Path(".sswg_cache")
+INDEX_FILENAME = "file_index.sqlite3"
+PRUNE_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".sswg_cache",
+        ".tox",
+        ".nox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        "node_modules",
+        "*.egg-info",
+    }
+)
+# Directories holding generated run outputs, for gates that only look at
+# sources (pass ``prune=PRUNE_DIRS | DATA_OUTPUT_DIRS``).
+DATA_OUTPUT_DIRS = frozenset({"artifacts", "build", "data", "logs"})
+RACY_NS = 2_000_000_000
+HASH_BLOCK = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    digest TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    gate TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (gate, digest)
+);
+"""
+
+__all__ = [
+    "DATA_OUTPUT_DIRS",
+    "FileIndex",
+    "PRUNE_DIRS",
+    "gate_key",
+    "get_file_index",
+]
+
+PathLike = Union[str, "os.PathLike[str]"]
+_Row = Tuple[int, int, int, Optional[str]]
+
+
+def gate_key(name: str, *parts: Any) -> str:
+    """Cache key for a gate: its name plus a hash of what its result depends on."""
+    material = json.dumps([repr(part) for part in parts]).encode("utf-8")
+    return f"{name}:{hashlib.sha256(material).hexdigest()[:16]}"
+
+
+def _file_digest(handle) -> str:
+    digest = hashlib.sha256()
+    for block in iter(lambda: handle.read(HASH_BLOCK), b""):
+        digest.update(block)
+    return digest.hexdigest()
+
+
+class FileIndex:
+    """Stat and content-hash index of the files under one root."""
+
+    def __init__(
+        self,
+        root: PathLike = ".",
+        cache_dir: Optional[PathLike] = None,
+        *,
+        prune: Iterable[str] = PRUNE_DIRS,
+    ) -> None:
+        self.root = Path(root).resolve()
+        self.cache_dir = Path(cache_dir) if cache_dir else self.root / DEFAULT_CACHE_DIR
+        self.prune = frozenset(prune)
+        self._lock = threading.RLock()
+        self._conn = self._open()
+        self._rows: Dict[str, _Row] = {
+            path: (size, mtime_ns, inode, digest)
+            for path, size, mtime_ns, inode, digest in self._conn.execute(
+                "SELECT path, size, mtime_ns, inode, digest FROM files"
+            )
+        }
+        # Paths handed out by files() -> their row key, to avoid re-resolving.
+        self._relpaths: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _open(self) -> sqlite3.Connection:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.cache_dir / INDEX_FILENAME, timeout=30.0, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error):
+            # Read-only checkout: keep the index for this process only.
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            conn.executescript(_SCHEMA)
+        return conn
+
+    # ── enumeration ──────────────────────────────────────────────
+
+    def _pruned(self, name: str) -> bool:
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in self.prune)
+
+    def _walk(self, top: Path) -> Iterable[Tuple[Path, os.stat_result]]:
+        stack = [top]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not self._pruned(entry.name):
+                                stack.append(Path(entry.path))
+                        elif entry.is_file():
+                            yield Path(entry.path), entry.stat()
+            except OSError:
+                continue
+
+    def _relative(self, path: Path) -> Optional[str]:
+        known = self._relpaths.get(os.path.abspath(path))
+        if known is not None:
+            return known
+        try:
+            return path.resolve().relative_to(self.root).as_posix()
+        except (OSError, ValueError):
+            return None
+
+    def files(self, paths: Iterable[PathLike] = (".",)) -> List[Path]:
+        """
+        Files under `paths` (directories recursively, pruned), each sorted per
+        argument and returned relative to the argument as given. Refreshes the
+        index rows under `paths`.
+        """
+        found: List[Path] = []
+        for raw in paths:
+            base = Path(raw)
+            if base.is_file():
+                found.append(base)
+                self._refresh_file(base)
+            elif base.is_dir():
+                found.extend(sorted(self._refresh_tree(base)))
+        return found
+
+    def _refresh_file(self, path: Path) -> None:
+        relpath = self._relative(path)
+        if relpath is None:
+            return
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        with self._lock:
+            self._update({relpath: stat}, prefix=None)
+
+    def _refresh_tree(self, base: Path) -> List[Path]:
+        prefix = self._relative(base)
+        listed: List[Path] = []
+        seen: Dict[str, os.stat_result] = {}
+        for path, stat in self._walk(base):
+            given = base / path.relative_to(base)
+            listed.append(given)
+            if prefix is not None:
+                relpath = path.relative_to(base).as_posix()
+                if prefix != ".":
+                    relpath = f"{prefix}/{relpath}"
+                seen[relpath] = stat
+                self._relpaths[os.path.abspath(given)] = relpath
+        if prefix is not None:
+            with self._lock:
+                self._update(seen, prefix=prefix)
+        return listed
+
+    def _update(
+        self, seen: Dict[str, os.stat_result], *, prefix: Optional[str]
+    ) -> None:
+        changed = []
+        for relpath, stat in seen.items():
+            key = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+            row = self._rows.get(relpath)
+            if row is None or row[:3] != key:
+                self._rows[relpath] = (*key, None)
+                changed.append((relpath, *key))
+        removed = []
+        if prefix is not None:
+            head = "" if prefix == "." else prefix + "/"
+            removed = [
+                relpath
+                for relpath in self._rows
+                if relpath.startswith(head) and relpath not in seen
+            ]
+            for relpath in removed:
+                del self._rows[relpath]
+        if not changed and not removed:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO files (path, size, mtime_ns, inode, digest) "
+                "VALUES (?, ?, ?, ?, NULL) ON CONFLICT(path) DO UPDATE SET "
+                "size = excluded.size, mtime_ns = excluded.mtime_ns, "
+                "inode = excluded.inode, digest = NULL",
+                changed,
+            )
+            self._conn.executemany(
+                "DELETE FROM files WHERE path = ?", [(path,) for path in removed]
+            )
+
+    # ── content hashes and gate results ──────────────────────────
+
+    def digest(self, path: PathLike) -> Optional[str]:
+        """Content hash of `path` (None outside the root or if unreadable)."""
+        relpath = self._relative(Path(path))
+        if relpath is None:
+            return None
+        with self._lock:
+            row = self._rows.get(relpath)
+        if row is not None and row[3] is not None:
+            return row[3]
+        try:
+            with open(path, "rb") as handle:
+                stat = os.fstat(handle.fileno())
+                value = _file_digest(handle)
+        except OSError:
+            return None
+        stored = value if stat.st_mtime_ns < time.time_ns() - RACY_NS else None
+        with self._lock:
+            self._rows[relpath] = (stat.st_size, stat.st_mtime_ns, stat.st_ino, stored)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO files "
+                    "(path, size, mtime_ns, inode, digest) VALUES (?, ?, ?, ?, ?)",
+                    (relpath, stat.st_size, stat.st_mtime_ns, stat.st_ino, stored),
+                )
+        return value
+
+    def cached(self, gate: str, path: PathLike, compute: Callable[[Path], Any]) -> Any:
+        """
+        Result of `compute(path)` for the file's current content under `gate`,
+        computed only when no result is stored for this content hash.
+        """
+        path = Path(path)
+        digest = self.digest(path)
+        if digest is None:
+            return compute(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM results WHERE gate = ? AND digest = ?",
+                (gate, digest),
+            ).fetchone()
+        if row is not None:
+            self.hits += 1
+            return json.loads(row[0])
+        self.misses += 1
+        value = compute(path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (gate, digest, value) VALUES (?, ?, ?)",
+                (gate, digest, json.dumps(value, sort_keys=True)),
+            )
+        return value
+
+    def prune_results(self) -> int:
+        """Drop gate results for content no longer present; returns rows removed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM results WHERE digest NOT IN "
+                "(SELECT digest FROM files WHERE digest IS NOT NULL)"
+            )
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """Indexed file count and result-cache hit/miss counters."""
+        with self._lock:
+            return {
+                "files": len(self._rows),
+                "hits": self.hits,
+                "misses": self.misses,
+                "root": str(self.root),
+            }
+
+
+_INDEXES: Dict[Path, FileIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_file_index(root: PathLike = ".") -> FileIndex:
+    """Return the process-wide FileIndex for `root`."""
+    key = Path(root).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = _INDEXES[key] = FileIndex(key)
+        return index
+
+
+# End of ai_cores/file_index_core.py
@@ -3,22 +3,33 @@
 ai_cores/governance_core.py — Governance document detection utilities.
 
 Provides deterministic scanning helpers for governance-like documents.
+
+`GovernanceSession` runs one validation pass. Each directive_core/docs
+document is read and parsed once (text, TOML anchor, ingestion order, banner
+and token flags) and the parse is shared by every validator. The
+independent validators run concurrently in a thread pool. Results are
+reported in declaration order with per-validator timings, and the first
+failure in that order wins, exactly as in the sequential chain. The module
+level ``validate_*`` functions each run on a fresh session.
 """
 
 from __future__ import annotations
 
 import fnmatch
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 import tomllib
 
+from ai_cores.file_index_core import FileIndex, gate_key, get_file_index
 from scripts.validate_governance_ingestion import (
     CANONICAL_GOVERNANCE_ORDER,
     GovernanceIngestionError,
-    validate_canonical_header_format as enforce_canonical_header_format,
     validate_governance_ingestion_order as enforce_governance_ingestion_order,
 )
 
@@ -28,6 +39,10 @@ __all__ = [
     "GOVERNANCE_TOKEN_PATTERNS",
     "GovernanceDocument",
     "GovernanceLoader",
+    "GovernanceReport",
+    "GovernanceSession",
+    "ParsedGovernanceDocument",
+    "ValidatorResult",
     "extract_ingestion_order",
     "find_governance_like_files",
     "is_governance_like",
@@ -96,9 +111,16 @@ class GovernanceDocument:
 class GovernanceLoader:
     """Deterministic loader for canonical governance documents."""
 
-    def __init__(self, docs_root: Path, order: Iterable[str] = CANONICAL_GOVERNANCE_ORDER):
+    def __init__(
+        self,
+        docs_root: Path,
+        order: Iterable[str] = CANONICAL_GOVERNANCE_ORDER,
+        *,
+        reader: Optional[Callable[[Path], str]] = None,
+    ):
         self.docs_root = docs_root
         self.order = list(order)
+        self.reader = reader or (lambda path: path.read_text(encoding="utf-8"))
 
     def load(self) -> Tuple[List[GovernanceDocument], List[str]]:
         errors: list[str] = []
@@ -131,7 +153,7 @@ class GovernanceLoader:
                     errors.append(f"Missing governance document: {filename}")
                 continue
 
-            content = path.read_text(encoding="utf-8")
+            content = self.reader(path)
             if not content.strip():
                 errors.append(f"Governance document is empty: {filename}")
                 continue
@@ -171,18 +193,34 @@ def is_governance_like(path: Path) -> bool:
     return _matches_tokens(payload)
 
 
-def _has_deprecation_banner(path: Path, *, max_lines: int = 12) -> bool:
+def _text_flags(payload: str, *, max_lines: int = 12) -> list[bool]:
+    """Return [has deprecation banner, has governance tokens] for a text."""
+    snippet = "\n".join(payload.splitlines()[:max_lines])
+    banner = all(pattern.search(snippet) for pattern in DEPRECATION_BANNER_PATTERNS)
+    return [banner, _matches_tokens(payload)]
+
+
+def _content_flags(path: Path) -> list[bool]:
     try:
-        lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
+        payload = path.read_text(encoding="utf-8", errors="ignore")
     except OSError:
-        return False
-    snippet = "\n".join(lines[:max_lines])
-    return all(pattern.search(snippet) for pattern in DEPRECATION_BANNER_PATTERNS)
+        return [False, False]
+    return _text_flags(payload)
+
+
+_GOVERNANCE_GATE = gate_key(
+    "governance_like",
+    GOVERNANCE_TOKEN_PATTERNS,
+    [pattern.pattern for pattern in DEPRECATION_BANNER_PATTERNS],
+)
 
 
 def load_canonic_ledger(path: Path) -> dict:
     """Load the TOML anchor from a canonic ledger document."""
-    text = path.read_text(encoding="utf-8")
+    return _parse_anchor(path.read_text(encoding="utf-8"))
+
+
+def _parse_anchor(text: str) -> dict:
     anchor_count = len(re.findall(r"(?m)^\[anchor\]\s*$", text))
     if anchor_count != 1:
         raise ValueError("Invalid Canonical Header")
@@ -211,8 +249,7 @@ def validate_canonic_ledger(path: Path) -> list[str]:
 
 def validate_required_governance_documents(repo_root: Path) -> Tuple[List[GovernanceDocument], List[str]]:
     """Return loaded documents and validation errors for required governance docs."""
-    loader = GovernanceLoader(repo_root / "directive_core" / "docs")
-    return loader.load()
+    return GovernanceSession(repo_root).required_documents()
 
 
 def validate_governance_ingestion_order(
@@ -231,12 +268,7 @@ def validate_governance_ingestion_order(
 
 def validate_canonical_header_format(repo_root: Path) -> tuple[dict[str, dict], list[str]]:
     """Return parsed anchors and validation errors for canonical header TOML enforcement."""
-    docs_root = repo_root / "directive_core" / "docs"
-    try:
-        anchors = enforce_canonical_header_format(docs_root, CANONICAL_GOVERNANCE_ORDER)
-    except GovernanceIngestionError as exc:
-        return {}, [str(exc)]
-    return anchors, []
+    return GovernanceSession(repo_root).canonical_headers()
 
 
 def extract_ingestion_order(text: str) -> Optional[List[str]]:
@@ -271,31 +303,7 @@ def extract_ingestion_order(text: str) -> Optional[List[str]]:
 
 def validate_constitution_precedence(repo_root: Path) -> list[str]:
     """Return validation errors for constitution precedence conflicts."""
-    errors: list[str] = []
-    documents, doc_errors = validate_required_governance_documents(repo_root)
-    if doc_errors:
-        return doc_errors
-
-    constitution = next(
-        (doc for doc in documents if doc.name == "SSWG_CONSTITUTION.toml"), None
-    )
-    if constitution is None:
-        return ["Missing governance document: SSWG_CONSTITUTION.toml"]
-
-    constitution_order = extract_ingestion_order(constitution.content)
-    if constitution_order and constitution_order != CANONICAL_GOVERNANCE_ORDER:
-        errors.append("Validator ingestion order conflicts with Constitution")
-
-    authoritative_order = constitution_order or CANONICAL_GOVERNANCE_ORDER
-    for doc in documents:
-        if doc.name == "SSWG_CONSTITUTION.toml":
-            continue
-        doc_order = extract_ingestion_order(doc.content)
-        if doc_order and doc_order != authoritative_order:
-            errors.append(
-                f"{doc.name}: governance ingestion order conflicts with Constitution"
-            )
-    return errors
+    return GovernanceSession(repo_root).constitution_precedence()
 
 
 def validate_governance_anchor_integrity(
@@ -304,26 +312,7 @@ def validate_governance_anchor_integrity(
     anchors: dict[str, dict] | None = None,
 ) -> list[str]:
     """Return validation errors for governance anchor block integrity."""
-    documents, errors = validate_required_governance_documents(repo_root)
-    if errors:
-        return errors
-
-    if anchors is None:
-        anchors, header_errors = validate_canonical_header_format(repo_root)
-        if header_errors:
-            return header_errors
-
-    anchor_errors: list[str] = []
-    for doc in documents:
-        anchor = anchors.get(doc.name)
-        if anchor is None:
-            anchor_errors.append("Invalid Canonical Header")
-            continue
-
-        for field in ANCHOR_REQUIRED_FIELDS:
-            if not anchor.get(field):
-                anchor_errors.append(f"{doc.name}: missing anchor field {field}")
-    return anchor_errors
+    return GovernanceSession(repo_root).anchor_integrity(anchors=anchors)
 
 
 def _is_excluded(path: Path, repo_root: Path) -> bool:
@@ -344,27 +333,37 @@ def _is_allowed_governance_path(path: Path, repo_root: Path) -> bool:
     return False
 
 
-def find_governance_like_files(repo_root: Path) -> List[Path]:
-    """Return governance-like files outside directive_core authorized roots."""
+def find_governance_like_files(
+    repo_root: Path, *, index: Optional[FileIndex] = None
+) -> List[Path]:
+    """
+    Return governance-like files outside directive_core authorized roots.
+
+    Files are enumerated through the repository's FileIndex and content checks
+    are cached per content hash, so unchanged files are not re-read.
+    """
     repo_root = repo_root.resolve()
+    if index is None:
+        index = get_file_index(repo_root)
     matches: List[Path] = []
-    for path in repo_root.rglob("*"):
-        if not path.is_file():
-            continue
+    for path in index.files([repo_root]):
         if _is_excluded(path, repo_root):
             continue
         if _is_allowed_governance_path(path, repo_root):
             continue
-        if _has_deprecation_banner(path):
+        banner, tokens = index.cached(_GOVERNANCE_GATE, path, _content_flags)
+        if banner:
             continue
-        if is_governance_like(path):
+        if _matches_filename(path.name) or tokens:
             matches.append(path.relative_to(repo_root))
     return sorted(matches)
 
 
-def validate_governance_source_location(repo_root: Path) -> list[str]:
+def validate_governance_source_location(
+    repo_root: Path, *, index: Optional[FileIndex] = None
+) -> list[str]:
     """Return validation errors for governance source location violations."""
-    violations = find_governance_like_files(repo_root)
+    violations = find_governance_like_files(repo_root, index=index)
     if violations:
         return [str(path) for path in violations]
     return []
@@ -398,74 +397,357 @@ def validate_governance_freeze(
     return []
 
 
-def run_governance_validations(
-    repo_root: Path,
-    *,
-    changed_files: Iterable[Path] = (),
-    phase2_passed: bool = False,
-) -> Optional["FailureLabel"]:
-    """Run governance validations fail-closed and return the first failure."""
-    from generator.failure_emitter import FailureLabel
-
-    source_errors = validate_governance_source_location(repo_root)
-    if source_errors:
-        return FailureLabel(
-            Type="governance_source_violation",
-            message="Governance-like document found outside directive_core/",
-            phase_id="governance_source_validation",
-            path=source_errors[0],
-        )
+# ─── Governance session ──────────────────────────────────────────
+
+INVALID_CANONICAL_HEADER = "Invalid Canonical Header"
 
-    docs, doc_errors = validate_required_governance_documents(repo_root)
-    if doc_errors:
-        return FailureLabel(
-            Type="missing_governance_document",
-            message=doc_errors[0],
-            phase_id="governance_document_presence",
-        )
 
-    anchors, canonical_header_errors = validate_canonical_header_format(repo_root)
-    if canonical_header_errors:
-        return FailureLabel(
-            Type="governance_anchor_violation",
-            message=canonical_header_errors[0],
-            phase_id="governance_anchor_integrity",
+@dataclass(frozen=True)
+class ParsedGovernanceDocument:
+    """A directive_core/docs document, read and parsed once per session."""
+
+    name: str
+    path: Path
+    content: str
+    anchor: Optional[dict]
+    ingestion_order: Optional[List[str]]
+    has_banner: bool
+    has_governance_tokens: bool
+
+
+@dataclass(frozen=True)
+class ValidatorResult:
+    """Errors and wall time of one validator in a session run."""
+
+    name: str
+    errors: List[str]
+    duration_ms: float
+    exception: Optional[BaseException] = None
+
+
+@dataclass
+class GovernanceReport:
+    """Validator results in declaration order plus the deciding failure."""
+
+    results: List[ValidatorResult] = field(default_factory=list)
+    failure: Optional["FailureLabel"] = None
+    wall_ms: float = 0.0
+
+    def timings(self) -> Dict[str, float]:
+        return {result.name: result.duration_ms for result in self.results}
+
+    def format_timings(self) -> str:
+        """One line per validator: name, status and duration."""
+        width = max((len(result.name) for result in self.results), default=0)
+        lines = []
+        for result in self.results:
+            status = "error" if result.exception else "fail" if result.errors else "ok"
+            lines.append(
+                f"{result.name:<{width}}  {status:<5} {result.duration_ms:9.2f} ms"
+            )
+        lines.append(f"{'total (wall)':<{width}}  {'':<5} {self.wall_ms:9.2f} ms")
+        return "\n".join(lines)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "failure": self.failure.as_dict() if self.failure else None,
+            "validators": [
+                {
+                    "name": result.name,
+                    "errors": result.errors,
+                    "duration_ms": round(result.duration_ms, 3),
+                }
+                for result in self.results
+            ],
+            "wall_ms": round(self.wall_ms, 3),
+        }
+
+
+class _Check(NamedTuple):
+    """How a session validator's errors become a FailureLabel."""
+
+    name: str
+    failure_type: str
+    phase_id: str
+    message: Optional[str] = None  # None: use the first error
+    error_is_path: bool = False
+
+
+_SESSION_CHECKS = [
+    _Check(
+        "governance_source_location",
+        "governance_source_violation",
+        "governance_source_validation",
+        "Governance-like document found outside directive_core/",
+        error_is_path=True,
+    ),
+    _Check(
+        "governance_document_presence",
+        "missing_governance_document",
+        "governance_document_presence",
+    ),
+    _Check(
+        "governance_canonical_header",
+        "governance_anchor_violation",
+        "governance_anchor_integrity",
+    ),
+    _Check(
+        "governance_ingestion_order",
+        "governance_ingestion_order_violation",
+        "governance_ingestion_order",
+    ),
+    _Check(
+        "constitution_precedence",
+        "constitution_precedence_violation",
+        "constitution_precedence",
+    ),
+    _Check(
+        "governance_anchor_integrity",
+        "governance_anchor_violation",
+        "governance_anchor_integrity",
+    ),
+    _Check(
+        "governance_freeze",
+        "governance_freeze_violation",
+        "governance_freeze",
+        "Governance changes blocked by active freeze",
+        error_is_path=True,
+    ),
+]
+
+
+class GovernanceSession:
+    """
+    One governance validation pass over a repository.
+
+    Reads and parses are memoized per session and are thread-safe, so the
+    validators share them when `run` executes them concurrently. A session
+    is a snapshot. Create a new one after the documents change.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        *,
+        index: Optional[FileIndex] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.repo_root = Path(repo_root)
+        self.docs_root = self.repo_root / "directive_core" / "docs"
+        self.index = index
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._memo: Dict[Any, Any] = {}
+        self._key_locks: Dict[Any, threading.Lock] = {}
+
+    def _once(self, key: Any, compute: Callable[[], Any]) -> Any:
+        if key in self._memo:
+            return self._memo[key]
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._memo:
+                self._memo[key] = compute()
+        return self._memo[key]
+
+    # ── shared reads and parses ──────────────────────────────────
+
+    def read_text(self, path: Path) -> str:
+        return self._once(("text", path), lambda: path.read_text(encoding="utf-8"))
+
+    def document(self, name: str) -> ParsedGovernanceDocument:
+        """The parsed docs-root document `name`."""
+        return self._once(("document", name), lambda: self._parse(name))
+
+    def _parse(self, name: str) -> ParsedGovernanceDocument:
+        path = self.docs_root / name
+        content = self.read_text(path)
+        try:
+            anchor: Optional[dict] = _parse_anchor(content)
+        except ValueError:
+            anchor = None
+        has_banner, has_tokens = _text_flags(content)
+        return ParsedGovernanceDocument(
+            name=name,
+            path=path,
+            content=content,
+            anchor=anchor,
+            ingestion_order=extract_ingestion_order(content),
+            has_banner=has_banner,
+            has_governance_tokens=has_tokens,
         )
 
-    ingestion_errors = validate_governance_ingestion_order(
-        repo_root, observed_order=[doc.name for doc in docs]
-    )
-    if ingestion_errors:
-        return FailureLabel(
-            Type="governance_ingestion_order_violation",
-            message=ingestion_errors[0],
-            phase_id="governance_ingestion_order",
+    # ── validators ───────────────────────────────────────────────
+
+    def source_location(self) -> List[str]:
+        return self._once(
+            "source_location",
+            lambda: [
+                str(path)
+                for path in find_governance_like_files(self.repo_root, index=self.index)
+            ],
         )
 
-    constitution_errors = validate_constitution_precedence(repo_root)
-    if constitution_errors:
-        return FailureLabel(
-            Type="constitution_precedence_violation",
-            message=constitution_errors[0],
-            phase_id="constitution_precedence",
+    def required_documents(self) -> Tuple[List[GovernanceDocument], List[str]]:
+        documents, errors = self._once(
+            "required_documents",
+            lambda: GovernanceLoader(self.docs_root, reader=self.read_text).load(),
         )
+        return list(documents), list(errors)
+
+    def canonical_headers(self) -> Tuple[Dict[str, dict], List[str]]:
+        anchors, errors = self._once("canonical_headers", self._canonical_headers)
+        return dict(anchors), list(errors)
 
-    anchor_errors = validate_governance_anchor_integrity(repo_root, anchors=anchors)
-    if anchor_errors:
-        return FailureLabel(
-            Type="governance_anchor_violation",
-            message=anchor_errors[0],
-            phase_id="governance_anchor_integrity",
+    def _canonical_headers(self) -> Tuple[Dict[str, dict], List[str]]:
+        names = sorted(
+            path.name
+            for path in self.docs_root.iterdir()
+            if path.is_file() and path.suffix == ".toml"
         )
+        anchors: Dict[str, dict] = {}
+        for name in names:
+            anchor = self.document(name).anchor
+            if anchor is None:
+                return {}, [INVALID_CANONICAL_HEADER]
+            if name in CANONICAL_GOVERNANCE_ORDER:
+                anchors[name] = anchor
+        return anchors, []
+
+    def ingestion_order(self) -> List[str]:
+        try:
+            enforce_governance_ingestion_order(
+                self.docs_root, CANONICAL_GOVERNANCE_ORDER
+            )
+        except GovernanceIngestionError as exc:
+            return [str(exc)]
+        return []
 
-    freeze_errors = validate_governance_freeze(
-        repo_root, changed_files, phase2_passed=phase2_passed
-    )
-    if freeze_errors:
-        return FailureLabel(
-            Type="governance_freeze_violation",
-            message="Governance changes blocked by active freeze",
-            phase_id="governance_freeze",
-            path=freeze_errors[0],
+    def constitution_precedence(self) -> List[str]:
+        documents, doc_errors = self.required_documents()
+        if doc_errors:
+            return doc_errors
+        if not any(doc.name == "SSWG_CONSTITUTION.toml" for doc in documents):
+            return ["Missing governance document: SSWG_CONSTITUTION.toml"]
+
+        errors: List[str] = []
+        constitution_order = self.document("SSWG_CONSTITUTION.toml").ingestion_order
+        if constitution_order and constitution_order != CANONICAL_GOVERNANCE_ORDER:
+            errors.append("Validator ingestion order conflicts with Constitution")
+
+        authoritative_order = constitution_order or CANONICAL_GOVERNANCE_ORDER
+        for doc in documents:
+            if doc.name == "SSWG_CONSTITUTION.toml":
+                continue
+            doc_order = self.document(doc.name).ingestion_order
+            if doc_order and doc_order != authoritative_order:
+                errors.append(
+                    f"{doc.name}: governance ingestion order conflicts "
+                    "with Constitution"
+                )
+        return errors
+
+    def anchor_integrity(
+        self, *, anchors: Optional[Dict[str, dict]] = None
+    ) -> List[str]:
+        documents, errors = self.required_documents()
+        if errors:
+            return errors
+
+        if anchors is None:
+            anchors, header_errors = self.canonical_headers()
+            if header_errors:
+                return header_errors
+
+        anchor_errors: List[str] = []
+        for doc in documents:
+            anchor = anchors.get(doc.name)
+            if anchor is None:
+                anchor_errors.append(INVALID_CANONICAL_HEADER)
+                continue
+
+            for key in ANCHOR_REQUIRED_FIELDS:
+                if not anchor.get(key):
+                    anchor_errors.append(f"{doc.name}: missing anchor field {key}")
+        return anchor_errors
+
+    # ── run ──────────────────────────────────────────────────────
+
+    def run(
+        self,
+        *,
+        changed_files: Iterable[Path] = (),
+        phase2_passed: bool = False,
+    ) -> GovernanceReport:
+        """
+        Run every validator and return the report. The failure is the first
+        failing validator in declaration order. An exception raised by a
+        validator is re-raised only if every validator before it passed,
+        which is when the sequential chain would have reached it.
+        """
+        from generator.failure_emitter import FailureLabel
+
+        changes = list(changed_files)
+        validators: List[Callable[[], List[str]]] = [
+            self.source_location,
+            lambda: self.required_documents()[1],
+            lambda: self.canonical_headers()[1],
+            self.ingestion_order,
+            self.constitution_precedence,
+            self.anchor_integrity,
+            lambda: validate_governance_freeze(
+                self.repo_root, changes, phase2_passed=phase2_passed
+            ),
+        ]
+
+        def timed(item: Tuple[str, Callable[[], List[str]]]) -> ValidatorResult:
+            name, validator = item
+            started = time.perf_counter()
+            try:
+                errors, exception = list(validator()), None
+            except Exception as exc:  # pylint: disable=broad-except
+                errors, exception = [], exc
+            elapsed = (time.perf_counter() - started) * 1000.0
+            return ValidatorResult(name, errors, elapsed, exception)
+
+        items = [
+            (check.name, validator)
+            for check, validator in zip(_SESSION_CHECKS, validators)
+        ]
+        workers = self.max_workers or len(items)
+        started = time.perf_counter()
+        if workers <= 1:
+            results = [timed(item) for item in items]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="governance"
+            ) as pool:
+                results = list(pool.map(timed, items))
+        report = GovernanceReport(
+            results=results, wall_ms=(time.perf_counter() - started) * 1000.0
         )
-    return None
+
+        for check, result in zip(_SESSION_CHECKS, results):
+            if result.exception is not None:
+                raise result.exception
+            if result.errors:
+                report.failure = FailureLabel(
+                    Type=check.failure_type,
+                    message=check.message or result.errors[0],
+                    phase_id=check.phase_id,
+                    path=result.errors[0] if check.error_is_path else None,
+                )
+                break
+        return report
+
+
+def run_governance_validations(
+    repo_root: Path,
+    *,
+    changed_files: Iterable[Path] = (),
+    phase2_passed: bool = False,
+) -> Optional["FailureLabel"]:
+    """Run governance validations fail-closed and return the first failure."""
+    session = GovernanceSession(repo_root)
+    report = session.run(changed_files=changed_files, phase2_passed=phase2_passed)
+    return report.failure
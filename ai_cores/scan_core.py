@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+ai_cores/scan_core.py — Shared single-pass multi-pattern scanning engine.
+
+Used by the secret scanner, the redaction gate, the semantic ambiguity gate
+and sanitizer.find_secret_indicators. A gate describes its rules once as a
+`PatternSet`; the set compiles them into one alternation of named groups
+(bytes and str flavours), so a file is read and scanned in a single pass
+instead of once per pattern.
+
+- Literal prefilter: every rule gets the literals at least one of which must
+  appear in any match (derived from the regex, or given explicitly). Each
+  chunk is checked with substring searches first. Only rules whose literals
+  occur go into the alternation for that chunk, and a chunk with no
+  candidates is never handed to the regex engine.
+- Files are read in line-aligned chunks (CHUNK_BYTES) and matched as bytes.
+  Line numbers are mapped from chunk offsets only when something matches.
+- Files whose first SNIFF_BYTES contain a NUL byte are treated as binary
+  and skipped.
+- Matching is line-local. The engine reports the first hit per rule. When a
+  line matches, the remaining rules are checked against that line only, so
+  overlapping matches are never lost. Scanning stops early once every rule
+  has been seen.
+
+Gates keep their own reporting: `scan_files` hands every `FileScan` to the
+gate's reporter callback.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    AnyStr,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+try:  # Python 3.11+
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - Python 3.10
+    # pylint: disable-next=deprecated-module
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+CHUNK_BYTES = 4 * 1024 * 1024
+SNIFF_BYTES = 8192
+MIN_LITERAL = 3
+_FLAG_MASK = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE
+_INLINE_FLAGS = {
+    "i": re.IGNORECASE,
+    "m": re.MULTILINE,
+    "s": re.DOTALL,
+    "x": re.VERBOSE,
+}
+_LEADING_FLAGS = re.compile(r"^\(\?([imsx]+)\)")
+
+__all__ = [
+    "FileScan",
+    "PatternSet",
+    "ScanHit",
+    "ScanRule",
+    "is_binary",
+    "iter_files",
+    "scan_files",
+]
+
+
+@dataclass(frozen=True)
+class ScanRule:
+    """
+    One pattern of a gate.
+
+    Attributes:
+        rule_id: Identifier reported for matches.
+        pattern: Regex source; a leading inline flag group such as ``(?i)``
+            is folded into `flags`.
+        flags: ``re`` flags (IGNORECASE / MULTILINE / DOTALL / VERBOSE).
+        literals: Strings of which at least one occurs in every match; derived
+            from the pattern when empty. Used only to skip work.
+        accept: Optional predicate on the matched text; rejected matches
+            do not count (e.g. the high-entropy check).
+    """
+
+    rule_id: str
+    pattern: str
+    flags: int = 0
+    literals: Tuple[str, ...] = ()
+    accept: Optional[Callable[[str], bool]] = None
+
+    @classmethod
+    def from_regex(
+        cls,
+        rule_id: str,
+        regex: Pattern[str],
+        accept: Optional[Callable[[str], bool]] = None,
+    ) -> "ScanRule":
+        return cls(rule_id, regex.pattern, regex.flags & _FLAG_MASK, accept=accept)
+
+
+@dataclass(frozen=True)
+class ScanHit:
+    """First match of a rule in a scanned text (line is 1-based)."""
+
+    rule_id: str
+    line: int
+
+
+@dataclass
+class FileScan:
+    """Scan outcome for one file."""
+
+    path: Path
+    hits: List[ScanHit] = field(default_factory=list)
+    binary: bool = False
+    error: Optional[str] = None
+
+    @property
+    def rule_ids(self) -> List[str]:
+        return [hit.rule_id for hit in self.hits]
+
+
+# ─── Literal extraction ──────────────────────────────────────────
+
+
+def _split_flags(pattern: str, flags: int) -> Tuple[str, int]:
+    match = _LEADING_FLAGS.match(pattern)
+    if match:
+        for letter in match.group(1):
+            flags |= _INLINE_FLAGS[letter]
+        pattern = pattern[match.end() :]
+    return pattern, flags & _FLAG_MASK
+
+
+def _required_literals(items: Sequence) -> Optional[FrozenSet[str]]:
+    """
+    Return strings of which every match of `items` contains at least one,
+    or None when no such set of strings of MIN_LITERAL+ characters is known.
+    """
+    candidates: List[FrozenSet[str]] = []
+    run: List[str] = []
+
+    def close_run() -> None:
+        if len(run) >= MIN_LITERAL:
+            candidates.append(frozenset(["".join(run)]))
+        run.clear()
+
+    for op, arg in items:
+        if op is _sre_parse.LITERAL:
+            run.append(chr(arg))
+            continue
+        if op is _sre_parse.AT:
+            continue  # zero-width (\b, ^, $) does not break a literal run
+        close_run()
+        if op is _sre_parse.SUBPATTERN:
+            found = _required_literals(arg[-1])
+        elif op is _sre_parse.BRANCH:
+            branches = [_required_literals(branch) for branch in arg[1]]
+            found = None
+            if branches and all(branch is not None for branch in branches):
+                found = frozenset().union(*branches)  # type: ignore[arg-type]
+        elif op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT) and arg[0] >= 1:
+            found = _required_literals(arg[2])
+        else:
+            found = None
+        if found:
+            candidates.append(found)
+    close_run()
+    if not candidates:
+        return None
+    # Prefer the requirement whose shortest literal is longest (most selective).
+    return max(candidates, key=lambda lits: (min(map(len, lits)), -len(lits)))
+
+
+def _derive_literals(pattern: str, flags: int) -> Tuple[str, ...]:
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except (re.error, RecursionError):
+        return ()
+    found = _required_literals(list(parsed))
+    return tuple(sorted(found)) if found else ()
+
+
+# ─── Compiled pattern set ────────────────────────────────────────
+
+
+@dataclass
+class _Flavour(Generic[AnyStr]):
+    """Per-type (bytes / str) compiled state of a PatternSet."""
+
+    singles: List[Pattern[AnyStr]]
+    literals: List[Tuple[AnyStr, ...]]
+    newline: AnyStr
+    combined: Dict[FrozenSet[int], Pattern[AnyStr]] = field(default_factory=dict)
+
+
+class PatternSet:
+    """A gate's rules, compiled once for single-pass scanning."""
+
+    def __init__(self, rules: Iterable[ScanRule]) -> None:
+        self.rules: List[ScanRule] = list(rules)
+        self._sources: List[str] = []
+        self._folded: List[bool] = []
+        literal_sets: List[Tuple[str, ...]] = []
+        for rule in self.rules:
+            source, flags = _split_flags(rule.pattern, rule.flags)
+            inline = "".join(
+                letter for letter, flag in _INLINE_FLAGS.items() if flags & flag
+            )
+            self._sources.append(f"(?{inline}:{source})" if inline else source)
+            folded = bool(flags & re.IGNORECASE)
+            literals = rule.literals or _derive_literals(source, flags)
+            literal_sets.append(
+                tuple(lit.lower() for lit in literals) if folded else tuple(literals)
+            )
+            self._folded.append(folded)
+        self._always = frozenset(
+            index for index, lits in enumerate(literal_sets) if not lits
+        )
+        self._text = _Flavour(
+            singles=[re.compile(source) for source in self._sources],
+            literals=literal_sets,
+            newline="\n",
+        )
+        self._bytes = _Flavour(
+            singles=[re.compile(source.encode("utf-8")) for source in self._sources],
+            literals=[
+                tuple(lit.encode("utf-8") for lit in lits) for lits in literal_sets
+            ],
+            newline=b"\n",
+        )
+        self._any_folded = any(
+            folded and literal_sets[index]
+            for index, folded in enumerate(self._folded)
+        )
+
+    @property
+    def signature(self) -> Tuple[Tuple[str, str, int], ...]:
+        """(rule_id, pattern, flags) per rule, e.g. for result cache keys."""
+        return tuple((rule.rule_id, rule.pattern, rule.flags) for rule in self.rules)
+
+    def _combined(self, flavour: _Flavour, active: FrozenSet[int]) -> Pattern:
+        regex = flavour.combined.get(active)
+        if regex is None:
+            source = "|".join(
+                f"(?P<r{index}>{self._sources[index]})" for index in sorted(active)
+            )
+            regex = re.compile(
+                source.encode("utf-8") if flavour is self._bytes else source
+            )
+            flavour.combined[active] = regex
+        return regex
+
+    def _candidates(self, flavour: _Flavour, chunk: AnyStr, pending) -> FrozenSet[int]:
+        lowered = chunk.lower() if self._any_folded else chunk
+        active = set(self._always & pending)
+        for index in pending - self._always:
+            haystack = lowered if self._folded[index] else chunk
+            if any(literal in haystack for literal in flavour.literals[index]):
+                active.add(index)
+        return frozenset(active)
+
+    def _accepted(self, index: int, text: AnyStr, start: int, end: int) -> bool:
+        accept = self.rules[index].accept
+        if accept is None:
+            return True
+        single = (self._bytes if isinstance(text, bytes) else self._text).singles[
+            index
+        ]
+        for match in single.finditer(text, start, end):
+            value = match.group(0)
+            if isinstance(value, bytes):
+                value = value.decode("utf-8", "replace")
+            if accept(value):
+                return True
+        return False
+
+    def _scan_chunk(
+        self,
+        flavour: _Flavour,
+        chunk: AnyStr,
+        pending: set,
+        base_line: int,
+        hits: List[ScanHit],
+    ) -> None:
+        """Record first hits of `pending` rules in `chunk`; updates `pending`."""
+        active = self._candidates(flavour, chunk, frozenset(pending))
+        position = 0
+        line, line_pos = base_line, 0
+        newline = flavour.newline
+        while active:
+            match = self._combined(flavour, active).search(chunk, position)
+            if match is None:
+                return
+            start = chunk.rfind(newline, 0, match.start()) + 1
+            end = chunk.find(newline, match.end())
+            end = len(chunk) if end < 0 else end
+            line += chunk.count(newline, line_pos, start)
+            line_pos = start
+            # Decide every active rule for this line: re-search the line with
+            # the rules not yet seen on it until nothing else matches, so a
+            # match starting inside another rule's match is not lost.
+            found = []
+            undecided = active
+            while match is not None:
+                index = int(match.lastgroup[1:])  # type: ignore[index]
+                undecided = undecided - {index}
+                if self._accepted(index, chunk, start, end):
+                    found.append(index)
+                if not undecided:
+                    break
+                match = self._combined(flavour, undecided).search(chunk, start, end)
+            for index in found:
+                hits.append(ScanHit(self.rules[index].rule_id, line))
+                pending.discard(index)
+            # Every active rule has now been decided for this line.
+            active = active - frozenset(found)
+            position = end + 1
+            if position > len(chunk):
+                return
+
+    # ── public API ───────────────────────────────────────────────
+
+    def scan_text(self, text: str) -> List[ScanHit]:
+        """Return the first hit per rule in `text`, in rule order."""
+        hits: List[ScanHit] = []
+        self._scan_chunk(self._text, text, set(range(len(self.rules))), 1, hits)
+        return self._ordered(hits)
+
+    def matches(self, text: str) -> List[str]:
+        """Rule ids matching `text`, in rule order."""
+        return [hit.rule_id for hit in self.scan_text(text)]
+
+    def scan_file(
+        self, path: Union[str, Path], *, skip_binary: bool = True
+    ) -> FileScan:
+        """Scan one file in line-aligned chunks; see module docstring."""
+        result = FileScan(Path(path))
+        pending = set(range(len(self.rules)))
+        try:
+            with open(path, "rb") as handle:
+                carry = b""
+                base_line = 1
+                first = True
+                while pending:
+                    block = handle.read(CHUNK_BYTES)
+                    if first:
+                        first = False
+                        if skip_binary and is_binary(block[:SNIFF_BYTES]):
+                            result.binary = True
+                            return result
+                    if not block:
+                        chunk, carry = carry, b""
+                    else:
+                        data = carry + block
+                        cut = data.rfind(b"\n") + 1
+                        if cut == 0:
+                            carry = data
+                            continue
+                        chunk, carry = data[:cut], data[cut:]
+                    if chunk:
+                        self._scan_chunk(
+                            self._bytes, chunk, pending, base_line, result.hits
+                        )
+                        base_line += chunk.count(b"\n")
+                    if not block:
+                        break
+        except OSError as exc:
+            result.error = exc.__class__.__name__
+        result.hits = self._ordered(result.hits)
+        return result
+
+    def _ordered(self, hits: List[ScanHit]) -> List[ScanHit]:
+        order = {rule.rule_id: index for index, rule in enumerate(self.rules)}
+        return sorted(hits, key=lambda hit: order[hit.rule_id])
+
+
+def is_binary(sample: bytes) -> bool:
+    """Sniff a leading sample: a NUL byte means binary (git's heuristic)."""
+    return b"\0" in sample
+
+
+def iter_files(paths: Iterable[Union[str, Path]]) -> Iterator[Path]:
+    """Yield files under `paths` (directories recursively, in sorted order)."""
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            for file_path in sorted(path.rglob("*")):
+                if file_path.is_file():
+                    yield file_path
+        elif path.is_file():
+            yield path
+
+
+def scan_files(
+    paths: Iterable[Union[str, Path]],
+    pattern_set: PatternSet,
+    reporter: Optional[Callable[[FileScan], None]] = None,
+    *,
+    skip_binary: bool = True,
+) -> List[FileScan]:
+    """
+    Scan every file under `paths` once. Each FileScan goes to `reporter`
+    (if given); files with hits are returned.
+    """
+    flagged = []
+    for path in iter_files(paths):
+        result = pattern_set.scan_file(path, skip_binary=skip_binary)
+        if reporter is not None:
+            reporter(result)
+        if result.hits:
+            flagged.append(result)
+    return flagged
+
+
+# End of ai_cores/scan_core.py
@@ -4,17 +4,35 @@ ai_cores/schema_core.py — Shared JSON Schema validation core.
 
 Provides centralized schema loading, validator construction, and artifact
 validation for deterministic enforcement.
+
+Validators are served from a process-wide registry keyed by
+``(schema_dir, schema_name, fingerprint)``. The fingerprint is derived from
+the ``(mtime_ns, size)`` of every schema file under ``schema_dir``, so the
+``$id`` store is built once per directory state and rebuilt only when a
+schema file is added, removed, or modified.
 """
 
 from __future__ import annotations
 
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, List, Tuple
 
 from jsonschema import Draft202012Validator, RefResolver
 
-__all__ = ["load_schema", "get_validator", "validate_artifact"]
+__all__ = [
+    "ValidatorRegistry",
+    "clear_validator_cache",
+    "get_validator",
+    "load_schema",
+    "schema_dir_fingerprint",
+    "validate_artifact",
+    "validator_cache_stats",
+]
+
+Fingerprint = Tuple[Tuple[str, int, int], ...]
 
 
 def load_schema(schema_dir: Path, schema_name: str) -> Dict[str, Any]:
@@ -25,21 +43,121 @@ def load_schema(schema_dir: Path, schema_name: str) -> Dict[str, Any]:
     return json.loads(schema_path.read_text(encoding="utf-8"))
 
 
-def get_validator(schema_dir: Path, schema_name: str) -> Draft202012Validator:
-    """Build a Draft 2020-12 validator with local $ref resolution."""
-    schema_dir = schema_dir.resolve()
-    schema = load_schema(schema_dir, schema_name)
+def schema_dir_fingerprint(schema_dir: Path) -> Fingerprint:
+    """Return a stat-only fingerprint of every JSON schema under schema_dir."""
+    entries: List[Tuple[str, int, int]] = []
+    pending = [str(schema_dir)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as iterator:
+                for entry in iterator:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".json"):
+                        stat = entry.stat()
+                        entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            continue
+    return tuple(sorted(entries))
+
+
+def _build_store(schema_dir: Path) -> Dict[str, Any]:
+    """Parse every schema under schema_dir into a ``$id`` keyed store."""
     store: Dict[str, Any] = {}
-    for path in schema_dir.rglob("*.json"):
+    for path in sorted(schema_dir.rglob("*.json")):
         try:
             payload = json.loads(path.read_text(encoding="utf-8"))
         except json.JSONDecodeError:
             continue
-        if "$id" in payload:
+        if isinstance(payload, dict) and "$id" in payload:
             store[payload["$id"].rstrip("#")] = payload
-    base_uri = schema_dir.as_uri().rstrip("/") + "/"
-    resolver = RefResolver(base_uri=base_uri, referrer=schema, store=store)
-    return Draft202012Validator(schema, resolver=resolver)
+    return store
+
+
+class ValidatorRegistry:
+    """Thread-safe cache of compiled validators and per-directory ``$id`` stores."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stores: Dict[Path, Tuple[Fingerprint, Dict[str, Any]]] = {}
+        self._validators: Dict[Tuple[Path, str, Fingerprint], Draft202012Validator] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, schema_dir: Path, schema_name: str) -> Draft202012Validator:
+        """Return a cached validator, rebuilding it if any schema file changed."""
+        schema_dir = schema_dir.resolve()
+        fingerprint = schema_dir_fingerprint(schema_dir)
+        key = (schema_dir, schema_name, fingerprint)
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self.hits += 1
+                return validator
+            self.misses += 1
+            store = self._store_for(schema_dir, fingerprint)
+
+        schema = load_schema(schema_dir, schema_name)
+        base_uri = schema_dir.as_uri().rstrip("/") + "/"
+        resolver = RefResolver(base_uri=base_uri, referrer=schema, store=store)
+        validator = Draft202012Validator(schema, resolver=resolver)
+        with self._lock:
+            return self._validators.setdefault(key, validator)
+
+    def _store_for(self, schema_dir: Path, fingerprint: Fingerprint) -> Dict[str, Any]:
+        cached = self._stores.get(schema_dir)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        if cached is not None:
+            self.invalidations += 1
+            self._validators = {
+                key: value
+                for key, value in self._validators.items()
+                if key[0] != schema_dir
+            }
+        store = _build_store(schema_dir)
+        self._stores[schema_dir] = (fingerprint, store)
+        return store
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/invalidation counters and current cache size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "validators": len(self._validators),
+                "stores": len(self._stores),
+            }
+
+    def clear(self) -> None:
+        """Drop all cached validators and stores and reset counters."""
+        with self._lock:
+            self._stores.clear()
+            self._validators.clear()
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
+
+
+_REGISTRY = ValidatorRegistry()
+
+
+def get_validator(schema_dir: Path, schema_name: str) -> Draft202012Validator:
+    """Return a Draft 2020-12 validator with local $ref resolution."""
+    return _REGISTRY.get(schema_dir, schema_name)
+
+
+def validator_cache_stats() -> Dict[str, int]:
+    """Return counters for the process-wide validator registry."""
+    return _REGISTRY.stats()
+
+
+def clear_validator_cache() -> None:
+    """Reset the process-wide validator registry."""
+    _REGISTRY.clear()
 
 
 def validate_artifact(
@@ -5,12 +5,14 @@ ai_evaluation package — Quality & scoring utilities for sswg-mvm.
 Public surface (MVM level):
 
 - evaluate_workflow_quality(workflow_dict) → dict of metrics
+- AnalysisContext for single-pass workflow analysis shared across metrics
 - SemanticAnalyzer for basic text/semantic checks
 - ScoreAdapter for normalizing external model scores
 """
 
 from __future__ import annotations
 
+from .analysis_context import AnalysisContext
 from .checkpoints import EvaluationCheckpoint, EvaluationCheckpointer
 from .evaluation_engine import evaluate_workflow_quality
 from .semantic_analysis import SemanticAnalyzer
@@ -18,6 +20,7 @@ from .verity_tensor import compute_verity
 from .scoring_adapter import ScoreAdapter
 
 __all__ = [
+    "AnalysisContext",
     "evaluate_workflow_quality",
     "SemanticAnalyzer",
     "ScoreAdapter",
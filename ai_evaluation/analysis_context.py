@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+ai_evaluation/analysis_context.py — Shared, single-pass analysis of a workflow.
+
+`AnalysisContext` walks a workflow once and exposes everything the quality
+metrics need: text blocks, normalized sentences, content tokens, and the
+phase/task index. Metric results are memoized on the context so composite
+metrics (e.g. epistemic optimization) reuse scores that were already
+computed during the same evaluation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .semantic_analysis import SemanticAnalyzer
+
+STOP_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "the",
+        "of",
+        "to",
+        "in",
+        "for",
+        "with",
+        "on",
+        "by",
+        "as",
+        "at",
+        "is",
+        "are",
+        "be",
+        "from",
+        "or",
+        "that",
+        "this",
+    }
+)
+
+_analyzer = SemanticAnalyzer()
+
+
+def tokenize(text: str) -> set[str]:
+    """Lowercase alphanumeric tokens of ``text`` minus stop words."""
+    return {
+        token
+        for token in "".join(
+            [ch.lower() if ch.isalnum() else " " for ch in text]
+        ).split()
+        if token and token not in STOP_WORDS
+    }
+
+
+@dataclass
+class AnalysisContext:
+    """
+    Precomputed view of a workflow shared across metric functions.
+
+    Attributes:
+        workflow: The workflow dict being evaluated.
+        metadata: workflow["metadata"] (empty dict if missing).
+        phases: Phase dicts, in workflow order.
+        tasks: Task dicts across all phases, in workflow order.
+        text_blocks: Text blocks as returned by SemanticAnalyzer.
+        sentences: Normalized (stripped, lowercased) sentences of text_blocks.
+        content_tokens: Union of tokenize() over all text blocks.
+    """
+
+    workflow: Dict[str, Any]
+    metadata: Dict[str, Any]
+    phases: List[Dict[str, Any]]
+    tasks: List[Dict[str, Any]]
+    text_blocks: List[str]
+    sentences: List[str]
+    content_tokens: set[str]
+    _scores: Dict[str, float] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_workflow(
+        cls,
+        workflow: Dict[str, Any],
+        analyzer: Optional[SemanticAnalyzer] = None,
+    ) -> "AnalysisContext":
+        """Build a context with a single pass over the workflow."""
+        analyzer = analyzer or _analyzer
+        phases = [p for p in workflow.get("phases", []) or [] if isinstance(p, dict)]
+        tasks: List[Dict[str, Any]] = []
+        for phase in phases:
+            tasks.extend(
+                [t for t in phase.get("tasks", []) or [] if isinstance(t, dict)]
+            )
+
+        text_blocks = analyzer.extract_text_blocks(workflow)
+        sentences: List[str] = []
+        content_tokens: set[str] = set()
+        for block in text_blocks:
+            for sentence in analyzer.split_sentences(block):
+                normalized = sentence.strip().lower()
+                if normalized:
+                    sentences.append(normalized)
+            content_tokens |= tokenize(block)
+
+        return cls(
+            workflow=workflow,
+            metadata=workflow.get("metadata", {}) or {},
+            phases=phases,
+            tasks=tasks,
+            text_blocks=text_blocks,
+            sentences=sentences,
+            content_tokens=content_tokens,
+        )
+
+    def score(self, name: str, func: Callable[["AnalysisContext"], float]) -> float:
+        """Return ``func(self)``, memoized under ``name`` for this context."""
+        if name not in self._scores:
+            self._scores[name] = float(func(self))
+        return self._scores[name]
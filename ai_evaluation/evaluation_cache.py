@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+ai_evaluation/evaluation_cache.py — Content-addressed quality report cache.
+
+Quality reports are keyed by the canonical hash (generator.hashing.hash_data)
+of the workflow content plus the metric registry version, so an unchanged
+workflow is only evaluated once no matter how many pipeline stages ask for
+its score. The workflow's own ``evaluation`` block is excluded from the key:
+it is where reports are written, and no metric reads it.
+
+Two tiers:
+- a bounded in-memory LRU (per process)
+- an optional on-disk tier (one JSON file per key) that survives across
+  CLI runs
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ai_monitoring.structured_logger import log_event
+from generator.hashing import hash_data
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_CACHE_DIR = Path(".sswg_cache/evaluations")
+EXCLUDED_KEYS = frozenset({"evaluation"})
+
+
+def workflow_cache_key(workflow: Dict[str, Any], registry_version: str) -> str:
+    """Return the content-address for a workflow under a metric registry."""
+    content = {k: v for k, v in workflow.items() if k not in EXCLUDED_KEYS}
+    return hash_data({"registry": registry_version, "workflow": content})
+
+
+class EvaluationCache:
+    """Bounded LRU of quality reports with an optional on-disk tier."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached report for ``key``, or None."""
+        with self._lock:
+            report = self._entries.get(key)
+            if report is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return deepcopy(report)
+
+        report = self._read_disk(key)
+        with self._lock:
+            if report is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._store(key, report)
+        return deepcopy(report)
+
+    def put(self, key: str, report: Dict[str, Any]) -> None:
+        """Store a copy of ``report`` in memory and, if enabled, on disk."""
+        snapshot = deepcopy(report)
+        with self._lock:
+            self._store(key, snapshot)
+        self._write_disk(key, snapshot)
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset counters (disk tier is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "disk_tier": str(self.cache_dir) if self.cache_dir else None,
+            }
+
+    def log_stats(self, event: str = "mvm.evaluation_cache.stats") -> None:
+        """Emit the current counters through the structured logger."""
+        log_event(event, self.stats())
+
+    def _store(self, key: str, report: Dict[str, Any]) -> None:
+        self._entries[key] = report
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def _write_disk(self, key: str, report: Dict[str, Any]) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(report, handle, sort_keys=True)
+            os.replace(tmp_name, path)
+        except (OSError, TypeError, ValueError):
+            return
+
+
+_CACHE = EvaluationCache()
+
+
+def get_evaluation_cache() -> EvaluationCache:
+    """Return the process-wide evaluation cache."""
+    return _CACHE
+
+
+def configure_evaluation_cache(
+    *,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    cache_dir: Optional[Path] = None,
+) -> EvaluationCache:
+    """Replace the process-wide cache (e.g. to enable the disk tier)."""
+    global _CACHE
+    _CACHE = EvaluationCache(max_entries=max_entries, cache_dir=cache_dir)
+    return _CACHE
@@ -10,58 +10,175 @@ It exposes a single entrypoint:
     evaluate_workflow_quality(workflow: dict) -> dict
 
 which returns a structured result suitable to be attached under
-workflow["evaluation"]["quality"] or similar.
+workflow["evaluation"]["quality"] or similar. Reports are served from the
+content-addressed cache in `evaluation_cache.py` when the workflow and the
+metric registry are unchanged.
 """
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict
+import functools
+import inspect
+import time
+from typing import Any, Callable, Dict, Optional
+
+from ai_conductor.optimization_loader import load_optimization_map
+from ai_monitoring.metrics import get_metrics_registry
+from ai_monitoring.tracing import span
+from generator.hashing import hash_data
+from generator.workflow_view import to_plain
 
 from . import quality_metrics as qm
+from .analysis_context import AnalysisContext
+from .evaluation_cache import get_evaluation_cache, workflow_cache_key
 
 MetricFunc = Callable[[Dict[str, Any]], float]
+ContextMetricFunc = Callable[[AnalysisContext], float]
+
+
+# Registry of metric names -> context functions
+_METRICS: Dict[str, ContextMetricFunc] = {}
+_DEFAULTS_REGISTERED = False
+
+# Bump when built-in metric logic changes so cached reports are invalidated.
+METRIC_LOGIC_REVISION = 1
+_REGISTRY_VERSION: Optional[str] = None
+
+_EVALUATION_SECONDS = get_metrics_registry().histogram(
+    "sswg_evaluation_seconds",
+    "evaluate_workflow_quality wall time in seconds.",
+    ("cache",),
+)
+_EVALUATION_SCORE = get_metrics_registry().histogram(
+    "sswg_evaluation_score",
+    "Overall quality score per evaluation.",
+    buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
+)
+
+
+def legacy_metric(func: MetricFunc) -> ContextMetricFunc:
+    """
+    Adapt a `(workflow) -> float` metric to the context calling convention.
+    """
+
+    def wrapper(ctx: AnalysisContext) -> float:
+        return func(ctx.workflow)
+
+    # Also sets __wrapped__, which metric_registry_version hashes through.
+    return functools.update_wrapper(wrapper, func)
+
+
+def _metric_identity(func: Callable[..., float]) -> str:
+    """Identify a metric implementation, looking through wrappers."""
+    target = inspect.unwrap(func)
+    identity = (
+        f"{getattr(target, '__module__', '')}."
+        f"{getattr(target, '__qualname__', type(target).__qualname__)}"
+    )
+    code = getattr(target, "__code__", None)
+    if code is not None:
+        # Tell apart same-named callables (e.g. lambdas) and edited bodies.
+        identity += f"@{code.co_firstlineno}:{hash_data(code.co_code.hex())[:16]}"
+    return identity
+
+
+def register_metric(
+    name: str,
+    func: Callable[[Any], float],
+    *,
+    uses_context: bool = False,
+) -> None:
+    """
+    Add or replace a metric in the default registry.
+
+    Args:
+        name: Key under which the score is reported.
+        func: Metric function. Plain `(workflow) -> float` callables are
+            wrapped with `legacy_metric` unless `uses_context` is True.
+        uses_context: True if `func` takes an AnalysisContext.
+    """
+    global _REGISTRY_VERSION
+    _register_default_metrics()
+    _METRICS[name] = func if uses_context else legacy_metric(func)
+    _REGISTRY_VERSION = None
 
 
-# Registry of metric names -> functions
-_METRICS: Dict[str, MetricFunc] = {}
+def metric_registry_version() -> str:
+    """
+    Return a hash identifying the active metric registry.
+
+    Covers the metric names and implementations, METRIC_LOGIC_REVISION, and
+    the optimization ontology that the throughput metric reads.
+    """
+    global _REGISTRY_VERSION
+    _register_default_metrics()
+    if _REGISTRY_VERSION is None:
+        try:
+            ontology_hash = hash_data(load_optimization_map())
+        except (FileNotFoundError, ValueError, OSError):
+            ontology_hash = None
+        _REGISTRY_VERSION = hash_data(
+            {
+                "revision": METRIC_LOGIC_REVISION,
+                "metrics": [
+                    f"{name}:{_metric_identity(func)}"
+                    for name, func in _METRICS.items()
+                ],
+                "ontology": ontology_hash,
+            }
+        )
+    return _REGISTRY_VERSION
 
 
 def _register_default_metrics() -> None:
     """
     Register built-in metrics from quality_metrics.py.
 
-    This assumes that `quality_metrics.py` defines some or all of:
-        - coverage_metric(workflow) -> float
-        - coherence_metric(workflow) -> float
-        - specificity_metric(workflow) -> float
-
-    Missing functions are simply skipped.
+    This assumes that `quality_metrics.py` defines some or all of the
+    `*_from_context(ctx) -> float` metrics (clarity, coverage, coherence,
+    ...). Missing functions are simply skipped.
     """
-    global _METRICS
-    if _METRICS:
+    global _DEFAULTS_REGISTERED
+    if _DEFAULTS_REGISTERED:
         return  # already initialized
+    _DEFAULTS_REGISTERED = True
 
     candidates = {
-        "clarity": getattr(qm, "clarity_metric", None),
-        "coverage": getattr(qm, "coverage_metric", None),
-        "coherence": getattr(qm, "coherence_metric", None),
-        "completeness": getattr(qm, "completeness_metric", None),
-        "epistemic_optimization": getattr(qm, "epistemic_optimization_metric", None),
-        "intent_alignment": getattr(qm, "intent_alignment_metric", None),
-        "specificity": getattr(qm, "specificity_metric", None),
-        "throughput": getattr(qm, "throughput_metric", None),
-        "usability": getattr(qm, "usability_metric", None),
+        "clarity": getattr(qm, "clarity_from_context", None),
+        "coverage": getattr(qm, "coverage_from_context", None),
+        "coherence": getattr(qm, "coherence_from_context", None),
+        "completeness": getattr(qm, "completeness_from_context", None),
+        "epistemic_optimization": getattr(
+            qm, "epistemic_optimization_from_context", None
+        ),
+        "intent_alignment": getattr(qm, "intent_alignment_from_context", None),
+        "specificity": getattr(qm, "specificity_from_context", None),
+        "throughput": getattr(qm, "throughput_from_context", None),
+        "usability": getattr(qm, "usability_from_context", None),
     }
 
-    _METRICS = {name: func for name, func in candidates.items() if callable(func)}
+    for name, func in candidates.items():
+        if callable(func):
+            _METRICS.setdefault(name, func)
 
 
-def evaluate_workflow_quality(workflow: Dict[str, Any]) -> Dict[str, Any]:
+@span("evaluation.evaluate")
+def evaluate_workflow_quality(
+    workflow: Dict[str, Any],
+    context: Optional[AnalysisContext] = None,
+    *,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
     """
     Evaluate a workflow using the default quality metrics.
 
+    The workflow is analyzed once into an AnalysisContext that every metric
+    shares; composite metrics reuse component scores through it.
+
     Args:
         workflow: A schema-aligned workflow dict.
+        context: Optional prebuilt context for `workflow`.
+        use_cache: Look up / store the report in the evaluation cache.
 
     Returns:
         Dict with:
@@ -70,12 +187,32 @@ def evaluate_workflow_quality(workflow: Dict[str, Any]) -> Dict[str, Any]:
               "metrics": {name: float, ...}
             }
     """
+    started = time.perf_counter()
     _register_default_metrics()
+    # Metrics only read; a plain snapshot keeps copy-on-write views from
+    # materializing every container they walk.
+    workflow = to_plain(workflow)
+
+    cache_key: Optional[str] = None
+    if use_cache:
+        try:
+            cache_key = workflow_cache_key(workflow, metric_registry_version())
+        except (TypeError, ValueError):
+            cache_key = None  # non-JSON content; evaluate uncached
+    if cache_key is not None:
+        cached = get_evaluation_cache().get(cache_key)
+        if cached is not None:
+            _EVALUATION_SECONDS.labels(cache="hit").observe(
+                time.perf_counter() - started
+            )
+            return cached
+
+    ctx = context or AnalysisContext.from_workflow(workflow)
 
     metrics: Dict[str, float] = {}
     for name, func in _METRICS.items():
         try:
-            value = float(func(workflow))
+            value = ctx.score(name, func)
         except Exception:
             value = 0.0
         metrics[name] = value
@@ -85,7 +222,14 @@ def evaluate_workflow_quality(workflow: Dict[str, Any]) -> Dict[str, Any]:
     else:
         overall = 0.0
 
-    return {
+    report = {
         "overall_score": overall,
         "metrics": metrics,
     }
+    if cache_key is not None:
+        get_evaluation_cache().put(cache_key, report)
+    _EVALUATION_SECONDS.labels(cache="miss" if use_cache else "off").observe(
+        time.perf_counter() - started
+    )
+    _EVALUATION_SCORE.observe(overall)
+    return report
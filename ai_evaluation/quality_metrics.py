@@ -18,44 +18,37 @@ New MVM-style scalar metrics:
 - completeness_metric(workflow) -> float
 - intent_alignment_metric(workflow) -> float
 - usability_metric(workflow) -> float
+
+Each scalar metric has a `*_from_context(ctx)` counterpart that reads from a
+shared `AnalysisContext`; `evaluation_engine` uses those so a single
+evaluation walks and tokenizes the workflow once. The `(workflow) -> float`
+functions remain as thin wrappers for existing callers.
 """
 
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 from ai_conductor.optimization_loader import load_optimization_map
 from ai_optimization.optimization_engine import OptimizationEngine
 
 from ai_cores.evaluation_core import evaluate_clarity
+from .analysis_context import STOP_WORDS, AnalysisContext, tokenize
 from .semantic_analysis import SemanticAnalyzer
 
-_STOP_WORDS = {
-    "a",
-    "an",
-    "and",
-    "the",
-    "of",
-    "to",
-    "in",
-    "for",
-    "with",
-    "on",
-    "by",
-    "as",
-    "at",
-    "is",
-    "are",
-    "be",
-    "from",
-    "or",
-    "that",
-    "this",
-}
+_STOP_WORDS = STOP_WORDS
 
 _analyzer = SemanticAnalyzer()
-_optimization_engine = OptimizationEngine()
+_optimization_engine: OptimizationEngine | None = None
+
+
+def get_optimization_engine() -> OptimizationEngine:
+    """Load the optimization ontology on first use rather than at import."""
+    global _optimization_engine  # pylint: disable=global-statement
+    if _optimization_engine is None:
+        _optimization_engine = OptimizationEngine()
+    return _optimization_engine
 
 
 def _load_optimization_profile() -> Dict[str, Any]:
@@ -67,20 +60,24 @@ def _load_optimization_profile() -> Dict[str, Any]:
     return profile if isinstance(profile, dict) else {}
 
 
+def _context(wf: Dict[str, Any]) -> AnalysisContext:
+    return AnalysisContext.from_workflow(wf, _analyzer)
+
+
 # ---------------------------------------------------------------------- #
 # Legacy-style clarity evaluator (dict output)
 # ---------------------------------------------------------------------- #
 # ---------------------------------------------------------------------- #
-# Scalar metrics for evaluation_engine
+# Context metrics for evaluation_engine
 # ---------------------------------------------------------------------- #
-def clarity_metric(wf: Dict[str, Any]) -> float:
+def clarity_from_context(ctx: AnalysisContext) -> float:
     """
     Scalar clarity metric: just unwraps evaluate_clarity.
     """
-    return float(evaluate_clarity(wf).get("clarity_score", 0.0))
+    return float(evaluate_clarity(ctx.workflow).get("clarity_score", 0.0))
 
 
-def coverage_metric(wf: Dict[str, Any]) -> float:
+def coverage_from_context(ctx: AnalysisContext) -> float:
     """
     Rough coverage metric: fraction of phases that contain *some* text
     in either `ai_task_logic` or `description`.
@@ -88,24 +85,23 @@ def coverage_metric(wf: Dict[str, Any]) -> float:
     Returns:
         value in [0, 1]
     """
-    phases = [p for p in wf.get("phases", []) or [] if isinstance(p, dict)]
-    if not phases:
+    if not ctx.phases:
         return 0.0
 
     covered = 0
-    for ph in phases:
+    for ph in ctx.phases:
         text = ph.get("ai_task_logic") or ph.get("description") or ""
         if str(text).strip():
             covered += 1
 
-    return covered / len(phases)
+    return covered / len(ctx.phases)
 
 
-def coherence_metric(wf: Dict[str, Any]) -> float:
+def coherence_from_context(ctx: AnalysisContext) -> float:
     """
     Very crude coherence proxy based on redundancy of sentences:
 
-    - Extract text blocks using SemanticAnalyzer.
+    - Use the normalized sentences of the context's text blocks.
     - Estimate redundancy as unique_sentences / total_sentences.
     - Map redundancy → "coherence" by assuming:
         coherence = redundancy
@@ -117,13 +113,13 @@ def coherence_metric(wf: Dict[str, Any]) -> float:
     Returns:
         value in [0, 1]
     """
-    blocks: List[str] = _analyzer.extract_text_blocks(wf)
-    redundancy = _analyzer.estimate_redundancy(blocks)  # in [0, 1]
+    if not ctx.sentences:
+        return 1.0
     # For now, treat redundancy as coherence directly.
-    return redundancy
+    return len(set(ctx.sentences)) / len(ctx.sentences)
 
 
-def specificity_metric(wf: Dict[str, Any]) -> float:
+def specificity_from_context(ctx: AnalysisContext) -> float:
     """
     Specificity approximated by average length of text blocks.
 
@@ -141,12 +137,11 @@ def specificity_metric(wf: Dict[str, Any]) -> float:
     specific than ultra-short fragments, but this will be replaced by
     richer analysis later.
     """
-    blocks: List[str] = _analyzer.extract_text_blocks(wf)
-    avg_len = _analyzer.average_length(blocks)
+    avg_len = _analyzer.average_length(ctx.text_blocks)
     return max(0.0, min(1.0, avg_len / 500.0))
 
 
-def completeness_metric(wf: Dict[str, Any]) -> float:
+def completeness_from_context(ctx: AnalysisContext) -> float:
     """
     Completeness proxy based on presence of phases, tasks, and task contracts.
 
@@ -154,42 +149,33 @@ def completeness_metric(wf: Dict[str, Any]) -> float:
     - fraction of phases that contain at least one task
     - fraction of tasks that declare both prerequisites and expected outputs
     """
-    phases = [p for p in wf.get("phases", []) or [] if isinstance(p, dict)]
-    if not phases:
+    if not ctx.phases:
         return 0.0
 
-    phase_with_tasks = 0
-    total_tasks = 0
+    phase_with_tasks = sum(1 for phase in ctx.phases if phase.get("tasks"))
     task_with_contract = 0
 
-    for phase in phases:
-        tasks = phase.get("tasks", []) or []
-        if tasks:
-            phase_with_tasks += 1
-        for task in tasks:
-            if not isinstance(task, dict):
-                continue
-            total_tasks += 1
-            prerequisites = task.get("prerequisites") or task.get("inputs")
-            expected_outputs = task.get("expected_outputs") or task.get("outputs")
-            if prerequisites is not None and expected_outputs is not None:
-                task_with_contract += 1
+    for task in ctx.tasks:
+        prerequisites = task.get("prerequisites") or task.get("inputs")
+        expected_outputs = task.get("expected_outputs") or task.get("outputs")
+        if prerequisites is not None and expected_outputs is not None:
+            task_with_contract += 1
 
-    if total_tasks == 0:
+    if not ctx.tasks:
         task_score = 0.0
     else:
-        task_score = task_with_contract / total_tasks
+        task_score = task_with_contract / len(ctx.tasks)
 
-    phase_score = phase_with_tasks / len(phases)
+    phase_score = phase_with_tasks / len(ctx.phases)
     return (phase_score + task_score) / 2.0
 
 
-def intent_alignment_metric(wf: Dict[str, Any]) -> float:
+def intent_alignment_from_context(ctx: AnalysisContext) -> float:
     """
     Intent alignment proxy based on token overlap between workflow intent
     (metadata purpose/description) and phase/task descriptions.
     """
-    metadata = wf.get("metadata", {}) or {}
+    metadata = ctx.metadata
     intent_text = " ".join(
         [
             str(metadata.get("purpose", "")),
@@ -200,56 +186,33 @@ def intent_alignment_metric(wf: Dict[str, Any]) -> float:
     if not intent_text:
         return 0.0
 
-    def _tokens(text: str) -> set[str]:
-        return {
-            token
-            for token in "".join(
-                [ch.lower() if ch.isalnum() else " " for ch in text]
-            ).split()
-            if token and token not in _STOP_WORDS
-        }
-
-    intent_tokens = _tokens(intent_text)
-    if not intent_tokens:
-        return 0.0
-
-    blocks: List[str] = _analyzer.extract_text_blocks(wf)
-    content_tokens: set[str] = set()
-    for block in blocks:
-        content_tokens |= _tokens(block)
-
-    if not content_tokens:
+    intent_tokens = tokenize(intent_text)
+    if not intent_tokens or not ctx.content_tokens:
         return 0.0
 
-    overlap = intent_tokens.intersection(content_tokens)
+    overlap = intent_tokens.intersection(ctx.content_tokens)
     return len(overlap) / len(intent_tokens)
 
 
-def usability_metric(wf: Dict[str, Any]) -> float:
+def usability_from_context(ctx: AnalysisContext) -> float:
     """
     Usability proxy based on tasks declaring prerequisites and expected outputs.
     """
-    tasks: List[Dict[str, Any]] = []
-    for phase in wf.get("phases", []) or []:
-        if not isinstance(phase, dict):
-            continue
-        tasks.extend([t for t in phase.get("tasks", []) or [] if isinstance(t, dict)])
-
-    if not tasks:
+    if not ctx.tasks:
         return 0.0
 
     usable = 0
-    for task in tasks:
+    for task in ctx.tasks:
         prerequisites = task.get("prerequisites") or task.get("inputs")
         expected_outputs = task.get("expected_outputs") or task.get("outputs")
         description = task.get("description") or task.get("action")
         if prerequisites is not None and expected_outputs is not None and description:
             usable += 1
 
-    return usable / len(tasks)
+    return usable / len(ctx.tasks)
 
 
-def throughput_metric(wf: Dict[str, Any]) -> float:
+def throughput_from_context(ctx: AnalysisContext) -> float:
     """
     Deterministic throughput proxy based on optimization constants vs noise.
 
@@ -279,24 +242,29 @@ def throughput_metric(wf: Dict[str, Any]) -> float:
     return hardware_constraints / (1 + noise_factor)
 
 
-def epistemic_optimization_metric(wf: Dict[str, Any]) -> float:
+def epistemic_optimization_from_context(ctx: AnalysisContext) -> float:
     """
     Combine semantic verity with deterministic throughput signals.
 
     The score reflects the tri-layer optimization state while honoring
-    the entropy budget defined by the optimization ontology.
+    the entropy budget defined by the optimization ontology. Component
+    scores are read through ``ctx.score`` so they are reused when the
+    engine has already computed them.
     """
     semantic_score = (
-        clarity_metric(wf) + coherence_metric(wf) + specificity_metric(wf)
+        ctx.score("clarity", clarity_from_context)
+        + ctx.score("coherence", coherence_from_context)
+        + ctx.score("specificity", specificity_from_context)
     ) / 3.0
-    throughput_score = throughput_metric(wf)
+    throughput_score = ctx.score("throughput", throughput_from_context)
     deterministic_delta = abs(throughput_score - semantic_score)
 
-    optimization_state = _optimization_engine.compute_total_optimization(
+    engine = get_optimization_engine()
+    optimization_state = engine.compute_total_optimization(
         semantic_delta=semantic_score,
         deterministic_delta=deterministic_delta,
     )
-    entropy_budget = _optimization_engine.entropy_budget_alpha()
+    entropy_budget = engine.entropy_budget_alpha()
     if optimization_state.environmental_entropy > entropy_budget:
         return 0.0
 
@@ -310,4 +278,52 @@ def epistemic_optimization_metric(wf: Dict[str, Any]) -> float:
     )
 
 
+# ---------------------------------------------------------------------- #
+# Scalar (workflow -> float) wrappers
+# ---------------------------------------------------------------------- #
+def clarity_metric(wf: Dict[str, Any]) -> float:
+    """Scalar clarity metric; see clarity_from_context."""
+    return clarity_from_context(_context(wf))
+
+
+def coverage_metric(wf: Dict[str, Any]) -> float:
+    """Phase text coverage in [0, 1]; see coverage_from_context."""
+    return coverage_from_context(_context(wf))
+
+
+def coherence_metric(wf: Dict[str, Any]) -> float:
+    """Sentence-redundancy coherence in [0, 1]; see coherence_from_context."""
+    return coherence_from_context(_context(wf))
+
+
+def specificity_metric(wf: Dict[str, Any]) -> float:
+    """Block-length specificity in [0, 1]; see specificity_from_context."""
+    return specificity_from_context(_context(wf))
+
+
+def completeness_metric(wf: Dict[str, Any]) -> float:
+    """Phase/task contract completeness; see completeness_from_context."""
+    return completeness_from_context(_context(wf))
+
+
+def intent_alignment_metric(wf: Dict[str, Any]) -> float:
+    """Intent/content token overlap; see intent_alignment_from_context."""
+    return intent_alignment_from_context(_context(wf))
+
+
+def usability_metric(wf: Dict[str, Any]) -> float:
+    """Task usability ratio; see usability_from_context."""
+    return usability_from_context(_context(wf))
+
+
+def throughput_metric(wf: Dict[str, Any]) -> float:
+    """Ontology-derived throughput proxy; see throughput_from_context."""
+    return throughput_from_context(_context(wf))
+
+
+def epistemic_optimization_metric(wf: Dict[str, Any]) -> float:
+    """Tri-layer optimization score; see epistemic_optimization_from_context."""
+    return epistemic_optimization_from_context(_context(wf))
+
+
 # End of ai_evaluation/quality_metrics.py
@@ -11,6 +11,8 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, Iterable, List
 
+from generator.workflow_view import to_plain
+
 
 class SemanticAnalyzer:
     """
@@ -30,6 +32,7 @@ class SemanticAnalyzer:
         """
         Collect candidate text fields from metadata, phases, modules, outputs.
         """
+        workflow = to_plain(workflow)  # read-only walk
         blocks: List[str] = []
 
         meta = workflow.get("metadata", {}) or {}
@@ -78,7 +81,7 @@ class SemanticAnalyzer:
         """
         sentences: List[str] = []
         for b in blocks:
-            sentences.extend(self._split_sentences(b))
+            sentences.extend(self.split_sentences(b))
 
         if not sentences:
             return 1.0
@@ -91,10 +94,15 @@ class SemanticAnalyzer:
 
         return unique / total
 
+    def split_sentences(self, text: str) -> List[str]:
+        """
+        Split text on sentence terminators, dropping blank fragments.
+        """
+        return [s for s in self._sentence_splitter.split(text) if s.strip()]
+
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
     _sentence_splitter = re.compile(r"[.!?]+")
 
-    def _split_sentences(self, text: str) -> List[str]:
-        return [s for s in self._sentence_splitter.split(text) if s.strip()]
+    _split_sentences = split_sentences
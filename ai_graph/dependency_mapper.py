@@ -8,7 +8,9 @@ ai_cores.dependency_core.
 
 from __future__ import annotations
 
-from ai_cores.dependency_core import DependencyGraph
+from ai_cores.dependency_core import CycleResolution, DependencyGraph
+
+__all__ = ["CycleResolution", "DependencyGraph"]
 
 
 # End of ai_graph/dependency_graph.py
@@ -8,17 +8,98 @@ metrics into a persistent knowledge base. Used to:
 - Track diff complexity over time
 - Track clarity scores
 - Adapt regeneration thresholds based on historical performance
+
+Storage (for path=./data/feedback_log.jsonl):
+- feedback_log.jsonl        append-only, one record per cycle
+- feedback_log.stats.json   running aggregates (Welford mean/variance,
+                            EWMA) plus the log offset they cover
+- feedback_log.archive.jsonl.gz  records moved out by compaction
+
+Recording a cycle appends one line and rewrites the small sidecar, so its
+cost does not depend on how much history exists. If the process dies between
+the two writes, the next load folds the log tail past the stored offset back
+into the aggregates. Compaction (automatic past `compact_bytes`) archives all
+but the last `window` records without touching the aggregates. A legacy
+feedback_log.json (full rewrite format) seeds the log and aggregates once
+when no sidecar exists yet.
+
+Several processes (batch workers) may record into the same log. Every
+record, compaction and sidecar write holds an exclusive ``fcntl.flock`` on
+``feedback_log.lock`` and first reloads the sidecar and folds the log tail
+written by other processes, so the aggregates always cover the whole log.
 """
 
 from __future__ import annotations
 
+import gzip
 import json
+import math
 import os
-import statistics
+import threading
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional
 
+from ai_cores.export_core import write_bytes
 from ai_monitoring.structured_logger import get_logger, log_event
+from ai_monitoring.tracing import span
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+DEFAULT_WINDOW = 50
+DEFAULT_EWMA_SPAN = 20
+DEFAULT_COMPACT_BYTES = 4 * 1024 * 1024
+
+
+class RunningStats:
+    """Welford mean/variance plus an EWMA over a stream of floats."""
+
+    __slots__ = ("count", "mean", "m2", "ewma", "alpha")
+
+    def __init__(self, alpha: float) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.ewma: Optional[float] = None
+        self.alpha = alpha
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.ewma is None:
+            self.ewma = value
+        else:
+            self.ewma += self.alpha * (value - self.ewma)
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Sample variance; None until two values have been seen."""
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "ewma": self.ewma,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], alpha: float) -> "RunningStats":
+        stats = cls(alpha)
+        stats.count = int(data.get("count", 0))
+        stats.mean = float(data.get("mean", 0.0))
+        stats.m2 = float(data.get("m2", 0.0))
+        ewma = data.get("ewma")
+        stats.ewma = float(ewma) if ewma is not None else None
+        return stats
 
 
 class FeedbackIntegrator:
@@ -26,49 +107,169 @@ class FeedbackIntegrator:
     Persist and aggregate feedback from diff cycles and evaluations.
 
     Responsibilities:
-    - Store per-cycle records (diff size, clarity, regeneration flag).
-    - Maintain a history of clarity scores.
+    - Append per-cycle records (diff size, clarity, regeneration flag).
+    - Maintain running clarity / diff-size aggregates and a bounded window
+      of recent records (`recent_records`).
     - Adapt the regeneration threshold based on average clarity.
     """
 
-    def __init__(self, path: str = "./data/feedback_log.json") -> None:
-        self.path = path
+    def __init__(
+        self,
+        path: str = "./data/feedback_log.jsonl",
+        *,
+        window: int = DEFAULT_WINDOW,
+        ewma_span: int = DEFAULT_EWMA_SPAN,
+        compact_bytes: int = DEFAULT_COMPACT_BYTES,
+    ) -> None:
+        log_path = Path(path)
+        stem = log_path.name.split(".", 1)[0]
+        self.path = str(log_path.with_name(f"{stem}.jsonl"))
+        self.stats_path = log_path.with_name(f"{stem}.stats.json")
+        self.archive_path = log_path.with_name(f"{stem}.archive.jsonl.gz")
+        self.legacy_path = log_path.with_name(f"{stem}.json")
+        self.lock_path = log_path.with_name(f"{stem}.lock")
+        self.window = window
+        self.compact_bytes = compact_bytes
+        self.alpha = 2.0 / (ewma_span + 1)
         self.logger = get_logger("feedback")
-        self.feedback_data: Dict[str, Any] = self._load_feedback()
+        self.recent_records: Deque[Dict[str, Any]] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._load_feedback()
+
+    @property
+    def feedback_data(self) -> Dict[str, Any]:
+        return self._state
 
     # ---------------------- Internal Helpers ---------------------- #
 
-    def _load_feedback(self) -> Dict[str, Any]:
-        """Load or initialize persistent feedback data."""
-        if os.path.exists(self.path):
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock shared with other processes using the same log."""
+        if fcntl is None:
+            yield
+            return
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock_path.open("ab") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
             try:
-                with open(self.path, "r", encoding="utf-8") as file_handle:
-                    data = json.load(file_handle)
-                # Ensure minimal structure exists
-                data.setdefault("records", [])
-                data.setdefault("regeneration_threshold", 2)
-                data.setdefault("clarity_scores", [])
-                data.setdefault("average_clarity", None)
-                return data
-            except (OSError, json.JSONDecodeError):
-                # Corrupt or unreadable file → reset structure
-                pass
-
-        return {
-            "records": [],
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _reset(self) -> None:
+        self.clarity = RunningStats(self.alpha)
+        self.diff_size = RunningStats(self.alpha)
+        self.recent_records.clear()
+        self._log_bytes = 0
+        self._state: Dict[str, Any] = {
+            "total_cycles": 0,
+            "regenerations": 0,
             "regeneration_threshold": 2,
-            "clarity_scores": [],
             "average_clarity": None,
         }
 
+    def _load_feedback(self) -> Dict[str, Any]:
+        """Load the sidecar aggregates and replay any unaccounted log tail."""
+        with self._lock, self._file_lock():
+            self._sync()
+        return self._state
+
+    def _sync(self) -> None:
+        """Reload the shared state from disk; the file lock must be held."""
+        self._reset()
+        log_path = Path(self.path)
+        sidecar: Optional[Dict[str, Any]] = None
+        if self.stats_path.exists():
+            try:
+                sidecar = json.loads(self.stats_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                # Corrupt or unreadable sidecar → rebuild from the log
+                sidecar = None
+
+        if sidecar is not None:
+            self.clarity = RunningStats.from_dict(sidecar["clarity"], self.alpha)
+            self.diff_size = RunningStats.from_dict(sidecar["diff_size"], self.alpha)
+            self._log_bytes = int(sidecar.get("log_bytes", 0))
+            for key in self._state:
+                self._state[key] = sidecar.get(key, self._state[key])
+            self.recent_records.extend(sidecar.get("recent", []))
+        elif not log_path.exists() and self.legacy_path.exists():
+            self._import_legacy()
+
+        size = log_path.stat().st_size if log_path.exists() else 0
+        if size < self._log_bytes:
+            # Compacted (or truncated) without a sidecar update: the
+            # aggregates already cover what is left.
+            self._log_bytes = size
+            self._save_feedback()
+        elif size > self._log_bytes:
+            with log_path.open("rb") as handle:
+                handle.seek(self._log_bytes)
+                tail = handle.read()
+            consumed = tail.rfind(b"\n") + 1
+            for line in tail[:consumed].splitlines():
+                try:
+                    self._fold(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+            self._log_bytes += consumed
+            self._save_feedback()
+
+    def _import_legacy(self) -> None:
+        """Seed the JSONL log and aggregates from a legacy feedback_log.json."""
+        try:
+            legacy = json.loads(self.legacy_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        records = legacy.get("records", []) if isinstance(legacy, dict) else []
+        if not records:
+            return
+        self._append_lines(records)
+        log_event(
+            self.logger,
+            "feedback_legacy_imported",
+            {"source": str(self.legacy_path), "records": len(records)},
+        )
+
+    def _append_lines(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Append records; return the log offset just past them."""
+        data = "".join(
+            json.dumps(record, separators=(",", ":")) + "\n" for record in records
+        ).encode("utf-8")
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+            # O_APPEND leaves the offset at the end of our own write.
+            return os.lseek(fd, 0, os.SEEK_CUR)
+        finally:
+            os.close(fd)
+
+    def _fold(self, record: Dict[str, Any]) -> None:
+        """Apply one record to the running aggregates."""
+        state = self._state
+        state["total_cycles"] += 1
+        state["regenerations"] += int(bool(record.get("regeneration_triggered")))
+        self.diff_size.add(float(record.get("diff_size", 0)))
+        clarity_score = record.get("clarity_score")
+        if clarity_score is not None:
+            self.clarity.add(float(clarity_score))
+        self.recent_records.append(record)
+        self._recalculate_threshold()
+
     def _save_feedback(self) -> None:
-        """Persist current feedback data to disk."""
-        os.makedirs(os.path.dirname(self.path), exist_ok=True)
-        with open(self.path, "w", encoding="utf-8") as file_handle:
-            json.dump(self.feedback_data, file_handle, indent=2)
+        """Persist the aggregate sidecar (constant size)."""
+        sidecar = dict(self._state)
+        sidecar["clarity"] = self.clarity.to_dict()
+        sidecar["diff_size"] = self.diff_size.to_dict()
+        sidecar["log_bytes"] = self._log_bytes
+        sidecar["recent"] = list(self.recent_records)
+        data = json.dumps(sidecar, separators=(",", ":")).encode("utf-8")
+        write_bytes(data, self.stats_path, skip_unchanged=False)
 
     # ---------------------- Core Methods ---------------------- #
 
+    @span("persistence.feedback.record_cycle")
     def record_cycle(
         self,
         diff_summary: Dict[str, Any],
@@ -97,34 +298,31 @@ class FeedbackIntegrator:
             "modified_phases": len(diff_summary.get("modified_phases", [])),
         }
 
-        self.feedback_data["records"].append(record)
-        self.feedback_data["clarity_scores"].append(clarity_score)
-
         log_event(self.logger, "feedback_recorded", record)
 
-        self._recalculate_threshold()
-        self._save_feedback()
+        with self._lock, self._file_lock():
+            self._sync()
+            self._log_bytes = self._append_lines([record])
+            self._fold(record)
+            if self._log_bytes > self.compact_bytes:
+                self._compact()
+            self._save_feedback()
 
     def _recalculate_threshold(self) -> None:
         """
         Dynamically adjust regeneration threshold based on historical
-        clarity and diff complexity.
+        clarity (running mean over every recorded score).
 
         Assumes clarity_scores are in [0.0, 1.0]:
         - >= 0.9 → threshold = 3
         - >= 0.7 → threshold = 2
         - else   → threshold = 1
         """
-        raw_scores: List[Any] = self.feedback_data.get("clarity_scores", [])
-        # Filter out None and coerce to float so Pylance / statistics are happy
-        clarity_scores: List[float] = [
-            float(score) for score in raw_scores if score is not None
-        ]
-        if not clarity_scores:
+        if not self.clarity.count:
             return
 
-        average_clarity = statistics.mean(clarity_scores)
-        self.feedback_data["average_clarity"] = round(average_clarity, 3)
+        average_clarity = self.clarity.mean
+        self._state["average_clarity"] = round(average_clarity, 3)
 
         if average_clarity >= 0.9:
             threshold = 3
@@ -133,30 +331,81 @@ class FeedbackIntegrator:
         else:
             threshold = 1
 
-        self.feedback_data["regeneration_threshold"] = threshold
+        if threshold != self._state["regeneration_threshold"]:
+            log_event(
+                self.logger,
+                "threshold_adjusted",
+                {
+                    "new_threshold": threshold,
+                    "average_clarity": average_clarity,
+                },
+            )
+        self._state["regeneration_threshold"] = threshold
+
+    def compact(self) -> int:
+        """
+        Move all but the last `window` records into the gzip archive.
 
+        Aggregates are unaffected. Returns the number of records archived.
+        """
+        with self._lock, self._file_lock():
+            self._sync()
+            archived = self._compact()
+            self._save_feedback()
+        return archived
+
+    def _compact(self) -> int:
+        log_path = Path(self.path)
+        if not log_path.exists():
+            return 0
+        lines = log_path.read_bytes().splitlines(keepends=True)
+        keep = lines[-self.window :] if self.window else []
+        archived = lines[: len(lines) - len(keep)]
+        if archived:
+            with gzip.open(self.archive_path, "ab") as archive:
+                archive.writelines(archived)
+        kept = b"".join(keep)
+        write_bytes(kept, log_path, skip_unchanged=False)
+        self._log_bytes = len(kept)
         log_event(
             self.logger,
-            "threshold_adjusted",
-            {
-                "new_threshold": threshold,
-                "average_clarity": average_clarity,
-            },
+            "feedback_compacted",
+            {"archived": len(archived), "kept": len(keep)},
         )
+        return len(archived)
 
     # ---------------------- Accessor Methods ---------------------- #
 
     def get_summary(self) -> Dict[str, Any]:
         """Return current learning status."""
-        total_cycles = len(self.feedback_data.get("records", []))
-        average_clarity = self.feedback_data.get("average_clarity")
-        threshold = self.feedback_data.get("regeneration_threshold")
+        clarity_variance = self.clarity.variance
         return {
-            "total_cycles": total_cycles,
-            "average_clarity": average_clarity,
-            "adaptive_threshold": threshold,
+            "total_cycles": self._state["total_cycles"],
+            "average_clarity": self._state["average_clarity"],
+            "adaptive_threshold": self._state["regeneration_threshold"],
+            "clarity_stddev": (
+                round(math.sqrt(clarity_variance), 3)
+                if clarity_variance is not None
+                else None
+            ),
+            "clarity_ewma": (
+                round(self.clarity.ewma, 3) if self.clarity.ewma is not None else None
+            ),
+            "average_diff_size": round(self.diff_size.mean, 3),
+            "regenerations": self._state["regenerations"],
         }
 
+    def load_records(self) -> List[Dict[str, Any]]:
+        """Return archived and live records, oldest first (reads the full log)."""
+        records: List[Dict[str, Any]] = []
+        if self.archive_path.exists():
+            with gzip.open(self.archive_path, "rt", encoding="utf-8") as archive:
+                records.extend(json.loads(line) for line in archive if line.strip())
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as handle:
+                records.extend(json.loads(line) for line in handle if line.strip())
+        return records
+
 
 if __name__ == "__main__":
     integrator = FeedbackIntegrator()
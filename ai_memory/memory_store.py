@@ -2,24 +2,49 @@
 """
 ai_memory/memory_store.py — Persistent workflow storage for sswg-mvm.
 
-Provides a simple filesystem-backed store for workflow snapshots.
+Provides a filesystem-backed store for workflow snapshots.
 
 Design:
-- Each saved workflow becomes a JSON file in `path`.
-- Filenames are of the form: {workflow_id}_{YYYYMMDD_%H%M%S}.json
-- Optional helpers:
-    - list_files(workflow_id?) → list of paths
+- Storage is delegated to a backend from ai_memory/snapshot_store.py.
+  The default `ShardedSnapshotBackend` writes
+  ``<path>/<2 hex shard>/{workflow_id}_{snapshot_id}.json`` and indexes each
+  snapshot in ``<path>/snapshot_index.sqlite3``; `FlatFileBackend` keeps the
+  original ``{workflow_id}_{YYYYMMDD_HHMMSS}.json`` flat layout.
+- Flat snapshots left in `path` by older versions stay readable (found by
+  listing the directory when the index has no entry); index them once with
+  ``python -m scripts.migrate_memory_store``. The directory fallback is only
+  enabled while some of them are not indexed yet.
+- Helpers:
+    - list_files(workflow_id?) → list of paths, oldest first
     - load_latest(workflow_id) → most recent snapshot, if any
+    - snapshots(workflow_id?, since?, until?) → SnapshotRefs in a time range
 """
 
 from __future__ import annotations
 
 import json
-import os
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from ai_monitoring.structured_logger import get_logger, log_event
+from ai_monitoring.tracing import span
+from generator.workflow_view import to_plain
+
+from .snapshot_store import (
+    FlatFileBackend,
+    ShardedSnapshotBackend,
+    SnapshotBackend,
+    SnapshotRef,
+    has_unindexed_legacy_snapshots,
+)
+
+
+def _to_ns(moment: Optional[datetime]) -> Optional[int]:
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1_000_000_000)
 
 
 class MemoryStore:
@@ -27,22 +52,39 @@ class MemoryStore:
     Filesystem-backed store for workflow JSON snapshots.
 
     Responsibilities:
-    - Save workflow dicts to timestamped JSON files.
+    - Save workflow dicts as uniquely named JSON snapshots.
     - List stored files, optionally filtered by workflow_id.
     - Load the latest snapshot for a given workflow_id.
     """
 
-    def __init__(self, path: str = "./data/workflows") -> None:
+    def __init__(
+        self,
+        path: str = "./data/workflows",
+        backend: Optional[SnapshotBackend] = None,
+    ) -> None:
         self.path = path
-        os.makedirs(self.path, exist_ok=True)
+        self.backend = backend or ShardedSnapshotBackend(path)
         self.logger = get_logger("memory")
+        self._legacy: Optional[FlatFileBackend] = None
+        if isinstance(self.backend, ShardedSnapshotBackend):
+            if has_unindexed_legacy_snapshots(self.backend):
+                self._legacy = FlatFileBackend(path, snapshots_only=True)
+                log_event(
+                    self.logger,
+                    "memory_legacy_layout",
+                    {
+                        "path": path,
+                        "hint": "python -m scripts.migrate_memory_store",
+                    },
+                )
 
     # ------------------------------------------------------------------ #
     # Core persistence
     # ------------------------------------------------------------------ #
+    @span("persistence.memory_store.save")
     def save(self, workflow: Dict[str, Any]) -> str:
         """
-        Persist a workflow dict to disk as a timestamped JSON file.
+        Persist a workflow dict to disk as a new JSON snapshot.
 
         Args:
             workflow: Workflow dict containing at least "workflow_id".
@@ -51,51 +93,61 @@ class MemoryStore:
             The path of the written JSON file.
         """
         workflow_id = str(workflow.get("workflow_id", "unnamed"))
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        filename = f"{workflow_id}_{timestamp}.json"
-        file_path = os.path.join(self.path, filename)
-
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as file_handle:
-            json.dump(workflow, file_handle, indent=2)
+        data = json.dumps(to_plain(workflow), indent=2).encode("utf-8")
+        ref = self.backend.save(workflow_id, data)
 
         log_event(
             self.logger,
             "memory_save",
-            {"workflow_id": workflow_id, "file": file_path},
+            {
+                "workflow_id": workflow_id,
+                "file": ref.path,
+                "snapshot_id": ref.snapshot_id,
+            },
         )
-        return file_path
+        return ref.path
 
     # ------------------------------------------------------------------ #
     # Convenience helpers
     # ------------------------------------------------------------------ #
+    def snapshots(
+        self,
+        workflow_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[SnapshotRef]:
+        """
+        Return snapshots created within [since, until], oldest first.
+
+        Naive datetimes are taken as UTC.
+        """
+        refs = self.backend.list(
+            workflow_id, since_ns=_to_ns(since), until_ns=_to_ns(until)
+        )
+        if self._legacy is not None:
+            indexed = {ref.path for ref in refs}
+            legacy = [
+                ref
+                for ref in self._legacy.list(
+                    workflow_id, since_ns=_to_ns(since), until_ns=_to_ns(until)
+                )
+                if ref.path not in indexed
+            ]
+            if legacy:
+                refs = sorted(legacy + refs, key=lambda ref: ref.created_ns)
+        return refs
+
     def list_files(self, workflow_id: Optional[str] = None) -> List[str]:
         """
         List stored workflow JSON files.
 
         Args:
-            workflow_id: If provided, only return files whose name starts
-                         with this workflow_id prefix.
+            workflow_id: If provided, only return snapshots of this workflow.
 
         Returns:
-            Sorted list of file paths.
+            File paths ordered by snapshot creation time.
         """
-        if not os.path.isdir(self.path):
-            return []
-
-        files = [
-            os.path.join(self.path, filename)
-            for filename in os.listdir(self.path)
-            if filename.endswith(".json")
-        ]
-
-        if workflow_id is not None:
-            prefix = f"{workflow_id}_"
-            files = [
-                path for path in files if os.path.basename(path).startswith(prefix)
-            ]
-
-        return sorted(files)
+        return [ref.path for ref in self.snapshots(workflow_id)]
 
     def load_latest(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -104,11 +156,13 @@ class MemoryStore:
         Returns:
             Workflow dict or None if no matching file exists / load fails.
         """
-        candidates = self.list_files(workflow_id)
-        if not candidates:
+        ref = self.backend.latest(workflow_id)
+        if ref is None and self._legacy is not None:
+            ref = self._legacy.latest(workflow_id)
+        if ref is None:
             return None
 
-        latest_path = candidates[-1]
+        latest_path = ref.path
         try:
             with open(latest_path, "r", encoding="utf-8") as file_handle:
                 workflow_data: Dict[str, Any] = json.load(file_handle)
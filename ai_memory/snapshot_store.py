@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+ai_memory/snapshot_store.py — Storage backends for MemoryStore snapshots.
+
+Two backends share one small interface (`SnapshotBackend`):
+
+- `ShardedSnapshotBackend` (default): snapshot files live in hash-prefix
+  shard directories (``<root>/<2 hex>/<workflow_id>_<snapshot_id>.json``)
+  and an append-only SQLite index in WAL mode (``<root>/snapshot_index.sqlite3``)
+  maps workflow_id → snapshots ordered by creation time. A ``heads`` table
+  keeps the newest snapshot per workflow, so ``latest()`` is one primary-key
+  lookup; time-range queries use the (workflow_id, created_ns) index.
+- `FlatFileBackend`: the original layout (one ``{workflow_id}_{timestamp}``
+  file per snapshot in a flat directory, found by listing it).
+
+Snapshot ids are ``<created_ns>-<pid>``: created_ns is strictly increasing
+within a process and the pid keeps concurrent writers apart, so parallel
+saves never collide. `index_flat_directory` registers existing flat
+snapshots in the index (see scripts/migrate_memory_store.py).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ai_cores.export_core import write_bytes
+
+INDEX_FILENAME = "snapshot_index.sqlite3"
+SHARD_WIDTH = 2
+_LEGACY_NAME = re.compile(r"^(?P<workflow_id>.+)_(?P<stamp>\d{8}_\d{6})\.json$")
+
+__all__ = [
+    "FlatFileBackend",
+    "ShardedSnapshotBackend",
+    "SnapshotBackend",
+    "SnapshotRef",
+    "has_unindexed_legacy_snapshots",
+    "index_flat_directory",
+    "is_legacy_snapshot",
+]
+
+
+@dataclass(frozen=True)
+class SnapshotRef:
+    """Location and ordering key of one stored snapshot."""
+
+    snapshot_id: str
+    workflow_id: str
+    created_ns: int
+    path: str
+
+
+class SnapshotBackend:
+    """Interface implemented by MemoryStore backends."""
+
+    root: Path
+
+    def save(self, workflow_id: str, data: bytes) -> SnapshotRef:
+        raise NotImplementedError
+
+    def latest(self, workflow_id: str) -> Optional[SnapshotRef]:
+        raise NotImplementedError
+
+    def list(
+        self,
+        workflow_id: Optional[str] = None,
+        *,
+        since_ns: Optional[int] = None,
+        until_ns: Optional[int] = None,
+    ) -> List[SnapshotRef]:
+        """Snapshots in creation order, optionally within [since_ns, until_ns]."""
+        raise NotImplementedError
+
+
+def _safe_name(workflow_id: str) -> str:
+    return workflow_id.replace(os.sep, "_").replace("/", "_")
+
+
+class _SnapshotClock:
+    """Strictly increasing nanosecond timestamps for this process."""
+
+    def __init__(self) -> None:
+        self._last = 0
+        self._lock = threading.Lock()
+
+    def next_ns(self) -> int:
+        with self._lock:
+            self._last = max(time.time_ns(), self._last + 1)
+            return self._last
+
+
+_CLOCK = _SnapshotClock()
+
+
+# ─── Legacy flat directory ───────────────────────────────────────
+
+
+def is_legacy_snapshot(path: str | os.PathLike[str]) -> bool:
+    """
+    True if ``path`` is named like a flat-layout snapshot
+    (``{workflow_id}_{YYYYMMDD_HHMMSS}.json``). Other JSON files in the
+    store root, such as tracked workflow sources, are not snapshots.
+    """
+    return _LEGACY_NAME.match(Path(path).name) is not None
+
+
+def _legacy_snapshot_id(path: Path) -> str:
+    return f"legacy-{path.stem}"
+
+
+def has_unindexed_legacy_snapshots(backend: ShardedSnapshotBackend) -> bool:
+    """
+    True if the backend root directly contains flat-layout snapshot files
+    that `index_flat_directory` has not registered yet.
+    """
+    ids = {
+        _legacy_snapshot_id(path)
+        for path in backend.root.glob("*.json")
+        if is_legacy_snapshot(path)
+    }
+    return bool(ids - backend.indexed_ids(ids))
+
+
+def _legacy_created_ns(path: Path) -> int:
+    match = _LEGACY_NAME.match(path.name)
+    if match:
+        stamp = datetime.strptime(match.group("stamp"), "%Y%m%d_%H%M%S")
+        return int(stamp.replace(tzinfo=timezone.utc).timestamp()) * 1_000_000_000
+    return path.stat().st_mtime_ns
+
+
+class FlatFileBackend(SnapshotBackend):
+    """
+    Original layout: every snapshot in one directory, found by listing it.
+
+    With ``snapshots_only`` only files named like snapshots are listed
+    (see `is_legacy_snapshot`); otherwise every ``*.json`` file is.
+    """
+
+    def __init__(
+        self, root: str | os.PathLike[str], *, snapshots_only: bool = False
+    ) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.snapshots_only = snapshots_only
+
+    def save(self, workflow_id: str, data: bytes) -> SnapshotRef:
+        created_ns = _CLOCK.next_ns()
+        stamp = datetime.fromtimestamp(created_ns / 1e9, timezone.utc)
+        name = f"{_safe_name(workflow_id)}_{stamp:%Y%m%d_%H%M%S}.json"
+        path = self.root / name
+        write_bytes(data, path, skip_unchanged=False)
+        return SnapshotRef(name[:-5], workflow_id, created_ns, str(path))
+
+    def list(
+        self,
+        workflow_id: Optional[str] = None,
+        *,
+        since_ns: Optional[int] = None,
+        until_ns: Optional[int] = None,
+    ) -> List[SnapshotRef]:
+        if not self.root.is_dir():
+            return []
+        prefix = f"{_safe_name(workflow_id)}_" if workflow_id is not None else ""
+        refs = []
+        for name in sorted(os.listdir(self.root)):
+            if not name.endswith(".json") or not name.startswith(prefix):
+                continue
+            path = self.root / name
+            match = _LEGACY_NAME.match(name)
+            if match is None and self.snapshots_only:
+                continue
+            owner = workflow_id or (match.group("workflow_id") if match else name[:-5])
+            created_ns = _legacy_created_ns(path)
+            if since_ns is not None and created_ns < since_ns:
+                continue
+            if until_ns is not None and created_ns > until_ns:
+                continue
+            refs.append(SnapshotRef(name[:-5], owner, created_ns, str(path)))
+        return refs
+
+    def latest(self, workflow_id: str) -> Optional[SnapshotRef]:
+        refs = self.list(workflow_id)
+        return refs[-1] if refs else None
+
+
+# ─── Sharded + indexed ───────────────────────────────────────────
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    snapshot_id TEXT NOT NULL UNIQUE,
+    workflow_id TEXT NOT NULL,
+    created_ns INTEGER NOT NULL,
+    relpath TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_by_workflow
+    ON snapshots (workflow_id, created_ns, seq);
+CREATE INDEX IF NOT EXISTS snapshots_by_time ON snapshots (created_ns, seq);
+CREATE TABLE IF NOT EXISTS heads (
+    workflow_id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    created_ns INTEGER NOT NULL
+);
+"""
+
+_ADVANCE_HEAD = """
+INSERT INTO heads (workflow_id, seq, created_ns) VALUES (?, ?, ?)
+ON CONFLICT (workflow_id) DO UPDATE SET
+    seq = excluded.seq, created_ns = excluded.created_ns
+WHERE (excluded.created_ns, excluded.seq) > (heads.created_ns, heads.seq)
+"""
+
+
+class ShardedSnapshotBackend(SnapshotBackend):
+    """
+    Hash-prefix sharded snapshot files plus an append-only SQLite (WAL) index.
+
+    Connections are per thread; SQLite serializes writers across threads and
+    processes, so each save is one short insert transaction after the file is
+    in place.
+    """
+
+    def __init__(self, root: str | os.PathLike[str]) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / INDEX_FILENAME
+        self._local = threading.local()
+        self._pid = os.getpid()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.index_path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._pid = os.getpid()
+        return conn
+
+    def shard_for(self, workflow_id: str) -> str:
+        digest = hashlib.sha1(workflow_id.encode("utf-8")).hexdigest()
+        return digest[:SHARD_WIDTH]
+
+    def save(self, workflow_id: str, data: bytes) -> SnapshotRef:
+        created_ns = _CLOCK.next_ns()
+        snapshot_id = f"{created_ns:019d}-{os.getpid()}"
+        shard = self.shard_for(workflow_id)
+        relpath = f"{shard}/{_safe_name(workflow_id)}_{snapshot_id}.json"
+        path = self.root / relpath
+        write_bytes(data, path, skip_unchanged=False)
+        self.register(snapshot_id, workflow_id, created_ns, relpath)
+        return SnapshotRef(snapshot_id, workflow_id, created_ns, str(path))
+
+    def register(
+        self, snapshot_id: str, workflow_id: str, created_ns: int, relpath: str
+    ) -> bool:
+        """Index an existing snapshot file; False if the id is already known."""
+        row = (snapshot_id, workflow_id, created_ns, relpath)
+        return self.register_many([row]) == 1
+
+    def register_many(self, rows: Iterable[Tuple[str, str, int, str]]) -> int:
+        """Index several snapshot files in one transaction; returns rows added."""
+        added = 0
+        with self._connect() as conn:
+            for snapshot_id, workflow_id, created_ns, relpath in rows:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO snapshots (snapshot_id, workflow_id,"
+                    " created_ns, relpath) VALUES (?, ?, ?, ?)",
+                    (snapshot_id, workflow_id, created_ns, relpath),
+                )
+                if cursor.rowcount:
+                    added += 1
+                    conn.execute(
+                        _ADVANCE_HEAD, (workflow_id, cursor.lastrowid, created_ns)
+                    )
+        return added
+
+    def _ref(self, row: Tuple[str, str, int, str]) -> SnapshotRef:
+        snapshot_id, workflow_id, created_ns, relpath = row
+        path = str(self.root / relpath)
+        return SnapshotRef(snapshot_id, workflow_id, created_ns, path)
+
+    def latest(self, workflow_id: str) -> Optional[SnapshotRef]:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT s.snapshot_id, s.workflow_id, s.created_ns, s.relpath "
+                "FROM heads h JOIN snapshots s ON s.seq = h.seq "
+                "WHERE h.workflow_id = ?",
+                (workflow_id,),
+            )
+            .fetchone()
+        )
+        return self._ref(row) if row else None
+
+    def list(
+        self,
+        workflow_id: Optional[str] = None,
+        *,
+        since_ns: Optional[int] = None,
+        until_ns: Optional[int] = None,
+    ) -> List[SnapshotRef]:
+        clauses, params = [], []  # type: ignore[var-annotated]
+        if workflow_id is not None:
+            clauses.append("workflow_id = ?")
+            params.append(workflow_id)
+        if since_ns is not None:
+            clauses.append("created_ns >= ?")
+            params.append(since_ns)
+        if until_ns is not None:
+            clauses.append("created_ns <= ?")
+            params.append(until_ns)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        rows = self._connect().execute(
+            "SELECT snapshot_id, workflow_id, created_ns, relpath FROM snapshots "
+            f"{where}ORDER BY created_ns, seq",
+            params,
+        )
+        return [self._ref(row) for row in rows]
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    def indexed_ids(self, snapshot_ids: Iterable[str]) -> Set[str]:
+        """Return the subset of ``snapshot_ids`` already in the index."""
+        ids = list(snapshot_ids)
+        found: Set[str] = set()
+        conn = self._connect()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT snapshot_id FROM snapshots WHERE snapshot_id IN ({marks})",
+                chunk,
+            )
+            found.update(row[0] for row in rows)
+        return found
+
+
+def index_flat_directory(
+    backend: ShardedSnapshotBackend,
+    source: str | os.PathLike[str] | None = None,
+    *,
+    move: bool = False,
+) -> Dict[str, int]:
+    """
+    Register flat-layout snapshots (default: in the backend root) in the
+    sharded index. Files stay in place unless ``move`` is set, in which case
+    they are moved into their shard directory first.
+
+    Only ``{workflow_id}_{YYYYMMDD_HHMMSS}.json`` files are snapshots; any
+    other ``*.json`` file is counted as skipped and never read or moved. The
+    workflow id comes from the file's ``workflow_id`` field, falling back to
+    the name. Re-running is safe: known snapshot ids are skipped.
+    """
+    source_dir = Path(source) if source is not None else backend.root
+    stats = {"scanned": 0, "indexed": 0, "skipped": 0, "moved": 0}
+    rows: List[Tuple[str, str, int, str]] = []
+    for path in sorted(source_dir.glob("*.json")):
+        stats["scanned"] += 1
+        match = _LEGACY_NAME.match(path.name)
+        if match is None:
+            stats["skipped"] += 1
+            continue
+        try:
+            payload: Any = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            stats["skipped"] += 1
+            continue
+        workflow_id = payload.get("workflow_id") if isinstance(payload, dict) else None
+        workflow_id = str(workflow_id or match.group("workflow_id"))
+        created_ns = _legacy_created_ns(path)
+        snapshot_id = _legacy_snapshot_id(path)
+        if move:
+            target = backend.root / backend.shard_for(workflow_id) / path.name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, target)
+            path = target
+            stats["moved"] += 1
+        rows.append(
+            (snapshot_id, workflow_id, created_ns, os.path.relpath(path, backend.root))
+        )
+    stats["indexed"] = backend.register_many(rows)
+    return stats
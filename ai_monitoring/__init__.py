@@ -7,6 +7,8 @@ Public surface (MVM level):
 - log_event(...) from structured_logger
 - CLIDashboard for quick TUI summaries
 - TelemetryLogger for lightweight structured event logging
+- get_metrics_registry / TextfileExporter for counters, gauges, histograms
+- span / get_tracer for hierarchical timing traces
 - performance alert helpers (latency / error-rate oriented)
 """
 #!/usr/bin/env python3
@@ -15,9 +17,14 @@ from __future__ import annotations
 
 from .structured_logger import log_event
 from .telemetry import TelemetryLogger
+from .metrics import TextfileExporter, get_metrics_registry
+from .tracing import get_tracer, span
 from .performance_alerts import (
     check_latency_threshold,
     check_error_rate_threshold,
+    check_metric_error_rate,
+    check_metric_latency,
+    check_metric_threshold,
 )
 
 # CLIDashboard imported lazily in get_cli_dashboard to avoid hard dependency
@@ -27,8 +34,15 @@ from .performance_alerts import (
 __all__ = [
     "log_event",
     "TelemetryLogger",
+    "TextfileExporter",
+    "get_metrics_registry",
+    "get_tracer",
+    "span",
     "check_latency_threshold",
     "check_error_rate_threshold",
+    "check_metric_error_rate",
+    "check_metric_latency",
+    "check_metric_threshold",
     "get_cli_dashboard",
 ]
 
@@ -0,0 +1,505 @@
+"""Conductor agent: delegates exclusively to ai_cores.module_core per AGENTS.md §19.7.
+
+ai_monitoring/metrics.py — In-process metrics registry for sswg-mvm.
+
+Counters, gauges and fixed-bucket histograms with optional labels, kept in
+a process-wide registry:
+
+    from ai_monitoring.metrics import get_metrics_registry
+
+    validations = get_metrics_registry().counter(
+        "sswg_validations", "Validator calls.", ("validator", "result")
+    )
+    validations.labels(validator="workflow_schema", result="pass").inc()
+
+Declaring a metric is get-or-create, so modules can declare the same name
+independently (same type and labels). Every value has its own lock, so
+updates are thread-safe and cheap. A forked child process starts with
+empty values instead of re-reporting its parent's counts.
+
+`TextfileExporter` writes the registry in the Prometheus text exposition
+format (what the node-exporter textfile collector and OpenMetrics scrapers
+read), atomically, on an interval. No network service is involved.
+`ai_monitoring.performance_alerts` evaluates thresholds against the values
+directly.
+"""
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import bisect
+import math
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ai_cores.export_core import write_bytes
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_TEXTFILE_PATH = Path("artifacts/metrics/sswg.prom")
+DEFAULT_EXPORT_INTERVAL = 15.0
+
+_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+LabelValues = Tuple[str, ...]
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "TextfileExporter",
+    "get_metrics_registry",
+]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n")
+
+
+def _label_text(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+# ─── Values ──────────────────────────────────────────────────────
+
+
+class _CounterValue:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeValue:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = float(value)
+
+
+class _HistogramValue:
+    __slots__ = ("_lock", "_bounds", "bucket_counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self._lock = threading.Lock()
+        self._bounds = bounds
+        self.bucket_counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall time (seconds) of the ``with`` block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self.bucket_counts), self.sum, self.count
+
+
+# ─── Metric families ─────────────────────────────────────────────
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str]
+    ) -> None:
+        if not _NAME_RE.match(name):
+            raise ValueError(f"Invalid metric name: {name!r}")
+        for label in labelnames:
+            if not _LABEL_RE.match(label) or label == "le":
+                raise ValueError(f"Invalid label name for {name}: {label!r}")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._children: Dict[LabelValues, Any] = {}
+        self._lock = threading.Lock()
+
+    def _new_value(self) -> Any:
+        raise NotImplementedError
+
+    def labels(self, **labels: object) -> Any:
+        """Return the value for one label set, creating it on first use."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {list(self.labelnames)}, "
+                f"got {sorted(labels)}"
+            )
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_value())
+        return child
+
+    def _unlabelled(self) -> Any:
+        if self.labelnames:
+            raise ValueError(f"{self.name} is labelled; call labels() first")
+        return self.labels()
+
+    def _matching(self, match: Dict[str, object]) -> List[Tuple[LabelValues, Any]]:
+        unknown = set(match) - set(self.labelnames)
+        if unknown:
+            raise ValueError(f"{self.name} has no labels {sorted(unknown)}")
+        wanted = {self.labelnames.index(k): str(v) for k, v in match.items()}
+        with self._lock:
+            items = list(self._children.items())
+        return [
+            (key, child)
+            for key, child in items
+            if all(key[index] == value for index, value in wanted.items())
+        ]
+
+    def _sorted(self) -> List[Tuple[LabelValues, Any]]:
+        return sorted(self._matching({}), key=lambda item: item[0])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children.clear()
+
+    def _reset_after_fork(self) -> None:
+        # Another thread may have held the lock at fork time.
+        self._lock = threading.Lock()
+        self._children = {}
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter, exposed as ``<name>_total``."""
+
+    kind = "counter"
+
+    def _new_value(self) -> _CounterValue:
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def total(self, **match: object) -> float:
+        """Sum over every label set matching ``match`` (all if empty)."""
+        return sum(child.value for _, child in self._matching(match))
+
+    def render(self) -> List[str]:
+        name = f"{self.name}_total"
+        lines = [
+            f"# HELP {name} {_escape_help(self.documentation)}",
+            f"# TYPE {name} counter",
+        ]
+        for key, child in self._sorted():
+            labels = _label_text(self.labelnames, key)
+            lines.append(f"{name}{labels} {_format_value(child.value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def _new_value(self) -> _GaugeValue:
+        return _GaugeValue()
+
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabelled().dec(amount)
+
+    def value(self, **labels: object) -> Optional[float]:
+        """Current value for an exact label set, or None if never set."""
+        key = tuple(str(labels.get(name)) for name in self.labelnames)
+        child = self._children.get(key) if set(labels) == set(self.labelnames) else None
+        return None if child is None else child.value
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.documentation)}",
+            f"# TYPE {self.name} gauge",
+        ]
+        for key, child in self._sorted():
+            labels = _label_text(self.labelnames, key)
+            lines.append(f"{self.name}{labels} {_format_value(child.value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram (bucket upper bounds, seconds by convention)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        bounds = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+        if not bounds:
+            raise ValueError(f"{name} needs at least one finite bucket")
+        self.buckets = bounds
+
+    def _new_value(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+    def time(self) -> ContextManager[None]:
+        return self._unlabelled().time()
+
+    def stats(self, **match: object) -> Tuple[int, float]:
+        """(count, sum) over every label set matching ``match``."""
+        count, total = 0, 0.0
+        for _, child in self._matching(match):
+            _, child_sum, child_count = child.snapshot()
+            count += child_count
+            total += child_sum
+        return count, total
+
+    def mean(self, **match: object) -> Optional[float]:
+        count, total = self.stats(**match)
+        return total / count if count else None
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.documentation)}",
+            f"# TYPE {self.name} histogram",
+        ]
+        names = self.labelnames + ("le",)
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for key, child in self._sorted():
+            counts, total, count = child.snapshot()
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                labels = _label_text(names, key + (bound,))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _label_text(self.labelnames, key)
+            lines.append(f"{self.name}_count{labels} {count}")
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        return lines
+
+
+# ─── Registry ────────────────────────────────────────────────────
+
+
+Metric = Union[Counter, Gauge, Histogram]
+
+
+class MetricsRegistry:
+    """Named metric families; declaring an existing name returns it."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _declare(self, cls: type, name: str, *args: object) -> Metric:
+        if cls is Counter and name.endswith("_total"):
+            name = name[: -len("_total")]
+        existing = self._metrics.get(name)
+        if existing is None:
+            with self._lock:
+                existing = self._metrics.get(name)
+                if existing is None:
+                    existing = self._metrics[name] = cls(name, *args)
+                    return existing
+        labelnames = tuple(args[1])  # type: ignore[arg-type]
+        if type(existing) is not cls or existing.labelnames != labelnames:
+            raise ValueError(
+                f"Metric {name} already declared as {existing.kind} "
+                f"with labels {list(existing.labelnames)}"
+            )
+        return existing
+
+    def counter(
+        self, name: str, documentation: str = "", labelnames: Sequence[str] = ()
+    ) -> Counter:
+        metric = self._declare(Counter, name, documentation, labelnames)
+        return metric  # type: ignore[return-value]
+
+    def gauge(
+        self, name: str, documentation: str = "", labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        metric = self._declare(Gauge, name, documentation, labelnames)
+        return metric  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str = "",
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = self._declare(Histogram, name, documentation, labelnames, buckets)
+        return metric  # type: ignore[return-value]
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Return a declared metric (counters by base name or ``_total``)."""
+        metric = self._metrics.get(name)
+        if metric is None and name.endswith("_total"):
+            metric = self._metrics.get(name[: -len("_total")])
+        return metric
+
+    def reset(self) -> None:
+        """Drop every recorded value; declarations are kept."""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+    def _reset_after_fork(self) -> None:
+        self._lock = threading.Lock()
+        for metric in list(self._metrics.values()):
+            metric._reset_after_fork()  # pylint: disable=protected-access
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class TextfileExporter:
+    """
+    Periodically write a registry to a ``.prom`` text file.
+
+    Each write goes to a temp file in the target directory and is renamed
+    into place, so a scraper never reads a partial file; unchanged content
+    is not rewritten. ``stop()`` performs a final write.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_TEXTFILE_PATH,
+        *,
+        registry: Optional[MetricsRegistry] = None,
+        interval: float = DEFAULT_EXPORT_INTERVAL,
+    ) -> None:
+        self.path = Path(path)
+        self.registry = registry or get_metrics_registry()
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self) -> bool:
+        """Write the current values now; returns False if unchanged."""
+        return write_bytes(self.registry.render().encode("utf-8"), self.path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def start(self) -> "TextfileExporter":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="sswg-metrics-textfile", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+        self.write()
+
+
+_REGISTRY = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _REGISTRY
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        after_in_child=_REGISTRY._reset_after_fork  # pylint: disable=protected-access
+    )
+
+# End of ai_monitoring/metrics.py
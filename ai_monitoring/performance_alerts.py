@@ -5,13 +5,19 @@ ai_monitoring/performance_alerts.py — Simple performance checks for sswg-mvm.
 This module provides small, composable helpers to check basic performance
 conditions such as latency and error rate. It is intentionally lightweight
 and side-effect free; callers decide how to emit logs or alerts.
+
+The ``check_metric_*`` variants read their inputs straight from the
+metrics registry (ai_monitoring/metrics.py) instead of caller-supplied
+numbers.
 """
 #!/usr/bin/env python3
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, replace
+from typing import Any, Optional
+
+from .metrics import Counter, Gauge, Histogram, MetricsRegistry, get_metrics_registry
 
 
 @dataclass
@@ -81,4 +87,74 @@ def check_error_rate_threshold(
     )
 
 
+def _metric(name: str, registry: Optional[MetricsRegistry], kinds: tuple) -> Any:
+    metric = (registry or get_metrics_registry()).get(name)
+    if not isinstance(metric, kinds):
+        expected = "/".join(kind.__name__.lower() for kind in kinds)
+        raise ValueError(f"No {expected} named {name!r} in the registry")
+    return metric
+
+
+def check_metric_latency(
+    name: str,
+    max_ms: float,
+    *,
+    registry: Optional[MetricsRegistry] = None,
+    **labels: str,
+) -> AlertResult:
+    """
+    Check the mean of a seconds histogram (optionally one label subset)
+    against a latency ceiling in milliseconds.
+    """
+    histogram = _metric(name, registry, (Histogram,))
+    mean_s = histogram.mean(**labels) or 0.0
+    return replace(check_latency_threshold(mean_s * 1000.0, max_ms), metric=name)
+
+
+def check_metric_error_rate(
+    name: str,
+    error_labels: dict,
+    max_rate: float,
+    *,
+    registry: Optional[MetricsRegistry] = None,
+    **labels: str,
+) -> AlertResult:
+    """
+    Check a counter's error share: samples matching ``error_labels`` over all
+    samples matching ``labels``.
+
+    Example: check_metric_error_rate("sswg_validations", {"result": "fail"}, 0.1)
+    """
+    counter = _metric(name, registry, (Counter,))
+    errors = counter.total(**labels, **error_labels)
+    total = counter.total(**labels)
+    return replace(
+        check_error_rate_threshold(int(errors), int(total), max_rate), metric=name
+    )
+
+
+def check_metric_threshold(
+    name: str,
+    max_value: float,
+    *,
+    registry: Optional[MetricsRegistry] = None,
+    **labels: str,
+) -> AlertResult:
+    """Check a gauge value (or a counter total) against an upper bound."""
+    metric = _metric(name, registry, (Gauge, Counter))
+    if isinstance(metric, Gauge):
+        value = metric.value(**labels) or 0.0
+    else:
+        value = metric.total(**labels)
+    ok = value <= max_value
+    msg = (
+        f"{name} OK: {value:.3f} ≤ {max_value:.3f}"
+        if ok
+        else f"{name} HIGH: {value:.3f} > {max_value:.3f}"
+    )
+    return AlertResult(
+        ok=ok, metric=name, value=value, threshold=max_value, message=msg
+    )
+
+
 # End of ai_monitoring/performance_alerts.py
@@ -5,27 +5,364 @@ ai_monitoring/structured_logger.py
 Structured logging for the SSWG / Grimoire system.
 
 Original behavior:
-- get_logger() creates console + file logger at ./logs/workflow.log
+- get_logger() creates a console + file logger
 - log_event(logger, event, data) records structured events
 
 MVM extensions:
 - New convenience signature: log_event(event, payload=None)
   which uses a shared module-level logger.
-- All new code can simply call: log_event("mvm.process.started", {"workflow_id": "..."}).
+- All new code can simply call:
+  log_event("mvm.process.started", {"workflow_id": "..."}).
 - Backwards-compatible with older usage: log_event(logger, "event", {...})
+
+Non-blocking delivery:
+- Loggers from get_logger() carry a single QueueHandler. The caller thread
+  builds a LogRecord, serializes the event payload to JSON and enqueues it;
+  nothing is serialized when the level is disabled.
+- A background QueueListener feeds the console handler and a JSONL sink at
+  ./logs/workflow.jsonl (one JSON object per line). The sink writes in
+  batches, flushes at least every ``flush_interval`` seconds, rotates before
+  a write would exceed ``max_bytes`` and gzips old segments (workflow.jsonl.1.gz, ...).
+- Every process runs its own listener, and all of them may share one sink
+  path (batch runner worker pools). Each batch write, with its size check and
+  any rotation, holds an exclusive ``fcntl.flock`` on ``<path>.lock``. A
+  process whose open file was rotated away by another reopens the path first.
+- configure() changes sink options; shutdown() drains the queue and runs at
+  interpreter exit.
 """
 #!/usr/bin/env python3
 
 from __future__ import annotations
 
+import atexit
 import datetime
+import gzip
+import json
 import logging
 import os
-from typing import Any, Dict, Optional, Union
+import queue
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import util as mp_util
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+
+LOG_PATH = "./logs/workflow.jsonl"
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+
+def _utc_iso(created: float) -> str:
+    stamp = datetime.datetime.fromtimestamp(created, datetime.timezone.utc)
+    return stamp.replace(tzinfo=None).isoformat() + "Z"
+
+
+class _EventMessage:
+    """
+    Record ``msg`` for log_event.
+
+    The payload is serialized to JSON when the message is built, on the
+    caller thread, so later mutation by the caller cannot change (or break)
+    what the listener writes.
+    """
+
+    __slots__ = ("event", "payload", "created")
+
+    def __init__(self, event: str, data: Optional[Dict[str, Any]]) -> None:
+        self.event = event
+        self.payload = (
+            json.dumps(data, default=str, ensure_ascii=False) if data else None
+        )
+        self.created = time.time()
+
+    def __str__(self) -> str:
+        msg = f"[{_utc_iso(self.created)}] EVENT: {self.event}"
+        if self.payload:
+            msg += f" | data={json.loads(self.payload)}"
+        return msg
+
+
+class JsonLineFormatter(logging.Formatter):
+    """Render a record as one compact JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": _utc_iso(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        payload = None
+        if isinstance(record.msg, _EventMessage):
+            entry["event"] = record.msg.event
+            payload = record.msg.payload
+        else:
+            entry["message"] = record.getMessage()
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        line = json.dumps(entry, default=str, ensure_ascii=False)
+        if payload:
+            # Splice the pre-serialized payload in rather than re-encoding it.
+            line = f'{line[:-1]}, "data": {payload}}}'
+        return line
+
+
+class JsonlRotatingHandler(logging.Handler):
+    """
+    Batched JSONL file sink with size-based rotation and gzip of old segments.
+
+    Meant to run behind a QueueListener: records are buffered and written
+    once ``batch_size`` lines are pending or ``flush_interval`` seconds have
+    passed since the last write. The file is opened on the first write.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = LOG_PATH,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.setFormatter(JsonLineFormatter())
+        self._buffer: List[str] = []
+        self._stream: Optional[IO[bytes]] = None
+        self._lock_stream: Optional[IO[bytes]] = None
+        self._last_flush = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buffer.append(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+            return
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._last_flush = time.monotonic()
+            if not self._buffer:
+                return
+            data = "".join(self._buffer).encode("utf-8")
+            self._buffer = []
+            with self._file_lock():
+                stream = self._current_stream()
+                # The size on disk, which includes other processes' appends.
+                size = os.fstat(stream.fileno()).st_size
+                if 0 < self.max_bytes < size + len(data) and size:
+                    self._rotate()
+                    stream = self._current_stream()
+                stream.write(data)
+                stream.flush()
+        finally:
+            self.release()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Serialize append and rotation with other processes using the path."""
+        if fcntl is None:
+            yield
+            return
+        if self._lock_stream is None:
+            lock_path = self.path.with_name(f"{self.path.name}.lock")
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            self._lock_stream = lock_path.open("ab")
+        fcntl.flock(self._lock_stream.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_stream.fileno(), fcntl.LOCK_UN)
+
+    def _current_stream(self) -> IO[bytes]:
+        """The open sink, reopened if another process rotated it away."""
+        if self._stream is not None:
+            try:
+                current = os.path.samestat(
+                    os.fstat(self._stream.fileno()), os.stat(self.path)
+                )
+            except FileNotFoundError:
+                current = False
+            if current:
+                return self._stream
+            self._stream.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = self.path.open("ab")
+        return self._stream
+
+    def _segment(self, index: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{index}.gz")
+
+    def _rotate(self) -> None:
+        # Called with the file lock held; segments another process removed
+        # (or never created) are skipped.
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self.backup_count <= 0:
+            self.path.unlink(missing_ok=True)
+            return
+        self._segment(self.backup_count).unlink(missing_ok=True)
+        for index in range(self.backup_count - 1, 0, -1):
+            try:
+                os.replace(self._segment(index), self._segment(index + 1))
+            except FileNotFoundError:
+                continue
+        try:
+            src = self.path.open("rb")
+        except FileNotFoundError:
+            return
+        with src, gzip.open(self._segment(1), "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        self.path.unlink(missing_ok=True)
 
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            for stream in (self._stream, self._lock_stream):
+                if stream is not None:
+                    stream.close()
+            self._stream = None
+            self._lock_stream = None
+            super().close()
 
-LOG_PATH = "./logs/workflow.log"
-os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueue records untouched; formatting happens on the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        _ensure_listener().queue.put_nowait(record)
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers when the queue goes idle."""
+
+    def __init__(self, *handlers: logging.Handler, flush_interval: float) -> None:
+        super().__init__(queue.SimpleQueue(), *handlers, respect_handler_level=True)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block: bool) -> Any:
+        while True:
+            try:
+                return self.queue.get(block, self.flush_interval)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+
+_options: Dict[str, Any] = {}
+_listener: Optional[_FlushingQueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def configure(
+    path: Union[str, Path] = LOG_PATH,
+    *,
+    console: bool = True,
+    stream: Optional[IO[str]] = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backup_count: int = DEFAULT_BACKUP_COUNT,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+) -> None:
+    """
+    Set sink options for all loggers from get_logger().
+
+    Drains and stops the running listener; the next record starts a new one
+    with these options.
+    """
+    shutdown()
+    with _listener_lock:
+        _options.clear()
+        _options.update(
+            path=path,
+            console=console,
+            stream=stream,
+            max_bytes=max_bytes,
+            backup_count=backup_count,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+        )
+
+
+def _ensure_listener() -> _FlushingQueueListener:
+    global _listener
+    listener = _listener
+    if listener is not None:
+        return listener
+    with _listener_lock:
+        if _listener is None:
+            opts = dict(_options) or {"path": LOG_PATH, "console": True}
+            flush_interval = opts.get("flush_interval", DEFAULT_FLUSH_INTERVAL)
+            handlers: List[logging.Handler] = []
+            if opts.get("console", True):
+                ch = logging.StreamHandler(opts.get("stream"))
+                ch.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+                handlers.append(ch)
+            handlers.append(
+                JsonlRotatingHandler(
+                    opts.get("path", LOG_PATH),
+                    max_bytes=opts.get("max_bytes", DEFAULT_MAX_BYTES),
+                    backup_count=opts.get("backup_count", DEFAULT_BACKUP_COUNT),
+                    batch_size=opts.get("batch_size", DEFAULT_BATCH_SIZE),
+                    flush_interval=flush_interval,
+                )
+            )
+            listener = _FlushingQueueListener(*handlers, flush_interval=flush_interval)
+            listener.start()
+            # multiprocessing children end in os._exit and skip atexit.
+            mp_util.Finalize(None, shutdown, exitpriority=0)
+            _listener = listener
+        return _listener
+
+
+def shutdown() -> None:
+    """Drain queued records, flush and close the sinks."""
+    global _listener
+    with _listener_lock:
+        listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _reset_after_fork() -> None:
+    # The parent's listener thread does not exist in a forked child.
+    global _listener, _listener_lock
+    _listener = None
+    _listener_lock = threading.Lock()
+
+
+atexit.register(shutdown)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 def get_logger(name: str = "grimoire") -> logging.Logger:
@@ -33,30 +370,13 @@ def get_logger(name: str = "grimoire") -> logging.Logger:
     logger = logging.getLogger(name)
     if not logger.handlers:
         logger.setLevel(logging.INFO)
-
-        # Console handler
-        ch = logging.StreamHandler()
-        ch.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
-
-        # File handler
-        fh = logging.FileHandler(LOG_PATH)
-        fh.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
-
-        logger.addHandler(ch)
-        logger.addHandler(fh)
+        logger.addHandler(_DeferredQueueHandler(None))
     return logger
 
 
-# Module-level default logger for MVM convenience
-_default_logger = get_logger("ai_monitoring.structured_logger")
-
-
-def _format_event(event: str, data: Optional[Dict[str, Any]] = None) -> str:
-    ts = datetime.datetime.utcnow().isoformat() + "Z"
-    msg = f"[{ts}] EVENT: {event}"
-    if data:
-        msg += f" | data={data}"
-    return msg
+# Module-level default logger for MVM convenience; the listener starts on the
+# first event so importing this module does not touch ./logs.
+_DEFAULT_LOGGER_NAME = "ai_monitoring.structured_logger"
 
 
 def log_event(
@@ -90,15 +410,17 @@ def log_event(
     if isinstance(arg1, str):
         event = arg1
         data = arg2 if isinstance(arg2, dict) else None
-        logger = _default_logger
+        logger = get_logger(_DEFAULT_LOGGER_NAME)
     else:
         # Case 2: legacy style — arg1 is logger, arg2 is event, arg3 is payload
         logger = arg1
         event = arg2 if isinstance(arg2, str) else "<unknown_event>"
         data = arg3 if isinstance(arg3, dict) else None
 
-    msg = _format_event(event, data)
-    logger.info(msg)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    # Serialized now: the listener thread only formats the line and writes it.
+    logger.info(_EventMessage(event, data))
 
 
 # Example usage
@@ -0,0 +1,272 @@
+"""Conductor agent: delegates exclusively to ai_cores.module_core per AGENTS.md §19.7.
+
+ai_monitoring/tracing.py — Hierarchical span tracing for sswg-mvm.
+
+    from ai_monitoring.tracing import get_tracer, span
+
+    get_tracer().start()
+    with span("pipeline.evaluation", workflow_id="wf_001"):
+        ...
+
+    @span("recursion.run_cycle")
+    def run_cycle(...): ...
+
+    get_tracer().write("artifacts/traces/run.trace.json")
+
+The active span lives in a ContextVar, so nesting follows the call stack
+(and asyncio tasks) without passing parents around. While the tracer is
+stopped, ``span()`` returns a no-op object: a disabled span costs a flag
+check and one small allocation, and traced functions a flag check per call.
+
+Finished spans export as Chrome / Perfetto trace-event JSON (load it in
+chrome://tracing or ui.perfetto.dev) and as collapsed stacks
+("outer;inner <self µs>" lines) for flamegraph.pl / speedscope.
+"""
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+
+from ai_cores.export_core import write_bytes
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+__all__ = [
+    "SpanRecord",
+    "Tracer",
+    "get_tracer",
+    "span",
+]
+
+
+@dataclass
+class SpanRecord:
+    """One finished span; times are perf_counter nanoseconds."""
+
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    start_ns: int
+    end_ns: int
+    thread_id: int
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+
+_CURRENT: ContextVar[Optional["_Span"]] = ContextVar("sswg_span", default=None)
+
+
+class _Span:
+    __slots__ = ("_tracer", "_token", "record")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self._tracer = tracer
+        self._token = None
+        self.record = SpanRecord(
+            span_id=0,
+            parent_id=None,
+            name=name,
+            start_ns=0,
+            end_ns=0,
+            thread_id=0,
+            attributes=attributes,
+        )
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.record.attributes[key] = value
+
+    def __enter__(self) -> "_Span":
+        parent = _CURRENT.get()
+        record = self.record
+        record.span_id = next(self._tracer._ids)  # pylint: disable=protected-access
+        record.parent_id = parent.record.span_id if parent is not None else None
+        record.thread_id = threading.get_ident()
+        self._token = _CURRENT.set(self)
+        record.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        self.record.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.record.error = exc_type.__name__
+        if self._token is not None:
+            _CURRENT.reset(self._token)
+        self._tracer._finish(self.record)  # pylint: disable=protected-access
+
+    def __call__(self, func: F) -> F:
+        return _decorate(self.record.name, self.record.attributes, func)
+
+
+class _NoopSpan:
+    __slots__ = ("_name", "_attributes")
+
+    def __init__(self, name: str = "", attributes: Optional[Dict[str, Any]] = None):
+        self._name = name
+        self._attributes = attributes or {}
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:
+        return None
+
+    def __call__(self, func: F) -> F:
+        return _decorate(self._name, self._attributes, func)
+
+
+def _decorate(name: str, attributes: Dict[str, Any], func: F) -> F:
+    # Enabled-ness is checked per call, not at decoration time.
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _TRACER.enabled:
+            return func(*args, **kwargs)
+        with _Span(_TRACER, name, dict(attributes)):
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+class Tracer:
+    """Collects finished spans while started."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._records: List[SpanRecord] = []
+        self._ids = itertools.count(1)
+        self._origin_ns = time.perf_counter_ns()
+
+    def start(self) -> None:
+        """Drop previous spans and begin recording."""
+        self._records = []
+        self._ids = itertools.count(1)
+        self._origin_ns = time.perf_counter_ns()
+        self.enabled = True
+
+    def stop(self) -> List[SpanRecord]:
+        """Stop recording and return the finished spans."""
+        self.enabled = False
+        return list(self._records)
+
+    def _finish(self, record: SpanRecord) -> None:
+        self._records.append(record)  # list.append is atomic under the GIL
+
+    @property
+    def records(self) -> List[SpanRecord]:
+        return list(self._records)
+
+    # ── exports ──────────────────────────────────────────────────
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Return the spans as a Chrome trace-event document (µs timestamps)."""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "sswg"}}
+        ]
+        for record in sorted(self._records, key=lambda r: r.start_ns):
+            args = {key: _jsonable(value) for key, value in record.attributes.items()}
+            if record.error:
+                args["error"] = record.error
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": (record.start_ns - self._origin_ns) / 1000.0,
+                    "dur": record.duration_ns / 1000.0,
+                    "pid": pid,
+                    "tid": record.thread_id,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def collapsed_stacks(self) -> str:
+        """
+        Return "root;child;leaf <self-time µs>" lines, aggregated per stack.
+
+        Self time is a span's duration minus its direct children's.
+        """
+        by_id = {record.span_id: record for record in self._records}
+        child_ns: Dict[int, int] = defaultdict(int)
+        for record in self._records:
+            if record.parent_id in by_id:
+                parent_id: int = record.parent_id  # type: ignore[assignment]
+                child_ns[parent_id] += record.duration_ns
+
+        paths: Dict[int, str] = {}
+
+        def path_of(record: SpanRecord) -> str:
+            cached = paths.get(record.span_id)
+            if cached is None:
+                parent = by_id.get(record.parent_id)  # type: ignore[arg-type]
+                if parent is None:
+                    cached = record.name
+                else:
+                    cached = f"{path_of(parent)};{record.name}"
+                paths[record.span_id] = cached
+            return cached
+
+        totals: Dict[str, int] = defaultdict(int)
+        for record in sorted(self._records, key=lambda r: r.start_ns):
+            self_ns = max(record.duration_ns - child_ns[record.span_id], 0)
+            totals[path_of(record)] += self_ns
+        return "".join(
+            f"{stack} {ns // 1000}\n" for stack, ns in sorted(totals.items())
+        )
+
+    def write(self, path: Union[str, Path]) -> Dict[str, str]:
+        """
+        Write ``path`` (trace-event JSON) and ``<path stem>.folded``
+        (collapsed stacks). Returns the written paths by format.
+        """
+        path = Path(path)
+        folded = path.with_name(path.name.split(".", 1)[0] + ".folded")
+        trace = json.dumps(self.chrome_trace(), separators=(",", ":"))
+        write_bytes(trace.encode("utf-8"), path)
+        write_bytes(self.collapsed_stacks().encode("utf-8"), folded)
+        return {"chrome": str(path), "collapsed": str(folded)}
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+_TRACER = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer."""
+    return _TRACER
+
+
+def span(name: str, **attributes: Any) -> Union[_Span, _NoopSpan]:
+    """
+    Open a span named ``name`` (context manager) or trace a function
+    (decorator). Attribute values should be small scalars.
+    """
+    if not _TRACER.enabled:
+        return _NoopSpan(name, attributes)
+    return _Span(_TRACER, name, attributes)
+
+
+# End of ai_monitoring/tracing.py
@@ -9,9 +9,10 @@ Provides utilities to merge multiple workflow variants into a single
 
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any, Dict, Iterable, List
 
+from generator.workflow_view import cow_copy
+
 
 def merge_variants(
     base_workflow: Dict[str, Any],
@@ -21,7 +22,7 @@ def merge_variants(
     Merge a base workflow with multiple variants.
 
     MVM strategy:
-    - Start from a deep copy of the base.
+    - Start from a copy-on-write copy of the base.
     - For metadata:
         - add keys present only in variants
         - for conflicting string fields, prefer the *longest* text
@@ -32,7 +33,7 @@ def merge_variants(
     This is intentionally naive; the main goal is to provide a stable
     interface and a predictable outcome.
     """
-    merged = deepcopy(base_workflow)
+    merged = cow_copy(base_workflow)
     variants_list = list(variants)
 
     if not variants_list:
@@ -56,7 +57,7 @@ def merge_variants(
             if not mid:
                 continue
             if mid not in base_modules:
-                base_modules[mid] = deepcopy(m)
+                base_modules[mid] = cow_copy(m)
             else:
                 base_modules[mid] = _merge_module(base_modules[mid], m)
 
@@ -81,10 +82,10 @@ def _merge_module(base: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]
     Merge two module dicts with the same module_id using the
     “longer text wins” heuristic for string fields.
     """
-    merged = dict(base)
+    merged = cow_copy(base)
     for k, v in other.items():
         if k not in merged:
-            merged[k] = v
+            merged[k] = cow_copy(v)
         else:
-            merged[k] = _prefer_longer_text(merged[k], v)
+            merged[k] = _prefer_longer_text(merged[k], cow_copy(v))
     return merged
@@ -11,9 +11,10 @@ to simulate variant behavior.
 
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any, Dict, List
 
+from generator.workflow_view import cow_copy
+
 
 def generate_variants(
     workflow: Dict[str, Any],
@@ -34,7 +35,7 @@ def generate_variants(
     num_variants = max(0, num_variants)
 
     for i in range(1, num_variants + 1):
-        v = deepcopy(workflow)
+        v = cow_copy(workflow)
         meta = v.setdefault("metadata", {}) or {}
 
         title = meta.get("title") or v.get("title") or "Workflow"
@@ -11,10 +11,10 @@ Provides:
 
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any, Dict
 
 from generator.history import HistoryManager  # soft dependency; module exists in MVM
+from generator.workflow_view import cow_copy
 
 
 class VersionController:
@@ -62,7 +62,7 @@ def create_child_version(
     parent_id = parent_workflow.get("workflow_id", "<parent-unnamed>")
     parent_version = str(parent_workflow.get("version", "0.0.0"))
 
-    child = deepcopy(child_body)
+    child = cow_copy(child_body)
     child_id = child.get("workflow_id", parent_id)
 
     new_version = vc.next_child_version(parent_version)
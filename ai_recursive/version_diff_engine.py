@@ -24,6 +24,8 @@ from difflib import unified_diff
 from typing import Any, Callable, Dict, Optional
 
 from ai_monitoring.structured_logger import log_event
+from ai_monitoring.tracing import span
+from generator.workflow_view import to_plain
 
 # Soft imports for feedback + evaluation
 try:
@@ -69,6 +71,7 @@ def diff_strings(str1: str, str2: str) -> str:
 # --------------------------------------------------------------------------- #
 # Core diff logic
 # --------------------------------------------------------------------------- #
+@span("diff.compute_summary")
 def compute_diff_summary(
     wf_old: Dict[str, Any], wf_new: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -90,6 +93,7 @@ def compute_diff_summary(
           "regeneration_recommended": bool
         }
     """
+    wf_old, wf_new = to_plain(wf_old), to_plain(wf_new)  # read-only walk
     summary = {
         "changed_fields": [],
         "added_phases": [],
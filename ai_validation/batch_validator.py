@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+ai_validation/batch_validator.py — Parallel batch schema validation for sswg-mvm.
+
+Provides:
+- ValidationSummary: per-file validation outcome shared by the data aggregator
+  and the regression harnesses.
+- validate_paths: stream file paths through a process pool and yield
+  summaries in input order.
+- write_jsonl: emit summaries as one JSON object per line so results can be
+  consumed incrementally.
+
+Each worker process warms the shared validator registry
+(ai_cores/schema_core.py) once at startup, so every file after the first is
+validated against an already compiled schema.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional, TextIO
+
+from ai_cores.schema_core import get_validator
+
+from .schema_validator import SCHEMAS_DIR, validate_template, validate_workflow
+
+__all__ = ["ValidationSummary", "validate_file", "validate_paths", "write_jsonl"]
+
+SCHEMA_NAMES = {
+    "template": "template_schema.json",
+    "workflow": "workflow_schema.json",
+}
+
+
+@dataclass
+class ValidationSummary:
+    """
+    Lightweight container for validation results.
+
+    Attributes:
+        path: Filesystem path to the JSON file.
+        kind: 'template' or 'workflow'.
+        ok: True if the file validates against its schema.
+        error_count: Number of schema violations (0 if ok or schema missing).
+        item_id: workflow_id / template_id of the object, if present.
+        skipped: True if the file was not a candidate for validation.
+        error: Load or validation exception message, if one was raised.
+    """
+
+    path: Path
+    kind: str
+    ok: bool
+    error_count: int
+    item_id: Optional[str] = None
+    skipped: bool = False
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        payload = asdict(self)
+        payload["path"] = str(self.path)
+        return payload
+
+
+def validate_file(
+    path: Path,
+    kind: str,
+    schema_uri: Optional[str] = None,
+) -> ValidationSummary:
+    """
+    Validate a single JSON file as a workflow or template.
+
+    Args:
+        path: Path to the JSON file.
+        kind: 'workflow' or 'template'.
+        schema_uri: If set, objects whose ``$schema`` differs are skipped.
+
+    Returns:
+        ValidationSummary describing the outcome. Load and validation
+        exceptions are captured in ``error`` rather than raised.
+    """
+    if kind not in SCHEMA_NAMES:
+        raise ValueError(f"Unknown validation kind: {kind!r}")
+
+    try:
+        obj = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        return ValidationSummary(path, kind, ok=False, error_count=1, error=str(exc))
+
+    id_key = "workflow_id" if kind == "workflow" else "template_id"
+    item_id = obj.get(id_key) if isinstance(obj, dict) else None
+
+    if schema_uri is not None and (
+        not isinstance(obj, dict) or str(obj.get("$schema", "")).strip() != schema_uri
+    ):
+        return ValidationSummary(
+            path, kind, ok=True, error_count=0, item_id=item_id, skipped=True
+        )
+
+    try:
+        if kind == "workflow":
+            ok, message = validate_workflow(obj)
+            error_count = 1 if message else 0
+        else:
+            ok, errors = validate_template(obj)
+            error_count = len(errors or [])
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        return ValidationSummary(
+            path, kind, ok=False, error_count=1, item_id=item_id, error=str(exc)
+        )
+
+    return ValidationSummary(
+        path, kind, ok=ok, error_count=error_count, item_id=item_id
+    )
+
+
+def _warm_validator(kind: str) -> None:
+    """Pool initializer: compile the schema once per worker process."""
+    try:
+        get_validator(SCHEMAS_DIR, SCHEMA_NAMES[kind])
+    except FileNotFoundError:
+        pass
+
+
+def validate_paths(
+    paths: Iterable[Path],
+    kind: str,
+    *,
+    jobs: int = 1,
+    fail_fast: bool = False,
+    schema_uri: Optional[str] = None,
+) -> Iterator[ValidationSummary]:
+    """
+    Validate files and yield one summary per path, in input order.
+
+    Paths are consumed lazily; at most ``jobs * 4`` files are in flight at a
+    time, so arbitrarily large corpora can be streamed.
+
+    Args:
+        paths: Iterable of JSON file paths.
+        kind: 'workflow' or 'template'.
+        jobs: Worker process count. ``1`` validates in the calling process.
+        fail_fast: Stop after the first failing (non-skipped) summary.
+        schema_uri: Optional ``$schema`` filter passed to validate_file.
+    """
+    if kind not in SCHEMA_NAMES:
+        raise ValueError(f"Unknown validation kind: {kind!r}")
+
+    if jobs <= 1:
+        for path in paths:
+            summary = validate_file(path, kind, schema_uri)
+            yield summary
+            if fail_fast and not summary.ok:
+                return
+        return
+
+    _warm_validator(kind)
+    window = jobs * 4
+    pending: Deque[Future] = deque()
+    path_iter = iter(paths)
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_warm_validator, initargs=(kind,)
+    ) as pool:
+        try:
+            for path in path_iter:
+                pending.append(pool.submit(validate_file, path, kind, schema_uri))
+                if len(pending) < window:
+                    continue
+                summary = pending.popleft().result()
+                yield summary
+                if fail_fast and not summary.ok:
+                    return
+            while pending:
+                summary = pending.popleft().result()
+                yield summary
+                if fail_fast and not summary.ok:
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def write_jsonl(summary: ValidationSummary, stream: TextIO) -> None:
+    """Write one summary as a JSON line and flush it."""
+    stream.write(json.dumps(summary.to_dict(), sort_keys=True) + "\n")
+    stream.flush()
@@ -16,12 +16,13 @@ this file can gain:
 
 from __future__ import annotations
 
+import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, TextIO, Tuple
 
-from .schema_validator import validate_workflow
+from .batch_validator import validate_paths, write_jsonl
 
 # Default directory where test workflow JSON files live.
 # You can adjust this path to match your actual layout.
@@ -45,10 +46,22 @@ def load_json(path: Path) -> Dict:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def run_regression_suite(base_dir: Path = DEFAULT_TEST_DIR) -> Tuple[int, int]:
+def run_regression_suite(
+    base_dir: Path = DEFAULT_TEST_DIR,
+    jobs: int = 1,
+    fail_fast: bool = False,
+    jsonl: Optional[TextIO] = None,
+) -> Tuple[int, int]:
     """
     Run schema validation on all workflow JSON files in base_dir.
 
+    Args:
+        base_dir: Directory to scan for workflow JSON files.
+        jobs: Worker process count (1 = validate in this process).
+        fail_fast: Stop at the first failing workflow.
+        jsonl: If given, write one JSON result per file to this stream
+            instead of the human-readable progress lines.
+
     Returns:
         (passed, failed)
     """
@@ -60,25 +73,33 @@ def run_regression_suite(base_dir: Path = DEFAULT_TEST_DIR) -> Tuple[int, int]:
     passed = 0
     failed = 0
 
-    print(f"[regression_tests] Found {len(files)} workflow files under {base_dir}")
-
-    for path in files:
-        wf = load_json(path)
-        ok, errors = validate_workflow(wf)
-        wf_id = wf.get("workflow_id", path.name)
+    if jsonl is None:
+        print(f"[regression_tests] Found {len(files)} workflow files under {base_dir}")
 
-        if ok:
-            print(f"  ✓ {wf_id} ({path})")
+    for summary in validate_paths(files, "workflow", jobs=jobs, fail_fast=fail_fast):
+        if summary.ok:
             passed += 1
         else:
-            error_count = 1 if errors else 0
-            print(f"  ✗ {wf_id} ({path}) — {error_count} schema issue(s)")
             failed += 1
 
-    print(
-        f"[regression_tests] Completed: {passed} passed, {failed} failed "
-        f"(dir={base_dir})"
-    )
+        if jsonl is not None:
+            write_jsonl(summary, jsonl)
+            continue
+
+        wf_id = summary.item_id or summary.path.name
+        if summary.ok:
+            print(f"  ✓ {wf_id} ({summary.path})")
+        else:
+            print(
+                f"  ✗ {wf_id} ({summary.path}) — "
+                f"{summary.error_count} schema issue(s)"
+            )
+
+    if jsonl is None:
+        print(
+            f"[regression_tests] Completed: {passed} passed, {failed} failed "
+            f"(dir={base_dir})"
+        )
     return passed, failed
 
 
@@ -89,11 +110,27 @@ def main(argv: List[str] | None = None) -> int:
     Usage:
         python -m ai_validation.regression_tests
         python -m ai_validation.regression_tests path/to/custom_dir
+        python -m ai_validation.regression_tests --jobs 8 --fail-fast --jsonl
     """
-    argv = argv or sys.argv[1:]
-    base_dir = Path(argv[0]) if argv else DEFAULT_TEST_DIR
+    parser = argparse.ArgumentParser(
+        description="Validate workflow JSON files against workflow_schema.json."
+    )
+    parser.add_argument("base_dir", nargs="?", type=Path, default=DEFAULT_TEST_DIR)
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes.")
+    parser.add_argument(
+        "--fail-fast", action="store_true", help="Stop at the first failure."
+    )
+    parser.add_argument(
+        "--jsonl", action="store_true", help="Emit JSON lines on stdout."
+    )
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
 
-    passed, failed = run_regression_suite(base_dir)
+    passed, failed = run_regression_suite(
+        args.base_dir,
+        jobs=args.jobs,
+        fail_fast=args.fail_fast,
+        jsonl=sys.stdout if args.jsonl else None,
+    )
 
     # Example of using `passed` meaningfully:
     # if no tests ran at all, flag that explicitly
@@ -19,12 +19,15 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple, List
 
 from jsonschema import ValidationError
 
 from ai_cores.schema_core import get_validator, load_schema
+from ai_monitoring.metrics import get_metrics_registry
+from ai_monitoring.tracing import span
 
 logger = logging.getLogger("ai_validation.schema_validator")
 logger.setLevel(logging.INFO)
@@ -35,6 +38,20 @@ logger.addHandler(handler)
 # Root/schemas directory (ai_validation is sibling of schemas)
 SCHEMAS_DIR = Path(__file__).resolve().parent.parent / "schemas"
 
+_VALIDATIONS = get_metrics_registry().counter(
+    "sswg_validations", "Validator calls by outcome.", ("validator", "result")
+)
+_VALIDATION_SECONDS = get_metrics_registry().histogram(
+    "sswg_validation_seconds", "Validator wall time in seconds.", ("validator",)
+)
+
+
+def _record_validation(validator: str, result: str, started: float) -> None:
+    _VALIDATIONS.labels(validator=validator, result=result).inc()
+    _VALIDATION_SECONDS.labels(validator=validator).observe(
+        time.perf_counter() - started
+    )
+
 
 def _load_schema(path: Path) -> Dict[str, Any]:
     """
@@ -57,6 +74,7 @@ def _get_validator(schema_name: str):
     return get_validator(SCHEMAS_DIR, schema_name)
 
 
+@span("validation.workflow_schema")
 def validate_workflow(
     workflow_obj: Any,
     schema_name: str = "workflow_schema.json",
@@ -74,11 +92,13 @@ def validate_workflow(
     if not isinstance(workflow_obj, dict):
         raise TypeError("workflow_obj must be a dict or support to_dict()")
 
+    started = time.perf_counter()
     try:
         validator = _get_validator(schema_name)
     except FileNotFoundError as e:
         logger.warning("Workflow schema not found: %s", e)
         # At MVM stage, treat missing schema as non-fatal and accept the object.
+        _record_validation("workflow_schema", "skipped", started)
         return True, None
 
     errors = sorted(validator.iter_errors(workflow_obj), key=lambda e: e.path)
@@ -86,15 +106,18 @@ def validate_workflow(
         for e in errors:
             logger.warning("Schema validation error: %s at %s", e.message, list(e.path))
         message = "; ".join(f"{e.message} at {list(e.path)}" for e in errors)
+        _record_validation("workflow_schema", "fail", started)
         return False, message
 
     logger.info(
         "Schema validation passed for workflow_id=%s",
         workflow_obj.get("workflow_id"),
     )
+    _record_validation("workflow_schema", "pass", started)
     return True, None
 
 
+@span("validation.template_schema")
 def validate_template(
     template_obj: Dict[str, Any],
     schema_name: str = "template_schema.json",
@@ -107,11 +130,13 @@ def validate_template(
         ok: bool — True if validation passed (no errors, or schema missing)
         errors: list[ValidationError] or None
     """
+    started = time.perf_counter()
     try:
         validator = _get_validator(schema_name)
     except FileNotFoundError as e:
         logger.warning("Template schema not found: %s", e)
         # At MVM stage, treat missing schema as non-fatal and accept the object.
+        _record_validation("template_schema", "skipped", started)
         return True, None
 
     errors = sorted(validator.iter_errors(template_obj), key=lambda e: e.path)
@@ -122,12 +147,14 @@ def validate_template(
                 e.message,
                 list(e.path),
             )
+        _record_validation("template_schema", "fail", started)
         return False, errors
 
     logger.info(
         "Template schema validation passed for template_id=%s",
         template_obj.get("template_id"),
     )
+    _record_validation("template_schema", "pass", started)
     return True, None
 
 
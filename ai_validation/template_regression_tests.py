@@ -13,12 +13,13 @@ data/templates/.
 
 from __future__ import annotations
 
+import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, TextIO, Tuple
 
-from ai_validation.schema_validator import validate_template
+from ai_validation.batch_validator import validate_paths, write_jsonl
 
 # Default directory where template JSON files live.
 DEFAULT_TEMPLATES_DIR = Path("data/templates")
@@ -62,11 +63,21 @@ def is_template_object(obj: Dict) -> bool:
 
 def run_template_regression_suite(
     base_dir: Path = DEFAULT_TEMPLATES_DIR,
+    jobs: int = 1,
+    fail_fast: bool = False,
+    jsonl: Optional[TextIO] = None,
 ) -> Tuple[int, int]:
     """
     Run template schema validation on all JSON files in base_dir that
     explicitly declare the template_schema.json $schema.
 
+    Args:
+        base_dir: Directory to scan for template JSON files.
+        jobs: Worker process count (1 = validate in this process).
+        fail_fast: Stop at the first failing template.
+        jsonl: If given, write one JSON result per file to this stream
+            instead of the human-readable progress lines.
+
     Returns:
         (passed, failed)
     """
@@ -79,34 +90,51 @@ def run_template_regression_suite(
     failed = 0
     skipped = 0
 
-    print(
-        f"[template_regression_tests] Scanning {len(files)} JSON file(s) "
-        f"under {base_dir}"
+    if jsonl is None:
+        print(
+            f"[template_regression_tests] Scanning {len(files)} JSON file(s) "
+            f"under {base_dir}"
+        )
+
+    summaries = validate_paths(
+        files,
+        "template",
+        jobs=jobs,
+        fail_fast=fail_fast,
+        schema_uri=TEMPLATE_SCHEMA_URI,
     )
-
-    for path in files:
-        obj = load_json(path)
-
-        if not is_template_object(obj):
-            print("  - SKIP (non-template or no template_schema $schema): " f"{path}")
+    for summary in summaries:
+        if summary.skipped:
             skipped += 1
-            continue
-
-        ok, errors = validate_template(obj)
-        tpl_id = obj.get("template_id", path.name)
-
-        if ok:
-            print(f"  ✓ {tpl_id} ({path})")
+        elif summary.ok:
             passed += 1
         else:
-            print(f"  ✗ {tpl_id} ({path}) — {len(errors or [])} schema issue(s)")
             failed += 1
 
-    print(
-        "[template_regression_tests] Completed: "
-        f"{passed} passed, {failed} failed, {skipped} skipped "
-        f"(dir={base_dir})"
-    )
+        if jsonl is not None:
+            write_jsonl(summary, jsonl)
+            continue
+
+        tpl_id = summary.item_id or summary.path.name
+        if summary.skipped:
+            print(
+                "  - SKIP (non-template or no template_schema $schema): "
+                f"{summary.path}"
+            )
+        elif summary.ok:
+            print(f"  ✓ {tpl_id} ({summary.path})")
+        else:
+            print(
+                f"  ✗ {tpl_id} ({summary.path}) — "
+                f"{summary.error_count} schema issue(s)"
+            )
+
+    if jsonl is None:
+        print(
+            "[template_regression_tests] Completed: "
+            f"{passed} passed, {failed} failed, {skipped} skipped "
+            f"(dir={base_dir})"
+        )
     return passed, failed
 
 
@@ -117,11 +145,29 @@ def main(argv: List[str] | None = None) -> int:
     Usage:
         python -m ai_validation.template_regression_tests
         python -m ai_validation.template_regression_tests path/to/custom_dir
+        python -m ai_validation.template_regression_tests --jobs 8 --jsonl
     """
-    argv = argv or sys.argv[1:]
-    base_dir = Path(argv[0]) if argv else DEFAULT_TEMPLATES_DIR
+    parser = argparse.ArgumentParser(
+        description="Validate template JSON files against template_schema.json."
+    )
+    parser.add_argument(
+        "base_dir", nargs="?", type=Path, default=DEFAULT_TEMPLATES_DIR
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes.")
+    parser.add_argument(
+        "--fail-fast", action="store_true", help="Stop at the first failure."
+    )
+    parser.add_argument(
+        "--jsonl", action="store_true", help="Emit JSON lines on stdout."
+    )
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
 
-    _ignored_passed, failed = run_template_regression_suite(base_dir)
+    _ignored_passed, failed = run_template_regression_suite(
+        args.base_dir,
+        jobs=args.jobs,
+        fail_fast=args.fail_fast,
+        jsonl=sys.stdout if args.jsonl else None,
+    )
     return 0 if failed == 0 else 1
 
 
@@ -17,34 +17,40 @@ Export serialization is centralized in ai_cores.export_core.
 import os
 from datetime import datetime
 
-from ai_cores.export_core import write_json, write_markdown
+from ai_cores.export_core import write_bytes, write_json, write_markdown
 
 
 # ---------------------- GRAPHVIZ EXPORT ---------------------- #
 
 
+def render_graphviz(wf: dict) -> str:
+    """Render the workflow dependency graph as Graphviz DOT source."""
+    graph = wf.get("dependency_graph", {})
+    nodes = graph.get("nodes", [])
+    edges = graph.get("edges", [])
+
+    lines = [
+        "digraph workflow {",
+        "  rankdir=LR;",
+        '  node [shape=box, style="rounded,filled", '
+        'color="#7C3AED", fillcolor="#EDE9FE"];',
+    ]
+    for n in nodes:
+        lines.append(f'  "{n}" [label="{n}"];')
+    for e in edges:
+        if len(e) == 2:
+            lines.append(f'  "{e[0]}" -> "{e[1]}";')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
 def export_graphviz(wf: dict, out_dir: str = "./build") -> str:
     """Export the workflow dependency graph to a Graphviz DOT file."""
     os.makedirs(out_dir, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     out_path = os.path.join(out_dir, f"workflow_graph_{timestamp}.dot")
 
-    graph = wf.get("dependency_graph", {})
-    nodes = graph.get("nodes", [])
-    edges = graph.get("edges", [])
-
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("digraph workflow {\n")
-        f.write(
-            '  rankdir=LR;\n  node [shape=box, style="rounded,filled", color="#7C3AED", fillcolor="#EDE9FE"];\n'
-        )
-        for n in nodes:
-            f.write(f'  "{n}" [label="{n}"];\n')
-        for e in edges:
-            if len(e) == 2:
-                f.write(f'  "{e[0]}" -> "{e[1]}";\n')
-        f.write("}\n")
-
+    write_bytes(render_graphviz(wf).encode("utf-8"), out_path)
     return out_path
 
 
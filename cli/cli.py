@@ -15,6 +15,8 @@ from subprocess import run as subprocess_run
 from typing import Sequence
 import sys
 
+from generator.batch_runner import add_arguments as add_batch_arguments
+from generator.batch_runner import run_from_args as run_batch_from_args
 from pdl.default_pdl import (
     execute_phase as pdl_execute_phase,
     load_default_phases,
@@ -198,6 +200,18 @@ def cmd_bundle(args: Namespace) -> None:
         raise SystemExit(exit_code)
 
 
+def cmd_batch(args: Namespace) -> None:
+    """
+    Run the MVM pipeline over many workflows in a worker pool.
+
+    Args:
+        args: Parsed CLI arguments from generator.batch_runner.add_arguments.
+    """
+    exit_code = run_batch_from_args(args, stdout=sys.stdout, stderr=sys.stderr)
+    if exit_code != 0:
+        raise SystemExit(exit_code)
+
+
 def build_parser() -> argparse.ArgumentParser:
     """
     Build the CLI argument parser with all SSWG commands.
@@ -298,6 +312,13 @@ def build_parser() -> argparse.ArgumentParser:
     )
     run_cmd.set_defaults(func=cmd_run)
 
+    batch = subparsers.add_parser(
+        "batch",
+        help="Run many workflows (directory, glob, or JSONL manifest) in parallel",
+    )
+    add_batch_arguments(batch)
+    batch.set_defaults(func=cmd_batch)
+
     validate = subparsers.add_parser(
         "validate",
         help="Validate the canonical PDL phase set for the golden path",
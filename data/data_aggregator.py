@@ -5,8 +5,9 @@ data/data_aggregator.py — Aggregated data views for sswg-mvm.
 Responsibilities (MVM-level):
 
 - Discover template and workflow JSON files on disk.
-- Load JSON content in a consistent way.
-- Optionally run schema validation (workflow/template) and return summaries.
+- Validate single files through ai_validation.batch_validator.validate_file.
+- Optionally run schema validation (workflow/template) and return summaries,
+  in parallel via ai_validation.batch_validator when ``jobs > 1``.
 - Provide simple, importable helpers that other subsystems (CLI, docs,
   tests) can use to inspect the current repository state.
 
@@ -16,36 +17,23 @@ only reads, validates, and summarizes.
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import argparse
+import sys
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Iterable, List, Optional, Tuple
 
-from ai_validation.schema_validator import validate_template, validate_workflow
+from ai_validation.batch_validator import (
+    ValidationSummary,
+    validate_file,
+    validate_paths,
+    write_jsonl,
+)
 
 # Root data directories
 TEMPLATES_DIR = Path("data/templates")
 WORKFLOWS_DIR = Path("data/workflows")
 
 
-@dataclass
-class ValidationSummary:
-    """
-    Lightweight container for validation results.
-
-    Attributes:
-        path: Filesystem path to the JSON file.
-        kind: 'template' or 'workflow'.
-        ok: True if the file validates against its schema.
-        error_count: Number of schema violations (0 if ok or schema missing).
-    """
-
-    path: Path
-    kind: str
-    ok: bool
-    error_count: int
-
-
 def _iter_json_files(root: Path) -> Iterable[Path]:
     """
     Yield all *.json files under a given root directory, recursively.
@@ -64,24 +52,6 @@ def _iter_json_files(root: Path) -> Iterable[Path]:
             yield path
 
 
-def _load_json(path: Path) -> Dict[str, Any]:
-    """
-    Load a JSON file into a Python dict.
-
-    Args:
-        path: Path to a JSON file.
-
-    Returns:
-        Parsed JSON as a dict.
-
-    Raises:
-        FileNotFoundError: If the file does not exist.
-        json.JSONDecodeError: If the file contains invalid JSON.
-    """
-    content = path.read_text(encoding="utf-8")
-    return json.loads(content)
-
-
 def list_template_files() -> List[Path]:
     """
     List all template JSON files under data/templates.
@@ -110,12 +80,12 @@ def validate_template_file(path: Path) -> ValidationSummary:
         path: Path to the template JSON file.
 
     Returns:
-        ValidationSummary describing the outcome.
+        ValidationSummary describing the outcome. A missing or malformed
+        file no longer raises: it is reported as ``ok=False`` with the
+        message in ``error``, as ai_validation.batch_validator.validate_file
+        does.
     """
-    obj = _load_json(path)
-    ok, errors = validate_template(obj)
-    error_count = len(errors or [])
-    return ValidationSummary(path=path, kind="template", ok=ok, error_count=error_count)
+    return validate_file(path, "template")
 
 
 def validate_workflow_file(path: Path) -> ValidationSummary:
@@ -126,63 +96,113 @@ def validate_workflow_file(path: Path) -> ValidationSummary:
         path: Path to the workflow JSON file.
 
     Returns:
-        ValidationSummary describing the outcome.
+        ValidationSummary describing the outcome. A missing or malformed
+        file no longer raises: it is reported as ``ok=False`` with the
+        message in ``error``, as ai_validation.batch_validator.validate_file
+        does.
     """
-    obj = _load_json(path)
-    ok, errors = validate_workflow(obj)
-    error_count = 1 if errors else 0
-    return ValidationSummary(path=path, kind="workflow", ok=ok, error_count=error_count)
+    return validate_file(path, "workflow")
+
+
+def _summarize(
+    paths: Iterable[Path],
+    kind: str,
+    jobs: int,
+    fail_fast: bool,
+) -> Tuple[List[ValidationSummary], int]:
+    summaries: List[ValidationSummary] = []
+    total_errors = 0
+
+    for summary in validate_paths(paths, kind, jobs=jobs, fail_fast=fail_fast):
+        summaries.append(summary)
+        total_errors += summary.error_count
 
+    return summaries, total_errors
 
-def summarize_templates() -> Tuple[List[ValidationSummary], int]:
+
+def summarize_templates(
+    jobs: int = 1, fail_fast: bool = False
+) -> Tuple[List[ValidationSummary], int]:
     """
     Run schema validation over all template JSON files.
 
+    Args:
+        jobs: Worker process count (1 = validate in this process).
+        fail_fast: Stop at the first failing file.
+
     Returns:
         (summaries, total_errors)
         summaries: List of ValidationSummary entries, one per file.
         total_errors: Sum of error_count across all summaries.
     """
-    summaries: List[ValidationSummary] = []
-    total_errors = 0
-
-    for path in list_template_files():
-        summary = validate_template_file(path)
-        summaries.append(summary)
-        total_errors += summary.error_count
-
-    return summaries, total_errors
+    return _summarize(list_template_files(), "template", jobs, fail_fast)
 
 
-def summarize_workflows() -> Tuple[List[ValidationSummary], int]:
+def summarize_workflows(
+    jobs: int = 1, fail_fast: bool = False
+) -> Tuple[List[ValidationSummary], int]:
     """
     Run schema validation over all workflow JSON files.
 
+    Args:
+        jobs: Worker process count (1 = validate in this process).
+        fail_fast: Stop at the first failing file.
+
     Returns:
         (summaries, total_errors)
         summaries: List of ValidationSummary entries, one per file.
         total_errors: Sum of error_count across all summaries.
     """
-    summaries: List[ValidationSummary] = []
-    total_errors = 0
+    return _summarize(list_workflow_files(), "workflow", jobs, fail_fast)
 
-    for path in list_workflow_files():
-        summary = validate_workflow_file(path)
-        summaries.append(summary)
-        total_errors += summary.error_count
 
-    return summaries, total_errors
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Validate all templates and workflows under data/."
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Worker processes (default: 1)."
+    )
+    parser.add_argument(
+        "--fail-fast", action="store_true", help="Stop at the first failing file."
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Emit one JSON object per file on stdout instead of text.",
+    )
+    return parser.parse_args(argv)
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Tiny CLI entrypoint for ad-hoc inspection:
 
     - Prints validation status for all templates and workflows.
     - Returns non-zero exit code if any file has schema errors.
     """
-    tmpl_summaries, tmpl_errors = summarize_templates()
-    wf_summaries, wf_errors = summarize_workflows()
+    args = _parse_args(argv)
+
+    if args.jsonl:
+        total_errors = 0
+        for kind, paths in (
+            ("template", list_template_files()),
+            ("workflow", list_workflow_files()),
+        ):
+            for summary in validate_paths(
+                paths, kind, jobs=args.jobs, fail_fast=args.fail_fast
+            ):
+                write_jsonl(summary, sys.stdout)
+                total_errors += summary.error_count
+            if args.fail_fast and total_errors:
+                break
+        return 0 if total_errors == 0 else 1
+
+    tmpl_summaries, tmpl_errors = summarize_templates(args.jobs, args.fail_fast)
+    wf_summaries: List[ValidationSummary] = []
+    wf_errors = 0
+    if not (args.fail_fast and tmpl_errors):
+        wf_summaries, wf_errors = summarize_workflows(args.jobs, args.fail_fast)
 
     print("=== Template Validation ===")
     for s in tmpl_summaries:
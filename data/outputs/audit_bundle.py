@@ -6,10 +6,10 @@ import hashlib
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from generator.audit_bundle import build_bundle as _build_bundle
-from generator.audit_bundle import load_audit_spec
+from generator.audit_bundle import BundleStats, load_audit_spec
+from generator.audit_bundle import build_bundle_with_stats as _build_bundle
 from generator.audit_bundle import validate_bundle as _validate_bundle
 
 
@@ -62,23 +62,27 @@ def _load_benchmark_log(path: Path) -> Dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def build_audit_bundle(
+def build_audit_bundle_with_stats(
     *,
     spec: Dict[str, Any],
     run_id: str,
     bundle_dir: Path,
     manifest_path: Path,
     benchmark_log_path: Path,
-) -> Dict[str, Any]:
-    """Create a bundle of audit artifacts with benchmark-derived metrics."""
+    workers: Optional[int] = None,
+    link: str = "auto",
+) -> Tuple[Dict[str, Any], BundleStats]:
+    """Create an audit bundle manifest and return it with transfer stats."""
     if not benchmark_log_path.exists():
         raise FileNotFoundError(f"Benchmark log missing: {benchmark_log_path}")
 
-    base_manifest = _build_bundle(
+    base_manifest, stats = _build_bundle(
         spec=spec,
         run_id=run_id,
         bundle_dir=bundle_dir,
         manifest_path=manifest_path,
+        workers=workers,
+        link=link,
     )
 
     benchmark_log = _load_benchmark_log(benchmark_log_path)
@@ -100,6 +104,29 @@ def build_audit_bundle(
 
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
     manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest, stats
+
+
+def build_audit_bundle(
+    *,
+    spec: Dict[str, Any],
+    run_id: str,
+    bundle_dir: Path,
+    manifest_path: Path,
+    benchmark_log_path: Path,
+    workers: Optional[int] = None,
+    link: str = "auto",
+) -> Dict[str, Any]:
+    """Create a bundle of audit artifacts with benchmark-derived metrics."""
+    manifest, _ = build_audit_bundle_with_stats(
+        spec=spec,
+        run_id=run_id,
+        bundle_dir=bundle_dir,
+        manifest_path=manifest_path,
+        benchmark_log_path=benchmark_log_path,
+        workers=workers,
+        link=link,
+    )
     return manifest
 
 
@@ -128,6 +155,7 @@ def validate_audit_bundle(manifest: Dict[str, Any]) -> Dict[str, Any]:
 
 __all__ = [
     "build_audit_bundle",
+    "build_audit_bundle_with_stats",
     "load_audit_spec",
     "validate_audit_bundle",
 ]
@@ -1,16 +1,62 @@
-"""Audit bundle creation and validation helpers (hashing via audit_core)."""
+"""
+Audit bundle creation and validation helpers (hashing via audit_core).
+
+`build_bundle` reads each artifact once: the bundle copy is written and
+hashed in the same pass, and files are processed in a thread pool sized for
+the bundle's device (`io_workers`). With ``link="auto"`` (the default) a
+copy-on-write reflink (FICLONE) is tried first where the filesystem
+supports it, so the bundle gets an independent copy without writing the
+data again. ``link="hardlink"`` hard-links sources into the bundle when they
+share a filesystem. The bundle then shares inodes with the sources, so use
+it only for sources that are never rewritten in place. Identical content
+within a bundle is stored once: duplicates are hard links to the first copy.
+Only files whose size matches another file are hashed up front to find
+them. Throughput is returned as `BundleStats` by `build_bundle_with_stats`
+and is never written into the manifest, which stays schema-exact
+(schemas/audit-bundle-manifest.json) and deterministic.
+"""
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import shutil
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from ai_cores.audit_core import hash_file
 from generator.hashing import hash_data
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+LINK_MODES = ("auto", "copy", "hardlink")
+COPY_CHUNK = 1 << 20
+ROTATIONAL_WORKERS = 2
+SOLID_STATE_WORKERS = 8
+# linux/fs.h _IOW(0x94, 9, int); not exported by fcntl before Python 3.12.
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+_T = TypeVar("_T")
+
 
 @dataclass(frozen=True)
 class BundleEntry:
@@ -22,6 +68,42 @@ class BundleEntry:
     content_hash: str
 
 
+@dataclass(frozen=True)
+class BundleStats:
+    """How a bundle's files were materialized, and how fast."""
+
+    files: int
+    bytes: int
+    copied: int
+    reflinked: int
+    hardlinked: int
+    deduplicated: int
+    workers: int
+    seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "files": self.files,
+            "bytes": self.bytes,
+            "copied": self.copied,
+            "reflinked": self.reflinked,
+            "hardlinked": self.hardlinked,
+            "deduplicated": self.deduplicated,
+            "workers": self.workers,
+            "seconds": round(self.seconds, 4),
+            "bytes_per_second": round(self.bytes_per_second, 1),
+            "files_per_second": round(self.files_per_second, 1),
+        }
+
+
 def load_audit_spec(path: Path) -> Dict[str, Any]:
     """Load the audit bundle specification from disk."""
     return json.loads(path.read_text(encoding="utf-8"))
@@ -47,17 +129,121 @@ def _resolve_components(spec: Dict[str, Any], run_id: str) -> List[dict]:
     return components
 
 
-def build_bundle(
-    *,
+class _Source(NamedTuple):
+    component_id: str
+    path: Path
+    target: Path
+    size: int
+
+
+def io_workers(path: Path) -> int:
+    """
+    Copy threads for the block device holding ``path``: ROTATIONAL_WORKERS
+    on spinning disks, SOLID_STATE_WORKERS otherwise or when unknown.
+    """
+    try:
+        device = os.stat(path).st_dev
+        node = Path(f"/sys/dev/block/{os.major(device)}:{os.minor(device)}")
+        # A partition has no queue of its own; its parent disk does.
+        for queue in (node / "queue", node.resolve().parent / "queue"):
+            flag = queue / "rotational"
+            if flag.exists():
+                if flag.read_text(encoding="utf-8").strip() == "1":
+                    return ROTATIONAL_WORKERS
+                return SOLID_STATE_WORKERS
+    except (OSError, ValueError):
+        pass
+    return SOLID_STATE_WORKERS
+
+
+def _reflink(source: BinaryIO, target: BinaryIO) -> bool:
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+    except OSError:
+        return False
+    return True
+
+
+def _hash_stream(source: BinaryIO, target: Optional[BinaryIO] = None) -> str:
+    """SHA-256 of ``source``, writing it to ``target`` in the same pass."""
+    hasher = hashlib.sha256()
+    buffer = bytearray(COPY_CHUNK)
+    view = memoryview(buffer)
+    while True:
+        size = source.readinto(buffer)
+        if not size:
+            break
+        chunk = view[:size]
+        hasher.update(chunk)
+        if target is not None:
+            target.write(chunk)
+    return hasher.hexdigest()
+
+
+def _materialize(
+    source: Path, target: Path, link: str, digest: Optional[str] = None
+) -> Tuple[str, str]:
+    """
+    Create ``target`` from ``source``; return (content hash, method). With a
+    known ``digest`` the content is not hashed again.
+    """
+    # Never write through an existing target: an earlier build may have
+    # hard-linked it to a source.
+    target.unlink(missing_ok=True)
+    if link == "hardlink":
+        try:
+            os.link(source, target)
+        except OSError:
+            pass
+        else:
+            return digest or hash_file(target), "hardlinked"
+    copy_later = False
+    with source.open("rb") as src, target.open("wb") as dst:
+        reflinked = link != "copy" and _reflink(src, dst)
+        if digest is None:
+            digest = _hash_stream(src, None if reflinked else dst)
+        else:
+            copy_later = not reflinked
+    if copy_later:
+        # Already hashed: let the kernel copy it (sendfile on Linux).
+        shutil.copyfile(source, target)
+    shutil.copystat(source, target)
+    return digest, "reflinked" if reflinked else "copied"
+
+
+def _link_duplicate(original: Path, target: Path) -> None:
+    target.unlink(missing_ok=True)
+    try:
+        os.link(original, target)
+    except OSError:
+        shutil.copy2(original, target)
+
+
+def _parallel(workers: int, func: Callable[..., _T], *columns: List[Any]) -> List[_T]:
+    if workers <= 1 or len(columns[0]) <= 1:
+        return list(map(func, *columns))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="audit-bundle"
+    ) as pool:
+        return list(pool.map(func, *columns))
+
+
+def bundle_artifacts(
     spec: Dict[str, Any],
     run_id: str,
     bundle_dir: Path,
-    manifest_path: Path,
-) -> Dict[str, Any]:
-    """Create a bundle of audit artifacts and emit a manifest."""
+    *,
+    workers: Optional[int] = None,
+    link: str = "auto",
+) -> Tuple[List[BundleEntry], BundleStats]:
+    """Copy (or link) the spec's artifacts into ``bundle_dir``."""
+    if link not in LINK_MODES:
+        raise ValueError(f"Unknown link mode: {link}")
+    started = time.perf_counter()
     bundle_dir.mkdir(parents=True, exist_ok=True)
-    entries: List[BundleEntry] = []
-
+    sources: List[_Source] = []
     for component in _resolve_components(spec, run_id):
         component_id = component["component_id"]
         for source in component.get("paths", []):
@@ -66,17 +252,94 @@ def build_bundle(
                 continue
             target_dir = bundle_dir / component_id
             target_dir.mkdir(parents=True, exist_ok=True)
-            target_path = target_dir / source_path.name
-            shutil.copy2(source_path, target_path)
-            entries.append(
-                BundleEntry(
-                    component_id=component_id,
-                    source_path=source_path,
-                    bundle_path=target_path,
-                    content_hash=hash_file(target_path),
+            sources.append(
+                _Source(
+                    component_id,
+                    source_path,
+                    target_dir / source_path.name,
+                    source_path.stat().st_size,
                 )
             )
 
+    workers = max(1, workers or io_workers(bundle_dir))
+    # The last source bundled to a path is the one left there.
+    writers = {source.target: index for index, source in enumerate(sources)}
+    sizes = Counter(source.size for source in sources)
+    digests: List[str] = [""] * len(sources)
+    methods: Counter = Counter()
+
+    def materialize(indexes: List[int]) -> None:
+        results = _parallel(
+            workers,
+            _materialize,
+            [sources[index].path for index in indexes],
+            [sources[index].target for index in indexes],
+            [link] * len(indexes),
+            [digests[index] or None for index in indexes],
+        )
+        for index, (digest, method) in zip(indexes, results):
+            digests[index] = digest
+            methods[method] += 1
+
+    # A file whose size no other file has cannot be a duplicate: copy and
+    # hash it in one pass. The rest are hashed first to find duplicates.
+    direct = {
+        index
+        for index, source in enumerate(sources)
+        if writers[source.target] == index and sizes[source.size] == 1
+    }
+    materialize(sorted(direct))
+    pending = [index for index in range(len(sources)) if index not in direct]
+    hashed = _parallel(workers, hash_file, [sources[index].path for index in pending])
+    originals: Dict[str, int] = {}
+    duplicates: List[Tuple[int, int]] = []
+    for index, digest in zip(pending, hashed):
+        digests[index] = digest
+        if writers[sources[index].target] != index:
+            continue
+        original = originals.setdefault(digest, index)
+        if original != index:
+            duplicates.append((original, index))
+    materialize(list(originals.values()))
+    for original, index in duplicates:
+        _link_duplicate(sources[original].target, sources[index].target)
+
+    entries = [
+        BundleEntry(
+            component_id=source.component_id,
+            source_path=source.path,
+            bundle_path=source.target,
+            content_hash=digest,
+        )
+        for source, digest in zip(sources, digests)
+    ]
+    stats = BundleStats(
+        files=len(writers),
+        bytes=sum(sources[index].size for index in writers.values()),
+        copied=methods["copied"],
+        reflinked=methods["reflinked"],
+        hardlinked=methods["hardlinked"],
+        deduplicated=len(duplicates),
+        workers=workers,
+        seconds=time.perf_counter() - started,
+    )
+    return entries, stats
+
+
+def build_bundle_with_stats(
+    *,
+    spec: Dict[str, Any],
+    run_id: str,
+    bundle_dir: Path,
+    manifest_path: Path,
+    workers: Optional[int] = None,
+    link: str = "auto",
+) -> Tuple[Dict[str, Any], BundleStats]:
+    """Create a bundle of audit artifacts, emit a manifest, return both."""
+    entries, stats = bundle_artifacts(
+        spec, run_id, bundle_dir, workers=workers, link=link
+    )
+
     manifest = {
         "anchor": {
             "anchor_id": "audit_bundle_manifest",
@@ -100,6 +363,27 @@ def build_bundle(
     manifest["bundle_hash"] = hash_data(manifest["entries"])
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
     manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest, stats
+
+
+def build_bundle(
+    *,
+    spec: Dict[str, Any],
+    run_id: str,
+    bundle_dir: Path,
+    manifest_path: Path,
+    workers: Optional[int] = None,
+    link: str = "auto",
+) -> Dict[str, Any]:
+    """Create a bundle of audit artifacts and emit a manifest."""
+    manifest, _ = build_bundle_with_stats(
+        spec=spec,
+        run_id=run_id,
+        bundle_dir=bundle_dir,
+        manifest_path=manifest_path,
+        workers=workers,
+        link=link,
+    )
     return manifest
 
 
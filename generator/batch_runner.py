@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+generator/batch_runner.py — Streaming many-workflow runner for sswg-mvm.
+
+Provides:
+- iter_workflow_sources: expand a directory, glob pattern, or JSONL manifest
+  into workflow sources (file paths or inline workflow objects).
+- run_batch: push sources through ``process_workflow`` on a process pool and
+  yield one BatchResult per workflow, in input order.
+- BatchStats: end-to-end counters and throughput (workflows/second).
+
+Each worker process warms its caches once at startup (compiled workflow
+schema, optimization ontology, and, when refinement is enabled, the shared
+embedding model), so every workflow after the first runs against warm state.
+
+Pipeline modules are imported inside the functions that run workflows, so
+registering the ``sswg batch`` subcommand stays cheap for the rest of the CLI.
+
+With refinement enabled, each worker records its cycles through
+``RecursionManager.run_cycle`` like a single run does: feedback, lineage
+history and memory snapshots. All three stores accept concurrent writer
+processes:
+- The feedback log and its aggregates are updated under a file lock.
+- History lines are O_APPEND writes that every process indexes.
+- Memory snapshots get per-process ids in a SQLite (WAL) index.
+"""
+
+# pylint: disable=import-outside-toplevel
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import re
+import sys
+import time
+from collections import deque
+from contextlib import redirect_stdout
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+__all__ = [
+    "BatchResult",
+    "BatchStats",
+    "iter_workflow_sources",
+    "run_batch",
+    "run_workflow",
+    "write_jsonl",
+]
+
+WorkflowSource = Union[Path, Dict[str, Any]]
+
+_SLUG_PATTERN = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of one workflow in a batch run.
+
+    Attributes:
+        index: Position of the source in the batch input.
+        source: File path, or ``<manifest>:<line>`` for inline workflows.
+        ok: True if the pipeline completed.
+        workflow_id: workflow_id of the refined workflow (or input, on failure).
+        out_dir: Directory the workflow's artifacts were exported to.
+        overall_score: Final quality score, if the pipeline produced one.
+        duration_s: Wall-clock time spent on this workflow in the worker.
+        error: Exception message if the pipeline failed.
+    """
+
+    index: int
+    source: str
+    ok: bool
+    workflow_id: Optional[str] = None
+    out_dir: Optional[str] = None
+    overall_score: Optional[float] = None
+    duration_s: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        payload = asdict(self)
+        payload["type"] = "result"
+        return payload
+
+
+@dataclass
+class BatchStats:
+    """Running totals for a batch; ``throughput`` is workflows/second."""
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    elapsed_s: float = 0.0
+
+    def record(self, result: BatchResult) -> None:
+        """Fold one result into the totals."""
+        self.total += 1
+        if result.ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        self.elapsed_s = time.perf_counter() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Completed workflows per second of wall-clock time."""
+        return self.total / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary record."""
+        return {
+            "type": "summary",
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "elapsed_s": round(self.elapsed_s, 6),
+            "workflows_per_second": round(self.throughput, 3),
+        }
+
+
+def iter_workflow_sources(
+    spec: Union[str, Path],
+) -> Iterator[Tuple[str, WorkflowSource]]:
+    """
+    Expand a batch input spec into ``(label, source)`` pairs.
+
+    Args:
+        spec: One of
+            - a directory: every ``*.json`` file in it (sorted, non-recursive)
+            - a ``.jsonl`` manifest: one entry per line, either a path string,
+              an object with a ``path`` key (relative to the manifest), or an
+              inline workflow object
+            - a glob pattern, e.g. ``data/workflows/**/*.json`` (sorted)
+
+    Raises:
+        FileNotFoundError: If ``spec`` names a path that does not exist and
+            is not a glob pattern.
+        ValueError: If a manifest line is not valid JSON or not a path/object.
+    """
+    path = Path(spec)
+    if path.is_dir():
+        for item in sorted(path.glob("*.json")):
+            yield str(item), item
+        return
+
+    if path.suffix == ".jsonl" and path.is_file():
+        yield from _iter_manifest(path)
+        return
+
+    if glob.has_magic(str(spec)):
+        for item in sorted(glob.glob(str(spec), recursive=True)):
+            if Path(item).is_file():
+                yield item, Path(item)
+        return
+
+    if path.is_file():
+        yield str(path), path
+        return
+
+    raise FileNotFoundError(f"Batch input not found: {spec}")
+
+
+def _iter_manifest(manifest: Path) -> Iterator[Tuple[str, WorkflowSource]]:
+    with manifest.open("r", encoding="utf-8") as handle:
+        for line_no, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(
+                    f"{manifest}:{line_no}: invalid JSON ({exc})"
+                ) from exc
+            label = f"{manifest}:{line_no}"
+            if isinstance(entry, str):
+                yield label, manifest.parent / entry
+            elif isinstance(entry, dict) and set(entry) == {"path"}:
+                yield label, manifest.parent / str(entry["path"])
+            elif isinstance(entry, dict):
+                yield label, entry
+            else:
+                raise ValueError(f"{label}: expected a path or workflow object")
+
+
+def _warm_worker(enable_refinement: bool, eval_cache_dir: Optional[str]) -> None:
+    """Pool initializer: build per-process caches before the first workflow."""
+    from ai_cores.schema_core import get_validator
+    from ai_evaluation.evaluation_cache import configure_evaluation_cache
+    from ai_evaluation.quality_metrics import get_optimization_engine
+    from ai_validation.schema_validator import SCHEMAS_DIR
+    from generator.embedding_engine import get_embedding_engine
+
+    configure_evaluation_cache(
+        cache_dir=Path(eval_cache_dir) if eval_cache_dir else None
+    )
+    try:
+        get_validator(SCHEMAS_DIR, "workflow_schema.json")
+    except FileNotFoundError:
+        pass
+    get_optimization_engine()
+    if enable_refinement:
+        get_embedding_engine().model  # pylint: disable=expression-not-assigned
+
+
+def _slug(value: str) -> str:
+    return _SLUG_PATTERN.sub("_", value).strip("_") or "workflow"
+
+
+def run_workflow(
+    index: int,
+    label: str,
+    source: WorkflowSource,
+    out_dir: Path,
+    enable_refinement: bool = True,
+) -> BatchResult:
+    """
+    Run one workflow through ``process_workflow`` and export its artifacts.
+
+    Artifacts go to ``out_dir/<index>_<workflow_id>`` so concurrent workers
+    never share an output directory. Exceptions are captured in the result.
+    Pipeline console output is sent to stderr so stdout stays valid JSONL.
+    """
+    from generator.main import export_artifacts, load_workflow, process_workflow
+    from generator.workflow_view import cow_copy
+
+    started = time.perf_counter()
+    workflow_id: Optional[str] = None
+    target_dir: Optional[Path] = None
+    try:
+        if isinstance(source, Path):
+            workflow = load_workflow(source)
+        else:
+            workflow = cow_copy(source)
+        workflow_id = str(workflow.get("workflow_id") or Path(label).stem)
+        target_dir = out_dir / f"{index:06d}_{_slug(workflow_id)}"
+        with redirect_stdout(sys.stderr):
+            refined = process_workflow(
+                workflow, enable_refinement=enable_refinement, out_dir=target_dir
+            )
+            export_artifacts(refined, target_dir)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        return BatchResult(
+            index,
+            label,
+            ok=False,
+            workflow_id=workflow_id,
+            out_dir=str(target_dir) if target_dir else None,
+            duration_s=round(time.perf_counter() - started, 6),
+            error=f"{type(exc).__name__}: {exc}",
+        )
+
+    quality = (refined.get("evaluation") or {}).get("quality") or {}
+    score = quality.get("overall_score")
+    return BatchResult(
+        index,
+        label,
+        ok=True,
+        workflow_id=str(refined.get("workflow_id", workflow_id)),
+        out_dir=str(target_dir),
+        overall_score=float(score) if isinstance(score, (int, float)) else None,
+        duration_s=round(time.perf_counter() - started, 6),
+    )
+
+
+def run_batch(
+    sources: Iterable[Tuple[str, WorkflowSource]],
+    *,
+    out_dir: Path,
+    jobs: int = 1,
+    enable_refinement: bool = True,
+    fail_fast: bool = False,
+    eval_cache_dir: Optional[Path] = None,
+) -> Iterator[BatchResult]:
+    """
+    Process workflows and yield one result per source, in input order.
+
+    Sources are consumed lazily with at most ``jobs * 4`` workflows in flight,
+    so manifests with thousands of entries stream without being loaded
+    up front.
+
+    Args:
+        sources: ``(label, source)`` pairs, e.g. from iter_workflow_sources.
+        out_dir: Root directory for per-workflow artifact directories.
+        jobs: Worker process count. ``1`` runs in the calling process.
+        enable_refinement: Forwarded to process_workflow.
+        fail_fast: Stop after the first failed workflow.
+        eval_cache_dir: Optional shared on-disk evaluation cache tier.
+    """
+    cache_dir = str(eval_cache_dir) if eval_cache_dir else None
+    if jobs <= 1:
+        _warm_worker(enable_refinement, cache_dir)
+        for index, (label, source) in enumerate(sources):
+            result = run_workflow(index, label, source, out_dir, enable_refinement)
+            yield result
+            if fail_fast and not result.ok:
+                return
+        return
+
+    window = jobs * 4
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_warm_worker,
+        initargs=(enable_refinement, cache_dir),
+    ) as pool:
+        try:
+            for index, (label, source) in enumerate(sources):
+                pending.append(
+                    pool.submit(
+                        run_workflow, index, label, source, out_dir, enable_refinement
+                    )
+                )
+                if len(pending) < window:
+                    continue
+                result = pending.popleft().result()
+                yield result
+                if fail_fast and not result.ok:
+                    return
+            while pending:
+                result = pending.popleft().result()
+                yield result
+                if fail_fast and not result.ok:
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def write_jsonl(record: Dict[str, Any], stream: TextIO) -> None:
+    """Write one record as a JSON line and flush it."""
+    stream.write(json.dumps(record, sort_keys=True) + "\n")
+    stream.flush()
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register batch options on an argparse parser or subparser."""
+    parser.add_argument(
+        "input",
+        help="Directory of workflow JSON files, a glob pattern, or a JSONL manifest.",
+    )
+    parser.add_argument(
+        "-o",
+        "--out-dir",
+        type=Path,
+        default=Path("data/outputs/batch"),
+        help="Root directory for per-workflow artifacts.",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Number of worker processes."
+    )
+    parser.add_argument(
+        "--jsonl",
+        type=Path,
+        help="Write per-workflow results and the summary as JSONL (default stdout).",
+    )
+    parser.add_argument(
+        "--no-refine",
+        action="store_true",
+        help="Disable recursive refinement step.",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop after the first failed workflow.",
+    )
+    parser.add_argument(
+        "--eval-cache-dir",
+        type=Path,
+        default=Path(".sswg_cache/evaluations"),
+        help="Directory for the persistent evaluation cache tier.",
+    )
+    parser.add_argument(
+        "--no-eval-cache",
+        action="store_true",
+        help="Disable the on-disk evaluation cache tier.",
+    )
+
+
+def run_from_args(args: argparse.Namespace, *, stdout: TextIO, stderr: TextIO) -> int:
+    """Run a batch from parsed arguments; returns a process exit code."""
+    stats = BatchStats()
+    stream = args.jsonl.open("w", encoding="utf-8") if args.jsonl else stdout
+    try:
+        results = run_batch(
+            iter_workflow_sources(args.input),
+            out_dir=args.out_dir,
+            jobs=args.jobs,
+            enable_refinement=not args.no_refine,
+            fail_fast=args.fail_fast,
+            eval_cache_dir=None if args.no_eval_cache else args.eval_cache_dir,
+        )
+        for result in results:
+            stats.record(result)
+            write_jsonl(result.to_dict(), stream)
+        write_jsonl(stats.to_dict(), stream)
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"[batch] {exc}", file=stderr)
+        return 2
+    finally:
+        if stream is not stdout:
+            stream.close()
+
+    print(
+        f"[batch] {stats.total} workflows ({stats.failed} failed) in "
+        f"{stats.elapsed_s:.2f}s — {stats.throughput:.2f} workflows/s",
+        file=stderr,
+    )
+    return 1 if stats.failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entrypoint (also exposed as ``sswg batch``)."""
+    parser = argparse.ArgumentParser(
+        description="Run the MVM pipeline over many workflows with a worker pool."
+    )
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    return run_from_args(args, stdout=sys.stdout, stderr=sys.stderr)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+generator/embedding_engine.py — Shared, cached sentence embeddings (CPU only).
+
+Provides:
+- get_embedding_model: process-wide, lazily loaded SentenceTransformer
+  singleton (None when sentence-transformers is not installed).
+- EmbeddingCache: on-disk float32 row matrix (memory-mapped for reads) plus
+  an append-only ``hash -> row`` index, keyed by the SHA-256 of the text.
+- EmbeddingEngine: ``encode_many`` batches every cache miss into a single
+  forward pass and persists the new rows, so unchanged text is never
+  re-embedded across runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger("generator.embedding_engine")
+
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+DEFAULT_CACHE_DIR = Path(".sswg_cache/embeddings")
+
+_MODELS: Dict[str, Any] = {}
+_MODELS_LOCK = threading.Lock()
+_UNAVAILABLE = object()
+
+
+def get_embedding_model(model_name: str = DEFAULT_MODEL_NAME) -> Optional[Any]:
+    """
+    Return the shared CPU SentenceTransformer for ``model_name``.
+
+    The model is constructed on first call only; later calls (from any
+    RecursionManager in the process) reuse it. Returns None if
+    sentence-transformers is unavailable or the model cannot be loaded.
+    """
+    with _MODELS_LOCK:
+        cached = _MODELS.get(model_name)
+        if cached is not None:
+            return None if cached is _UNAVAILABLE else cached
+
+        model: Any = _UNAVAILABLE
+        if importlib.util.find_spec("sentence_transformers") is None:
+            logger.warning(
+                "sentence-transformers is unavailable; using lexical semantic delta."
+            )
+        else:
+            try:
+                sentence_transformers = importlib.import_module("sentence_transformers")
+                model = sentence_transformers.SentenceTransformer(
+                    model_name, device="cpu"
+                )
+                logger.info("Loaded SentenceTransformer model: %s", model_name)
+            except Exception as exc:  # pragma: no cover
+                logger.warning(
+                    "sentence-transformers unavailable; using lexical semantic "
+                    "delta (%s).",
+                    exc,
+                )
+        _MODELS[model_name] = model
+        return None if model is _UNAVAILABLE else model
+
+
+def text_hash(text: str) -> str:
+    """Return the cache key for a flattened text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Persistent ``text hash -> float32 vector`` store.
+
+    Layout under ``cache_dir/<model>/``:
+    - ``vectors.f32``: row-major float32 matrix, one row per embedding
+    - ``index.jsonl``: append-only ``{"hash": ..., "row": ...}`` records
+    - ``meta.json``: ``{"dim": ...}``
+    """
+
+    def __init__(self, cache_dir: Path, model_name: str) -> None:
+        self.root = Path(cache_dir) / model_name.replace("/", "__")
+        self.vectors_path = self.root / "vectors.f32"
+        self.index_path = self.root / "index.jsonl"
+        self.meta_path = self.root / "meta.json"
+        self.dim: Optional[int] = None
+        self._rows: Dict[str, int] = {}
+        self._matrix: Any = None
+        self._lock = threading.Lock()
+        self._load_index()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def _load_index(self) -> None:
+        if self.meta_path.exists():
+            try:
+                self.dim = int(json.loads(self.meta_path.read_text("utf-8"))["dim"])
+            except (OSError, ValueError, KeyError, TypeError):
+                self.dim = None
+        if self.dim is None or not self.index_path.exists():
+            return
+        row_bytes = self.dim * 4
+        max_rows = (
+            self.vectors_path.stat().st_size // row_bytes
+            if self.vectors_path.exists()
+            else 0
+        )
+        with self.index_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn trailing write
+                row = record.get("row")
+                if isinstance(row, int) and row < max_rows:
+                    self._rows[str(record.get("hash"))] = row
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Return cached vectors (numpy arrays) or None for each key."""
+        with self._lock:
+            if not any(key in self._rows for key in keys):
+                return [None] * len(keys)
+            matrix = self._mapped_matrix()
+            return [
+                matrix[self._rows[key]].copy() if key in self._rows else None
+                for key in keys
+            ]
+
+    def put_many(self, keys: Sequence[str], vectors: Any) -> None:
+        """Append new rows and index entries; existing keys are skipped."""
+        numpy = importlib.import_module("numpy")
+        matrix = numpy.asarray(vectors, dtype=numpy.float32)
+        if matrix.ndim != 2 or len(keys) != matrix.shape[0]:
+            raise ValueError("put_many expects one vector per key")
+        with self._lock:
+            if self.dim is None:
+                self.dim = int(matrix.shape[1])
+                self.root.mkdir(parents=True, exist_ok=True)
+                self.meta_path.write_text(json.dumps({"dim": self.dim}), "utf-8")
+            elif matrix.shape[1] != self.dim:
+                raise ValueError(
+                    f"Embedding dim {matrix.shape[1]} does not match cache {self.dim}"
+                )
+
+            row_bytes = self.dim * 4
+            new_rows: List[str] = []
+            with self.vectors_path.open("ab") as vectors_handle:
+                # Serialize appends from concurrent worker processes.
+                if fcntl is not None:
+                    fcntl.flock(vectors_handle.fileno(), fcntl.LOCK_EX)
+                vectors_handle.seek(0, os.SEEK_END)
+                next_row = vectors_handle.tell() // row_bytes
+                for key, vector in zip(keys, matrix):
+                    if key in self._rows:
+                        continue
+                    vectors_handle.write(vector.tobytes())
+                    self._rows[key] = next_row
+                    new_rows.append(json.dumps({"hash": key, "row": next_row}))
+                    next_row += 1
+                vectors_handle.flush()
+                os.fsync(vectors_handle.fileno())
+                if new_rows:
+                    with self.index_path.open("a", encoding="utf-8") as index_handle:
+                        index_handle.write("\n".join(new_rows) + "\n")
+            if new_rows:
+                self._matrix = None  # remap to include new rows
+
+    def _mapped_matrix(self) -> Any:
+        if self._matrix is None:
+            numpy = importlib.import_module("numpy")
+            rows = self.vectors_path.stat().st_size // (self.dim * 4)
+            self._matrix = numpy.memmap(
+                self.vectors_path, dtype=numpy.float32, mode="r", shape=(rows, self.dim)
+            )
+        return self._matrix
+
+
+class EmbeddingEngine:
+    """Batch encoder with a persistent vector cache."""
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL_NAME,
+        *,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        batch_size: int = 32,
+    ) -> None:
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.cache = EmbeddingCache(cache_dir, model_name) if cache_dir else None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def model(self) -> Optional[Any]:
+        """The shared model, loaded on first access."""
+        return get_embedding_model(self.model_name)
+
+    @property
+    def available(self) -> bool:
+        """True when a real embedding model can be used."""
+        return self.model is not None
+
+    def encode_many(self, texts: Sequence[str]) -> List[Any]:
+        """
+        Encode texts to float32 vectors, in input order.
+
+        Cache hits are read from the memory-mapped store; all misses are
+        encoded in one ``model.encode`` call and appended to the cache.
+
+        Raises:
+            RuntimeError: If no embedding model is available.
+        """
+        model = self.model
+        if model is None:
+            raise RuntimeError("No embedding model available")
+
+        keys = [text_hash(text) for text in texts]
+        results: List[Optional[Any]] = (
+            self.cache.get_many(keys) if self.cache else [None] * len(keys)
+        )
+
+        missing: Dict[str, List[int]] = {}
+        for idx, (key, vector) in enumerate(zip(keys, results)):
+            if vector is None:
+                missing.setdefault(key, []).append(idx)
+        self.hits += len(keys) - sum(len(v) for v in missing.values())
+        self.misses += len(missing)
+
+        if missing:
+            miss_keys = list(missing)
+            first_idx = [missing[key][0] for key in miss_keys]
+            encoded = model.encode(
+                [texts[idx] for idx in first_idx],
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                device="cpu",
+                show_progress_bar=False,
+            )
+            numpy = importlib.import_module("numpy")
+            encoded = numpy.asarray(encoded, dtype=numpy.float32)
+            if self.cache is not None:
+                try:
+                    self.cache.put_many(miss_keys, encoded)
+                except (OSError, ValueError) as exc:
+                    logger.warning("Embedding cache write failed: %s", exc)
+            for key, vector in zip(miss_keys, encoded):
+                for idx in missing[key]:
+                    results[idx] = vector
+
+        return results  # type: ignore[return-value]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and cached row count."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached_rows": len(self.cache) if self.cache else 0,
+        }
+
+
+_ENGINES: Dict[str, EmbeddingEngine] = {}
+
+
+def get_embedding_engine(model_name: str = DEFAULT_MODEL_NAME) -> EmbeddingEngine:
+    """Return the process-wide engine for ``model_name``."""
+    with _MODELS_LOCK:
+        engine = _ENGINES.get(model_name)
+        if engine is None:
+            engine = EmbeddingEngine(model_name)
+            _ENGINES[model_name] = engine
+        return engine
+
+
+def cosine_similarity(left: Any, right: Any) -> float:
+    """Cosine similarity between two 1-D vectors."""
+    numpy = importlib.import_module("numpy")
+    left = numpy.asarray(left, dtype=numpy.float32)
+    right = numpy.asarray(right, dtype=numpy.float32)
+    denom = float(numpy.linalg.norm(left) * numpy.linalg.norm(right))
+    if denom == 0.0:
+        return 0.0
+    return float(numpy.dot(left, right) / denom)
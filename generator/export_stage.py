@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+generator/export_stage.py — Single-pass multi-format workflow export.
+
+The MVM pipeline used to export the refined workflow several times per run
+(the visualization exports twice, then the JSON/Markdown artifacts), each
+with its own ``json.dumps(indent=2)``. This stage renders every requested
+format once into memory and fans the bytes out to disk:
+
+- json      → ``<workflow_id>.json``  (serialized exactly once)
+- markdown  → ``<workflow_id>.md``
+- dot       → ``<workflow_id>.dot``   (dependency graph, Graphviz)
+- mermaid   → ``<workflow_id>.mmd``   (module graph, Mermaid flowchart)
+
+Writes go through ai_cores.export_core.write_bytes: atomic (temp file +
+rename) and skipped when the file on disk already has the same content
+hash, so re-running an unchanged workflow rewrites nothing.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List
+
+from ai_cores.export_core import content_digest, write_bytes
+from ai_monitoring.metrics import get_metrics_registry
+from ai_monitoring.tracing import span
+from ai_visualization.export_manager import render_graphviz
+from ai_visualization.mermaid_generator import mermaid_from_workflow
+from generator.exporters import get_workflow_id, json_payload, render_markdown
+from generator.utils import log
+from generator.workflow_view import to_plain
+
+__all__ = [
+    "EXPORT_FORMATS",
+    "ExportReport",
+    "export_workflow_formats",
+    "render_formats",
+]
+
+Renderer = Callable[[Any], str]
+
+_RENDERERS: Dict[str, Renderer] = {
+    "json": lambda wf: json.dumps(json_payload(wf), indent=2),
+    "markdown": render_markdown,
+    "dot": render_graphviz,
+    "mermaid": mermaid_from_workflow,
+}
+
+_EXPORT_FILES = get_metrics_registry().counter(
+    "sswg_export_files", "Export files by format and outcome.", ("format", "result")
+)
+_EXPORT_SECONDS = get_metrics_registry().histogram(
+    "sswg_export_seconds", "export_workflow_formats wall time in seconds."
+)
+
+# Format name → file extension, in export order.
+EXPORT_FORMATS: Dict[str, str] = {
+    "json": ".json",
+    "markdown": ".md",
+    "dot": ".dot",
+    "mermaid": ".mmd",
+}
+
+
+@dataclass
+class ExportReport:
+    """Outcome of one export pass."""
+
+    paths: Dict[str, str] = field(default_factory=dict)
+    digests: Dict[str, str] = field(default_factory=dict)
+    written: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+
+
+def render_formats(
+    workflow: Any, formats: Iterable[str] = tuple(EXPORT_FORMATS)
+) -> Dict[str, bytes]:
+    """
+    Render ``workflow`` into the requested formats.
+
+    Returns:
+        Mapping from format name to encoded file content.
+
+    Raises:
+        ValueError: If a format is not one of EXPORT_FORMATS.
+    """
+    plain = to_plain(workflow)  # read-only; views are never materialized
+    rendered: Dict[str, bytes] = {}
+    for fmt in formats:
+        if fmt not in _RENDERERS:
+            raise ValueError(f"Invalid export format: {fmt}")
+        rendered[fmt] = _RENDERERS[fmt](plain).encode("utf-8")
+    return rendered
+
+
+@span("export.workflow_formats")
+def export_workflow_formats(
+    workflow: Any,
+    out_dir: str | os.PathLike[str],
+    formats: Iterable[str] = tuple(EXPORT_FORMATS),
+) -> ExportReport:
+    """
+    Render ``workflow`` once and write each format under ``out_dir``.
+
+    Files whose content hash is unchanged are left untouched and reported
+    in ``ExportReport.skipped``.
+    """
+    started = time.perf_counter()
+    wf_id = get_workflow_id(workflow)
+    report = ExportReport()
+    with span("export.render"):
+        rendered = render_formats(workflow, formats)
+    with span("export.write"):
+        for fmt, data in rendered.items():
+            path = os.path.join(os.fspath(out_dir), f"{wf_id}{EXPORT_FORMATS[fmt]}")
+            report.paths[fmt] = path
+            report.digests[fmt] = content_digest(data)
+            if write_bytes(data, path):
+                report.written.append(fmt)
+                _EXPORT_FILES.labels(format=fmt, result="written").inc()
+            else:
+                report.skipped.append(fmt)
+                _EXPORT_FILES.labels(format=fmt, result="skipped").inc()
+    _EXPORT_SECONDS.observe(time.perf_counter() - started)
+    log(
+        f"Exported workflow {wf_id} → {', '.join(report.paths)} "
+        f"(written={len(report.written)}, unchanged={len(report.skipped)})"
+    )
+    return report
@@ -10,6 +10,9 @@ Exports:
 - JSON: full workflow structure
 - Markdown: human-readable summary
 
+The ``json_payload`` / ``render_markdown`` renderers are shared with
+generator.export_stage, which writes every format in a single pass.
+
 Serialization is centralized in ai_cores.export_core.
 """
 
@@ -70,7 +73,7 @@ def _extract_sections(workflow: Any, wf_id: str) -> WorkflowSections:
     )
 
 
-def _get_workflow_id(workflow: Any) -> str:
+def get_workflow_id(workflow: Any) -> str:
     """Best-effort workflow ID extraction."""
     if _is_mapping(workflow):
         return str(
@@ -79,47 +82,47 @@ def _get_workflow_id(workflow: Any) -> str:
     return str(getattr(workflow, "workflow_id", "unnamed_workflow"))
 
 
-def export_json(workflow: Any, out_dir: str = "templates") -> str:
+def json_payload(workflow: Any) -> Any:
     """
-    Export a workflow to JSON.
+    Return the JSON-serializable projection of a workflow.
 
-    - If `workflow` is a dict, it is written as-is (shallow-copied).
+    - If `workflow` is a dict, it is returned as-is (shallow-copied).
     - If `workflow` is an object, we project the legacy fields used in tests.
     """
+    if _is_mapping(workflow):
+        return dict(workflow)  # shallow copy for safety
+    wf_id = get_workflow_id(workflow)
+    # Backwards-compatible projection for legacy Workflow objects
+    return {
+        "workflow_id": getattr(workflow, "workflow_id", wf_id),
+        "objective": getattr(workflow, "objective", None),
+        "stages": getattr(workflow, "structured_instruction", {}),
+        "modules": getattr(workflow, "modular_workflow", {}),
+        "evaluation_report": getattr(workflow, "evaluation_report", None),
+        "improved_workflow": getattr(workflow, "improved_workflow", None),
+    }
+
+
+def export_json(workflow: Any, out_dir: str = "templates") -> str:
+    """Export a workflow to JSON (see ``json_payload`` for the projection)."""
     _ensure_dir(out_dir)
-    wf_id = _get_workflow_id(workflow)
+    wf_id = get_workflow_id(workflow)
     filename = os.path.join(out_dir, f"{wf_id}.json")
 
-    if _is_mapping(workflow):
-        data: Dict[str, Any] = dict(workflow)  # shallow copy for safety
-    else:
-        # Backwards-compatible projection for legacy Workflow objects
-        data = {
-            "workflow_id": getattr(workflow, "workflow_id", wf_id),
-            "objective": getattr(workflow, "objective", None),
-            "stages": getattr(workflow, "structured_instruction", {}),
-            "modules": getattr(workflow, "modular_workflow", {}),
-            "evaluation_report": getattr(workflow, "evaluation_report", None),
-            "improved_workflow": getattr(workflow, "improved_workflow", None),
-        }
-
-    path = write_json(data, filename)
+    path = write_json(json_payload(workflow), filename)
     log(f"Exported workflow {wf_id} → JSON at {path}")
     return path
 
 
-def export_markdown(workflow: Any, out_dir: str = "templates") -> str:
+def render_markdown(workflow: Any) -> str:
     """
-    Export a workflow to a lightweight Markdown summary.
+    Render a workflow as a lightweight Markdown summary.
 
     Tries to render something sensible for both dict-based and object-based
     workflows. It is intentionally lossy and human-facing.
     """
     # pylint: disable=too-many-branches,too-many-statements,too-many-locals
-    _ensure_dir(out_dir)
-    wf_id = _get_workflow_id(workflow)
-    filename = os.path.join(out_dir, f"{wf_id}.md")
-
+    wf_id = get_workflow_id(workflow)
     sections = _extract_sections(workflow, wf_id)
 
     md_lines: list[str] = []
@@ -178,8 +181,16 @@ def export_markdown(workflow: Any, out_dir: str = "templates") -> str:
         else:
             md_lines.append(f"- {sections.evaluation}")
 
-    md_content = "\n".join(md_lines)
-    path = write_markdown(md_content, filename)
+    return "\n".join(md_lines)
+
+
+def export_markdown(workflow: Any, out_dir: str = "templates") -> str:
+    """Export a workflow to a lightweight Markdown summary."""
+    _ensure_dir(out_dir)
+    wf_id = get_workflow_id(workflow)
+    filename = os.path.join(out_dir, f"{wf_id}.md")
+
+    path = write_markdown(render_markdown(workflow), filename)
     log(f"Exported workflow {wf_id} → Markdown at {path}")
     return path
 
@@ -2,17 +2,57 @@
 """
 generator/history.py — Workflow lineage and change history.
 
-Stores parent/child workflow relationships and score deltas in a simple
-JSON file, for later analysis or visualization.
+Stores parent/child workflow relationships and score deltas for later
+analysis or visualization.
+
+Layout (for storage_path=./data/history.json):
+- data/history/segment-000000.jsonl ...  append-only lineage log, one
+  HistoryRecord per line; a new segment starts past SEGMENT_BYTES.
+- data/history/index.snapshot            adjacency index checkpoint.
+- data/history/log.lock                  flock serializing appends.
+- data/history.json                      legacy full-rewrite file; imported
+                                         once when no segments exist yet.
+
+The in-memory index interns workflow ids to ints and keeps, per node, the
+ordinals of records where it is parent (children side) or child (parents
+side), plus each record's (segment, offset). It is loaded from the snapshot
+at startup and brought up to date by scanning the log past the snapshot's
+position, and it is shared by every HistoryManager on the same path within a
+process. Graph queries walk only the records adjacent to the nodes they
+return; `find_relations` seeks straight to the matching lines.
+
+Several processes may append to the same log (batch runner workers). Each
+append, including the choice of segment and any rollover, holds an exclusive
+``fcntl.flock`` on ``log.lock`` and goes to the newest segment on disk, so a
+segment never grows once a later one exists and catching up past it is safe.
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+import os
+import struct
+import threading
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from ai_cores.export_core import write_bytes
+from ai_monitoring.tracing import span
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+SEGMENT_BYTES = 64 * 1024 * 1024
+SNAPSHOT_EVERY = 50_000
+_SNAPSHOT_MAGIC = b"SSWGLIN1"
+_SNAPSHOT_VERSION = 1
 
 
 @dataclass
@@ -27,51 +67,460 @@ class HistoryRecord:
     modifications: List[str]
     score_delta: float
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "parent_workflow": self.parent_workflow,
+            "child_workflow": self.child_workflow,
+            "modifications": list(self.modifications),
+            "score_delta": self.score_delta,
+        }
+
+    @classmethod
+    def from_dict(cls, item: Dict[str, Any]) -> "HistoryRecord":
+        return cls(
+            timestamp=item.get("timestamp", ""),
+            parent_workflow=item.get("parent_workflow", ""),
+            child_workflow=item.get("child_workflow", ""),
+            modifications=list(item.get("modifications", [])),
+            score_delta=float(item.get("score_delta", 0)),
+        )
+
+
+def _segment_name(number: int) -> str:
+    return f"segment-{number:06d}.jsonl"
+
+
+class _Adjacency:
+    """
+    Record ordinals per node: a compressed base loaded from the snapshot
+    (``ordinals[start[n]:start[n + 1]]``) plus arrays for edges added since.
+    """
+
+    def __init__(self) -> None:
+        self.start = array("q", [0])
+        self.ordinals = array("i")
+        self.extra: Dict[int, array] = {}
+
+    def __getitem__(self, node: int) -> array:
+        if node + 1 < len(self.start):
+            base = self.ordinals[self.start[node] : self.start[node + 1]]
+        else:
+            base = array("i")
+        added = self.extra.get(node)
+        return base + added if added is not None else base
+
+    def add(self, node: int, ordinal: int) -> None:
+        added = self.extra.get(node)
+        if added is None:
+            self.extra[node] = array("i", [ordinal])
+        else:
+            added.append(ordinal)
+
+    def compacted(self, nodes: int) -> "_Adjacency":
+        """Return the same adjacency with every edge in the compressed base."""
+        if not self.extra and len(self.start) == nodes + 1:
+            return self
+        merged = _Adjacency()
+        start, ordinals = merged.start, merged.ordinals
+        for node in range(nodes):
+            ordinals.extend(self[node])
+            start.append(len(ordinals))
+        return merged
+
+
+class _LineageIndex:
+    """Adjacency index over the lineage log of one directory."""
+
+    def __init__(self, log_dir: Path, segment_bytes: int, snapshot_every: int):
+        self.log_dir = log_dir
+        self.segment_bytes = segment_bytes
+        self.snapshot_every = snapshot_every
+        self.snapshot_path = log_dir / "index.snapshot"
+        self.lock_path = log_dir / "log.lock"
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything indexed so far."""
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        # Per record ordinal
+        self.parent_of = array("i")
+        self.child_of = array("i")
+        self.segment_of = array("i")
+        self.offset_of = array("q")
+        # Per node id: ordinals of records where the node is parent / child
+        self.out_edges = _Adjacency()
+        self.in_edges = _Adjacency()
+        # Log position indexed contiguously, and this process's own appends
+        # past it (skipped when catching up).
+        self.scanned: Tuple[int, int] = (0, 0)
+        self.own: Set[Tuple[int, int]] = set()
+        self.segment = 0
+        self.unsnapshotted = 0
+
+    # ── building ────────────────────────────────────────────────
+
+    def intern(self, workflow_id: str) -> int:
+        node = self.ids.get(workflow_id)
+        if node is None:
+            node = len(self.names)
+            self.ids[workflow_id] = node
+            self.names.append(workflow_id)
+        return node
+
+    def add(self, parent: str, child: str, segment: int, offset: int) -> None:
+        ordinal = len(self.parent_of)
+        parent_id = self.intern(parent)
+        child_id = self.intern(child)
+        self.parent_of.append(parent_id)
+        self.child_of.append(child_id)
+        self.segment_of.append(segment)
+        self.offset_of.append(offset)
+        self.out_edges.add(parent_id, ordinal)
+        self.in_edges.add(child_id, ordinal)
+        self.unsnapshotted += 1
+
+    def segments(self) -> List[int]:
+        if not self.log_dir.is_dir():
+            return []
+        numbers = []
+        for name in os.listdir(self.log_dir):
+            if name.startswith("segment-") and name.endswith(".jsonl"):
+                numbers.append(int(name[len("segment-") : -len(".jsonl")]))
+        return sorted(numbers)
+
+    def catch_up(self) -> int:
+        """Index log lines past `scanned` that this process did not write."""
+        added = 0
+        start_segment, start_offset = self.scanned
+        if start_offset:
+            current = self.log_dir / _segment_name(start_segment)
+            if not current.exists() or current.stat().st_size < start_offset:
+                # Log removed or rewritten underneath us → rebuild from disk
+                self.reset()
+                start_segment, start_offset = self.scanned
+        for number in self.segments():
+            if number < start_segment:
+                continue
+            offset = start_offset if number == start_segment else 0
+            with (self.log_dir / _segment_name(number)).open("rb") as handle:
+                handle.seek(offset)
+                data = handle.read()
+            position = 0
+            while True:
+                end = data.find(b"\n", position)
+                if end < 0:
+                    break
+                key = (number, offset + position)
+                if key in self.own:
+                    self.own.discard(key)
+                else:
+                    try:
+                        item = json.loads(data[position:end])
+                    except json.JSONDecodeError:
+                        item = None
+                    if isinstance(item, dict):
+                        self.add(
+                            str(item.get("parent_workflow", "")),
+                            str(item.get("child_workflow", "")),
+                            number,
+                            offset + position,
+                        )
+                        added += 1
+                position = end + 1
+            self.scanned = (number, offset + position)
+            self.segment = max(self.segment, number)
+        return added
+
+    # ── snapshot ────────────────────────────────────────────────
+
+    def _snapshot_arrays(self, records: int, nodes: int) -> List[Tuple[array, int]]:
+        """Arrays stored after the snapshot header, with their lengths."""
+        return [
+            (self.parent_of, records),
+            (self.child_of, records),
+            (self.segment_of, records),
+            (self.offset_of, records),
+            (self.out_edges.start, nodes + 1),
+            (self.out_edges.ordinals, records),
+            (self.in_edges.start, nodes + 1),
+            (self.in_edges.ordinals, records),
+        ]
+
+    def load_snapshot(self) -> bool:
+        try:
+            raw = self.snapshot_path.read_bytes()
+        except OSError:
+            return False
+        if not raw.startswith(_SNAPSHOT_MAGIC):
+            return False
+        try:
+            (header_len,) = struct.unpack_from("<Q", raw, len(_SNAPSHOT_MAGIC))
+            body = len(_SNAPSHOT_MAGIC) + 8
+            header = json.loads(raw[body : body + header_len])
+            if header.get("version") != _SNAPSHOT_VERSION:
+                return False
+            position = body + header_len
+            records = int(header["records"])
+            nodes = len(header["names"])
+            for target, count in self._snapshot_arrays(records, nodes):
+                size = count * target.itemsize
+                del target[:]
+                target.frombytes(raw[position : position + size])
+                position += size
+                if len(target) != count:
+                    raise ValueError("truncated snapshot")
+        except (struct.error, ValueError, KeyError):
+            self.reset()
+            return False
+
+        self.names = list(header["names"])
+        self.ids = {name: node for node, name in enumerate(self.names)}
+        self.scanned = (int(header["scanned"][0]), int(header["scanned"][1]))
+        self.segment = self.scanned[0]
+        return True
+
+    def write_snapshot(self) -> None:
+        """Checkpoint the index; only the contiguously scanned log is covered."""
+        self.catch_up()
+        if self.own:
+            # Own appends past a gap we could not close; checkpoint later.
+            return
+        self.out_edges = self.out_edges.compacted(len(self.names))
+        self.in_edges = self.in_edges.compacted(len(self.names))
+        header = json.dumps(
+            {
+                "version": _SNAPSHOT_VERSION,
+                "records": len(self.parent_of),
+                "scanned": list(self.scanned),
+                "names": self.names,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        parts = [_SNAPSHOT_MAGIC, struct.pack("<Q", len(header)), header]
+        for target, _ in self._snapshot_arrays(len(self.parent_of), len(self.names)):
+            parts.append(target.tobytes())
+        write_bytes(b"".join(parts), self.snapshot_path, skip_unchanged=False)
+        self.unsnapshotted = 0
+
+    # ── appending ───────────────────────────────────────────────
+
+    @contextmanager
+    def file_lock(self) -> Iterator[None]:
+        """Exclusive lock shared with other processes appending to the log."""
+        if fcntl is None:
+            yield
+            return
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        with self.lock_path.open("ab") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _current_segment(self) -> Path:
+        """Newest segment on disk, rolled over if full; the file lock is held."""
+        while (self.log_dir / _segment_name(self.segment + 1)).exists():
+            self.segment += 1
+        path = self.log_dir / _segment_name(self.segment)
+        try:
+            if path.stat().st_size >= self.segment_bytes:
+                self.segment += 1
+                path = self.log_dir / _segment_name(self.segment)
+        except FileNotFoundError:
+            pass
+        return path
+
+    def append(self, record: HistoryRecord) -> None:
+        line = (json.dumps(record.to_dict(), separators=(",", ":")) + "\n").encode(
+            "utf-8"
+        )
+        if self.segment == 0 and not self.log_dir.is_dir():
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+        with self.file_lock():
+            path = self._current_segment()
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+                # O_APPEND leaves the offset at the end of our own write.
+                end = os.lseek(fd, 0, os.SEEK_CUR)
+            finally:
+                os.close(fd)
+        offset = end - len(line)
+        self.add(record.parent_workflow, record.child_workflow, self.segment, offset)
+        if (self.segment, offset) == self.scanned:
+            self.scanned = (self.segment, end)
+        else:
+            self.own.add((self.segment, offset))
+        if end >= self.segment_bytes:
+            self.segment += 1
+            self.write_snapshot()
+        elif self.unsnapshotted >= self.snapshot_every:
+            self.write_snapshot()
+
+    # ── reading ─────────────────────────────────────────────────
+
+    def read(self, ordinals: List[int]) -> List[HistoryRecord]:
+        records = []
+        handles: Dict[int, Any] = {}
+        try:
+            for ordinal in ordinals:
+                number = self.segment_of[ordinal]
+                handle = handles.get(number)
+                if handle is None:
+                    handle = (self.log_dir / _segment_name(number)).open("rb")
+                    handles[number] = handle
+                handle.seek(self.offset_of[ordinal])
+                records.append(HistoryRecord.from_dict(json.loads(handle.readline())))
+        finally:
+            for handle in handles.values():
+                handle.close()
+        return records
+
+    def walk(
+        self, workflow_id: str, depth: Optional[int], upward: bool
+    ) -> List[str]:
+        start = self.ids.get(workflow_id)
+        if start is None:
+            return []
+        edges = self.in_edges if upward else self.out_edges
+        step = self.parent_of if upward else self.child_of
+        seen = {start}
+        found: List[str] = []
+        frontier = deque([(start, 0)])
+        while frontier:
+            node, level = frontier.popleft()
+            if depth is not None and level >= depth:
+                continue
+            for ordinal in edges[node]:
+                other = step[ordinal]
+                if other not in seen:
+                    seen.add(other)
+                    found.append(self.names[other])
+                    frontier.append((other, level + 1))
+        return found
+
+    def path(self, source: int, target: int) -> Optional[List[int]]:
+        """Shortest parent→child chain from source to target (bidirectional BFS)."""
+        if source == target:
+            return [source]
+        forward: Dict[int, Optional[int]] = {source: None}
+        backward: Dict[int, Optional[int]] = {target: None}
+        forward_frontier, backward_frontier = [source], [target]
+        while forward_frontier and backward_frontier:
+            expand_forward = len(forward_frontier) <= len(backward_frontier)
+            if expand_forward:
+                frontier, visited, other = forward_frontier, forward, backward
+                edges, step = self.out_edges, self.child_of
+            else:
+                frontier, visited, other = backward_frontier, backward, forward
+                edges, step = self.in_edges, self.parent_of
+            next_frontier = []
+            for node in frontier:
+                for ordinal in edges[node]:
+                    neighbour = step[ordinal]
+                    if neighbour in visited:
+                        continue
+                    visited[neighbour] = node
+                    if neighbour in other:
+                        return self._join(neighbour, forward, backward)
+                    next_frontier.append(neighbour)
+            if expand_forward:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+        return None
+
+    @staticmethod
+    def _join(
+        meet: int,
+        forward: Dict[int, Optional[int]],
+        backward: Dict[int, Optional[int]],
+    ) -> List[int]:
+        head: List[int] = []
+        node: Optional[int] = meet
+        while node is not None:
+            head.append(node)
+            node = forward[node]
+        head.reverse()
+        node = backward[meet]
+        while node is not None:
+            head.append(node)
+            node = backward[node]
+        return head
+
+
+_INDEXES: Dict[Tuple[str, int, int], _LineageIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
 
 class HistoryManager:
     """
     Manage storage and retrieval of workflow history records.
 
-    Records are persisted as a JSON list of HistoryRecord dictionaries.
+    Records are appended to JSONL segments next to `storage_path`; see the
+    module docstring for the layout and the index.
     """
 
-    def __init__(self, storage_path: Path | str = Path("./data/history.json")) -> None:
+    def __init__(
+        self,
+        storage_path: Path | str = Path("./data/history.json"),
+        *,
+        segment_bytes: int = SEGMENT_BYTES,
+        snapshot_every: int = SNAPSHOT_EVERY,
+    ) -> None:
         self.storage_path = Path(storage_path)
-        self._records: List[HistoryRecord] = []
-        self._load()
+        self.log_dir = self.storage_path.with_suffix("")
+        key = (str(self.log_dir.absolute()), segment_bytes, snapshot_every)
+        with _INDEXES_LOCK:
+            index = _INDEXES.get(key)
+            if index is None:
+                index = _LineageIndex(self.log_dir, segment_bytes, snapshot_every)
+                _INDEXES[key] = index
+                self._index = index
+                self._load()
+            else:
+                self._index = index
+        with index.lock:
+            index.catch_up()
 
     def _load(self) -> None:
-        """Load existing history data from disk, if present."""
-        if not self.storage_path.exists():
-            return
+        """Load the index snapshot, import legacy data, and scan the log tail."""
+        index = self._index
+        with index.lock:
+            if index.load_snapshot():
+                return
+            if not index.segments() and self.storage_path.exists():
+                self._import_legacy()
+            if index.catch_up() >= index.snapshot_every:
+                index.write_snapshot()
 
+    def _import_legacy(self) -> None:
+        """Append records from a legacy JSON list file to the lineage log."""
         try:
             text = self.storage_path.read_text(encoding="utf-8")
             raw_records = json.loads(text)
         except (OSError, json.JSONDecodeError):
-            self._records = []
             return
-
-        for item in raw_records:
-            self._records.append(
-                HistoryRecord(
-                    timestamp=item.get("timestamp", ""),
-                    parent_workflow=item.get("parent_workflow", ""),
-                    child_workflow=item.get("child_workflow", ""),
-                    modifications=list(item.get("modifications", [])),
-                    score_delta=float(item.get("score_delta", 0)),
-                )
-            )
-
-    def _save(self) -> None:
-        """Persist the current records to disk."""
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        raw = [asdict(record) for record in self._records]
-        self.storage_path.write_text(
-            json.dumps(raw, indent=2),
-            encoding="utf-8",
+        if not isinstance(raw_records, list) or not raw_records:
+            return
+        lines = "".join(
+            json.dumps(HistoryRecord.from_dict(item).to_dict(), separators=(",", ":"))
+            + "\n"
+            for item in raw_records
         )
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        with self._index.file_lock():
+            if self._index.segments():
+                return  # Another process imported it first
+            segment = self.log_dir / _segment_name(0)
+            with segment.open("a", encoding="utf-8") as handle:
+                handle.write(lines)
 
+    @span("persistence.history.record_transition")
     def record_transition(
         self,
         parent_workflow_id: str,
@@ -102,21 +551,74 @@ class HistoryManager:
             modifications=modifications or [],
             score_delta=score_delta,
         )
-        self._records.append(record)
-        self._save()
+        with self._index.lock:
+            self._index.append(record)
         return record
 
+    def checkpoint(self) -> None:
+        """Persist the adjacency index so the next startup skips the log scan."""
+        with self._index.lock:
+            self._index.write_snapshot()
+
     def find_relations(self, workflow_id: str) -> List[HistoryRecord]:
         """
         Find all history records where the given workflow appears as
         either parent or child.
         """
-        return [
-            record
-            for record in self._records
-            if workflow_id in (record.parent_workflow, record.child_workflow)
-        ]
+        index = self._index
+        with index.lock:
+            node = index.ids.get(workflow_id)
+            if node is None:
+                return []
+            ordinals = sorted(set(index.out_edges[node]) | set(index.in_edges[node]))
+            return index.read(ordinals)
+
+    def ancestors(self, workflow_id: str, depth: Optional[int] = None) -> List[str]:
+        """
+        Workflows `workflow_id` derives from, nearest first (breadth-first).
+
+        Args:
+            depth: Maximum number of generations to walk (None = unlimited).
+        """
+        with self._index.lock:
+            return self._index.walk(workflow_id, depth, upward=True)
+
+    def descendants(self, workflow_id: str, depth: Optional[int] = None) -> List[str]:
+        """Workflows derived from `workflow_id`, nearest first (breadth-first)."""
+        with self._index.lock:
+            return self._index.walk(workflow_id, depth, upward=False)
+
+    def lineage_path(self, source_id: str, target_id: str) -> Optional[List[str]]:
+        """
+        Shortest chain of workflow ids linking `source_id` to `target_id`
+        through parent→child transitions, in either direction.
+
+        Returns:
+            ``[source_id, ..., target_id]`` or None if neither descends from
+            the other.
+        """
+        index = self._index
+        with index.lock:
+            source = index.ids.get(source_id)
+            target = index.ids.get(target_id)
+            if source is None or target is None:
+                return None
+            chain = index.path(source, target)
+            if chain is None:
+                chain = index.path(target, source)
+                if chain is not None:
+                    chain.reverse()
+            return [index.names[node] for node in chain] if chain else None
+
+    def iter_records(self) -> Iterator[HistoryRecord]:
+        """Yield every stored history record in log order."""
+        for number in self._index.segments():
+            path = self.log_dir / _segment_name(number)
+            with path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        yield HistoryRecord.from_dict(json.loads(line))
 
     def all_records(self) -> List[HistoryRecord]:
         """Return a copy of all stored history records."""
-        return list(self._records)
+        return list(self.iter_records())
@@ -14,16 +14,17 @@ This version operates on schema-aligned JSON workflows:
 - Records history of parent/child workflow relationships
 """
 
-# pylint: disable=wrong-import-position,too-many-lines
+# pylint: disable=wrong-import-position,too-many-lines,import-outside-toplevel
 
 from __future__ import annotations
 
 import argparse
 import json
 import logging
+from contextlib import contextmanager
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, Optional, Union
 
 import sys
 
@@ -31,25 +32,13 @@ ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from ai_graph.dependency_mapper import DependencyGraph
-from ai_validation.schema_validator import validate_workflow
-from ai_visualization.mermaid_generator import mermaid_from_workflow
-from ai_visualization.export_manager import export_graphviz
-from ai_visualization.export_manager import export_json as viz_export_json
-from ai_visualization.export_manager import export_markdown as viz_export_markdown
-from ai_conductor.orchestrator import Orchestrator, RunContext
-from ai_conductor.workflow import Workflow
-from ai_evaluation.checkpoints import EvaluationCheckpointer
-from ai_evaluation.evaluation_engine import evaluate_workflow_quality
-from ai_memory.memory_store import MemoryStore
-from ai_memory.feedback_integrator import FeedbackIntegrator
-from ai_recursive.version_diff_engine import compute_diff_summary
-from data.data_parsing import load_template
 from ai_cores.audit_core import utc_timestamp
-from generator.exporters import export_json, export_markdown
-from generator.history import HistoryManager
-from generator.recursion_manager import RecursionManager
-from generator.pdl_executor import execute_pdl_run
+from generator.workflow_view import cow_copy
+
+# Pipeline dependencies (orchestrator, schema validation, evaluation, recursion,
+# PDL runtime, exporters) are imported inside the functions that use them so
+# each CLI mode only pays for the subsystems it runs; `--version` stays cheap.
+# scripts/benchmark_startup.py guards the resulting cold-start budget.
 
 # ─── Logging Setup ────────────────────────────────────────────────
 
@@ -391,6 +380,8 @@ def _apply_meta_metrics(
     baseline_overall = None
     baseline_status = "missing"
 
+    from ai_memory.memory_store import MemoryStore
+
     baseline = MemoryStore().load_latest(str(workflow_id))
     if baseline:
         baseline_meta = baseline.get("evaluation", {}).get("meta_metrics", {})
@@ -492,14 +483,19 @@ def _apply_dependency_tracking(
         if any(dep not in module_ids for dep in deps)
     }
 
+    from ai_graph.dependency_mapper import DependencyGraph
+
     graph_helper = DependencyGraph(modules)
     graph_helper.autocorrect_missing_dependencies()
 
     cycle_detected = graph_helper.detect_cycle()
     cycle_corrected = False
+    cycle_resolution: Dict[str, Any] = {}
     if cycle_detected:
         logger.warning("Dependency cycle detected; attempting autocorrect.")
-        cycle_corrected = graph_helper.attempt_autocorrect_cycle()
+        resolution = graph_helper.resolve_cycles()
+        cycle_corrected = resolution.resolved
+        cycle_resolution = resolution.to_dict()
         if not cycle_corrected and workflow.get("evaluation") is not None:
             workflow["evaluation"].setdefault("notes", []).append(
                 "Unresolved dependency cycle detected; manual review required.",
@@ -546,6 +542,7 @@ def _apply_dependency_tracking(
                     "missing_dependencies": missing_dependencies,
                     "cycle_detected": cycle_detected,
                     "cycle_corrected": cycle_corrected,
+                    "cycle_resolution": cycle_resolution,
                     "changes": changes,
                 },
                 "impact_analysis": {
@@ -565,28 +562,41 @@ def _apply_dependency_tracking(
 
 # ─── Optional telemetry integration ──────────────────────────────
 
-try:
-    # Import the underlying implementation, but do NOT re-export it directly.
-    from ai_monitoring.structured_logger import log_event as _raw_log_event
-except Exception:  # pylint: disable=broad-exception-caught
-    # Fallback implementation if monitoring is not wired yet.
-    def _raw_log_event(*args: Any, **kwargs: Any) -> None:  # type: ignore[unused-argument]
-        """
-        Very lenient fallback logger: accepts any args/kwargs.
-
-        We try to extract an event name and payload if possible for logging,
-        but otherwise just emit a generic info line.
-        """
-        if args:
-            event = args[0]
-        else:
-            event = "<unknown-event>"
-        payload = None
-        if len(args) > 1:
-            payload = args[1]
-        else:
-            payload = kwargs.get("payload")
-        logger.info("log_event(%s, %r)", event, payload)
+
+def _raw_log_event(*args: Any, **kwargs: Any) -> None:  # type: ignore[unused-argument]
+    """
+    Very lenient fallback logger: accepts any args/kwargs.
+
+    We try to extract an event name and payload if possible for logging,
+    but otherwise just emit a generic info line.
+    """
+    if args:
+        event = args[0]
+    else:
+        event = "<unknown-event>"
+    payload = None
+    if len(args) > 1:
+        payload = args[1]
+    else:
+        payload = kwargs.get("payload")
+    logger.info("log_event(%s, %r)", event, payload)
+
+
+_telemetry_sink: Optional[Any] = None
+
+
+def _resolve_telemetry_sink() -> Any:
+    """Bind the structured logger on first use (it is not needed at import)."""
+    global _telemetry_sink  # pylint: disable=global-statement
+    if _telemetry_sink is None:
+        try:
+            # Import the underlying implementation, but do NOT re-export it.
+            from ai_monitoring.structured_logger import log_event as sink
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Fallback implementation if monitoring is not wired yet.
+            sink = _raw_log_event
+        _telemetry_sink = sink
+    return _telemetry_sink
 
 
 def log_event(
@@ -599,7 +609,7 @@ def log_event(
     This gives us a stable, simple signature for the rest of the MVM code,
     regardless of how ai_monitoring.structured_logger.log_event is defined.
     """
-    _raw_log_event(event, payload)
+    _resolve_telemetry_sink()(event, payload)
 
 
 # ─── Defaults ────────────────────────────────────────────────────
@@ -607,6 +617,10 @@ def log_event(
 # Default template path for MVM demos (used when no --template is given)
 DEFAULT_TEMPLATE = Path("data/templates/campfire_workflow.json")
 
+# Mirrors ai_evaluation.evaluation_cache.DEFAULT_CACHE_DIR; duplicated so that
+# argument parsing does not import the evaluation stack.
+DEFAULT_EVAL_CACHE_DIR = Path(".sswg_cache/evaluations")
+
 
 # ─── CLI Parsing ─────────────────────────────────────────────────
 
@@ -674,6 +688,39 @@ def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
         type=Path,
         help="Run the PDL runtime executor against the provided PDL YAML file.",
     )
+    parser.add_argument(
+        "--eval-cache-dir",
+        type=Path,
+        default=DEFAULT_EVAL_CACHE_DIR,
+        help="Directory for the persistent evaluation cache tier.",
+    )
+    parser.add_argument(
+        "--no-eval-cache",
+        action="store_true",
+        help="Disable the on-disk evaluation cache tier.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        help=(
+            "Write pipeline metrics in Prometheus text format to this file "
+            "(atomically, every --metrics-interval seconds and at exit)."
+        ),
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=15.0,
+        help="Seconds between --metrics-file writes.",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        help=(
+            "Record spans and write Chrome/Perfetto trace-event JSON to this "
+            "path, plus collapsed stacks to <name>.folded beside it."
+        ),
+    )
 
     return parser.parse_args(argv)
 
@@ -710,10 +757,35 @@ def process_workflow(
     - dependency graph autocorrect
     - evaluation + semantic deltas
     - recursive refinement with llm_adapter
-    - visualization exports
+
+    Artifacts (JSON, Markdown, DOT, Mermaid) are written afterwards, in a
+    single pass, by `export_artifacts`.
     """
+    from ai_conductor.orchestrator import Orchestrator
+    from ai_conductor.workflow import Workflow
+    from ai_evaluation.checkpoints import EvaluationCheckpointer
+    from ai_evaluation.evaluation_cache import get_evaluation_cache
+    from ai_evaluation.evaluation_engine import evaluate_workflow_quality
+    from ai_monitoring.metrics import get_metrics_registry
+    from ai_monitoring.tracing import span
+    from ai_recursive.version_diff_engine import compute_diff_summary
+    from ai_validation.schema_validator import validate_workflow
+    from ai_visualization.mermaid_generator import mermaid_from_workflow
+    from generator.recursion_manager import RecursionManager
+
     workflow_id = workflow.get("workflow_id", "unnamed_workflow")
     log_event("mvm.process.started", {"workflow_id": workflow_id})
+    metrics = get_metrics_registry()
+    stage_seconds = metrics.histogram(
+        "sswg_pipeline_stage_seconds",
+        "process_workflow stage wall time in seconds.",
+        ("stage",),
+    )
+
+    @contextmanager
+    def stage(name: str) -> Iterator[None]:
+        with span(f"pipeline.{name}"), stage_seconds.labels(stage=name).time():
+            yield
 
     checkpoint_manager = EvaluationCheckpointer()
 
@@ -724,14 +796,17 @@ def process_workflow(
     )
 
     # 1. Normalize task packaging for modular reuse
-    _apply_task_packaging(workflow, change_source="initial_pass")
+    with stage("task_packaging"):
+        _apply_task_packaging(workflow, change_source="initial_pass")
 
     # 2. Validate inheritance requirements for multi-domain workflows
-    _apply_inheritance_checks(workflow, change_source="initial_pass")
+    with stage("inheritance_checks"):
+        _apply_inheritance_checks(workflow, change_source="initial_pass")
 
     # 3. Schema validation
     # 1. Schema validation
-    is_valid, errors = validate_workflow(workflow)
+    with stage("schema_validation"):
+        is_valid, errors = validate_workflow(workflow)
     if not is_valid and errors:
         logger.warning("Initial schema validation reported issues: %s", errors)
         workflow.setdefault("evaluation", {}).setdefault(
@@ -740,14 +815,17 @@ def process_workflow(
         ).append("Schema validation reported issues; see logs for details.")
 
     # 4. Build dependency graph and autocorrect structural issues
-    _apply_dependency_tracking(workflow, change_source="initial_pass")
+    with stage("dependency_tracking"):
+        _apply_dependency_tracking(workflow, change_source="initial_pass")
 
     # 5. Generate mermaid representation (for logging/debugging)
-    mermaid = mermaid_from_workflow(workflow)
+    with stage("mermaid"):
+        mermaid = mermaid_from_workflow(workflow)
     logger.info("Mermaid graph for workflow %s:\n%s", workflow_id, mermaid)
 
     # 6. Evaluation + semantic scoring
-    base_quality = evaluate_workflow_quality(workflow)
+    with stage("evaluation"):
+        base_quality = evaluate_workflow_quality(workflow)
     workflow.setdefault("evaluation", {})["quality"] = base_quality
     base_checkpoint = checkpoint_manager.record(
         "baseline_quality",
@@ -764,14 +842,16 @@ def process_workflow(
 
     # 7. Recursive refinement (single iteration) if enabled
     # 4. Evaluation + semantic scoring
-    base_quality = evaluate_workflow_quality(workflow)
+    with stage("evaluation"):
+        base_quality = evaluate_workflow_quality(workflow)
     workflow.setdefault("evaluation", {})["quality"] = base_quality
 
     # 5. Recursive refinement (single iteration) if enabled
-    refined = deepcopy(workflow)
+    refined = cow_copy(workflow)
     if enable_refinement:
         recursion_manager = RecursionManager(output_dir=out_dir)
-        outcome = recursion_manager.run_cycle(refined, depth=0)
+        with stage("refinement"):
+            outcome = recursion_manager.run_cycle(refined, depth=0)
         refined = outcome.refined_workflow
         refined.setdefault("evaluation", {}).update(
             {
@@ -836,26 +916,22 @@ def process_workflow(
                 "semantic_delta": outcome.semantic_delta,
             },
         )
-        _apply_task_packaging(refined, change_source="refinement_pass")
-        _apply_inheritance_checks(refined, change_source="refinement_pass")
-        _apply_dependency_tracking(refined, change_source="refinement_pass")
+        with stage("task_packaging"):
+            _apply_task_packaging(refined, change_source="refinement_pass")
+        with stage("inheritance_checks"):
+            _apply_inheritance_checks(refined, change_source="refinement_pass")
+        with stage("dependency_tracking"):
+            _apply_dependency_tracking(refined, change_source="refinement_pass")
 
     if not enable_refinement:
         workflow.setdefault("evaluation", {})[
             "checkpoint_summary"
         ] = checkpoint_manager.summarize()
 
-    # 6. Export updated visualization assets
-    # 8. Export updated visualization assets
-    export_graphviz(refined, str(out_dir))
-    viz_export_json(refined, str(out_dir))
-    viz_export_markdown(refined, str(out_dir))
-
-    # 6. Export updated visualization assets
-    export_graphviz(refined, str(out_dir))
-    viz_export_json(refined, str(out_dir))
-    viz_export_markdown(refined, str(out_dir))
-
+    get_evaluation_cache().log_stats()
+    metrics.counter(
+        "sswg_workflows_processed", "process_workflow runs.", ("refinement",)
+    ).labels(refinement=str(enable_refinement).lower()).inc()
     log_event("mvm.process.completed", {"workflow_id": workflow_id})
     return refined
 
@@ -868,23 +944,26 @@ def export_artifacts(
     out_dir: Path,
 ) -> Dict[str, str]:
     """
-    Export JSON + Markdown artifacts for the workflow.
+    Export JSON, Markdown, DOT and Mermaid artifacts for the workflow.
+
+    The workflow is rendered once; unchanged files are not rewritten.
 
     Returns:
         Mapping from artifact type to path (as str).
     """
-    out_dir = out_dir or Path("data/outputs")
-    out_dir_str = str(out_dir)
-    logger.info("Exporting artifacts to %s", out_dir_str)
+    from generator.export_stage import export_workflow_formats
 
-    json_path = export_json(workflow, out_dir_str)
-    md_path = export_markdown(workflow, out_dir_str)
+    out_dir = out_dir or Path("data/outputs")
+    logger.info("Exporting artifacts to %s", out_dir)
 
-    return {"json": json_path, "markdown": md_path}
+    report = export_workflow_formats(workflow, out_dir)
+    return report.paths
 
 
 def record_feedback(original: Dict[str, Any], refined: Dict[str, Any]) -> None:
     """Record diff-driven feedback into persistent memory."""
+    from ai_memory.feedback_integrator import FeedbackIntegrator
+    from ai_recursive.version_diff_engine import compute_diff_summary
 
     diff_summary = compute_diff_summary(original, refined)
     clarity_after = (
@@ -933,6 +1012,8 @@ def record_history_if_needed(
         # No detectable differences worth a history record
         return
 
+    from generator.history import HistoryManager
+
     history_manager = HistoryManager()
     record = history_manager.record_transition(
         parent_workflow_id=parent_id,
@@ -969,21 +1050,30 @@ def run_mvm(
     Returns:
         The refined workflow dict.
     """
+    from ai_monitoring.tracing import span
+
     if isinstance(workflow_source, Path):
-        workflow = load_workflow(workflow_source)
+        original = load_workflow(workflow_source)
     else:
-        # Defensive copy so callers can reuse their original dict
-        workflow = deepcopy(workflow_source)
-
-    original = deepcopy(workflow)
-    refined = process_workflow(
-        workflow,
-        enable_refinement=enable_refinement,
-        out_dir=out_dir,
-    )
-    export_artifacts(refined, out_dir)
-    record_history_if_needed(original, refined, enable_history=enable_history)
-    record_feedback(original, refined)
+        # Defensive copy so callers can reuse (and mutate) their original dict
+        original = deepcopy(workflow_source)
+
+    # The pipeline mutates a copy-on-write view, so `original` (never mutated)
+    # doubles as the pre-run snapshot.
+    workflow = cow_copy(original)
+    with span("mvm.run", workflow_id=original.get("workflow_id")):
+        with span("mvm.process_workflow"):
+            refined = process_workflow(
+                workflow,
+                enable_refinement=enable_refinement,
+                out_dir=out_dir,
+            )
+        with span("mvm.export"):
+            export_artifacts(refined, out_dir)
+        with span("mvm.history"):
+            record_history_if_needed(original, refined, enable_history=enable_history)
+        with span("mvm.feedback"):
+            record_feedback(original, refined)
 
     if preview:
         snippet = json.dumps(refined, indent=2)[:800]
@@ -1005,6 +1095,37 @@ def main(argv: Optional[list] = None) -> int:
         print("sswg-mvm software — MVM v0.1.0")
         return 0
 
+    if not (args.metrics_file or args.trace):
+        return _run_cli(args)
+
+    from ai_monitoring.metrics import TextfileExporter
+    from ai_monitoring.tracing import get_tracer
+
+    exporter = None
+    if args.metrics_file:
+        exporter = TextfileExporter(args.metrics_file, interval=args.metrics_interval)
+        exporter.start()
+    if args.trace:
+        get_tracer().start()
+    try:
+        return _run_cli(args)
+    finally:
+        if exporter is not None:
+            exporter.stop()
+        if args.trace:
+            get_tracer().stop()
+            written = get_tracer().write(args.trace)
+            logger.info("Trace written to %s", ", ".join(written.values()))
+
+
+def _run_cli(args: argparse.Namespace) -> int:
+    """Run the selected CLI mode (PDL run or MVM pipeline)."""
+    from ai_evaluation.evaluation_cache import configure_evaluation_cache
+
+    configure_evaluation_cache(
+        cache_dir=None if args.no_eval_cache else args.eval_cache_dir
+    )
+
     # Resolve workflow source:
     # - --demo forces the canonical template + output dir
     # - If --template is provided, load from data/templates/<slug>.json
@@ -1016,6 +1137,8 @@ def main(argv: Optional[list] = None) -> int:
         logger.info("Demo mode: using template %s", workflow_source)
     elif args.template:
         try:
+            from data.data_parsing import load_template
+
             workflow_source = load_template(args.template)
             logger.info(
                 "Loaded workflow from template slug '%s' via data.templates",
@@ -1030,6 +1153,8 @@ def main(argv: Optional[list] = None) -> int:
     if args.pdl:
         pdl_path = args.pdl
         try:
+            from generator.pdl_executor import execute_pdl_run
+
             result = execute_pdl_run(
                 pdl_path=pdl_path,
                 report_dir=out_dir / "pdl_runs",
@@ -1046,6 +1171,8 @@ def main(argv: Optional[list] = None) -> int:
             return 1
 
     try:
+        from ai_conductor.orchestrator import Orchestrator, RunContext
+
         orchestrator = Orchestrator()
         context = RunContext(
             workflow_source=workflow_source,
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import time
 from dataclasses import dataclass
 from importlib import import_module
 from importlib.util import find_spec
@@ -18,8 +19,11 @@ from typing import Any, Dict, Optional
 import yaml
 from jsonschema import Draft202012Validator
 
+from ai_cores.config_core import get_config_service
 from ai_cores.schema_core import get_validator, load_schema
 from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from ai_monitoring.metrics import get_metrics_registry
+from ai_monitoring.tracing import span
 
 from generator.failure_emitter import FailureEmitter, FailureLabel
 from generator.hashing import hash_data
@@ -29,6 +33,13 @@ REPO_ROOT = find_repo_root()
 SCHEMAS_DIR = REPO_ROOT / "schemas"
 PHASE_CONSTRAINTS_PATH = SCHEMAS_DIR / "phase_constraints.yaml"
 
+_VALIDATIONS = get_metrics_registry().counter(
+    "sswg_validations", "Validator calls by outcome.", ("validator", "result")
+)
+_VALIDATION_SECONDS = get_metrics_registry().histogram(
+    "sswg_validation_seconds", "Validator wall time in seconds.", ("validator",)
+)
+
 
 @dataclass
 class PDLFailureLabel:  # pylint: disable=invalid-name
@@ -82,19 +93,35 @@ def _load_pdl_yaml(path: Path) -> Dict[str, Any]:
     return data
 
 
-def _load_phase_constraints(schema_dir: Path) -> Dict[str, Any]:
-    """Load the phase constraints mapping from disk."""
-    constraints_path = schema_dir / PHASE_CONSTRAINTS_PATH.name
-    if not constraints_path.exists():
+def _parse_phase_constraints(payload: Any, constraints_path: Path) -> Dict[str, Any]:
+    """Validate a phase constraints document and return its phases mapping."""
+    if not isinstance(payload, dict):
         raise PDLValidationError(
             PDLFailureLabel(
-                Type="io_failure",
-                message="Phase constraints file not found",
+                Type="schema_failure",
+                message="Phase constraints document must be a mapping",
+                evidence={"path": str(constraints_path)},
+            )
+        )
+    phases = payload.get("phases")
+    if not isinstance(phases, dict):
+        raise PDLValidationError(
+            PDLFailureLabel(
+                Type="schema_failure",
+                message="Phase constraints missing required phases mapping",
                 evidence={"path": str(constraints_path)},
             )
         )
+    return phases
+
+
+def _load_phase_constraints(schema_dir: Path) -> Dict[str, Any]:
+    """Load the phase constraints mapping (cached per process, read-only)."""
+    constraints_path = schema_dir / PHASE_CONSTRAINTS_PATH.name
     try:
-        payload = yaml.safe_load(constraints_path.read_text(encoding="utf-8"))
+        phases = get_config_service().load(
+            constraints_path, _parse_phase_constraints, default=None
+        )
     except (OSError, yaml.YAMLError) as exc:
         raise PDLValidationError(
             PDLFailureLabel(
@@ -103,20 +130,11 @@ def _load_phase_constraints(schema_dir: Path) -> Dict[str, Any]:
                 evidence={"path": str(constraints_path)},
             )
         ) from exc
-    if not isinstance(payload, dict):
+    if phases is None:
         raise PDLValidationError(
             PDLFailureLabel(
-                Type="schema_failure",
-                message="Phase constraints document must be a mapping",
-                evidence={"path": str(constraints_path)},
-            )
-        )
-    phases = payload.get("phases")
-    if not isinstance(phases, dict):
-        raise PDLValidationError(
-            PDLFailureLabel(
-                Type="schema_failure",
-                message="Phase constraints missing required phases mapping",
+                Type="io_failure",
+                message="Phase constraints file not found",
                 evidence={"path": str(constraints_path)},
             )
         )
@@ -243,6 +261,7 @@ def _validate_handler_paths(phases: list[dict[str, Any]]) -> None:
             )
 
 
+@span("validation.pdl")
 def validate_pdl_object(
     pdl_obj: Dict[str, Any],
     *,
@@ -251,6 +270,30 @@ def validate_pdl_object(
     resolve_handlers: bool = True,
 ) -> None:
     """Validate a PDL object against the schema."""
+    started = time.perf_counter()
+    result = "fail"
+    try:
+        _validate_pdl_object(
+            pdl_obj,
+            schema_dir=schema_dir,
+            schema_name=schema_name,
+            resolve_handlers=resolve_handlers,
+        )
+        result = "pass"
+    finally:
+        _VALIDATIONS.labels(validator="pdl", result=result).inc()
+        _VALIDATION_SECONDS.labels(validator="pdl").observe(
+            time.perf_counter() - started
+        )
+
+
+def _validate_pdl_object(
+    pdl_obj: Dict[str, Any],
+    *,
+    schema_dir: Path,
+    schema_name: str,
+    resolve_handlers: bool,
+) -> None:
     try:
         validator = _get_validator(schema_dir, schema_name)
     except FileNotFoundError as exc:
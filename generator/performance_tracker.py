@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 from ai_monitoring.structured_logger import get_logger, log_event
+from ai_monitoring.tracing import span
 
 
 @dataclass
@@ -45,6 +46,9 @@ class PhaseStats:
 class PerformanceTracker:
     """
     Track timing and basic performance metrics for generator phases.
+
+    Tracked blocks are also recorded as ai_monitoring.tracing spans, so they
+    nest inside a trace when one is being recorded.
     """
 
     def __init__(self) -> None:
@@ -93,13 +97,16 @@ class _TimingContext:
         self._label = label
         self._start: Optional[float] = None
         self._success: bool = True
+        self._span = span(label)
 
     def __enter__(self) -> "_TimingContext":
+        self._span.__enter__()
         self._start = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc, exc_tb) -> None:
         end = time.perf_counter()
+        self._span.__exit__(exc_type, exc, exc_tb)
         duration = end - (self._start or end)
         self._success = exc is None
         self._tracker._record(self._label, duration, self._success)
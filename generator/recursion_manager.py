@@ -3,12 +3,11 @@
 
 from __future__ import annotations
 
-import importlib
 import logging
-from copy import deepcopy
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ai_evaluation.evaluation_engine import evaluate_workflow_quality
 from ai_memory.benchmark_tracker import BenchmarkTracker
@@ -16,7 +15,9 @@ from ai_optimization.optimization_engine import OptimizationEngine, Optimization
 from ai_evaluation.semantic_analysis import SemanticAnalyzer
 from ai_memory.feedback_integrator import FeedbackIntegrator
 from ai_memory.memory_store import MemoryStore
+from ai_monitoring.metrics import get_metrics_registry
 from ai_monitoring.structured_logger import log_event
+from ai_monitoring.tracing import span
 from ai_recursive.version_diff_engine import compute_diff_summary
 from ai_validation import (
     ErrorClass,
@@ -27,11 +28,27 @@ from ai_validation import (
     classify_exception,
     recovery_decision,
 )
+from generator.embedding_engine import (
+    DEFAULT_MODEL_NAME,
+    cosine_similarity,
+    get_embedding_engine,
+)
 from generator.history import HistoryManager
+from generator.workflow_view import cow_copy
 from modules.llm_adapter import RefinementContract, generate_refinement, generate_text
 
 logger = logging.getLogger("generator.recursion_manager")
 
+_RECURSION_CYCLES = get_metrics_registry().counter(
+    "sswg_recursion_cycles", "Recursion cycles run.", ("regenerated",)
+)
+_RECURSION_CYCLE_SECONDS = get_metrics_registry().histogram(
+    "sswg_recursion_cycle_seconds", "RecursionManager.run_cycle wall time in seconds."
+)
+_RECURSION_SCORE_DELTA = get_metrics_registry().gauge(
+    "sswg_recursion_score_delta", "Score delta of the latest recursion cycle."
+)
+
 
 @dataclass
 class RecursionPolicy:
@@ -55,30 +72,22 @@ class RecursionOutcome:
 
 
 class SemanticDeltaCalculator:
-    """Compute semantic deltas between workflow snapshots."""
+    """Compute semantic deltas between workflow snapshots.
+
+    Embeddings come from the process-wide EmbeddingEngine: the model is
+    loaded once per process on first use and vectors are cached on disk by
+    flattened-text hash. Without sentence-transformers, lexical token sets
+    are used instead.
+    """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+    def __init__(self, model_name: str = DEFAULT_MODEL_NAME) -> None:
         self.analyzer = SemanticAnalyzer()
-        self.model = None
-        self._util = None
+        self.engine = get_embedding_engine(model_name)
 
-        module_spec = importlib.util.find_spec("sentence_transformers")
-        if module_spec is None:
-            logger.warning(
-                "sentence-transformers is unavailable; using lexical semantic delta."
-            )
-            return
-
-        try:
-            sentence_transformers = importlib.import_module("sentence_transformers")
-            self.model = sentence_transformers.SentenceTransformer(model_name)
-            self._util = sentence_transformers.util
-            logger.info("Loaded SentenceTransformer model: %s", model_name)
-        except Exception as exc:  # pragma: no cover
-            logger.warning(
-                "sentence-transformers unavailable; using lexical semantic delta (%s).",
-                exc,
-            )
+    @property
+    def model(self) -> Any:
+        """The shared embedding model, or None for lexical deltas."""
+        return self.engine.model
 
     def _flatten_workflow(self, workflow: Dict[str, Any]) -> str:
         """Flatten workflow content into a plain text representation."""
@@ -87,10 +96,14 @@ class SemanticDeltaCalculator:
 
     def encode(self, workflow: Dict[str, Any]):
         """Encode workflow content into an embedding or lexical tokens."""
-        text = self._flatten_workflow(workflow)
-        if not self.model:
-            return text.lower().split()
-        return self.model.encode(text, convert_to_tensor=True)
+        return self.encode_many([workflow])[0]
+
+    def encode_many(self, workflows: List[Dict[str, Any]]) -> List[Any]:
+        """Encode several workflows with a single batched forward pass."""
+        texts = [self._flatten_workflow(workflow) for workflow in workflows]
+        if not self.engine.available:
+            return [text.lower().split() for text in texts]
+        return self.engine.encode_many(texts)
 
     def delta(self, before_embedding: Any, after_embedding: Any) -> float:
         """Compute semantic delta between embeddings."""
@@ -102,7 +115,7 @@ class SemanticDeltaCalculator:
             overlap = len(before_set.intersection(after_set))
             total = max(len(before_set.union(after_set)), 1)
             return 1.0 - (overlap / total)
-        similarity = self._util.cos_sim(before_embedding, after_embedding).item()
+        similarity = cosine_similarity(before_embedding, after_embedding)
         return 1.0 - max(min(similarity, 1.0), -1.0)
 
 
@@ -180,6 +193,12 @@ class RecursionManager:  # pylint: disable=too-many-instance-attributes
         embedding = self.delta_calculator.encode(workflow)
         return {"quality": quality, "embedding": embedding}
 
+    def _attach_embeddings(self, *pairs: tuple[Dict[str, Any], Dict[str, Any]]) -> None:
+        """Encode (workflow, report) pairs in one batch and attach embeddings."""
+        embeddings = self.delta_calculator.encode_many([wf for wf, _ in pairs])
+        for (_, report), embedding in zip(pairs, embeddings):
+            report["embedding"] = embedding
+
     def _render_metric_plot(
         self,
         before_report: Dict[str, Any],
@@ -270,7 +289,7 @@ class RecursionManager:  # pylint: disable=too-many-instance-attributes
         )
         suggestion = generate_text(prompt)
 
-        regenerated = deepcopy(workflow)
+        regenerated = cow_copy(workflow)
         recursion_meta = regenerated.setdefault("recursion", {})
         recursion_meta["llm_prompt"] = prompt
         recursion_meta["llm_suggestion"] = suggestion
@@ -328,6 +347,7 @@ class RecursionManager:  # pylint: disable=too-many-instance-attributes
             deterministic_delta=deterministic_delta,
         )
 
+    @span("recursion.refine")
     def refine_workflow(
         self,
         workflow_data: Dict[str, Any],
@@ -337,7 +357,7 @@ class RecursionManager:  # pylint: disable=too-many-instance-attributes
     ) -> Dict[str, Any]:
         """Generate a refined workflow variant using the LLM contract."""
 
-        refined_workflow = deepcopy(workflow_data)
+        refined_workflow = cow_copy(workflow_data)
         recursion_metadata = refined_workflow.setdefault("recursion_metadata", {})
         if lineage_context and lineage_context.get("prior_reasoning"):
             recursion_metadata.setdefault(
@@ -389,11 +409,13 @@ class RecursionManager:  # pylint: disable=too-many-instance-attributes
 
         return refined_workflow
 
+    @span("recursion.run_cycle")
     def run_cycle(
         self, workflow_data: Dict[str, Any], depth: int = 0
     ) -> RecursionOutcome:
         """Run a recursion cycle and return the outcome."""
         # pylint: disable=too-many-locals
+        started = time.perf_counter()
         schema_version = self._ensure_schema_tags(workflow_data)
         lineage_context = self._load_lineage_context(workflow_data)
 
@@ -406,11 +428,18 @@ class RecursionManager:  # pylint: disable=too-many-instance-attributes
             },
         )
 
-        baseline_report = self._evaluate(workflow_data)
+        baseline_report: Dict[str, Any] = {
+            "quality": evaluate_workflow_quality(workflow_data)
+        }
         candidate = self.refine_workflow(
             workflow_data, baseline_report, depth, lineage_context
         )
-        candidate_report = self._evaluate(candidate)
+        candidate_report: Dict[str, Any] = {
+            "quality": evaluate_workflow_quality(candidate)
+        }
+        self._attach_embeddings(
+            (workflow_data, baseline_report), (candidate, candidate_report)
+        )
 
         score_delta = (
             candidate_report["quality"]["overall_score"]
@@ -506,6 +535,9 @@ class RecursionManager:  # pylint: disable=too-many-instance-attributes
                 "regenerated": regenerate,
             },
         )
+        _RECURSION_CYCLES.labels(regenerated=str(regenerate).lower()).inc()
+        _RECURSION_CYCLE_SECONDS.observe(time.perf_counter() - started)
+        _RECURSION_SCORE_DELTA.set(score_delta)
 
         return RecursionOutcome(
             refined_workflow=final_workflow,
@@ -1,10 +1,26 @@
-"""Sanitization helpers for sensitive payloads."""
+"""
+Sanitization helpers for sensitive payloads.
+
+`sanitize_payload` walks nested payloads with an explicit stack, so nesting
+depth is not bounded by the recursion limit. Containers whose contents come
+back unchanged are returned by identity instead of being copied. Exact
+``dict`` and ``list`` containers are shared; tuples and other mappings are
+still rebuilt as lists and dicts. String leaves go through `redact_text`.
+It applies every SECRET_PATTERNS substitution in one pass of a combined
+regex, then scores only high-entropy candidates that can reach the
+threshold. Short strings are memoized in a bounded LRU, since log payloads
+repeat the same values.
+"""
 
 from __future__ import annotations
 
 import math
 import re
-from typing import Any, Iterable, Mapping
+from collections import Counter
+from functools import lru_cache
+from typing import Any, List, Mapping, Optional
+
+from ai_cores.scan_core import PatternSet, ScanRule
 
 SENSITIVE_KEYS = (
     "password",
@@ -30,15 +46,34 @@ HIGH_ENTROPY_PATTERN = re.compile(r"[A-Za-z0-9+/=_-]{20,}")
 
 MAX_STRING_LENGTH = 256
 HIGH_ENTROPY_THRESHOLD = 4.0
+REDACTED = "[REDACTED]"
+
+# Strings up to MEMO_MAX_LENGTH characters are memoized (MEMO_ENTRIES LRU).
+MEMO_ENTRIES = 8192
+MEMO_MAX_LENGTH = 512
+
+_LEADING_FLAGS = re.compile(r"^\(\?([a-z]+)\)")
+
+
+def _scoped(pattern: re.Pattern[str]) -> str:
+    """Pattern source with a leading global flag group made local."""
+    match = _LEADING_FLAGS.match(pattern.pattern)
+    if match is None:
+        return f"(?:{pattern.pattern})"
+    return f"(?{match.group(1)}:{pattern.pattern[match.end():]})"
+
+
+# SECRET_PATTERNS as one alternation. A leftmost match of the union gives
+# the same result as substituting each pattern in turn: no pattern can match
+# inside "[REDACTED]" or start inside another pattern's match.
+_SECRET_UNION = re.compile("|".join(_scoped(pattern) for pattern in SECRET_PATTERNS))
 
 
 def shannon_entropy(value: str) -> float:
     """Compute Shannon entropy for a string."""
     if not value:
         return 0.0
-    counts = {}
-    for char in value:
-        counts[char] = counts.get(char, 0) + 1
+    counts = Counter(value)
     length = len(value)
     return -sum(
         (count / length) * math.log2(count / length) for count in counts.values()
@@ -52,53 +87,153 @@ def _truncate(value: str) -> str:
     return value[:MAX_STRING_LENGTH] + "...[TRUNCATED]"
 
 
+def _is_high_entropy(token: str) -> bool:
+    # Entropy is at most log2(distinct symbols); most tokens (hex digests,
+    # identifiers) are rejected by that bound without the full computation.
+    if len(set(token)) < 2**HIGH_ENTROPY_THRESHOLD:
+        return False
+    return shannon_entropy(token) >= HIGH_ENTROPY_THRESHOLD
+
+
+def _redact(value: str) -> str:
+    redacted = _SECRET_UNION.sub(REDACTED, value)
+    if len(redacted) >= 20:
+        for token in HIGH_ENTROPY_PATTERN.findall(redacted):
+            if _is_high_entropy(token):
+                redacted = redacted.replace(token, REDACTED)
+    return _truncate(redacted)
+
+
+_redact_memo = lru_cache(maxsize=MEMO_ENTRIES)(_redact)
+
+
 def redact_text(value: str) -> str:
     """Redact secrets and high-entropy tokens from a string."""
-    redacted = value
-    for pattern in SECRET_PATTERNS:
-        redacted = pattern.sub("[REDACTED]", redacted)
-    for token in HIGH_ENTROPY_PATTERN.findall(redacted):
-        if shannon_entropy(token) >= HIGH_ENTROPY_THRESHOLD:
-            redacted = redacted.replace(token, "[REDACTED]")
-    return _truncate(redacted)
+    if len(value) <= MEMO_MAX_LENGTH:
+        return _redact_memo(value)
+    return _redact(value)
+
+
+# Same tokens as HIGH_ENTROPY_PATTERN.findall, but a match may only start at
+# the beginning of a run, so the engine does not retry inside short words.
+_HIGH_ENTROPY_TOKEN = re.compile(
+    r"(?<![A-Za-z0-9+/=_-])" + HIGH_ENTROPY_PATTERN.pattern
+)
+
+# Secret patterns (reported by source) plus the high-entropy token check,
+# compiled once for single-pass scanning of strings and files.
+SECRET_SCAN = PatternSet(
+    [ScanRule.from_regex(pattern.pattern, pattern) for pattern in SECRET_PATTERNS]
+    + [
+        ScanRule.from_regex(
+            "high_entropy", _HIGH_ENTROPY_TOKEN, accept=_is_high_entropy
+        )
+    ]
+)
 
 
 def find_secret_indicators(value: str) -> list[str]:
     """Return matching secret indicators for a string."""
-    indicators: list[str] = []
-    for pattern in SECRET_PATTERNS:
-        if pattern.search(value):
-            indicators.append(pattern.pattern)
-    for token in HIGH_ENTROPY_PATTERN.findall(value):
-        if shannon_entropy(token) >= HIGH_ENTROPY_THRESHOLD:
-            indicators.append("high_entropy")
-            break
-    return indicators
-
-
-def _sanitize_mapping(data: Mapping[str, Any]) -> dict[str, Any]:
-    """Sanitize a mapping by redacting sensitive keys."""
-    sanitized: dict[str, Any] = {}
-    for key, value in data.items():
-        key_lower = key.lower()
-        if any(token in key_lower for token in SENSITIVE_KEYS):
-            sanitized[key] = "[REDACTED]"
-        else:
-            sanitized[key] = sanitize_payload(value)
-    return sanitized
+    return SECRET_SCAN.matches(value)
 
 
-def _sanitize_iterable(values: Iterable[Any]) -> list[Any]:
-    """Sanitize a list of values."""
-    return [sanitize_payload(value) for value in values]
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    key_lower = key.lower()
+    return any(token in key_lower for token in SENSITIVE_KEYS)
 
 
-def sanitize_payload(value: Any) -> Any:
-    """Sanitize a payload recursively."""
-    if isinstance(value, Mapping):
-        return _sanitize_mapping(value)
-    if isinstance(value, (list, tuple)):
-        return _sanitize_iterable(value)
+_CONTAINERS = (Mapping, list, tuple)
+_SCALARS = frozenset({int, float, bool, type(None)})
+
+
+def _is_container(value: Any) -> bool:
+    kind = type(value)
+    return kind is dict or kind is list or isinstance(value, _CONTAINERS)
+
+
+class _Frame:
+    """A container being sanitized: its children and their results so far."""
+
+    __slots__ = ("source", "keys", "values", "results", "changed")
+
+    def __init__(self, source: Any) -> None:
+        self.source = source
+        kind = type(source)
+        if kind is dict or (kind is not list and isinstance(source, Mapping)):
+            self.keys: Optional[List[Any]] = list(source.keys())
+            self.values = list(source.values())
+        else:
+            self.keys = None
+            self.values = list(source)
+        self.results: List[Any] = []
+        self.changed = kind is not dict and kind is not list
+
+    def finish(self) -> Any:
+        if not self.changed:
+            return self.source
+        if self.keys is None:
+            return self.results
+        return dict(zip(self.keys, self.results))
+
+
+def _sanitize_leaf(value: Any) -> Any:
     if isinstance(value, str):
-        return redact_text(value)
+        redacted = redact_text(value)
+        return value if redacted == value else redacted
     return value
+
+
+def sanitize_payload(value: Any) -> Any:
+    """
+    Sanitize a payload: redact values under sensitive keys and secrets in
+    strings. Unchanged dict/list subtrees are returned as-is; treat the
+    result as read-only.
+    """
+    if not _is_container(value):
+        return _sanitize_leaf(value)
+    frame = _Frame(value)
+    stack = [frame]
+    active = {id(value)}
+    while True:
+        keys, values, results = frame.keys, frame.values, frame.results
+        changed = frame.changed
+        child_frame = None
+        # Leaves are handled in this inner loop; a container child suspends
+        # the frame and is processed next.
+        for index in range(len(results), len(values)):
+            child = values[index]
+            kind = type(child)
+            if keys is not None and _is_sensitive_key(keys[index]):
+                result = REDACTED
+            elif kind is str:
+                result = redact_text(child)
+                if result == child:
+                    result = child
+            elif kind in _SCALARS or not _is_container(child):
+                result = _sanitize_leaf(child)
+            else:
+                if id(child) in active:
+                    raise ValueError("Cannot sanitize a self-referencing payload")
+                active.add(id(child))
+                child_frame = _Frame(child)
+                break
+            if result is not child:
+                changed = True
+            results.append(result)
+        frame.changed = changed
+        if child_frame is not None:
+            stack.append(child_frame)
+            frame = child_frame
+            continue
+
+        stack.pop()
+        active.discard(id(frame.source))
+        result = frame.finish()
+        if not stack:
+            return result
+        parent = stack[-1]
+        if result is not frame.source:
+            parent.changed = True
+        parent.results.append(result)
+        frame = parent
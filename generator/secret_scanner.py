@@ -9,11 +9,19 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, Optional
 
-from generator.sanitizer import find_secret_indicators
+from ai_cores.file_index_core import FileIndex, gate_key
+from ai_cores.scan_core import iter_files
+from generator.sanitizer import (
+    HIGH_ENTROPY_THRESHOLD,
+    SECRET_SCAN,
+    find_secret_indicators,
+)
 
 
 CANONICAL_DIRS = ("generator", "cli", "pdl", "reproducibility")
 
+SECRET_GATE = gate_key("secret_scan", SECRET_SCAN.signature, HIGH_ENTROPY_THRESHOLD)
+
 
 @dataclass(frozen=True)
 class AllowlistEntry:  # pylint: disable=too-many-instance-attributes
@@ -84,29 +92,34 @@ def _is_canonical_path(path: Path) -> bool:
 
 def _scan_text(content: str) -> list[str]:
     """Scan a content string for secret indicators."""
-    indicators = set()
-    for line in content.splitlines():
-        indicators.update(find_secret_indicators(line))
-    return sorted(indicators)
+    return sorted(find_secret_indicators(content))
+
 
+def _scan_content(path: Path) -> list[str]:
+    return sorted(SECRET_SCAN.scan_file(path).rule_ids)
 
-def scan_file(path: Path) -> list[str]:
-    """Scan a single file and return secret indicators."""
+
+def scan_file(path: Path, *, index: Optional[FileIndex] = None) -> list[str]:
+    """Scan a single file (one pass, binaries skipped) for secret indicators."""
     if path.name.endswith(".env"):
         return ["env_file"]
-    try:
-        content = path.read_text(encoding="utf-8")
-    except OSError:
-        return []
-    return _scan_text(content)
+    if index is not None:
+        return index.cached(SECRET_GATE, path, _scan_content)
+    return _scan_content(path)
 
 
 def scan_paths(
     paths: Iterable[Path],
     *,
     allowlist: list[AllowlistEntry],
+    index: Optional[FileIndex] = None,
 ) -> dict:
-    """Scan paths for secrets and apply allowlist rules."""
+    """
+    Scan paths for secrets and apply allowlist rules.
+
+    With a FileIndex, files are enumerated through it and per-file results
+    are reused for unchanged content.
+    """
     violations = []
     allowlist_errors = []
     for entry in allowlist:
@@ -137,18 +150,11 @@ def scan_paths(
             )
             continue
 
-    for path in paths:
-        if not path.exists():
-            continue
-        if path.is_dir():
-            for file_path in path.rglob("*"):
-                if file_path.is_dir():
-                    continue
-                violations.extend(
-                    _scan_single_path(file_path, allowlist, allowlist_errors)
-                )
-        else:
-            violations.extend(_scan_single_path(path, allowlist, allowlist_errors))
+    files = iter_files(paths) if index is None else index.files(paths)
+    for file_path in files:
+        violations.extend(
+            _scan_single_path(file_path, allowlist, allowlist_errors, index)
+        )
 
     return {"violations": violations, "allowlist_errors": allowlist_errors}
 
@@ -157,9 +163,10 @@ def _scan_single_path(
     path: Path,
     allowlist: list[AllowlistEntry],
     allowlist_errors: list[dict],
+    index: Optional[FileIndex] = None,
 ) -> list[dict]:
     """Scan a path and apply allowlist rules for violations."""
-    indicators = scan_file(path)
+    indicators = scan_file(path, index=index)
     if not indicators:
         return []
     if _is_canonical_path(path):
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional
 
@@ -16,6 +15,9 @@ def generate_workflow_id(prefix: str = "workflow") -> str:
     Format:
         {prefix}_{8-hex}_{YYYYMMDDHHMMSS}
     """
+    # uuid pulls in platform (~15 ms); only pay for it when an ID is minted.
+    import uuid  # pylint: disable=import-outside-toplevel
+
     random_part = uuid.uuid4().hex[:8]
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
     return f"{prefix}_{random_part}_{timestamp}"
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+generator/workflow_view.py — Copy-on-write views over JSON-style workflows.
+
+`cow_copy(workflow)` replaces `deepcopy(workflow)` in the MVM pipeline. It
+returns a `CowDict`: a real ``dict`` subclass (so isinstance checks, JSON
+encoding, schema validation and equality all behave as before) that
+shallow-copies a nested dict or list the first time it is reached through the
+view. Containers that are never reached, such as untouched phases, modules
+or metadata, stay shared with the source. Leaves (str/int/float/bool/None)
+are immutable and always shared.
+
+Rules:
+- The source is never mutated through a view.
+- `cow_copy(view)` forks: both the view and the copy re-wrap anything they
+  reach afterwards. References to nested containers taken *before* a fork
+  still point at the pre-fork objects and must not be used for mutation.
+- Raw dict operations that bypass the overridden methods (`dict(view)`,
+  `{**view}`) return shallow copies whose nested values may be shared with
+  the source; treat those as read-only or go through the view instead.
+- Pickling and `deepcopy` produce plain dicts/lists.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+__all__ = ["CowDict", "CowList", "cow_copy", "is_view", "to_plain"]
+
+
+# A view owns the child views stamped with its current token (a bare object()).
+
+
+def _owned_by(value: Any, token: object) -> bool:
+    return getattr(value, "_parent_token", None) is token
+
+
+def _wrap(value: Any, token: object) -> Any:
+    if isinstance(value, dict):
+        return CowDict(value, _parent_token=token)
+    if isinstance(value, list):
+        return CowList(value, _parent_token=token)
+    return value
+
+
+class CowDict(dict):
+    """
+    Copy-on-access dict view.
+
+    Nested containers are wrapped (shallow-copied) on first access through
+    ``[]``, ``get``, ``setdefault``, ``pop``, ``items`` or ``values``.
+    Containers assigned by the caller are owned as-is.
+    """
+
+    __slots__ = ("_token", "_parent_token", "_assigned")
+
+    def __init__(self, source: Any = (), *, _parent_token: Optional[object] = None):
+        dict.__init__(self, source)
+        self._token = object()
+        self._parent_token = _parent_token
+        self._assigned: Optional[set] = None
+
+    # ── ownership ────────────────────────────────────────────────
+
+    def _own(self, key: Any, value: Any) -> Any:
+        if not isinstance(value, (dict, list)) or _owned_by(value, self._token):
+            return value
+        if self._assigned is not None and key in self._assigned:
+            return value
+        value = _wrap(value, self._token)
+        dict.__setitem__(self, key, value)
+        return value
+
+    def _own_all(self) -> None:
+        for key, value in list(dict.items(self)):
+            self._own(key, value)
+
+    def _mark(self, key: Any, value: Any) -> None:
+        if isinstance(value, (dict, list)) and not _owned_by(value, self._token):
+            if self._assigned is None:
+                self._assigned = set()
+            self._assigned.add(key)
+        elif self._assigned is not None:
+            self._assigned.discard(key)
+
+    def fork(self) -> "CowDict":
+        """Return a copy-on-write copy; both sides re-wrap on next access."""
+        self._token = object()
+        self._assigned = None
+        return CowDict(self)
+
+    # ── reads ────────────────────────────────────────────────────
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._own(key, dict.__getitem__(self, key))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self):  # type: ignore[override]
+        self._own_all()
+        return dict.items(self)
+
+    def values(self):  # type: ignore[override]
+        self._own_all()
+        return dict.values(self)
+
+    # ── writes ───────────────────────────────────────────────────
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._mark(key, value)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        dict.__delitem__(self, key)
+        if self._assigned is not None:
+            self._assigned.discard(key)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def update(self, other: Any = (), **kwargs: Any) -> None:  # type: ignore[override]
+        # Views are read through their own accessors so shared source
+        # containers are never adopted as owned.
+        if isinstance(other, Mapping):
+            pairs: Iterable[Tuple[Any, Any]] = other.items()
+        elif hasattr(other, "keys"):
+            pairs = ((key, other[key]) for key in other.keys())
+        else:
+            pairs = other
+        for key, value in pairs:
+            self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def __ior__(self, other: Any) -> "CowDict":  # type: ignore[override]
+        self.update(other)
+        return self
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key not in self:
+            return dict.pop(self, key, *default)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._assigned = None
+
+    def copy(self) -> Dict[Any, Any]:  # type: ignore[override]
+        """Shallow copy with plain-dict aliasing of the (owned) children."""
+        return dict(self.items())
+
+    __copy__ = copy
+
+    def __reduce__(self):
+        return (dict, (to_plain(self),))
+
+
+class CowList(list):
+    """
+    List view whose container elements are wrapped when the list is created.
+
+    Only the elements become views; their own children are copied lazily.
+    """
+
+    __slots__ = ("_token", "_parent_token")
+
+    def __init__(
+        self, source: Iterable[Any] = (), *, _parent_token: Optional[object] = None
+    ):
+        token = object()
+        list.__init__(self, [_wrap(value, token) for value in source])
+        self._token = token
+        self._parent_token = _parent_token
+
+    def __reduce__(self):
+        return (list, (to_plain(self),))
+
+
+def cow_copy(workflow: Any) -> Any:
+    """
+    Return a copy-on-write copy of a workflow (or any dict/list).
+
+    Drop-in replacement for ``deepcopy`` on JSON-style data: mutating the
+    result never affects ``workflow``.
+    """
+    if isinstance(workflow, CowDict):
+        return workflow.fork()
+    if isinstance(workflow, dict):
+        return CowDict(workflow)
+    if isinstance(workflow, list):
+        return CowList(workflow)
+    return workflow
+
+
+def is_view(value: Any) -> bool:
+    """True if ``value`` is a CowDict or CowList."""
+    return isinstance(value, (CowDict, CowList))
+
+
+def to_plain(value: Any) -> Any:
+    """
+    Return ``value`` with every view replaced by a plain dict/list.
+
+    Untouched subtrees are returned as-is (shared), so the result must be
+    treated as read-only; use ``deepcopy`` for an independent copy.
+    """
+    if isinstance(value, dict):
+        if not isinstance(value, CowDict):
+            return value
+        plain: Dict[Any, Any] = {}
+        for key, item in dict.items(value):
+            plain[key] = to_plain(item)
+        return plain
+    if isinstance(value, list):
+        if not isinstance(value, CowList):
+            return value
+        items: List[Any] = [to_plain(item) for item in list.__iter__(value)]
+        return items
+    return value
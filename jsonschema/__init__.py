@@ -6,7 +6,7 @@ from dataclasses import dataclass
 import json
 import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 
@@ -36,232 +36,331 @@ class RefResolver:
         return ref, schema
 
 
+Checker = Callable[[Any, List[Any], List[Any]], Iterator[ValidationError]]
+
+
 class Draft202012Validator:
-    """Minimal Draft 2020-12 validator used by tests."""
+    """Minimal Draft 2020-12 validator used by tests.
+
+    The schema is compiled on first use into a tree of checker closures
+    (see ``_SchemaCompiler``); ``$ref`` targets are resolved once and then
+    memoized, so repeated ``iter_errors`` calls never touch the filesystem.
+    """
 
     def __init__(
         self, schema: Dict[str, Any], resolver: Optional[RefResolver] = None
     ) -> None:
         self.schema = schema
         self.resolver = resolver or RefResolver(referrer=schema)
+        self._checker: Optional[Checker] = None
 
     def iter_errors(self, instance: Any) -> Iterable[ValidationError]:
-        return _iter_errors(instance, self.schema, [], [], self.resolver, self.schema)
+        if self._checker is None:
+            compiler = _SchemaCompiler(self.resolver)
+            self._checker = compiler.compile(self.schema, self.schema)
+        return self._checker(instance, [], [])
 
 
-def _iter_errors(
-    instance: Any,
-    schema: Dict[str, Any],
-    path: List[Any],
-    schema_path: List[Any],
-    resolver: RefResolver,
-    referrer: Optional[Dict[str, Any]],
+def _accept(
+    instance: Any, path: List[Any], schema_path: List[Any]
 ) -> Iterator[ValidationError]:
-    if "$ref" in schema:
-        resolved, resolved_referrer = _resolve_ref(schema["$ref"], resolver, referrer)
-        yield from _iter_errors(
-            instance,
-            resolved,
-            path,
-            schema_path + ["$ref"],
-            resolver,
-            resolved_referrer,
-        )
-        return
-
-    if "allOf" in schema:
-        for idx, subschema in enumerate(schema["allOf"]):
-            yield from _iter_errors(
-                instance,
-                subschema,
-                path,
-                schema_path + ["allOf", idx],
-                resolver,
-                referrer,
-            )
-
-    if "const" in schema and instance != schema["const"]:
-        yield ValidationError(
-            f"{instance!r} is not equal to {schema['const']!r}",
-            path,
-            schema_path + ["const"],
-        )
-        return
+    return iter(())
 
-    if "enum" in schema and instance not in schema["enum"]:
-        yield ValidationError(
-            f"{instance!r} is not one of {schema['enum']!r}",
-            path,
-            schema_path + ["enum"],
-        )
 
-    if "type" in schema and not _matches_type(instance, schema["type"]):
-        yield ValidationError(
-            f"{instance!r} is not of type '{schema['type']}'",
-            path,
-            schema_path + ["type"],
-        )
-        return
-
-    if isinstance(instance, dict):
-        yield from _validate_object(
-            instance, schema, path, schema_path, resolver, referrer
-        )
-    elif isinstance(instance, list):
-        yield from _validate_array(
-            instance, schema, path, schema_path, resolver, referrer
-        )
-    elif isinstance(instance, str):
-        pattern = schema.get("pattern")
-        if pattern and re.match(pattern, instance) is None:
-            yield ValidationError(
-                f"{instance!r} does not match '{pattern}'",
-                path,
-                schema_path + ["pattern"],
-            )
-
-
-def _validate_object(
-    instance: Dict[str, Any],
-    schema: Dict[str, Any],
-    path: List[Any],
-    schema_path: List[Any],
-    resolver: RefResolver,
-    referrer: Optional[Dict[str, Any]],
+def _reject(
+    instance: Any, path: List[Any], schema_path: List[Any]
 ) -> Iterator[ValidationError]:
-    required = schema.get("required", [])
-    for key in required:
-        if key not in instance:
-            yield ValidationError(
-                f"'{key}' is a required property",
-                path,
-                schema_path + ["required"],
-            )
-
-    properties = schema.get("properties", {})
-    for key, subschema in properties.items():
-        if key in instance:
-            yield from _iter_errors(
-                instance[key],
-                subschema,
-                path + [key],
-                schema_path + ["properties", key],
-                resolver,
-                referrer,
-            )
-
-    additional = schema.get("additionalProperties", True)
-    if additional is False:
-        for key in instance:
-            if key not in properties:
+    yield ValidationError(
+        f"False schema does not allow {instance!r}", path, schema_path
+    )
+
+
+class _SchemaCompiler:
+    """Compile schema dicts into checker closures with memoized ``$ref`` nodes."""
+
+    def __init__(self, resolver: RefResolver) -> None:
+        self.resolver = resolver
+        self._compiled: Dict[Tuple[int, int], Checker] = {}
+        # Keep compiled schema objects alive so their ids stay unique.
+        self._pinned: List[Tuple[Any, Any]] = []
+
+    def compile(self, schema: Any, referrer: Optional[Dict[str, Any]]) -> Checker:
+        key = (id(schema), id(referrer))
+        checker = self._compiled.get(key)
+        if checker is None:
+            self._pinned.append((schema, referrer))
+            checker = self._build(schema, referrer)
+            self._compiled[key] = checker
+        return checker
+
+    def _build(self, schema: Any, referrer: Optional[Dict[str, Any]]) -> Checker:
+        if schema is True or schema == {}:
+            return _accept
+        if schema is False:
+            return _reject
+        if not isinstance(schema, dict):
+            raise TypeError(f"Schema must be an object or boolean, got {schema!r}")
+        if "$ref" in schema:
+            return self._build_ref(schema["$ref"], referrer)
+
+        all_of = [
+            (idx, self.compile(subschema, referrer))
+            for idx, subschema in enumerate(schema.get("allOf", []))
+        ]
+        has_const = "const" in schema
+        const = schema.get("const")
+        enum_check = _enum_predicate(schema["enum"]) if "enum" in schema else None
+        has_type = "type" in schema
+        type_check = _type_predicate(schema["type"]) if has_type else None
+        object_check = self._build_object(schema, referrer)
+        array_check = self._build_array(schema, referrer)
+        pattern = schema.get("pattern")
+        regex = re.compile(pattern) if pattern else None
+
+        def check(
+            instance: Any, path: List[Any], schema_path: List[Any]
+        ) -> Iterator[ValidationError]:
+            for idx, sub_check in all_of:
+                yield from sub_check(instance, path, schema_path + ["allOf", idx])
+
+            if has_const and instance != const:
                 yield ValidationError(
-                    f"Additional properties are not allowed ('{key}' was unexpected)",
-                    path + [key],
-                    schema_path + ["additionalProperties"],
-                )
-    elif isinstance(additional, dict):
-        for key, value in instance.items():
-            if key not in properties:
-                yield from _iter_errors(
-                    value,
-                    additional,
-                    path + [key],
-                    schema_path + ["additionalProperties"],
-                    resolver,
-                    referrer,
+                    f"{instance!r} is not equal to {const!r}",
+                    path,
+                    schema_path + ["const"],
                 )
+                return
 
-    min_props = schema.get("minProperties")
-    if min_props is not None and len(instance) < min_props:
-        yield ValidationError(
-            f"{len(instance)} is less than the minimum of {min_props}",
-            path,
-            schema_path + ["minProperties"],
-        )
+            if enum_check is not None and not enum_check(instance):
+                yield ValidationError(
+                    f"{instance!r} is not one of {schema['enum']!r}",
+                    path,
+                    schema_path + ["enum"],
+                )
 
-    max_props = schema.get("maxProperties")
-    if max_props is not None and len(instance) > max_props:
-        yield ValidationError(
-            f"{len(instance)} is greater than the maximum of {max_props}",
-            path,
-            schema_path + ["maxProperties"],
+            if type_check is not None and not type_check(instance):
+                yield ValidationError(
+                    f"{instance!r} is not of type '{schema['type']}'",
+                    path,
+                    schema_path + ["type"],
+                )
+                return
+
+            if isinstance(instance, dict):
+                if object_check is not None:
+                    yield from object_check(instance, path, schema_path)
+            elif isinstance(instance, list):
+                if array_check is not None:
+                    yield from array_check(instance, path, schema_path)
+            elif isinstance(instance, str):
+                if regex is not None and regex.match(instance) is None:
+                    yield ValidationError(
+                        f"{instance!r} does not match '{pattern}'",
+                        path,
+                        schema_path + ["pattern"],
+                    )
+
+        return check
+
+    def _build_ref(self, ref: str, referrer: Optional[Dict[str, Any]]) -> Checker:
+        target: List[Checker] = []
+
+        def check(
+            instance: Any, path: List[Any], schema_path: List[Any]
+        ) -> Iterator[ValidationError]:
+            if not target:
+                resolved, resolved_referrer = _resolve_ref(
+                    ref, self.resolver, referrer
+                )
+                target.append(self.compile(resolved, resolved_referrer))
+            return target[0](instance, path, schema_path + ["$ref"])
+
+        return check
+
+    def _build_object(
+        self, schema: Dict[str, Any], referrer: Optional[Dict[str, Any]]
+    ) -> Optional[Checker]:
+        required = tuple(schema.get("required", []))
+        properties = schema.get("properties", {})
+        property_checks = [
+            (key, self.compile(subschema, referrer))
+            for key, subschema in properties.items()
+        ]
+        property_names = frozenset(properties)
+        additional = schema.get("additionalProperties", True)
+        additional_check = (
+            self.compile(additional, referrer) if isinstance(additional, dict) else None
         )
+        forbid_additional = additional is False
+        min_props = schema.get("minProperties")
+        max_props = schema.get("maxProperties")
+        if not (
+            required
+            or property_checks
+            or forbid_additional
+            or additional_check is not None
+            or min_props is not None
+            or max_props is not None
+        ):
+            return None
+
+        def check(
+            instance: Dict[str, Any], path: List[Any], schema_path: List[Any]
+        ) -> Iterator[ValidationError]:
+            for key in required:
+                if key not in instance:
+                    yield ValidationError(
+                        f"'{key}' is a required property",
+                        path,
+                        schema_path + ["required"],
+                    )
+
+            for key, sub_check in property_checks:
+                if key in instance:
+                    yield from sub_check(
+                        instance[key],
+                        path + [key],
+                        schema_path + ["properties", key],
+                    )
+
+            if forbid_additional:
+                for key in instance:
+                    if key not in property_names:
+                        yield ValidationError(
+                            "Additional properties are not allowed "
+                            f"('{key}' was unexpected)",
+                            path + [key],
+                            schema_path + ["additionalProperties"],
+                        )
+            elif additional_check is not None:
+                for key, value in instance.items():
+                    if key not in property_names:
+                        yield from additional_check(
+                            value,
+                            path + [key],
+                            schema_path + ["additionalProperties"],
+                        )
+
+            if min_props is not None and len(instance) < min_props:
+                yield ValidationError(
+                    f"{len(instance)} is less than the minimum of {min_props}",
+                    path,
+                    schema_path + ["minProperties"],
+                )
 
+            if max_props is not None and len(instance) > max_props:
+                yield ValidationError(
+                    f"{len(instance)} is greater than the maximum of {max_props}",
+                    path,
+                    schema_path + ["maxProperties"],
+                )
 
-def _validate_array(
-    instance: List[Any],
-    schema: Dict[str, Any],
-    path: List[Any],
-    schema_path: List[Any],
-    resolver: RefResolver,
-    referrer: Optional[Dict[str, Any]],
-) -> Iterator[ValidationError]:
-    min_items = schema.get("minItems")
-    if min_items is not None and len(instance) < min_items:
-        yield ValidationError(
-            f"{len(instance)} is less than the minimum of {min_items}",
-            path,
-            schema_path + ["minItems"],
+        return check
+
+    def _build_array(
+        self, schema: Dict[str, Any], referrer: Optional[Dict[str, Any]]
+    ) -> Optional[Checker]:
+        min_items = schema.get("minItems")
+        max_items = schema.get("maxItems")
+        prefix_checks = [
+            (idx, self.compile(subschema, referrer))
+            for idx, subschema in enumerate(schema.get("prefixItems", []))
+        ]
+        prefix_len = len(prefix_checks)
+        items_schema = schema.get("items")
+        forbid_items = items_schema is False
+        items_check = (
+            self.compile(items_schema, referrer)
+            if isinstance(items_schema, dict)
+            else None
         )
+        if (
+            min_items is None
+            and max_items is None
+            and not prefix_checks
+            and not forbid_items
+            and items_check is None
+        ):
+            return None
+
+        def check(
+            instance: List[Any], path: List[Any], schema_path: List[Any]
+        ) -> Iterator[ValidationError]:
+            if min_items is not None and len(instance) < min_items:
+                yield ValidationError(
+                    f"{len(instance)} is less than the minimum of {min_items}",
+                    path,
+                    schema_path + ["minItems"],
+                )
 
-    max_items = schema.get("maxItems")
-    if max_items is not None and len(instance) > max_items:
-        yield ValidationError(
-            f"{len(instance)} is greater than the maximum of {max_items}",
-            path,
-            schema_path + ["maxItems"],
-        )
+            if max_items is not None and len(instance) > max_items:
+                yield ValidationError(
+                    f"{len(instance)} is greater than the maximum of {max_items}",
+                    path,
+                    schema_path + ["maxItems"],
+                )
 
-    prefix_items = schema.get("prefixItems", [])
-    for idx, subschema in enumerate(prefix_items):
-        if idx >= len(instance):
-            break
-        yield from _iter_errors(
-            instance[idx],
-            subschema,
-            path + [idx],
-            schema_path + ["prefixItems", idx],
-            resolver,
-            referrer,
-        )
+            for idx, sub_check in prefix_checks:
+                if idx >= len(instance):
+                    break
+                yield from sub_check(
+                    instance[idx], path + [idx], schema_path + ["prefixItems", idx]
+                )
 
-    items_schema = schema.get("items")
-    if items_schema is False:
-        if len(instance) > len(prefix_items):
-            yield ValidationError(
-                "Additional items are not allowed",
-                path,
-                schema_path + ["items"],
-            )
-    elif isinstance(items_schema, dict):
-        start = len(prefix_items)
-        for idx in range(start, len(instance)):
-            yield from _iter_errors(
-                instance[idx],
-                items_schema,
-                path + [idx],
-                schema_path + ["items"],
-                resolver,
-                referrer,
-            )
-
-
-def _matches_type(instance: Any, expected: Any) -> bool:
-    if isinstance(expected, list):
-        return any(_matches_type(instance, option) for option in expected)
-    if expected == "object":
-        return isinstance(instance, dict)
-    if expected == "array":
-        return isinstance(instance, list)
-    if expected == "string":
-        return isinstance(instance, str)
-    if expected == "number":
-        return isinstance(instance, (int, float)) and not isinstance(instance, bool)
-    if expected == "integer":
-        return isinstance(instance, int) and not isinstance(instance, bool)
-    if expected == "boolean":
-        return isinstance(instance, bool)
-    return True
+            if forbid_items:
+                if len(instance) > prefix_len:
+                    yield ValidationError(
+                        "Additional items are not allowed",
+                        path,
+                        schema_path + ["items"],
+                    )
+            elif items_check is not None:
+                for idx in range(prefix_len, len(instance)):
+                    yield from items_check(
+                        instance[idx], path + [idx], schema_path + ["items"]
+                    )
+
+        return check
+
+
+def _enum_predicate(options: List[Any]) -> Callable[[Any], bool]:
+    try:
+        members = frozenset(options)
+    except TypeError:
+        return lambda instance: instance in options
+
+    def contains(instance: Any) -> bool:
+        try:
+            return instance in members
+        except TypeError:
+            return instance in options
+
+    return contains
+
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "number": lambda value: isinstance(value, (int, float))
+    and not isinstance(value, bool),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+}
+
+
+def _type_predicate(expected: Any) -> Optional[Callable[[Any], bool]]:
+    """Return a type check for ``expected``, or None if any instance matches."""
+    options = expected if isinstance(expected, list) else [expected]
+    checks = []
+    for option in options:
+        check = _TYPE_CHECKS.get(option) if isinstance(option, str) else None
+        if check is None:
+            return None
+        checks.append(check)
+    if len(checks) == 1:
+        return checks[0]
+    return lambda value: any(check(value) for check in checks)
 
 
 def _resolve_ref(
@@ -365,8 +464,18 @@ def _base_dir_from_uri(uri: str, base_root: Path) -> Path:
     return Path(parsed.path.lstrip("/")).parent
 
 
+_DOCUMENT_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
 def _load_schema(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _DOCUMENT_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    document = json.loads(path.read_text(encoding="utf-8"))
+    _DOCUMENT_CACHE[path] = (key, document)
+    return document
 
 
 __all__ = ["Draft202012Validator", "RefResolver", "ValidationError"]
@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from textwrap import dedent
 from typing import Any, Callable, Dict
 
+from generator.workflow_view import to_plain
+
 
 def generate_text(prompt: str) -> str:
     """
@@ -108,7 +110,7 @@ def generate_refinement(
     prompt = dedent(
         f"""
         You are refining a workflow (depth={depth}).
-        Workflow snippet: {json.dumps(workflow_data)[:1200]}
+        Workflow snippet: {json.dumps(to_plain(workflow_data))[:1200]}
         Evaluation snapshot: {evaluation_report}
 
         Respond with JSON fields: decision (accept|revise|stop), refined_workflow (object),
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import json
 
 from pathlib import Path
 
 from ai_cores.cli_arg_parser_core import build_parser, parse_args
-from data.outputs.audit_bundle import build_audit_bundle, load_audit_spec
+from data.outputs.audit_bundle import build_audit_bundle_with_stats, load_audit_spec
+from generator.audit_bundle import LINK_MODES
 from generator.failure_emitter import FailureEmitter, FailureLabel
 
 
@@ -43,6 +45,25 @@ def _parse_args() -> argparse.Namespace:
         default=Path("artifacts/performance/benchmarks_20251227_090721.json"),
         help="Benchmark log path used for audit metrics.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Copy threads (default: sized to the bundle directory's device).",
+    )
+    parser.add_argument(
+        "--link",
+        choices=LINK_MODES,
+        default="auto",
+        help="auto: reflink where supported, else copy; hardlink: share inodes "
+        "with sources on the same filesystem.",
+    )
+    parser.add_argument(
+        "--stats-path",
+        type=Path,
+        default=None,
+        help="Optional JSON sidecar for transfer stats (kept out of the manifest).",
+    )
     return parse_args(parser)
 
 
@@ -90,14 +111,26 @@ def main() -> int:
         return 1
 
     bundle_dir = args.bundle_dir / args.run_id
-    build_audit_bundle(
+    _, stats = build_audit_bundle_with_stats(
         spec=spec,
         run_id=args.run_id,
         bundle_dir=bundle_dir,
         manifest_path=args.manifest_path,
         benchmark_log_path=args.benchmark_log,
+        workers=args.workers,
+        link=args.link,
     )
 
+    if args.stats_path is not None:
+        args.stats_path.parent.mkdir(parents=True, exist_ok=True)
+        args.stats_path.write_text(
+            json.dumps(stats.as_dict(), indent=2), encoding="utf-8"
+        )
+    print(
+        f"Bundled {stats.files} files ({stats.bytes} bytes) in "
+        f"{stats.seconds:.3f}s: {stats.bytes_per_second:.0f} bytes/s, "
+        f"{stats.files_per_second:.1f} files/s"
+    )
     print("Audit bundle build passed")
     return 0
 
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark (bytes/s and files/s) for generator.audit_bundle.
+
+Writes --files source artifacts totalling about --size-mb, with a
+--dup-share fraction of them repeating earlier content. It bundles them
+with the previous builder, which ran copy2 and then hash_file on the copy,
+one file at a time. It then bundles them with build_bundle_with_stats in
+each link mode. Sources and bundles share one scratch directory
+(--work-dir), so hard links and reflinks are possible where that
+filesystem supports them.
+Sources are in the page cache, so the numbers measure the warm-cache case.
+Each build runs --repeat times into a fresh directory; the fastest run counts.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ai_cores.audit_core import hash_file
+from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from generator.audit_bundle import build_bundle_with_stats
+
+
+def build_sources(
+    root: Path, files: int, size_mb: float, dup_share: float, seed: int
+) -> Dict[str, Any]:
+    """Write the source artifacts and return an audit spec covering them."""
+    rng = random.Random(seed)
+    mean = size_mb * 1e6 / files
+    written: List[bytes] = []
+    components = []
+    for index in range(files):
+        if written and rng.random() < dup_share:
+            payload = rng.choice(written)
+        else:
+            payload = rng.randbytes(max(1, int(rng.uniform(0.5, 1.5) * mean)))
+            written.append(payload)
+        path = root / f"artifact_{index:05d}.bin"
+        path.write_bytes(payload)
+        components.append(
+            {"component_id": f"component_{index % 8}", "path_template": str(path)}
+        )
+    return {"components": components}
+
+
+def _legacy_build(spec: Dict[str, Any], bundle_dir: Path) -> int:
+    for component in spec["components"]:
+        source = Path(component["path_template"])
+        target_dir = bundle_dir / component["component_id"]
+        target_dir.mkdir(parents=True, exist_ok=True)
+        target = target_dir / source.name
+        shutil.copy2(source, target)
+        hash_file(target)
+    return len(spec["components"])
+
+
+def _rates(total_bytes: int, files: int, seconds: float) -> Dict[str, float]:
+    return {
+        "seconds": round(seconds, 3),
+        "mb_per_second": round(total_bytes / seconds / 1e6, 1),
+        "files_per_second": round(files / seconds, 1),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser("Benchmark audit bundle build throughput.")
+    parser.add_argument("--files", type=int, default=400)
+    parser.add_argument("--size-mb", type=float, default=400)
+    parser.add_argument("--dup-share", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--work-dir", type=Path, default=None)
+    parser.add_argument("--output", type=str, help="Optional JSON report path.")
+    args = parse_args(parser, argv)
+
+    with tempfile.TemporaryDirectory(dir=args.work_dir) as scratch:
+        root = Path(scratch)
+        sources = root / "sources"
+        sources.mkdir()
+        spec = build_sources(
+            sources, args.files, args.size_mb, args.dup_share, args.seed
+        )
+        total_bytes = sum(path.stat().st_size for path in sources.iterdir())
+
+        timings = []
+        for run in range(args.repeat):
+            start = time.perf_counter()
+            _legacy_build(spec, root / f"legacy_{run}")
+            timings.append(time.perf_counter() - start)
+        legacy = _rates(total_bytes, args.files, min(timings))
+
+        modes: Dict[str, Any] = {}
+        for label, link, workers in (
+            ("copy_serial", "copy", 1),
+            ("copy", "copy", None),
+            ("auto", "auto", None),
+            ("hardlink", "hardlink", None),
+        ):
+            runs = [
+                build_bundle_with_stats(
+                    spec=spec,
+                    run_id="benchmark",
+                    bundle_dir=root / f"{label}_{run}",
+                    manifest_path=root / f"{label}_{run}.json",
+                    link=link,
+                    workers=workers,
+                )[1].as_dict()
+                for run in range(args.repeat)
+            ]
+            transfer = min(runs, key=lambda item: item["seconds"])
+            modes[label] = {
+                **_rates(total_bytes, args.files, transfer["seconds"]),
+                "workers": transfer["workers"],
+                "copied": transfer["copied"],
+                "reflinked": transfer["reflinked"],
+                "hardlinked": transfer["hardlinked"],
+                "deduplicated": transfer["deduplicated"],
+                "speedup": round(legacy["seconds"] / transfer["seconds"], 1),
+            }
+
+    report = {
+        "files": args.files,
+        "payload_mb": round(total_bytes / 1e6, 1),
+        "legacy": legacy,
+        "modes": modes,
+    }
+    payload_text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload_text)
+    print(payload_text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for DependencyGraph cycle resolution.
+
+Builds seeded synthetic module graphs: mostly backward dependencies (a DAG
+in listing order) plus a fraction of forward dependencies that close cycles.
+For each size it times ``DependencyGraph.resolve_cycles`` and reports time
+per (node + edge), which should stay roughly flat if the pass is linear.
+Graph limits are disabled so sizes above config/graph_limits.yml can be
+measured.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import logging
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from ai_cores.dependency_core import DependencyGraph
+
+DEFAULT_SIZES = (1000, 2500, 5000, 10000, 20000)
+NO_LIMITS = {"enforce": False}
+
+
+def build_modules(
+    nodes: int, degree: int, cycle_ratio: float, seed: int
+) -> List[Dict[str, Any]]:
+    """Return ``nodes`` modules with about ``degree`` dependencies each."""
+    rng = random.Random(seed)
+    modules = []
+    for pos in range(nodes):
+        deps = set()
+        for _ in range(degree):
+            if rng.random() < cycle_ratio:
+                target = rng.randrange(nodes)
+            elif pos:
+                target = rng.randrange(max(0, pos - 50), pos)
+            else:
+                continue
+            deps.add(f"m{target}")
+        modules.append({"module_id": f"m{pos}", "dependencies": sorted(deps)})
+    return modules
+
+
+def measure(nodes: int, degree: int, cycle_ratio: float, seed: int) -> Dict[str, Any]:
+    modules = build_modules(nodes, degree, cycle_ratio, seed)
+    edges = sum(len(module["dependencies"]) for module in modules)
+    gc.collect()
+    gc.disable()  # as timeit does; keeps GC pauses out of the scaling figure
+    try:
+        started = time.perf_counter()
+        graph = DependencyGraph(modules, graph_limits=NO_LIMITS)
+        report = graph.resolve_cycles()
+        elapsed = time.perf_counter() - started
+    finally:
+        gc.enable()
+    return {
+        "nodes": nodes,
+        "edges": edges,
+        "cycle_components": len(report.components),
+        "largest_component": max((len(c) for c in report.components), default=0),
+        "removed_edges": len(report.removed_edges),
+        "resolved": report.resolved,
+        "elapsed_ms": round(elapsed * 1000, 3),
+        "us_per_element": round(elapsed * 1e6 / (nodes + edges), 3),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser("Scaling benchmark for SCC-based cycle resolution.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--degree", type=int, default=4)
+    parser.add_argument("--cycle-ratio", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, help="Optional JSON report path.")
+    args = parse_args(parser, argv)
+
+    logging.getLogger("ai_cores.dependency_core").setLevel(logging.WARNING)
+    rows = [
+        measure(size, args.degree, args.cycle_ratio, args.seed) for size in args.sizes
+    ]
+    per_element = [row["us_per_element"] for row in rows]
+    report = {
+        "degree": args.degree,
+        "cycle_ratio": args.cycle_ratio,
+        "results": rows,
+        # ~1.0 means linear scaling between the smallest and largest size.
+        "scaling_ratio": round(per_element[-1] / per_element[0], 3) if rows else None,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Lineage index benchmark for generator.history.HistoryManager.
+
+Builds a synthetic lineage log (each workflow derives from a random earlier
+one; every transition is recorded several times), then times:
+
+- cold start (full log scan) and warm start (index snapshot + tail scan)
+- record_transition on the large history
+- ancestors / descendants / lineage_path / find_relations
+- the previous design's linear find_relations scan over the same records
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from generator import history as history_module
+from generator.history import SEGMENT_BYTES, HistoryManager, HistoryRecord
+
+
+def write_log(log_dir: Path, transitions: int, workflows: int, seed: int) -> List:
+    """Write `transitions` records in HistoryManager's layout; return the edges."""
+    rng = random.Random(seed)
+    # Random recursive tree: wf_i derives from a uniformly chosen earlier
+    # workflow; refinement runs re-record the same transitions.
+    parents = [0] + [rng.randrange(child) for child in range(1, workflows)]
+    edges = []
+    for index in range(transitions):
+        child = 1 + index % (workflows - 1)
+        edges.append((f"wf_{parents[child]}", f"wf_{child}"))
+    log_dir.mkdir(parents=True)
+    segment, written = 0, 0
+    handle = (log_dir / f"segment-{segment:06d}.jsonl").open("wb")
+    try:
+        for parent, child in edges:
+            record = {
+                "timestamp": "2025-01-01T00:00:00Z",
+                "parent_workflow": parent,
+                "child_workflow": child,
+                "modifications": ["Module count changed"],
+                "score_delta": 0.1,
+            }
+            line = (json.dumps(record, separators=(",", ":")) + "\n").encode()
+            handle.write(line)
+            written += len(line)
+            if written >= SEGMENT_BYTES:
+                handle.close()
+                segment, written = segment + 1, 0
+                handle = (log_dir / f"segment-{segment:06d}.jsonl").open("wb")
+    finally:
+        handle.close()
+    return edges
+
+
+def timed(func: Callable[[], Any], repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser("Benchmark the HistoryManager lineage index.")
+    parser.add_argument("--transitions", type=int, default=1_000_000)
+    parser.add_argument("--workflows", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, help="Optional JSON report path.")
+    args = parse_args(parser, argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Path(tmp) / "history.json"
+        edges = write_log(
+            storage.with_suffix(""), args.transitions, args.workflows, args.seed
+        )
+        target = f"wf_{args.workflows - 1}"
+
+        cold = timed(lambda: HistoryManager(storage))
+        history = HistoryManager(storage)
+        checkpoint = timed(history.checkpoint)
+        history_module._INDEXES.clear()  # pylint: disable=protected-access
+        warm = timed(lambda: HistoryManager(storage))
+        history = HistoryManager(storage)
+
+        record = timed(lambda: history.record_transition("wf_1", "wf_2", 0.0), 1000)
+        ancestors = history.ancestors(target)
+        queries: Dict[str, float] = {
+            "ancestors_depth3": timed(lambda: history.ancestors(target, 3), 1000),
+            "ancestors_all": timed(lambda: history.ancestors(target), 10),
+            "descendants_depth2": timed(lambda: history.descendants("wf_50", 2), 100),
+            "descendants_all": timed(lambda: history.descendants("wf_50"), 10),
+            "lineage_path": timed(
+                lambda: history.lineage_path(ancestors[-1], target), 100
+            ),
+            "find_relations": timed(lambda: history.find_relations(target), 100),
+        }
+        records = [
+            HistoryRecord("", parent, child, [], 0.0) for parent, child in edges
+        ]
+        linear = timed(
+            lambda: [
+                r for r in records if target in (r.parent_workflow, r.child_workflow)
+            ],
+            5,
+        )
+
+    def ms(seconds: float) -> float:
+        return round(seconds * 1000, 3)
+
+    report = {
+        "transitions": args.transitions,
+        "workflows": args.workflows,
+        "cold_start_ms": ms(cold),
+        "checkpoint_ms": ms(checkpoint),
+        "warm_start_ms": ms(warm),
+        "record_transition_us": round(record * 1e6, 1),
+        "ancestors_all_count": len(ancestors),
+        **{f"{name}_ms": ms(value) for name, value in queries.items()},
+        "legacy_linear_find_relations_ms": ms(linear),
+    }
+    payload_text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload_text, encoding="utf-8")
+    print(payload_text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
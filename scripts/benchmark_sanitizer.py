@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark (MB of string leaves per second) for
+generator.sanitizer.sanitize_payload.
+
+Builds a nested log-like payload: records with repeated event names and
+messages, unique hex digests, a few random base64-like tokens, planted
+secrets and sensitive keys. It times the current sanitizer against the
+previous one on the first --legacy-mb of records. The previous sanitizer
+was recursive, ran SECRET_PATTERNS one after another and scored every
+candidate token. The report also records whether each version survives a
+payload nested --depth levels deep.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import random
+import string
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from generator.sanitizer import (
+    HIGH_ENTROPY_PATTERN,
+    HIGH_ENTROPY_THRESHOLD,
+    SECRET_PATTERNS,
+    SENSITIVE_KEYS,
+    _truncate,
+    sanitize_payload,
+    shannon_entropy,
+)
+
+EVENTS = [f"mvm.phase.{name}" for name in ("start", "end", "retry", "export")]
+WORDS = (
+    "workflow phase module evaluation refinement clarity dependency schema "
+    "artifact overlay governance export history lineage metric budget anchor"
+).split()
+PLANTED = (
+    "retry with api_key=placeholder",
+    "sk-" + "Q" * 24,
+    "password: hunter2",
+    "AKIA" + "EXAMPLEEXAMPLE12",
+)
+B64 = string.ascii_letters + string.digits + "+/"
+
+
+def _legacy_redact_text(value: str) -> str:
+    redacted = value
+    for pattern in SECRET_PATTERNS:
+        redacted = pattern.sub("[REDACTED]", redacted)
+    for token in HIGH_ENTROPY_PATTERN.findall(redacted):
+        if shannon_entropy(token) >= HIGH_ENTROPY_THRESHOLD:
+            redacted = redacted.replace(token, "[REDACTED]")
+    return _truncate(redacted)
+
+
+def _legacy_sanitize(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        sanitized = {}
+        for key, item in value.items():
+            key_lower = key.lower()
+            if any(token in key_lower for token in SENSITIVE_KEYS):
+                sanitized[key] = "[REDACTED]"
+            else:
+                sanitized[key] = _legacy_sanitize(item)
+        return sanitized
+    if isinstance(value, (list, tuple)):
+        return [_legacy_sanitize(item) for item in value]
+    if isinstance(value, str):
+        return _legacy_redact_text(value)
+    return value
+
+
+def _record(rng: random.Random, messages: List[str]) -> Dict[str, Any]:
+    context: Dict[str, Any] = {
+        "module_id": f"m{rng.randrange(500)}",
+        "sha256": "%064x" % rng.getrandbits(256),
+        "scores": [round(rng.random(), 3) for _ in range(3)],
+        "tags": rng.sample(WORDS, 3),
+    }
+    roll = rng.random()
+    if roll < 0.02:
+        context["session_token"] = "abc"
+    elif roll < 0.04:
+        context["note"] = rng.choice(PLANTED)
+    elif roll < 0.05:
+        context["nonce"] = "".join(rng.choice(B64) for _ in range(32))
+    return {
+        "event": rng.choice(EVENTS),
+        "message": rng.choice(messages),
+        "context": context,
+        "children": [{"phase": rng.choice(WORDS), "ok": True}],
+    }
+
+
+def build_payload(total_mb: float, seed: int) -> Tuple[List[Dict[str, Any]], float]:
+    """Records whose string leaves add up to about total_mb megabytes."""
+    rng = random.Random(seed)
+    messages = [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randrange(6, 16)))
+        for _ in range(2000)
+    ]
+    records: List[Dict[str, Any]] = []
+    size = 0
+    target = total_mb * 1e6
+    while size < target:
+        record = _record(rng, messages)
+        size += _string_bytes([record])
+        records.append(record)
+    return records, size / 1e6
+
+
+def _string_bytes(values: Iterable[Any]) -> int:
+    total = 0
+    stack = list(values)
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            total += len(value)
+        elif isinstance(value, Mapping):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return total
+
+
+def _nested(depth: int) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"leaf": "password: x"}
+    for _ in range(depth):
+        payload = {"child": payload}
+    return payload
+
+
+def _survives(func, payload: Any) -> bool:
+    try:
+        func(payload)
+    except RecursionError:
+        return False
+    return True
+
+
+def _timed(func, payload: Any) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    func(payload)
+    return time.perf_counter() - start
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser("Benchmark payload sanitization throughput.")
+    parser.add_argument("--size-mb", type=float, default=100)
+    parser.add_argument("--legacy-mb", type=float, default=20)
+    parser.add_argument("--depth", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=5)
+    parser.add_argument("--output", type=str, help="Optional JSON report path.")
+    args = parse_args(parser, argv)
+
+    records, total_mb = build_payload(args.size_mb, args.seed)
+    share = min(1.0, args.legacy_mb / total_mb)
+    legacy_records = records[: int(len(records) * share)]
+    legacy_mb = _string_bytes(legacy_records) / 1e6
+    payload = {"run_id": "benchmark", "records": records}
+
+    current = _timed(sanitize_payload, payload)
+    legacy = _timed(_legacy_sanitize, {"records": legacy_records})
+    deep = _nested(args.depth)
+    report = {
+        "payload_mb": round(total_mb, 1),
+        "records": len(records),
+        "sanitize_mb_s": round(total_mb / current, 1),
+        "legacy_mb_s": round(legacy_mb / legacy, 1),
+        "speedup": round((total_mb / current) / (legacy_mb / legacy), 1),
+        "depth": args.depth,
+        "deep_ok": _survives(sanitize_payload, deep),
+        "legacy_deep_ok": _survives(_legacy_sanitize, deep),
+        "recursion_limit": sys.getrecursionlimit(),
+    }
+    payload_text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload_text)
+    print(payload_text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark (MB/s) for the shared scanning engine (ai_cores.scan_core).
+
+Writes a synthetic corpus (prose, JSON lines with hashes, a few planted
+secrets / ambiguity phrases, one binary blob per file set) and times each gate
+with the engine against the previous approach:
+
+- secrets: per line, every SECRET_PATTERNS regex + high-entropy check
+- redaction: whole-file read, one `search` per DISALLOWED_PATTERNS regex
+- ambiguity: whole-file read, one `search` per AMBIGUITY_PATTERNS regex
+
+The previous approaches are timed on the first --legacy-mb of the corpus.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from ai_cores.scan_core import PatternSet, iter_files, scan_files
+from generator.sanitizer import (
+    HIGH_ENTROPY_PATTERN,
+    HIGH_ENTROPY_THRESHOLD,
+    SECRET_PATTERNS,
+    SECRET_SCAN,
+    shannon_entropy,
+)
+from scripts.redaction_gate import DISALLOWED_PATTERNS, REDACTION_SCAN
+from scripts.validate_semantic_ambiguity import AMBIGUITY_PATTERNS, AMBIGUITY_SCAN
+
+FILE_BYTES = 16 * 1024 * 1024
+WORDS = (
+    "workflow phase module evaluation refinement clarity dependency schema "
+    "artifact overlay governance export history lineage metric budget anchor "
+    "deterministic validation reproducibility template outline objective"
+).split()
+PLANTED = (
+    "api_key = 'not-a-real-key'",
+    "this may be interpreted as allowed",
+    "token: placeholder",
+    "hypothetically speaking",
+)
+
+
+def _line(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.3:
+        record = {
+            "module_id": f"m{rng.randrange(10_000)}",
+            "sha256": "%064x" % rng.getrandbits(256),
+            "score": round(rng.random(), 3),
+        }
+        return json.dumps(record)
+    if roll < 0.00005:
+        return rng.choice(PLANTED)
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randrange(6, 18)))
+
+
+def write_corpus(root: Path, total_mb: int, seed: int) -> List[Path]:
+    rng = random.Random(seed)
+    block = "\n".join(_line(rng) for _ in range(40_000)).encode("utf-8") + b"\n"
+    paths = []
+    remaining = total_mb * 1024 * 1024
+    index = 0
+    while remaining > 0:
+        path = root / f"corpus_{index:04d}.txt"
+        size = min(FILE_BYTES, remaining)
+        with path.open("wb") as handle:
+            written = 0
+            while written < size:
+                piece = block[: size - written]
+                handle.write(piece)
+                written += len(piece)
+                if rng.random() < 0.5:
+                    handle.write((rng.choice(PLANTED) + "\n").encode("utf-8"))
+        paths.append(path)
+        remaining -= size
+        index += 1
+    (root / "blob.bin").write_bytes(b"\0\1\2" * 1024 * 1024)
+    return paths
+
+
+def _legacy_indicators(value: str) -> List[str]:
+    indicators = [p.pattern for p in SECRET_PATTERNS if p.search(value)]
+    for token in HIGH_ENTROPY_PATTERN.findall(value):
+        if shannon_entropy(token) >= HIGH_ENTROPY_THRESHOLD:
+            indicators.append("high_entropy")
+            break
+    return indicators
+
+
+def _legacy_secrets(path: Path) -> List[str]:
+    indicators = set()
+    for line in path.read_text(encoding="utf-8").splitlines():
+        indicators.update(_legacy_indicators(line))
+    return sorted(indicators)
+
+
+def _legacy_search(patterns) -> Callable[[Path], List[str]]:
+    def scan(path: Path) -> List[str]:
+        content = path.read_text(encoding="utf-8")
+        return [name for name, pattern in patterns if pattern.search(content)]
+
+    return scan
+
+
+def _throughput(func: Callable[[], object], megabytes: float) -> float:
+    start = time.perf_counter()
+    func()
+    return round(megabytes / (time.perf_counter() - start), 1)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser("Benchmark single-pass scanning throughput.")
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--legacy-mb", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--output", type=Path, help="Optional JSON report path.")
+    args = parse_args(parser, argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_corpus(root, args.size_mb, args.seed)
+        files = [p for p in iter_files([root]) if p.suffix == ".txt"]
+        total = sum(p.stat().st_size for p in files) / 1e6
+        legacy_files, legacy_total = [], 0.0
+        for path in files:
+            if legacy_total >= args.legacy_mb * 1.048576:
+                break
+            legacy_files.append(path)
+            legacy_total += path.stat().st_size / 1e6
+
+        gates: Dict[str, PatternSet] = {
+            "secrets": SECRET_SCAN,
+            "redaction": REDACTION_SCAN,
+            "ambiguity": AMBIGUITY_SCAN,
+        }
+        legacy = {
+            "secrets": _legacy_secrets,
+            "redaction": _legacy_search(
+                [(pattern.pattern, pattern) for pattern in DISALLOWED_PATTERNS]
+            ),
+            "ambiguity": _legacy_search(AMBIGUITY_PATTERNS),
+        }
+        report: Dict[str, object] = {"corpus_mb": round(total, 1)}
+        for name, pattern_set in gates.items():
+            engine = _throughput(lambda: scan_files([root], pattern_set), total)
+            old = _throughput(
+                lambda: [legacy[name](path) for path in legacy_files], legacy_total
+            )
+            report[name] = {
+                "engine_mb_s": engine,
+                "legacy_mb_s": old,
+                "speedup": round(engine / old, 1),
+            }
+
+    payload_text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload_text, encoding="utf-8")
+    print(payload_text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
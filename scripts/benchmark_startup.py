@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Cold-start import benchmark for the sswg-mvm CLI entrypoint.
+
+Runs ``python -X importtime -c "import generator.main"`` in fresh
+interpreters, reports the median cumulative import time and the slowest
+imported modules, and fails when the median exceeds ``--budget-ms`` or when
+any module that the entrypoint is expected to load lazily (orchestrator,
+evaluation stack, embedding backends, ...) shows up at import time.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import subprocess  # nosec B404
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from ai_cores.cli_arg_parser_core import build_parser, parse_args
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_TARGET = "generator.main"
+DEFAULT_BUDGET_MS = 150.0
+DEFAULT_REPEATS = 5
+
+# Modules that must stay out of `import generator.main`; each CLI mode imports
+# them when (and only when) it needs them.
+DEFERRED_MODULES = (
+    "sentence_transformers",
+    "numpy",
+    "asyncio",
+    "ai_conductor.orchestrator",
+    "ai_evaluation.quality_metrics",
+    "ai_validation.schema_validator",
+    "generator.pdl_executor",
+    "generator.recursion_manager",
+    "ai_monitoring.structured_logger",
+)
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """Parse ``-X importtime`` output into records (header line skipped)."""
+    records: List[ImportRecord] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us = int(fields[0])
+            cumulative_us = int(fields[1])
+        except ValueError:
+            continue  # column header
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        records.append(ImportRecord(stripped, self_us, cumulative_us, depth))
+    return records
+
+
+def measure_import(target: str) -> List[ImportRecord]:
+    """Import ``target`` in a fresh interpreter and return its import records."""
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"import {target} failed: {result.stderr.strip().splitlines()[-1:]}"
+        )
+    return parse_importtime(result.stderr)
+
+
+def summarize(
+    target: str,
+    runs: Sequence[List[ImportRecord]],
+    *,
+    budget_ms: float,
+    deferred: Sequence[str] = DEFERRED_MODULES,
+    top: int = 10,
+) -> Dict[str, object]:
+    """Build the benchmark report for a set of import runs."""
+    totals_ms = []
+    for records in runs:
+        matches = [r for r in records if r.module == target and r.depth == 0]
+        if not matches:
+            raise RuntimeError(f"{target} not found in -X importtime output")
+        totals_ms.append(matches[-1].cumulative_us / 1000.0)
+
+    last = runs[-1]
+    imported = {record.module for record in last}
+    leaked = sorted(module for module in deferred if module in imported)
+    slowest = sorted(
+        (r for r in last if r.module != target),
+        key=lambda r: r.cumulative_us,
+        reverse=True,
+    )[:top]
+    median_ms = statistics.median(totals_ms)
+    return {
+        "target": target,
+        "budget_ms": budget_ms,
+        "median_ms": round(median_ms, 3),
+        "samples_ms": [round(value, 3) for value in totals_ms],
+        "module_count": len(last),
+        "deferred_modules_imported": leaked,
+        "slowest": [
+            {"module": r.module, "cumulative_ms": round(r.cumulative_us / 1000, 3)}
+            for r in slowest
+        ],
+        "ok": median_ms <= budget_ms and not leaked,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser("Cold-start import benchmark for generator.main.")
+    parser.add_argument("--target", default=DEFAULT_TARGET)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="Fail if the median cumulative import time exceeds this budget.",
+    )
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument(
+        "--output", type=Path, help="Optional path for the JSON report."
+    )
+    args = parse_args(parser, argv)
+
+    try:
+        runs = [measure_import(args.target) for _ in range(max(1, args.repeats))]
+        report = summarize(args.target, runs, budget_ms=args.budget_ms)
+    except RuntimeError as exc:
+        print(f"Startup benchmark failed: {exc}")
+        return 1
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+    if report["deferred_modules_imported"]:
+        print(
+            "Startup benchmark failed: eagerly imported "
+            + ", ".join(report["deferred_modules_imported"])  # type: ignore[arg-type]
+        )
+    if report["median_ms"] > args.budget_ms:  # type: ignore[operator]
+        print(
+            f"Startup benchmark failed: median {report['median_ms']} ms "
+            f"exceeds budget {args.budget_ms} ms"
+        )
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
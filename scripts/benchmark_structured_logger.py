@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Caller-thread overhead benchmark for ai_monitoring.structured_logger.
+
+Compares the time `log_event` costs the calling thread against the previous
+synchronous design (f-string render, then StreamHandler + FileHandler on the
+caller). Both variants write the console stream to os.devnull and the file
+sink to a temporary directory. The queue variant's background drain time
+is reported separately, as is the cost of a call at a disabled level.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from ai_monitoring import structured_logger
+
+
+def build_payload(keys: int) -> Dict[str, Any]:
+    """Workflow-sized payload: nested module entries with a little text."""
+    return {
+        "workflow_id": "wf_benchmark",
+        "modules": [
+            {"module_id": f"m{i}", "phase_id": f"P{i % 5}", "notes": "x" * 40}
+            for i in range(keys)
+        ],
+    }
+
+
+def _legacy_logger(path: Path, stream: Any) -> logging.Logger:
+    logger = logging.getLogger("benchmark.structured_logger.legacy")
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    ch = logging.StreamHandler(stream)
+    ch.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    fh = logging.FileHandler(path, delay=True)
+    fh.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    logger.addHandler(ch)
+    logger.addHandler(fh)
+    return logger
+
+
+def measure_legacy(events: int, payload: Dict[str, Any], out_dir: Path) -> float:
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        logger = _legacy_logger(out_dir / "legacy.log", devnull)
+        started = time.perf_counter()
+        for _ in range(events):
+            ts = datetime.datetime.utcnow().isoformat() + "Z"
+            logger.info(f"[{ts}] EVENT: benchmark.event | data={payload}")
+        elapsed = time.perf_counter() - started
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers.clear()
+    return elapsed
+
+
+def measure_queued(
+    events: int, payload: Dict[str, Any], out_dir: Path, batch_size: int
+) -> Dict[str, float]:
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        structured_logger.configure(
+            out_dir / "workflow.jsonl", stream=devnull, batch_size=batch_size
+        )
+        logger = structured_logger.get_logger("benchmark.structured_logger.queued")
+        logger.propagate = False
+        started = time.perf_counter()
+        for _ in range(events):
+            structured_logger.log_event(logger, "benchmark.event", payload)
+        caller = time.perf_counter() - started
+        structured_logger.shutdown()
+        drained = time.perf_counter() - started
+
+        logger.setLevel(logging.WARNING)
+        started = time.perf_counter()
+        for _ in range(events):
+            structured_logger.log_event(logger, "benchmark.event", payload)
+        disabled = time.perf_counter() - started
+        logger.setLevel(logging.INFO)
+    structured_logger.configure()
+    return {"caller": caller, "drained": drained, "disabled": disabled}
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser("Benchmark structured_logger caller-thread overhead.")
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--modules", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--output", type=Path, help="Optional JSON report path.")
+    args = parse_args(parser, argv)
+
+    payload = build_payload(args.modules)
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp)
+        legacy = measure_legacy(args.events, payload, out_dir)
+        queued = measure_queued(args.events, payload, out_dir, args.batch_size)
+
+    def per_event(seconds: float) -> float:
+        return round(seconds * 1e6 / args.events, 3)
+
+    report = {
+        "events": args.events,
+        "payload_bytes": len(json.dumps(payload)),
+        "legacy_us_per_event": per_event(legacy),
+        "queued_caller_us_per_event": per_event(queued["caller"]),
+        "queued_drain_us_per_event": per_event(queued["drained"]),
+        "disabled_level_us_per_event": per_event(queued["disabled"]),
+        "caller_speedup": round(legacy / queued["caller"], 2),
+    }
+    payload_text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload_text, encoding="utf-8")
+    print(payload_text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
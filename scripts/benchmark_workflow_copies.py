@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Peak-memory benchmark: deepcopy vs copy-on-write workflow views.
+
+Replays the copy pattern of the MVM pipeline (input copy, refinement copy,
+one copy per candidate variant, each followed by a small targeted edit) on a
+synthetic workflow and reports tracemalloc peak memory and wall time for
+``copy.deepcopy`` and ``generator.workflow_view.cow_copy``.
+
+``--read-all`` additionally serializes every copy, which reaches (and
+therefore materializes) every container of the views; this is the
+worst case for copy-on-write.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from generator.workflow_view import cow_copy
+
+CopyFunc = Callable[[Any], Any]
+
+
+def build_workflow(phases: int, tasks: int, text_size: int) -> Dict[str, Any]:
+    """Return a deterministic synthetic workflow of the requested size."""
+    filler = "lorem ipsum dolor sit amet " * max(1, text_size // 27)
+    return {
+        "workflow_id": "benchmark_workflow",
+        "version": "v.09.mvm.25",
+        "metadata": {"title": "Copy benchmark", "purpose": filler},
+        "phases": [
+            {
+                "id": f"phase_{p}",
+                "title": f"Phase {p}",
+                "ai_task_logic": filler,
+                "tasks": [
+                    {
+                        "id": f"task_{p}_{t}",
+                        "description": f"{t} {filler}",
+                        "outputs": [f"artifact_{p}_{t}"],
+                        "metadata": {"tags": ["bench", f"p{p}"]},
+                    }
+                    for t in range(tasks)
+                ],
+            }
+            for p in range(phases)
+        ],
+        "modules": [
+            {"module_id": f"m{p}", "description": filler, "dependencies": []}
+            for p in range(phases)
+        ],
+    }
+
+
+def _touch(workflow: Dict[str, Any], label: str) -> None:
+    workflow.setdefault("metadata", {})["stage"] = label
+    workflow.setdefault("evaluation", {}).setdefault("notes", []).append(label)
+    first_task = workflow["phases"][0]["tasks"][0]
+    first_task["description"] = f"{first_task['description']} [{label}]"
+
+
+def run_scenario(
+    copy_fn: CopyFunc, source: Dict[str, Any], variants: int, read_all: bool
+) -> List[Any]:
+    """Apply the pipeline copy pattern to ``source`` using ``copy_fn``."""
+    workflow = copy_fn(source)
+    _touch(workflow, "intake")
+    refined = copy_fn(workflow)
+    _touch(refined, "refine")
+    candidates = []
+    for index in range(variants):
+        candidate = copy_fn(refined)
+        _touch(candidate, f"variant_{index}")
+        candidates.append(candidate)
+    kept = [workflow, refined, *candidates]
+    if read_all:
+        for item in kept:
+            json.dumps(item)
+    return kept
+
+
+def measure(
+    copy_fn: CopyFunc, source: Dict[str, Any], variants: int, read_all: bool
+) -> Dict[str, float]:
+    """Return peak traced memory (KiB) and elapsed time (ms) for one run."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    kept = run_scenario(copy_fn, source, variants, read_all)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return {"peak_kib": round(peak / 1024, 1), "elapsed_ms": round(elapsed * 1000, 3)}
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser("Peak-memory benchmark for workflow copies.")
+    parser.add_argument("--phases", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--text-size", type=int, default=200)
+    parser.add_argument("--variants", type=int, default=3)
+    parser.add_argument("--read-all", action="store_true")
+    parser.add_argument("--output", type=Path, help="Optional JSON report path.")
+    args = parse_args(parser, argv)
+
+    source = build_workflow(args.phases, args.tasks, args.text_size)
+    results = {
+        "deepcopy": measure(copy.deepcopy, source, args.variants, args.read_all),
+        "cow_copy": measure(cow_copy, source, args.variants, args.read_all),
+    }
+    baseline = results["deepcopy"]["peak_kib"] or 1.0
+    report = {
+        "workflow": {
+            "phases": args.phases,
+            "tasks_per_phase": args.tasks,
+            "bytes": len(json.dumps(source)),
+        },
+        "variants": args.variants,
+        "read_all": args.read_all,
+        "results": results,
+        "peak_reduction": round(1 - results["cow_copy"]["peak_kib"] / baseline, 3),
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
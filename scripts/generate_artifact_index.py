@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any
 
 from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from ai_cores.file_index_core import gate_key, get_file_index
 from generator.hashing import hash_data
 
 
@@ -44,6 +45,25 @@ def _load_json(path: Path) -> dict[str, Any] | None:
     return payload
 
 
+# Bump the version when _artifact_entry changes shape.
+ARTIFACT_GATE = gate_key("artifact_index", 1)
+
+
+def _artifact_entry(path: Path) -> dict[str, Any] | None:
+    payload = _load_json(path)
+    if not payload:
+        return None
+    anchor = payload.get("anchor")
+    if not anchor:
+        return None
+    return {
+        "anchor_id": anchor.get("anchor_id", ""),
+        "anchor_version": anchor.get("anchor_version"),
+        "run_id": payload.get("run_id"),
+        "hash": hash_data(payload),
+    }
+
+
 def _classification_lookup(policy: dict[str, Any]) -> dict[str, str]:
     rules = policy.get("classification_rules", [])
     return {
@@ -64,22 +84,21 @@ def main() -> int:
     classification_map = _classification_lookup(policy)
     entries = []
 
-    for path in args.artifacts_dir.rglob("*.json"):
-        payload = _load_json(path)
-        if not payload:
+    index = get_file_index()
+    for path in index.files([args.artifacts_dir]):
+        if path.suffix != ".json":
             continue
-        anchor = payload.get("anchor")
-        if not anchor:
+        entry = index.cached(ARTIFACT_GATE, path, _artifact_entry)
+        if entry is None:
             continue
-        anchor_id = anchor.get("anchor_id", "")
-        run_id = payload.get("run_id")
+        anchor_id = entry["anchor_id"]
         entries.append(
             {
                 "anchor_id": anchor_id,
-                "anchor_version": anchor.get("anchor_version"),
-                "run_id": run_id,
+                "anchor_version": entry["anchor_version"],
+                "run_id": entry["run_id"],
                 "path": str(path),
-                "hash": hash_data(payload),
+                "hash": entry["hash"],
                 "retention_class": classification_map.get(anchor_id, "unclassified"),
             }
         )
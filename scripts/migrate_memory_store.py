@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Index an existing flat MemoryStore directory into the sharded snapshot index.
+
+Older versions wrote every snapshot as ``{workflow_id}_{YYYYMMDD_HHMMSS}.json``
+directly under data/workflows. This registers those files in
+``snapshot_index.sqlite3`` so `MemoryStore.load_latest` and range queries
+find them through the index. Files stay where they are unless ``--move`` is
+given, which relocates them into their hash-prefix shard directory.
+Other JSON files in the directory (e.g. tracked workflow sources such as
+data/workflows/workflow_001.json) are never indexed or moved. Re-running is
+safe; files that are already indexed are skipped.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List
+
+from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from ai_memory.snapshot_store import ShardedSnapshotBackend, index_flat_directory
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser("Index flat MemoryStore snapshots into the sharded store.")
+    parser.add_argument(
+        "--path",
+        type=Path,
+        default=Path("data/workflows"),
+        help="MemoryStore root (default: data/workflows).",
+    )
+    parser.add_argument(
+        "--source",
+        type=Path,
+        help="Flat snapshot directory to index (default: the store root).",
+    )
+    parser.add_argument(
+        "--move",
+        action="store_true",
+        help="Move indexed files into their shard directories.",
+    )
+    args = parse_args(parser, argv)
+
+    backend = ShardedSnapshotBackend(args.path)
+    stats = index_flat_directory(backend, args.source, move=args.move)
+    stats["total_indexed"] = backend.count()
+    print(json.dumps(stats, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
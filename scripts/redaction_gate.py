@@ -5,6 +5,8 @@ import re
 from pathlib import Path
 
 from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from ai_cores.file_index_core import gate_key, get_file_index
+from ai_cores.scan_core import PatternSet, ScanRule, scan_files
 from generator.failure_emitter import FailureEmitter, FailureLabel
 
 
@@ -31,19 +33,22 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--run-id", type=str, default="redaction-scan", help="Run identifier."
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rescan every file instead of reusing results for unchanged content.",
+    )
     return parse_args(parser)
 
 
+REDACTION_SCAN = PatternSet(
+    ScanRule.from_regex(pattern.pattern, pattern) for pattern in DISALLOWED_PATTERNS
+)
+REDACTION_GATE = gate_key("redaction", REDACTION_SCAN.signature)
+
+
 def _scan_file(path: Path) -> list[str]:
-    try:
-        content = path.read_text(encoding="utf-8")
-    except OSError:
-        return []
-    hits = []
-    for pattern in DISALLOWED_PATTERNS:
-        if pattern.search(content):
-            hits.append(pattern.pattern)
-    return hits
+    return REDACTION_SCAN.scan_file(path).rule_ids
 
 
 def main() -> int:
@@ -51,15 +56,15 @@ def main() -> int:
     emitter = FailureEmitter(Path("artifacts/redaction/failures"))
     violations = []
 
-    for scan_dir in args.scan_dirs:
-        if not scan_dir.exists():
-            continue
-        for path in scan_dir.rglob("*"):
-            if path.is_dir():
-                continue
-            matches = _scan_file(path)
-            if matches:
-                violations.append({"path": str(path), "patterns": matches})
+    if args.no_cache:
+        for result in scan_files(args.scan_dirs, REDACTION_SCAN):
+            violations.append({"path": str(result.path), "patterns": result.rule_ids})
+    else:
+        index = get_file_index()
+        for path in index.files(args.scan_dirs):
+            patterns = index.cached(REDACTION_GATE, path, _scan_file)
+            if patterns:
+                violations.append({"path": str(path), "patterns": patterns})
 
     if violations:
         emitter.emit(
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from ai_cores.governance_core import GovernanceSession
+from generator.failure_emitter import FailureEmitter
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = build_parser("Run all governance validations with per-validator timings.")
+    parser.add_argument(
+        "--repo-root",
+        type=Path,
+        default=Path("."),
+        help="Repository root to validate.",
+    )
+    parser.add_argument(
+        "--changed-files",
+        type=Path,
+        nargs="*",
+        default=[],
+        help="Changed paths checked against an active governance freeze.",
+    )
+    parser.add_argument(
+        "--phase2-passed",
+        action="store_true",
+        help="Phase 2 tests passed (allows lifting the governance freeze).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Validator threads (1 runs them sequentially).",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    parser.add_argument(
+        "--run-id",
+        type=str,
+        default="governance-validations",
+        help="Run identifier.",
+    )
+    return parse_args(parser)
+
+
+def main() -> int:
+    args = _parse_args()
+    session = GovernanceSession(args.repo_root, max_workers=args.workers)
+    report = session.run(
+        changed_files=args.changed_files, phase2_passed=args.phase2_passed
+    )
+    if args.json:
+        print(json.dumps(report.as_dict(), indent=2))
+    else:
+        print(report.format_timings())
+
+    if report.failure is not None:
+        FailureEmitter(Path("artifacts/governance/failures")).emit(
+            report.failure, run_id=args.run_id
+        )
+        print(f"Governance validation failed: {report.failure.phase_id}")
+        return 1
+
+    print("Governance validation passed")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
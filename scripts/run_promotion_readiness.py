@@ -10,10 +10,8 @@ from pathlib import Path
 from ai_evaluation.checkpoints import EvaluationCheckpointer
 from ai_cores.cli_arg_parser_core import build_parser, parse_args
 from ai_cores.deprecation_core import find_deprecation_banner_violations
-from ai_cores.governance_core import (
-    validate_canonical_header_format,
-    validate_governance_ingestion_order,
-)
+from ai_cores.file_index_core import get_file_index
+from ai_cores.governance_core import GovernanceSession
 from jsonschema import Draft202012Validator
 from generator.determinism import (
     bijectivity_check,
@@ -347,7 +345,8 @@ def main() -> int:
             ),
         )
 
-    _, header_errors = validate_canonical_header_format(repo_root)
+    governance = GovernanceSession(repo_root)
+    _, header_errors = governance.canonical_headers()
     if header_errors:
         return _gate_failure(
             failure_emitter,
@@ -359,7 +358,7 @@ def main() -> int:
             ),
         )
 
-    governance_errors = validate_governance_ingestion_order(repo_root)
+    governance_errors = governance.ingestion_order()
     if governance_errors:
         return _gate_failure(
             failure_emitter,
@@ -1109,6 +1108,7 @@ def main() -> int:
             Path("config/anchor_registry.json"),
         ],
         allowlist=allowlist,
+        index=get_file_index(),
     )
     if secret_scan["violations"] or secret_scan["allowlist_errors"]:
         return gate_failure(
@@ -4,6 +4,7 @@ import argparse
 from pathlib import Path
 
 from ai_cores.cli_arg_parser_core import build_parser, parse_args
+from ai_cores.file_index_core import get_file_index
 from generator.failure_emitter import FailureEmitter, FailureLabel
 from generator.secret_scanner import load_allowlist, scan_paths
 
@@ -61,7 +62,7 @@ def main() -> int:
     allowlist = load_allowlist(args.allowlist_path)
     scan_targets = list(args.scan_dirs) + list(args.scan_files)
 
-    results = scan_paths(scan_targets, allowlist=allowlist)
+    results = scan_paths(scan_targets, allowlist=allowlist, index=get_file_index())
     violations = results["violations"]
     allowlist_errors = results["allowlist_errors"]
 
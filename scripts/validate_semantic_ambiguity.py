@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Dict, Any, Tuple
 
+from ai_cores.scan_core import PatternSet, ScanRule
+
 ERROR_LABEL = "Semantic Ambiguity"
 
 # Minimal semver (X.Y.Z) for anchor_version where applicable
@@ -157,18 +159,24 @@ def quarantine_append(quarantine_path: Path, payload: Dict[str, Any]) -> None:
     with quarantine_path.open("a", encoding="utf-8") as f:
         f.write(json.dumps(payload, sort_keys=True) + "\n")
 
+
+# All patterns compiled into one single-pass scan (see ai_cores/scan_core.py).
+AMBIGUITY_SCAN = PatternSet(
+    ScanRule.from_regex(rule_id, pattern) for rule_id, pattern in AMBIGUITY_PATTERNS
+)
+
+
 def detect_semantic_ambiguity(text: str, source_path: str) -> List[AmbiguityFinding]:
     findings: List[AmbiguityFinding] = []
 
-    for rule_id, pattern in AMBIGUITY_PATTERNS:
-        if pattern.search(text):
-            findings.append(
-                AmbiguityFinding(
-                    path=source_path,
-                    rule_id=rule_id,
-                    message=f"Matched semantic ambiguity pattern: {rule_id}",
-                )
+    for rule_id in AMBIGUITY_SCAN.matches(text):
+        findings.append(
+            AmbiguityFinding(
+                path=source_path,
+                rule_id=rule_id,
+                message=f"Matched semantic ambiguity pattern: {rule_id}",
             )
+        )
 
     return findings
 
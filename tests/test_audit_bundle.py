@@ -0,0 +1,113 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import json
+from pathlib import Path
+
+from jsonschema import Draft202012Validator
+
+from ai_cores.audit_core import hash_file
+from generator.audit_bundle import (
+    build_bundle,
+    build_bundle_with_stats,
+    validate_bundle,
+)
+from tests.assertions import require
+
+
+def _spec(paths):
+    return {
+        "components": [
+            {"component_id": component_id, "path_template": str(path)}
+            for component_id, path in paths
+        ]
+    }
+
+
+def test_bundle_hashes_copies_and_deduplicates(tmp_path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "report.json").write_text('{"run_id": "run-1"}', encoding="utf-8")
+    (src / "copy.json").write_text('{"run_id": "run-1"}', encoding="utf-8")
+    (src / "other.json").write_text('{"run_id": null}', encoding="utf-8")
+    (src / "large.log").write_bytes(b"x" * 3_000_000)
+    spec = _spec(
+        [
+            ("reports", src / "report.json"),
+            ("reports", src / "missing.json"),
+            ("copies", src / "copy.json"),
+            ("copies", src / "other.json"),
+            ("logs", src / "large.log"),
+        ]
+    )
+    bundle = tmp_path / "bundle"
+    manifest, stats = build_bundle_with_stats(
+        spec=spec,
+        run_id="run-1",
+        bundle_dir=bundle,
+        manifest_path=tmp_path / "manifest.json",
+        workers=4,
+        link="copy",
+    )
+
+    entries = manifest["entries"]
+    require(
+        [entry["component_id"] for entry in entries]
+        == ["reports", "copies", "copies", "logs"],
+        "Expected spec order kept and missing sources skipped",
+    )
+    for entry in entries:
+        require(
+            entry["content_hash"] == hash_file(Path(entry["source_path"])),
+            f"Expected source content hash for {entry['bundle_path']}",
+        )
+    report = bundle / "reports" / "report.json"
+    copy = bundle / "copies" / "copy.json"
+    require(
+        report.stat().st_ino == copy.stat().st_ino,
+        "Expected identical content stored once",
+    )
+    require(
+        report.stat().st_ino != (src / "report.json").stat().st_ino,
+        "Expected copy mode not to share inodes with sources",
+    )
+    transfer = stats.as_dict()
+    require(
+        (transfer["files"], transfer["copied"], transfer["deduplicated"]) == (4, 3, 1),
+        f"Unexpected transfer stats: {transfer}",
+    )
+    require(transfer["bytes"] == 3_000_000 + 2 * 19 + 16, "Expected bundled bytes")
+    require(
+        validate_bundle(manifest)["status"] == "pass", "Expected bundle to validate"
+    )
+    schema = json.loads(
+        Path("schemas/audit-bundle-manifest.json").read_text(encoding="utf-8")
+    )
+    validator = Draft202012Validator(schema)
+    errors = [error.message for error in validator.iter_errors(manifest)]
+    require(not errors, f"Expected a schema-exact manifest: {errors}")
+
+
+def test_hardlink_rebuild_never_writes_through_to_sources(tmp_path) -> None:
+    source = tmp_path / "evidence.txt"
+    source.write_text("original", encoding="utf-8")
+    bundle = tmp_path / "bundle"
+    kwargs = {
+        "spec": _spec([("evidence", source)]),
+        "run_id": "run-1",
+        "bundle_dir": bundle,
+        "manifest_path": tmp_path / "manifest.json",
+    }
+    _, linked = build_bundle_with_stats(link="hardlink", **kwargs)
+    target = bundle / "evidence" / "evidence.txt"
+    require(linked.hardlinked == 1, "Expected a hard link")
+    require(target.stat().st_ino == source.stat().st_ino, "Expected shared inode")
+
+    # Rebuilding as a copy must replace the link, not write through it.
+    manifest = build_bundle(link="copy", **kwargs)
+    require("transfer" not in manifest, "Expected no stats in the manifest")
+    require(target.stat().st_size == 8, "Expected the copy in place")
+    require(target.stat().st_ino != source.stat().st_ino, "Expected link replaced")
+    target.write_text("tampered", encoding="utf-8")
+    require(
+        source.read_text(encoding="utf-8") == "original", "Expected source untouched"
+    )
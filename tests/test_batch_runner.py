@@ -0,0 +1,95 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import json
+from pathlib import Path
+
+from generator.batch_runner import (
+    BatchStats,
+    iter_workflow_sources,
+    run_batch,
+)
+from tests.assertions import require
+
+
+def _write_workflow(path: Path, workflow_id: str) -> Path:
+    path.write_text(
+        json.dumps(
+            {
+                "workflow_id": workflow_id,
+                "version": "v.09.mvm.25",
+                "metadata": {"purpose": f"Batch test {workflow_id}"},
+                "phases": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_iter_workflow_sources_directory_glob_and_manifest(tmp_path: Path) -> None:
+    _write_workflow(tmp_path / "b.json", "b")
+    _write_workflow(tmp_path / "a.json", "a")
+    manifest = tmp_path / "batch.jsonl"
+    manifest.write_text(
+        '"a.json"\n{"path": "b.json"}\n\n{"workflow_id": "inline", "phases": []}\n',
+        encoding="utf-8",
+    )
+
+    from_dir = [source for _, source in iter_workflow_sources(tmp_path)]
+    require(
+        from_dir == [tmp_path / "a.json", tmp_path / "b.json"],
+        "Expected sorted JSON files from directory",
+    )
+    from_glob = list(iter_workflow_sources(str(tmp_path / "*.json")))
+    require(len(from_glob) == 2, "Expected glob expansion")
+
+    entries = list(iter_workflow_sources(manifest))
+    require(entries[0][1] == tmp_path / "a.json", "Expected manifest-relative path")
+    require(entries[1][1] == tmp_path / "b.json", "Expected path object entry")
+    require(entries[2][0] == f"{manifest}:4", "Expected line-numbered label")
+    require(entries[2][1]["workflow_id"] == "inline", "Expected inline workflow")
+
+
+def test_run_batch_streams_results_in_order(tmp_path: Path) -> None:
+    sources = [
+        (str(path), path)
+        for path in (
+            _write_workflow(tmp_path / "one.json", "one"),
+            tmp_path / "missing.json",
+            _write_workflow(tmp_path / "two.json", "two"),
+        )
+    ]
+    stats = BatchStats()
+    results = []
+    for result in run_batch(
+        sources, out_dir=tmp_path / "out", jobs=2, enable_refinement=False
+    ):
+        stats.record(result)
+        results.append(result)
+
+    require([r.index for r in results] == [0, 1, 2], "Expected input order")
+    require([r.ok for r in results] == [True, False, True], "Expected one failure")
+    require("FileNotFoundError" in (results[1].error or ""), "Expected error text")
+    require(
+        list(Path(results[0].out_dir).glob("one.json")),
+        "Expected per-workflow artifacts",
+    )
+    summary = stats.to_dict()
+    require(summary["total"] == 3 and summary["failed"] == 1, "Expected totals")
+    require(summary["workflows_per_second"] > 0, "Expected throughput")
+
+
+def test_run_batch_fail_fast_stops_after_failure(tmp_path: Path) -> None:
+    sources = [
+        ("missing", tmp_path / "missing.json"),
+        ("one", _write_workflow(tmp_path / "one.json", "one")),
+    ]
+    results = list(
+        run_batch(
+            sources,
+            out_dir=tmp_path / "out",
+            enable_refinement=False,
+            fail_fast=True,
+        )
+    )
+    require(len(results) == 1 and not results[0].ok, "Expected early stop")
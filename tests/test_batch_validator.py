@@ -0,0 +1,34 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from ai_validation.batch_validator import validate_paths
+from tests.assertions import require
+
+
+def _write_files(tmp_path: Path) -> list[Path]:
+    paths = []
+    for idx in range(6):
+        path = tmp_path / f"item_{idx}.json"
+        path.write_text("{not json" if idx == 3 else "{}", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_validate_paths_preserves_input_order(tmp_path: Path) -> None:
+    paths = _write_files(tmp_path)
+    summaries = list(
+        validate_paths(paths, "template", jobs=2, schema_uri="urn:none")
+    )
+    require([s.path for s in summaries] == paths, "Expected stable result order")
+    require(summaries[3].error is not None, "Expected load error to be captured")
+    require(all(s.skipped for i, s in enumerate(summaries) if i != 3), "Expected skips")
+
+
+def test_validate_paths_fail_fast_stops_early(tmp_path: Path) -> None:
+    paths = _write_files(tmp_path)
+    summaries = list(
+        validate_paths(paths, "template", fail_fast=True, schema_uri="urn:none")
+    )
+    require(len(summaries) == 4, "Expected fail-fast to stop after first failure")
@@ -0,0 +1,41 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+from scripts.benchmark_startup import (
+    DEFAULT_TARGET,
+    measure_import,
+    parse_importtime,
+    summarize,
+)
+from tests.assertions import require
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   json.decoder
+import time:       300 |        420 | json
+import time:        50 |        470 | generator.main
+"""
+
+
+def test_parse_importtime_reads_depth_and_cumulative() -> None:
+    records = parse_importtime(SAMPLE)
+    require(
+        [r.module for r in records] == ["json.decoder", "json", "generator.main"],
+        "Expected header skipped and module names stripped",
+    )
+    require(records[0].depth == 1, "Expected nested import depth")
+    require(records[2].cumulative_us == 470, "Expected cumulative microseconds")
+
+    report = summarize("generator.main", [records], budget_ms=0.1, deferred=["json"])
+    require(report["median_ms"] == 0.47, "Expected median in milliseconds")
+    require(report["deferred_modules_imported"] == ["json"], "Expected leak report")
+    require(report["ok"] is False, "Expected budget and leak failures")
+
+
+def test_generator_main_import_defers_heavy_modules() -> None:
+    report = summarize(
+        DEFAULT_TARGET, [measure_import(DEFAULT_TARGET)], budget_ms=float("inf")
+    )
+    require(
+        report["deferred_modules_imported"] == [],
+        f"Expected lazy imports, got {report['deferred_modules_imported']}",
+    )
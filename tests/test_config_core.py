@@ -0,0 +1,61 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+from ai_cores.config_core import (
+    ConfigService,
+    GraphLimits,
+    get_config_service,
+    parse_graph_limits,
+)
+from tests.assertions import require
+
+
+def test_config_service_caches_until_file_changes(tmp_path) -> None:
+    path = tmp_path / "graph_limits.yml"
+    path.write_text("graph_limits:\n  max_nodes: 10\n", encoding="utf-8")
+    calls = []
+
+    def parser(payload, source):
+        calls.append(source)
+        return parse_graph_limits(payload, source)
+
+    service = ConfigService(stat_interval=0.0)
+    first = service.load(path, parser)
+    second = service.load(path, parser)
+    require(first == GraphLimits(max_nodes=10), "Expected parsed limits")
+    require(second is first and len(calls) == 1, "Expected a single parse")
+
+    path.write_text("graph_limits:\n  max_nodes: 250\n", encoding="utf-8")
+    require(service.load(path, parser).max_nodes == 250, "Expected reload")
+    require(len(calls) == 2, "Expected reparse after (mtime, size) change")
+
+    service.invalidate(path)
+    service.load(path, parser)
+    require(len(calls) == 3, "Expected reparse after invalidate")
+    require(service.hits == 1 and service.loads == 3, "Expected hit/load stats")
+
+
+def test_config_service_missing_file_and_validation_errors(tmp_path) -> None:
+    service = ConfigService(stat_interval=60.0)
+    missing = tmp_path / "absent.yml"
+    require(
+        service.graph_limits(missing) == GraphLimits(),
+        "Expected defaults for a missing file",
+    )
+
+    bad = tmp_path / "bad.yml"
+    bad.write_text("graph_limits:\n  max_nodes: -1\n", encoding="utf-8")
+    for _ in range(2):
+        try:
+            service.graph_limits(bad)
+        except ValueError as exc:
+            require("max_nodes" in str(exc), "Expected validation message")
+        else:
+            require(False, "Expected ValueError for invalid limits")
+    require(service.loads == 1, "Expected failed loads to stay uncached")
+
+
+def test_repo_config_typed_accessors() -> None:
+    service = get_config_service()
+    require(service.graph_limits().max_nodes == 1000, "Expected repo graph limits")
+    require(not service.recursion_settings().enabled, "Expected recursion settings")
+    require(service.telemetry_settings().endpoint == "", "Expected telemetry settings")
@@ -0,0 +1,84 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import random
+
+from ai_cores.dependency_core import DependencyGraph
+from tests.assertions import require
+
+NO_LIMITS = {"enforce": False}
+
+
+def _modules(spec: dict) -> list:
+    return [
+        {"module_id": mid, "dependencies": list(deps)} for mid, deps in spec.items()
+    ]
+
+
+def test_resolve_cycles_removes_stray_edge_and_self_loop() -> None:
+    modules = _modules(
+        {
+            "m1": ["m5"],
+            "m2": ["m1"],
+            "m3": ["m2"],
+            "m4": ["m3"],
+            "m5": ["m4"],
+            "loop": ["loop"],
+            "leaf": ["m5"],
+        }
+    )
+    graph = DependencyGraph(modules)
+
+    require(
+        graph.find_cycle_components() == [["m1", "m2", "m3", "m4", "m5"], ["loop"]],
+        "Expected both cycle clusters",
+    )
+    report = graph.resolve_cycles()
+    require(report.resolved, "Expected cycles resolved")
+    require(
+        report.feedback_edges == [("m1", "m5"), ("loop", "loop")],
+        "Expected only the stray back-reference and the self-loop removed",
+    )
+    require(modules[1]["dependencies"] == ["m1"], "Expected chain edges kept")
+    require(not graph.detect_cycle(), "Expected acyclic graph")
+    require(
+        report.to_dict()["removed_edges"][0]
+        == {"module_id": "m1", "dependency": "m5", "reason": "feedback"},
+        "Expected structured removal report",
+    )
+
+
+def test_resolve_cycles_prefers_optional_dependencies() -> None:
+    modules = _modules({"a": ["b", "c"], "b": ["a"], "c": []})
+    modules[0]["dependency_optional"] = True
+    graph = DependencyGraph(modules)
+
+    require(graph.attempt_autocorrect_cycle(), "Expected correction")
+    report = graph.resolve_cycles()
+    require(not report.components, "Expected no cycles left")
+    require(modules[0]["dependencies"] == ["b", "c"], "Expected a untouched")
+    require(modules[1]["dependencies"] == [], "Expected optional edge removed")
+    require(not graph.attempt_autocorrect_cycle(), "Expected False without a cycle")
+
+
+def test_resolve_cycles_on_large_random_graph_is_acyclic() -> None:
+    rng = random.Random(3)
+    names = [f"n{i}" for i in range(3000)]
+    rng.shuffle(names)
+    modules = _modules({name: rng.sample(names, 3) for name in names})
+    graph = DependencyGraph(modules, graph_limits=NO_LIMITS)
+    report = graph.resolve_cycles()
+
+    require(report.resolved, "Expected resolution")
+    require(not graph.detect_cycle(), "Expected no cycle after batch removal")
+    require(
+        len(report.removed_edges) < sum(len(m["dependencies"]) for m in modules),
+        "Expected a partial feedback set",
+    )
+
+
+def test_detect_cycle_tracks_dependency_edits() -> None:
+    modules = _modules({"a": ["b", "ghost"], "b": []})
+    graph = DependencyGraph(modules)
+    graph.autocorrect_missing_dependencies()
+    require(modules[0]["dependencies"] == ["b"], "Expected missing dep removed")
+    require(not graph.detect_cycle(), "Expected adjacency rebuilt after edits")
@@ -0,0 +1,57 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+from ai_conductor.dependency_graph import CoreDependencyGraph
+from tests.assertions import require
+
+
+def _ids(modules: list) -> list:
+    return [module["module_id"] for module in modules]
+
+
+def test_topological_levels_and_critical_path() -> None:
+    modules = [
+        {"module_id": "report", "dependencies": ["analyze", "fetch"]},
+        {"module_id": "fetch"},
+        {"module_id": "analyze", "dependencies": ["fetch", "fetch", "ghost"]},
+        {"module_id": "lint"},
+        {"module_id": "publish", "dependencies": ["report"]},
+    ]
+    graph = CoreDependencyGraph(modules)
+
+    require(
+        _ids(graph.topological_order())
+        == ["fetch", "lint", "analyze", "report", "publish"],
+        "Expected Kahn order with ties in module order",
+    )
+    require(
+        [_ids(wave) for wave in graph.topological_levels()]
+        == [["fetch", "lint"], ["analyze"], ["report"], ["publish"]],
+        "Expected concurrent waves",
+    )
+    require(graph.critical_path_length() == 4, "Expected longest chain of 4")
+    require(modules[2]["dependencies"] == ["fetch", "fetch"], "Expected ghost dropped")
+
+
+def test_unresolved_cycle_degrades_to_original_order() -> None:
+    modules = [
+        {"module_id": "a", "dependencies": ["b"]},
+        {"module_id": "b", "dependencies": ["a"]},
+        {"module_id": "c"},
+    ]
+    graph = CoreDependencyGraph(modules)
+
+    require(graph.topological_order() == modules, "Expected original order")
+    require(
+        [_ids(wave) for wave in graph.topological_levels()] == [["a"], ["b"], ["c"]],
+        "Expected sequential waves",
+    )
+
+    require(graph.attempt_autocorrect_cycle(), "Expected cycle resolved")
+    require(
+        [_ids(wave) for wave in graph.topological_levels()] == [["a", "c"], ["b"]],
+        "Expected schedule rebuilt after autocorrect",
+    )
+    require(
+        modules[0]["dependencies"] == [] and modules[1]["dependencies"] == ["a"],
+        "Expected the forward reference removed",
+    )
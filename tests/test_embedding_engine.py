@@ -0,0 +1,51 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from generator import embedding_engine
+from generator.embedding_engine import EmbeddingCache, EmbeddingEngine
+from tests.assertions import require
+
+
+class _FakeModel:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts, **_kwargs):
+        numpy = pytest.importorskip("numpy")
+        self.calls.append(list(texts))
+        return numpy.array([[float(len(t)), 1.0, 0.0] for t in texts])
+
+
+def test_encode_many_batches_misses_and_reuses_disk_cache(
+    tmp_path: Path, monkeypatch
+) -> None:
+    pytest.importorskip("numpy")
+    model = _FakeModel()
+    monkeypatch.setitem(embedding_engine._MODELS, "fake-model", model)
+
+    engine = EmbeddingEngine("fake-model", cache_dir=tmp_path)
+    first = engine.encode_many(["alpha", "beta", "alpha"])
+    require(model.calls == [["alpha", "beta"]], "Expected one batched call")
+    require(first[0][0] == 5.0 and first[1][0] == 4.0, "Unexpected vectors")
+
+    reopened = EmbeddingEngine("fake-model", cache_dir=tmp_path)
+    reopened.encode_many(["beta", "gamma"])
+    require(model.calls[-1] == ["gamma"], "Expected cached row to be reused")
+    require(len(EmbeddingCache(tmp_path, "fake-model")) == 3, "Expected 3 rows")
+
+
+def test_semantic_delta_calculator_lexical_batch(monkeypatch) -> None:
+    from generator.recursion_manager import SemanticDeltaCalculator
+
+    monkeypatch.setitem(
+        embedding_engine._MODELS, "missing-model", embedding_engine._UNAVAILABLE
+    )
+    calc = SemanticDeltaCalculator("missing-model")
+    before, after = calc.encode_many(
+        [{"metadata": {"title": "Alpha beta"}}, {"metadata": {"title": "Alpha"}}]
+    )
+    require(calc.delta(before, after) == 0.5, "Expected lexical delta of 0.5")
@@ -17,3 +17,62 @@ def test_evaluate_clarity_scores_valid():
     metrics = evaluate_clarity(wf)
     require("clarity_score" in metrics, "Expected clarity_score in metrics output")
     require(metrics["clarity_score"] > 0, "Expected clarity_score to be positive")
+
+
+def test_evaluate_workflow_quality_extracts_text_once(monkeypatch):
+    from ai_evaluation.evaluation_engine import evaluate_workflow_quality
+    from ai_evaluation.semantic_analysis import SemanticAnalyzer
+
+    calls = []
+    original = SemanticAnalyzer.extract_text_blocks
+
+    def counting(self, workflow):
+        calls.append(1)
+        return original(self, workflow)
+
+    monkeypatch.setattr(SemanticAnalyzer, "extract_text_blocks", counting)
+    wf = {
+        "metadata": {"purpose": "Plan a garden. Plan a garden."},
+        "phases": [{"id": "P1", "description": "Plan soil and seeds."}],
+    }
+    report = evaluate_workflow_quality(wf)
+    require(len(calls) == 1, f"Expected one text extraction, got {len(calls)}")
+    require("epistemic_optimization" in report["metrics"], "Expected all metrics")
+
+
+def test_analysis_context_matches_legacy_metric():
+    from ai_evaluation.analysis_context import AnalysisContext
+    from ai_evaluation.evaluation_engine import legacy_metric
+    from ai_evaluation.quality_metrics import coherence_metric
+
+    wf = {"metadata": {"title": "Alpha. Alpha. Beta."}}
+    ctx = AnalysisContext.from_workflow(wf)
+    score = legacy_metric(coherence_metric)(ctx)
+    require(abs(score - 2 / 3) < 1e-9, f"Unexpected coherence score {score}")
+
+
+def test_replacing_a_legacy_metric_changes_the_registry_version(monkeypatch):
+    from ai_evaluation import evaluation_engine as engine
+
+    monkeypatch.setattr(engine, "_METRICS", dict(engine._METRICS))
+    monkeypatch.setattr(engine, "_REGISTRY_VERSION", None)
+
+    def first(workflow):
+        return 0.1
+
+    def second(workflow):
+        return 0.2
+
+    engine.register_metric("replaced", first)
+    before = engine.metric_registry_version()
+    engine.register_metric("replaced", second)
+    require(
+        engine.metric_registry_version() != before, "Expected a new registry version"
+    )
+    engine.register_metric("replaced", lambda workflow: 0.3)
+    lambda_version = engine.metric_registry_version()
+    engine.register_metric("replaced", lambda workflow: 0.3 if workflow else 0.0)
+    require(
+        engine.metric_registry_version() != lambda_version,
+        "Expected same-named lambdas told apart",
+    )
@@ -0,0 +1,42 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from ai_evaluation.evaluation_cache import EvaluationCache, configure_evaluation_cache
+from ai_evaluation.evaluation_engine import evaluate_workflow_quality
+from tests.assertions import require
+
+
+def _workflow() -> dict:
+    return {
+        "workflow_id": "wf_cache",
+        "metadata": {"purpose": "Cache evaluation reports."},
+        "phases": [{"id": "P1", "description": "Evaluate once."}],
+    }
+
+
+def test_evaluation_cache_hits_on_unchanged_content() -> None:
+    cache = configure_evaluation_cache()
+    wf = _workflow()
+    first = evaluate_workflow_quality(wf)
+    wf.setdefault("evaluation", {})["quality"] = first
+    second = evaluate_workflow_quality(wf)
+    wf["phases"][0]["description"] = "Evaluate again after an edit."
+    evaluate_workflow_quality(wf)
+    stats = cache.stats()
+    require(first == second, "Expected cached report to match")
+    require(first is not second, "Expected cache to return a copy")
+    require(stats["hits"] == 1 and stats["misses"] == 2, f"Unexpected stats {stats}")
+
+
+def test_evaluation_cache_evicts_and_persists(tmp_path: Path) -> None:
+    cache = EvaluationCache(max_entries=1, cache_dir=tmp_path)
+    cache.put("aa", {"overall_score": 1.0, "metrics": {}})
+    cache.put("bb", {"overall_score": 0.5, "metrics": {}})
+    require(cache.stats()["evictions"] == 1, "Expected LRU eviction")
+
+    reopened = EvaluationCache(cache_dir=tmp_path)
+    report = reopened.get("aa")
+    require(report == {"overall_score": 1.0, "metrics": {}}, "Expected disk hit")
+    require(reopened.stats()["disk_hits"] == 1, "Expected disk hit counter")
@@ -0,0 +1,71 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import json
+import os
+
+from ai_cores.export_core import write_bytes
+from generator.export_stage import EXPORT_FORMATS, export_workflow_formats
+from generator.workflow_view import cow_copy
+from tests.assertions import require
+
+
+def _workflow() -> dict:
+    return {
+        "workflow_id": "stage_test",
+        "version": "v.09.mvm.25",
+        "metadata": {"purpose": "Export stage"},
+        "phases": [{"id": "p1", "tasks": [{"id": "t1", "description": "do"}]}],
+        "modules": [
+            {"module_id": "m1", "name": "First", "dependencies": []},
+            {"module_id": "m2", "name": "Second", "dependencies": ["m1"]},
+        ],
+        "dependency_graph": {"nodes": ["m1", "m2"], "edges": [["m1", "m2"]]},
+    }
+
+
+def test_export_writes_all_formats_then_skips_unchanged(tmp_path) -> None:
+    workflow = _workflow()
+
+    first = export_workflow_formats(cow_copy(workflow), tmp_path)
+    require(first.written == list(EXPORT_FORMATS), "Expected every format written")
+    require(
+        json.loads((tmp_path / "stage_test.json").read_text()) == workflow,
+        "Expected JSON export to round-trip",
+    )
+    dot = (tmp_path / "stage_test.dot").read_text()
+    require('"m1" -> "m2";' in dot, "Expected DOT edge")
+    mermaid = (tmp_path / "stage_test.mmd").read_text()
+    require("m1 --> m2" in mermaid, "Expected Mermaid edge")
+
+    mtimes = {fmt: os.stat(path).st_mtime_ns for fmt, path in first.paths.items()}
+    second = export_workflow_formats(workflow, tmp_path)
+    require(second.skipped == list(EXPORT_FORMATS), "Expected unchanged skip")
+    require(second.digests == first.digests, "Expected stable digests")
+    require(
+        all(
+            os.stat(path).st_mtime_ns == mtimes[fmt]
+            for fmt, path in second.paths.items()
+        ),
+        "Expected skipped files to be untouched",
+    )
+
+    workflow["metadata"]["purpose"] = "Changed"
+    third = export_workflow_formats(workflow, tmp_path, ["json", "dot"])
+    require(third.written == ["json"], "Expected only changed content rewritten")
+    require(third.skipped == ["dot"], "Expected DOT unchanged")
+    require(
+        not [p for p in tmp_path.iterdir() if p.name.endswith(".tmp")],
+        "Expected no temp files left behind",
+    )
+
+
+def test_write_bytes_replaces_atomically(tmp_path) -> None:
+    target = tmp_path / "nested" / "out.txt"
+    require(write_bytes(b"one", target), "Expected first write")
+    require(not write_bytes(b"one", target), "Expected identical write skipped")
+    require(write_bytes(b"two", target), "Expected changed write")
+    require(target.read_bytes() == b"two", "Expected new content")
+    require(
+        write_bytes(b"two", target, skip_unchanged=False), "Expected forced rewrite"
+    )
+    require(list(target.parent.iterdir()) == [target], "Expected no temp files")
@@ -0,0 +1,78 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import os
+
+from ai_cores import file_index_core
+from ai_cores.file_index_core import FileIndex, gate_key
+from tests.assertions import require
+
+
+def _counting_scan(calls):
+    def scan(path):
+        calls.append(path.name)
+        return {"size": len(path.read_bytes())}
+
+    return scan
+
+
+def test_rerun_only_rescans_changed_files(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(file_index_core, "RACY_NS", 0)
+    root = tmp_path / "repo"
+    (root / "docs").mkdir(parents=True)
+    (root / ".git").mkdir()
+    (root / "venv" / "lib").mkdir(parents=True)
+    (root / ".git" / "HEAD").write_text("ref", encoding="utf-8")
+    (root / "venv" / "lib" / "site.py").write_text("x", encoding="utf-8")
+    for name in ("a.md", "b.md", "c.md"):
+        (root / "docs" / name).write_text(name, encoding="utf-8")
+    gate = gate_key("sizes", 1)
+    calls: list = []
+    scan = _counting_scan(calls)
+
+    index = FileIndex(root)
+    files = index.files([root])
+    require(
+        [path.relative_to(root).as_posix() for path in files]
+        == ["docs/a.md", "docs/b.md", "docs/c.md"],
+        "Expected sorted files with .git and venv pruned",
+    )
+    for path in files:
+        index.cached(gate, path, scan)
+    require(len(calls) == 3, "Expected every file scanned on the first run")
+
+    (root / "docs" / "b.md").write_text("changed", encoding="utf-8")
+    (root / "docs" / "c.md").unlink()
+    calls.clear()
+    reopened = FileIndex(root)
+    results = {
+        path.name: reopened.cached(gate, path, scan)
+        for path in reopened.files([root / "docs"])
+    }
+    require(calls == ["b.md"], f"Expected only the changed file rescanned: {calls}")
+    require(
+        results == {"a.md": {"size": 4}, "b.md": {"size": 7}},
+        "Expected cached and fresh results, removed file dropped",
+    )
+    require(reopened.stats()["files"] == 2, "Expected removed file unindexed")
+
+
+def test_racy_same_size_rewrite_is_detected(tmp_path) -> None:
+    path = tmp_path / "config.txt"
+    path.write_text("token=aaaa", encoding="utf-8")
+    stamp = path.stat().st_mtime_ns
+    index = FileIndex(tmp_path)
+    calls: list = []
+    scan = _counting_scan(calls)
+    index.files([tmp_path])
+    index.cached("gate", path, scan)
+
+    # Same size and mtime, different content: only the hash can tell.
+    path.write_text("token=bbbb", encoding="utf-8")
+    os.utime(path, ns=(stamp, stamp))
+    index.files([tmp_path])
+    index.cached("gate", path, scan)
+    require(len(calls) == 2, "Expected a racily-clean file to be re-hashed")
+    require(
+        index.digest(path) == FileIndex(tmp_path).digest(path),
+        "Expected content hash independent of index instance",
+    )
@@ -7,6 +7,7 @@ import pytest
 
 from ai_cores.governance_core import (
     CANONICAL_GOVERNANCE_ORDER,
+    GovernanceSession,
     run_governance_validations,
     validate_constitution_precedence,
     validate_governance_anchor_integrity,
@@ -216,3 +217,58 @@ def test_governance_freeze_enforced(tmp_path: Path) -> None:
         phase2_passed=False,
     )
     require(lift_errors, "Expected governance freeze lift violation before Phase 2 pass")
+
+
+def test_governance_session_reads_each_document_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo_root = _repo_with_required_docs(tmp_path)
+    docs_root = (repo_root / "directive_core" / "docs").resolve()
+    reads: list[str] = []
+    original = Path.read_text
+
+    def counting_read_text(self: Path, *args, **kwargs) -> str:
+        if self.resolve().parent == docs_root:
+            reads.append(self.name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    session = GovernanceSession(repo_root, max_workers=4)
+    report = session.run()
+    require(len(report.results) == 7, "Expected every validator to report")
+    require(
+        sorted(reads) == sorted(CANONICAL_GOVERNANCE_ORDER),
+        f"Expected one read per governance document, got {sorted(reads)}",
+    )
+    require(
+        session.document("AGENTS.toml").anchor["anchor_id"] == "agents",
+        "Expected parsed anchor shared through the session",
+    )
+
+
+def test_governance_session_report_matches_sequential_chain(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    duplicate_anchor = "[anchor]\n[anchor]\n"
+    _write_required_docs(repo_root, overrides={"REFERENCES.toml": duplicate_anchor})
+    concurrent = GovernanceSession(repo_root, max_workers=4).run()
+    sequential = GovernanceSession(repo_root, max_workers=1).run()
+    names = [result.name for result in concurrent.results]
+    require(
+        names == [result.name for result in sequential.results],
+        "Expected deterministic validator ordering",
+    )
+    require(names[0] == "governance_source_location", "Expected declaration order")
+    chained = run_governance_validations(repo_root)
+    require(
+        concurrent.failure == sequential.failure == chained,
+        "Expected the first failure in declaration order",
+    )
+    require(
+        concurrent.failure.Type == "governance_anchor_violation",
+        f"Expected anchor failure, got {concurrent.failure}",
+    )
+    require(
+        set(concurrent.timings()) == set(names)
+        and "total (wall)" in concurrent.format_timings(),
+        "Expected per-validator timings",
+    )
@@ -0,0 +1,112 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import json
+import multiprocessing
+
+from generator import history as history_module
+from generator.history import HistoryManager
+from tests.assertions import require
+
+
+def _build(path) -> HistoryManager:
+    history = HistoryManager(path, snapshot_every=4)
+    #   root → a → b → c
+    #        ↘ x → b      (b has two parents)
+    for parent, child in (
+        ("root", "a"),
+        ("a", "b"),
+        ("root", "x"),
+        ("x", "b"),
+        ("b", "c"),
+        ("a", "b"),
+    ):
+        history.record_transition(parent, child, 0.1, [f"{parent}->{child}"])
+    return history
+
+
+def test_graph_queries_follow_lineage(tmp_path) -> None:
+    history = _build(tmp_path / "history.json")
+    require(history.ancestors("c") == ["b", "a", "x", "root"], "Expected BFS order")
+    require(history.ancestors("c", depth=1) == ["b"], "Expected depth limit")
+    require(
+        history.descendants("root", depth=2) == ["a", "x", "b"],
+        "Expected deduplicated descendants",
+    )
+    require(
+        history.lineage_path("root", "c") == ["root", "a", "b", "c"],
+        "Expected shortest downward chain",
+    )
+    require(
+        history.lineage_path("c", "a") == ["c", "b", "a"], "Expected upward chain"
+    )
+    require(history.lineage_path("a", "x") is None, "Expected siblings unrelated")
+    relations = history.find_relations("b")
+    require(
+        [r.modifications[0] for r in relations] == ["a->b", "x->b", "b->c", "a->b"],
+        "Expected matching records in log order",
+    )
+    require(len(history.all_records()) == 6, "Expected every record readable")
+
+
+def test_index_restores_from_snapshot_and_imports_legacy(tmp_path) -> None:
+    legacy = tmp_path / "history.json"
+    legacy.write_text(
+        json.dumps(
+            [
+                {
+                    "timestamp": "2025-01-01T00:00:00Z",
+                    "parent_workflow": "old",
+                    "child_workflow": "root",
+                    "modifications": [],
+                    "score_delta": 0.5,
+                }
+            ]
+        ),
+        encoding="utf-8",
+    )
+    _build(legacy).checkpoint()
+    require(
+        (tmp_path / "history" / "index.snapshot").exists(), "Expected snapshot file"
+    )
+
+    # A second writer appends behind the snapshot; a fresh index sees both.
+    segment = tmp_path / "history" / "segment-000000.jsonl"
+    with segment.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"parent_workflow": "c", "child_workflow": "d"}))
+        handle.write("\n")
+    history_module._INDEXES.clear()  # pylint: disable=protected-access
+    reloaded = HistoryManager(legacy, snapshot_every=4)
+    require(
+        reloaded.ancestors("d")[-1] == "old", "Expected legacy + tail in the index"
+    )
+    require(len(reloaded.all_records()) == 8, "Expected legacy imported once")
+
+
+def _record_chain(path: str, worker: int, count: int) -> None:
+    history = HistoryManager(path, segment_bytes=600, snapshot_every=25)
+    for index in range(count):
+        history.record_transition(f"w{worker}-{index}", f"w{worker}-{index + 1}", 0.0)
+
+
+def test_processes_rolling_segments_keep_every_record_indexed(tmp_path) -> None:
+    path = str(tmp_path / "history.json")
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=_record_chain, args=(path, worker, 100))
+        for worker in range(4)
+    ]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(60)
+    require(all(process.exitcode == 0 for process in workers), "Expected clean exits")
+    require((tmp_path / "history" / "index.snapshot").exists(), "Expected a snapshot")
+
+    history_module._INDEXES.clear()  # pylint: disable=protected-access
+    reloaded = HistoryManager(path, segment_bytes=600, snapshot_every=25)
+    require(len(reloaded.all_records()) == 400, "Expected every record on disk")
+    for worker in range(4):
+        require(
+            len(reloaded.ancestors(f"w{worker}-100")) == 100,
+            f"Expected worker {worker}'s whole chain in the index",
+        )
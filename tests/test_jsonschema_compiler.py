@@ -0,0 +1,57 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from jsonschema import Draft202012Validator, RefResolver
+from tests.assertions import require
+
+
+def _validator(tmp_path: Path) -> Draft202012Validator:
+    (tmp_path / "item.json").write_text(
+        json.dumps(
+            {
+                "type": "object",
+                "required": ["id"],
+                "properties": {
+                    "id": {"type": "string", "pattern": "^[a-z]+$"},
+                    "kind": {"enum": ["a", "b"]},
+                },
+                "additionalProperties": False,
+            }
+        ),
+        encoding="utf-8",
+    )
+    schema = {
+        "type": "object",
+        "properties": {"items": {"type": "array", "items": {"$ref": "item.json"}}},
+    }
+    resolver = RefResolver(base_uri=tmp_path.as_uri() + "/", referrer=schema, store={})
+    return Draft202012Validator(schema, resolver=resolver)
+
+
+def test_compiled_validator_reports_paths(tmp_path: Path) -> None:
+    validator = _validator(tmp_path)
+    instance = {"items": [{"id": "ok"}, {"id": "BAD", "kind": "c", "x": 1}, {}]}
+    prefix = ["properties", "items", "items", "$ref"]
+    errors = [
+        (list(error.path), list(error.schema_path))
+        for error in validator.iter_errors(instance)
+    ]
+    expected = [
+        (["items", 1, "id"], prefix + ["properties", "id", "pattern"]),
+        (["items", 1, "kind"], prefix + ["properties", "kind", "enum"]),
+        (["items", 1, "x"], prefix + ["additionalProperties"]),
+        (["items", 2], prefix + ["required"]),
+    ]
+    require(errors == expected, f"Unexpected error paths: {errors}")
+
+
+def test_compiled_validator_memoizes_refs(tmp_path: Path) -> None:
+    validator = _validator(tmp_path)
+    valid = list(validator.iter_errors({"items": [{"id": "ok"}]}))
+    require(not valid, "Expected instance to validate")
+    (tmp_path / "item.json").unlink()
+    errors = list(validator.iter_errors({"items": [{}]}))
+    require(len(errors) == 1, "Expected memoized $ref to validate without disk access")
@@ -0,0 +1,106 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+from ai_memory.memory_store import MemoryStore
+from ai_memory.snapshot_store import ShardedSnapshotBackend, index_flat_directory
+from tests.assertions import require
+
+
+def test_sharded_store_orders_snapshots_and_queries_ranges(tmp_path) -> None:
+    store = MemoryStore(str(tmp_path))
+    paths = []
+
+    def worker(offset: int) -> None:
+        for index in range(10):
+            paths.append(store.save({"workflow_id": "wf_a", "n": offset + index}))
+
+    threads = [threading.Thread(target=worker, args=(i * 100,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.save({"workflow_id": "wf_b", "n": -1})
+    last = store.save({"workflow_id": "wf_a", "n": 999})
+
+    require(len(set(paths)) == 40, "Expected unique snapshot files under concurrency")
+    require(store.load_latest("wf_a")["n"] == 999, "Expected newest snapshot")
+    require(store.load_latest("missing") is None, "Expected None for unknown id")
+    files = store.list_files("wf_a")
+    require(len(files) == 41 and files[-1] == last, "Expected creation order")
+    shard = ShardedSnapshotBackend(tmp_path).shard_for("wf_a")
+    require(
+        all(f.startswith(str(tmp_path / shard)) for f in files),
+        "Expected hash-prefix shard directory",
+    )
+
+    refs = store.snapshots("wf_a")
+    middle = datetime.fromtimestamp(refs[20].created_ns / 1e9, timezone.utc)
+    recent = store.snapshots("wf_a", since=middle - timedelta(microseconds=1))
+    require(21 <= len(recent) <= 22, "Expected range query from the middle")
+    require(
+        store.snapshots(until=datetime(2000, 1, 1)) == [],
+        "Expected empty range before any snapshot",
+    )
+
+
+def test_flat_directory_is_readable_and_migrates(tmp_path) -> None:
+    for stamp, step in (("20240101_090000", 1), ("20240102_090000", 2)):
+        (tmp_path / f"wf_old_{stamp}.json").write_text(
+            json.dumps({"workflow_id": "wf_old", "step": step}), encoding="utf-8"
+        )
+    (tmp_path / "wf_bad_20240101_090000.json").write_text("{", encoding="utf-8")
+
+    store = MemoryStore(str(tmp_path))
+    require(store.load_latest("wf_old")["step"] == 2, "Expected legacy fallback")
+    store.save({"workflow_id": "wf_old", "step": 3})
+    require(len(store.list_files("wf_old")) == 3, "Expected legacy + indexed files")
+
+    backend = ShardedSnapshotBackend(tmp_path)
+    stats = index_flat_directory(backend, move=True)
+    require(
+        stats == {"scanned": 3, "indexed": 2, "skipped": 1, "moved": 2},
+        f"Unexpected migration stats {stats}",
+    )
+    require(
+        index_flat_directory(backend)["indexed"] == 0, "Expected idempotent re-run"
+    )
+    migrated = MemoryStore(str(tmp_path))
+    require(migrated.load_latest("wf_old")["step"] == 3, "Expected newest after move")
+    steps = [
+        json.loads(open(path, encoding="utf-8").read())["step"]
+        for path in migrated.list_files("wf_old")
+    ]
+    require(steps == [1, 2, 3], "Expected migrated snapshots in time order")
+
+
+def test_non_snapshot_json_is_never_indexed_or_moved(tmp_path) -> None:
+    source = tmp_path / "workflow_001.json"
+    source.write_text(json.dumps({"workflow_id": "workflow_001"}), encoding="utf-8")
+
+    store = MemoryStore(str(tmp_path))
+    require(store._legacy is None, "Expected no legacy mode for source files")
+    require(store.list_files() == [], "Expected the source file not listed")
+
+    stats = index_flat_directory(ShardedSnapshotBackend(tmp_path), move=True)
+    require(
+        stats == {"scanned": 1, "indexed": 0, "skipped": 1, "moved": 0},
+        f"Unexpected migration stats {stats}",
+    )
+    require(source.exists(), "Expected the source file left in place")
+
+
+def test_in_place_migration_turns_off_the_directory_fallback(tmp_path) -> None:
+    (tmp_path / "wf_old_20240101_090000.json").write_text(
+        json.dumps({"workflow_id": "wf_old", "step": 1}), encoding="utf-8"
+    )
+    require(MemoryStore(str(tmp_path))._legacy is not None, "Expected fallback")
+
+    stats = index_flat_directory(ShardedSnapshotBackend(tmp_path))
+    require(stats["indexed"] == 1 and stats["moved"] == 0, f"Unexpected {stats}")
+    migrated = MemoryStore(str(tmp_path))
+    require(migrated._legacy is None, "Expected no fallback once indexed")
+    require(migrated.load_latest("wf_old")["step"] == 1, "Expected indexed file")
+    require(len(migrated.list_files("wf_old")) == 1, "Expected one listed file")
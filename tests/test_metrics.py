@@ -0,0 +1,89 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import threading
+
+from ai_monitoring.metrics import MetricsRegistry, TextfileExporter
+from ai_monitoring.performance_alerts import (
+    check_metric_error_rate,
+    check_metric_latency,
+    check_metric_threshold,
+)
+from tests.assertions import require
+
+
+def test_registry_renders_prometheus_text() -> None:
+    registry = MetricsRegistry()
+    calls = registry.counter("demo_calls_total", "Calls.", ("result",))
+    stage = registry.histogram("demo_seconds", "Stage time.", buckets=(0.1, 1.0))
+    registry.gauge("demo_depth", 'Depth "now".').set(3)
+
+    calls.labels(result="ok").inc()
+    calls.labels(result='say "hi"').inc(2)
+    stage.observe(0.05)
+    stage.observe(0.5)
+    stage.observe(5)
+
+    text = registry.render()
+    for line in (
+        "# TYPE demo_calls_total counter",
+        'demo_calls_total{result="ok"} 1.0',
+        'demo_calls_total{result="say \\"hi\\""} 2.0',
+        'demo_seconds_bucket{le="0.1"} 1',
+        'demo_seconds_bucket{le="1.0"} 2',
+        'demo_seconds_bucket{le="+Inf"} 3',
+        "demo_seconds_count 3",
+        "demo_seconds_sum 5.55",
+        "demo_depth 3.0",
+    ):
+        require(line in text.splitlines(), f"Expected line {line!r}")
+    require(
+        registry.counter("demo_calls", "", ("result",)) is calls,
+        "Expected get-or-create by base name",
+    )
+    try:
+        registry.gauge("demo_calls", "", ("result",))
+    except ValueError:
+        pass
+    else:
+        require(False, "Expected type conflicts to be rejected")
+
+
+def test_counters_are_thread_safe_and_feed_alerts(tmp_path) -> None:
+    registry = MetricsRegistry()
+    runs = registry.counter("demo_runs", "Runs.", ("result",))
+    latency = registry.histogram("demo_latency_seconds", "Latency.", ("stage",))
+
+    def worker() -> None:
+        for index in range(1000):
+            runs.labels(result="fail" if index % 10 == 0 else "ok").inc()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    latency.labels(stage="eval").observe(0.2)
+    latency.labels(stage="eval").observe(0.4)
+
+    require(runs.total() == 4000, "Expected no lost increments")
+    rate = check_metric_error_rate(
+        "demo_runs", {"result": "fail"}, 0.05, registry=registry
+    )
+    require(not rate.ok and rate.value == 0.1, "Expected 10% error rate alert")
+    slow = check_metric_latency(
+        "demo_latency_seconds", 250.0, registry=registry, stage="eval"
+    )
+    require(not slow.ok and round(slow.value) == 300, "Expected mean latency in ms")
+    require(
+        check_metric_threshold("demo_runs", 5000, registry=registry).ok,
+        "Expected counter total under threshold",
+    )
+
+    path = tmp_path / "metrics" / "sswg.prom"
+    exporter = TextfileExporter(path, registry=registry, interval=60.0).start()
+    exporter.stop()
+    require(
+        'demo_runs_total{result="fail"} 400.0' in path.read_text("utf-8"),
+        "Expected textfile written on stop",
+    )
+    require(not exporter.write(), "Expected unchanged metrics to skip the rewrite")
@@ -0,0 +1,104 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import asyncio
+import os
+import time
+
+from ai_conductor import ModuleRegistry, PhaseController, Workflow
+from tests.assertions import require
+
+
+def _process_module(context: dict) -> dict:
+    return {"worker_pid": os.getpid(), "seen": sorted(context)}
+
+
+def _workflow(modules: list, **phase: object) -> Workflow:
+    return Workflow(
+        {
+            "workflow_id": "wf_phase",
+            "phases": [{"id": "P", **phase}],
+            "modules": [{"phase_id": "P", **module} for module in modules],
+        }
+    )
+
+
+def test_waves_run_concurrently_and_merge_in_topological_order() -> None:
+    registry = ModuleRegistry()
+
+    def slow_writer(context: dict) -> dict:
+        time.sleep(0.2)
+        return {"winner": "slow", "slow": True}
+
+    async def fast_writer(context: dict) -> dict:
+        await asyncio.sleep(0.01)
+        return {"winner": "fast", "fast": True}
+
+    def reader(context: dict) -> dict:
+        return {"reader_saw": sorted(context)}
+
+    def failing(context: dict) -> dict:
+        raise RuntimeError("boom")
+
+    registry.register("fast", fast_writer, phase_id="P")
+    registry.register("slow", slow_writer, phase_id="P")
+    registry.register("slow_2", slow_writer, phase_id="P")
+    registry.register("broken", failing, phase_id="P")
+    registry.register("reader", reader, phase_id="P")
+    workflow = _workflow(
+        [
+            {"module_id": "fast"},
+            {"module_id": "slow"},
+            {"module_id": "slow_2"},
+            {"module_id": "broken"},
+            {"module_id": "reader", "dependencies": ["fast", "slow"]},
+        ]
+    )
+
+    controller = PhaseController(registry, max_concurrency=4)
+    controller.run_phase(workflow, "P")
+    run = controller.last_run
+
+    require(run is not None and run.mode == "waves", "Expected wave mode")
+    require(run.waves == 2, "Expected two waves")
+    require(run.wall_time_s < 0.38, "Expected slow modules to overlap")
+    require(run.speedup > 1.0, "Expected measurable speedup")
+    require(
+        set(run.module_times_s) == {"fast", "slow", "slow_2", "broken", "reader"},
+        "Expected per-module timings, including failures",
+    )
+    context = workflow.get_context()
+    require(context["winner"] == "slow", "Expected later module to win the merge")
+    require(
+        context["reader_saw"] == ["fast", "slow", "winner"],
+        "Expected dependents to see earlier waves only",
+    )
+
+
+def test_process_hint_and_phase_concurrency_override() -> None:
+    registry = ModuleRegistry()
+    registry.register(
+        "isolated", _process_module, phase_id="P", metadata={"executor": "process"}
+    )
+    workflow = _workflow([{"module_id": "isolated"}], max_concurrency=2)
+
+    controller = PhaseController(registry)
+    controller.run_phase(workflow, "P")
+
+    require(controller.last_run.max_concurrency == 2, "Expected phase override")
+    require(
+        workflow.get_context()["worker_pid"] != os.getpid(),
+        "Expected module to run in a worker process",
+    )
+
+
+def test_sequential_mode_is_default() -> None:
+    registry = ModuleRegistry()
+    registry.register("first", lambda ctx: {"first": 1}, phase_id="P")
+    registry.register("second", lambda ctx: {"second": ctx["first"] + 1}, phase_id="P")
+    workflow = _workflow([{"module_id": "first"}, {"module_id": "second"}])
+
+    controller = PhaseController(registry)
+    controller.run_phase(workflow, "P")
+
+    require(controller.last_run.mode == "sequential", "Expected sequential mode")
+    require(workflow.get_context()["second"] == 2, "Expected chained context")
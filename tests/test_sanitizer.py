@@ -1,6 +1,10 @@
 """Validation tests governed by deterministic agent scope per AGENTS.md §9."""
 from __future__ import annotations
 
+import sys
+
+import pytest
+
 from generator.sanitizer import redact_text, sanitize_payload
 from tests.assertions import require
 
@@ -25,3 +29,38 @@ def test_sanitize_payload_redacts_sensitive_keys() -> None:
         sanitized["nested"]["password"] == "[REDACTED]",
         "Expected password to be redacted",
     )
+
+
+def test_sanitize_payload_shares_untouched_subtrees() -> None:
+    clean = {"phase": "export", "scores": [0.5, 0.75], "tags": ["a", "b"]}
+    payload = {"clean": clean, "dirty": {"note": "password: hunter2", "n": 1}}
+    sanitized = sanitize_payload(payload)
+    require(sanitized is not payload, "Expected changed root to be rebuilt")
+    require(sanitized["clean"] is clean, "Expected untouched dict shared")
+    require(sanitized["clean"]["scores"] is clean["scores"], "Expected list shared")
+    require(sanitize_payload(clean) is clean, "Expected clean payload returned as-is")
+    require(
+        sanitized["dirty"] == {"note": "[REDACTED] hunter2", "n": 1},
+        f"Expected secret redacted, got {sanitized['dirty']}",
+    )
+    require(
+        sanitize_payload(("x", {"api_key": 1})) == ["x", {"api_key": "[REDACTED]"}],
+        "Expected tuples rebuilt as lists",
+    )
+
+
+def test_sanitize_payload_handles_deep_nesting() -> None:
+    payload: dict = {"leaf": "token=abc"}
+    for _ in range(sys.getrecursionlimit() * 3):
+        payload = {"child": payload}
+    sanitized = sanitize_payload(payload)
+    depth = 0
+    while "child" in sanitized:
+        sanitized = sanitized["child"]
+        depth += 1
+    require(depth == sys.getrecursionlimit() * 3, "Expected full depth kept")
+    require(sanitized == {"leaf": "[REDACTED]abc"}, "Expected leaf redacted")
+    cyclic: list = []
+    cyclic.append(cyclic)
+    with pytest.raises(ValueError):
+        sanitize_payload(cyclic)
@@ -0,0 +1,52 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import re
+
+from ai_cores import scan_core
+from ai_cores.scan_core import PatternSet, ScanRule, scan_files
+from tests.assertions import require
+
+
+def _pattern_set() -> PatternSet:
+    return PatternSet(
+        [
+            ScanRule("api", r"(?i)api[_-]?key\s*[:=]"),
+            ScanRule("key", r"(?i)key\s*[:=]"),
+            ScanRule.from_regex("long_word", re.compile(r"\b[a-z]{12,}\b")),
+            ScanRule("digits", r"\d{4}", accept=lambda token: token != "0000"),
+        ]
+    )
+
+
+def test_overlapping_rules_all_reported_with_lines() -> None:
+    patterns = _pattern_set()
+    text = "intro 0000\nAPI_KEY = x\nnothing here\ncode 1234 extraordinarily\n"
+    hits = {hit.rule_id: hit.line for hit in patterns.scan_text(text)}
+    require(
+        hits == {"api": 2, "key": 2, "long_word": 4, "digits": 4},
+        f"Expected overlapping and rejected matches handled, got {hits}",
+    )
+    require(patterns.matches("key: 1") == ["key"], "Expected rule-ordered ids")
+    require(patterns.matches("0000 only") == [], "Expected accept() to reject")
+
+
+def test_scan_files_skips_binary_and_spans_chunks(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(scan_core, "CHUNK_BYTES", 64)
+    text = tmp_path / "b_text.txt"
+    text.write_text(
+        "filler line\n" * 20 + "apikey=" + "x " * 50 + "\n" + "tail 4321"
+    )
+    (tmp_path / "a_blob.bin").write_bytes(b"\0api_key=1234\n")
+    seen = []
+    flagged = scan_files([tmp_path], _pattern_set(), reporter=seen.append)
+    require(
+        [result.path.name for result in seen] == ["a_blob.bin", "b_text.txt"],
+        "Expected every file reported in sorted order",
+    )
+    require(seen[0].binary and not seen[0].hits, "Expected binary file skipped")
+    require(len(flagged) == 1, "Expected only the text file flagged")
+    hits = {hit.rule_id: hit.line for hit in flagged[0].hits}
+    require(
+        hits == {"api": 21, "key": 21, "digits": 22},
+        f"Expected line numbers across chunk boundaries, got {hits}",
+    )
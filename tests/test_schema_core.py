@@ -0,0 +1,48 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from ai_cores.schema_core import ValidatorRegistry
+from tests.assertions import require
+
+
+def _write_schema(path: Path, required: list[str]) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "$schema": "https://json-schema.org/draft/2020-12/schema",
+                "$id": "sample.json",
+                "type": "object",
+                "required": required,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_validator_registry_reuses_validators(tmp_path: Path) -> None:
+    _write_schema(tmp_path / "sample.json", ["a"])
+    registry = ValidatorRegistry()
+    first = registry.get(tmp_path, "sample.json")
+    second = registry.get(tmp_path, "sample.json")
+    stats = registry.stats()
+    require(first is second, "Expected cached validator to be reused")
+    require(stats["hits"] == 1 and stats["misses"] == 1, "Unexpected counters")
+
+
+def test_validator_registry_invalidates_on_schema_change(tmp_path: Path) -> None:
+    schema_path = tmp_path / "sample.json"
+    _write_schema(schema_path, ["a"])
+    registry = ValidatorRegistry()
+    first = registry.get(tmp_path, "sample.json")
+    _write_schema(schema_path, ["a", "bb"])
+    stat = schema_path.stat()
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = registry.get(tmp_path, "sample.json")
+    errors = list(second.iter_errors({"a": 1}))
+    require(first is not second, "Expected validator rebuild after change")
+    require(registry.stats()["invalidations"] == 1, "Expected one invalidation")
+    require(len(errors) == 1, "Expected rebuilt validator to use new schema")
@@ -0,0 +1,119 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import gzip
+import io
+import json
+import logging
+import multiprocessing
+
+from ai_monitoring import structured_logger
+from tests.assertions import require
+
+
+class _CountingRepr:
+    calls = 0
+
+    def __repr__(self) -> str:
+        _CountingRepr.calls += 1
+        return "<counted>"
+
+
+def test_queued_jsonl_sink_rotates_and_gzips(tmp_path) -> None:
+    console = io.StringIO()
+    path = tmp_path / "workflow.jsonl"
+    structured_logger.configure(
+        path, stream=console, max_bytes=1500, backup_count=2, batch_size=4
+    )
+    try:
+        for index in range(120):
+            structured_logger.log_event("test.event", {"index": index})
+        structured_logger.get_logger("tests.structured_logger").info("plain %d", 7)
+        structured_logger.shutdown()
+
+        segments = sorted(p.name for p in tmp_path.iterdir())
+        expected = [
+            "workflow.jsonl",
+            "workflow.jsonl.1.gz",
+            "workflow.jsonl.2.gz",
+            "workflow.jsonl.lock",
+        ]
+        require(segments == expected, "Expected rotation capped at backup_count")
+        tail = [json.loads(line) for line in path.read_text("utf-8").splitlines()]
+        require(
+            tail[-1]["message"] == "plain 7" and tail[-2]["data"] == {"index": 119},
+            "Expected records in order as JSON lines",
+        )
+        with gzip.open(tmp_path / "workflow.jsonl.1.gz", "rt") as handle:
+            first = json.loads(handle.readline())
+        require(first["event"] == "test.event", "Expected gzipped JSONL segments")
+        require(
+            "EVENT: test.event | data={'index': 0}" in console.getvalue(),
+            "Expected console output to keep the event format",
+        )
+    finally:
+        structured_logger.configure()
+
+
+def test_disabled_level_skips_payload_rendering(tmp_path) -> None:
+    structured_logger.configure(tmp_path / "workflow.jsonl", console=False)
+    logger = structured_logger.get_logger("tests.structured_logger.quiet")
+    logger.setLevel(logging.WARNING)
+    try:
+        structured_logger.log_event(logger, "quiet.event", {"value": _CountingRepr()})
+        structured_logger.shutdown()
+        require(_CountingRepr.calls == 0, "Expected no rendering at disabled level")
+        require(
+            not (tmp_path / "workflow.jsonl").exists(), "Expected nothing written"
+        )
+    finally:
+        logger.setLevel(logging.INFO)
+        structured_logger.configure()
+
+
+def test_payload_is_snapshotted_when_the_event_is_logged(tmp_path) -> None:
+    path = tmp_path / "workflow.jsonl"
+    structured_logger.configure(path, console=False)
+    try:
+        payload = {"items": []}
+        for index in range(50):
+            structured_logger.log_event("snapshot.event", payload)
+            payload["items"].append(index)
+        structured_logger.shutdown()
+        lengths = [
+            len(json.loads(line)["data"]["items"])
+            for line in path.read_text("utf-8").splitlines()
+        ]
+        require(lengths == list(range(50)), "Expected payload values at call time")
+    finally:
+        structured_logger.configure()
+
+
+def _emit_from_worker(path: str, worker: int, count: int) -> None:
+    structured_logger.configure(
+        path, console=False, max_bytes=20_000, backup_count=1_000, batch_size=16
+    )
+    for index in range(count):
+        structured_logger.log_event("worker.event", {"w": worker, "i": index})
+    structured_logger.shutdown()
+
+
+def test_processes_sharing_a_sink_lose_no_records(tmp_path) -> None:
+    path = tmp_path / "w.jsonl"
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=_emit_from_worker, args=(str(path), worker, 1_000))
+        for worker in range(4)
+    ]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(60)
+    require(all(process.exitcode == 0 for process in workers), "Expected clean exits")
+
+    lines = path.read_text("utf-8").splitlines()
+    for segment in tmp_path.glob("w.jsonl.*.gz"):
+        with gzip.open(segment, "rt") as handle:
+            lines.extend(handle.read().splitlines())
+    entries = [json.loads(line) for line in lines]
+    seen = {(entry["data"]["w"], entry["data"]["i"]) for entry in entries}
+    require(len(lines) == 4_000 and len(seen) == 4_000, f"Lost records: {len(seen)}")
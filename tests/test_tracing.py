@@ -0,0 +1,82 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import asyncio
+import json
+
+from ai_monitoring.tracing import get_tracer, span
+from tests.assertions import require
+
+
+@span("test.leaf", kind="decorated")
+def _leaf() -> int:
+    return 42
+
+
+def test_spans_nest_and_export(tmp_path) -> None:
+    tracer = get_tracer()
+    tracer.start()
+    try:
+        with span("test.root", workflow_id="wf_trace"):
+            with span("test.child"):
+                require(_leaf() == 42, "Expected decorated return value")
+            try:
+                with span("test.failing"):
+                    raise ValueError("boom")
+            except ValueError:
+                pass
+    finally:
+        records = tracer.stop()
+
+    by_name = {record.name: record for record in records}
+    root = by_name["test.root"]
+    require(root.parent_id is None, "Expected root span")
+    require(
+        by_name["test.child"].parent_id == root.span_id
+        and by_name["test.leaf"].parent_id == by_name["test.child"].span_id,
+        "Expected contextvar parent propagation",
+    )
+    require(by_name["test.failing"].error == "ValueError", "Expected error recorded")
+
+    written = tracer.write(tmp_path / "run.trace.json")
+    events = json.loads((tmp_path / "run.trace.json").read_text("utf-8"))
+    complete = [e for e in events["traceEvents"] if e["ph"] == "X"]
+    require(len(complete) == 4, "Expected one complete event per span")
+    require(
+        complete[0]["args"] == {"workflow_id": "wf_trace"}, "Expected span attributes"
+    )
+    stacks = dict(
+        line.rsplit(" ", 1) for line in tracer.collapsed_stacks().splitlines()
+    )
+    require(
+        "test.root;test.child;test.leaf" in stacks,
+        "Expected collapsed stack per nesting path",
+    )
+    require(written["collapsed"].endswith("run.folded"), "Expected .folded summary")
+
+
+def test_disabled_tracer_records_nothing_and_tasks_inherit_parent() -> None:
+    tracer = get_tracer()
+    before = len(tracer.records)
+    with span("test.ignored"):
+        _leaf()
+    require(len(tracer.records) == before, "Expected no spans while stopped")
+
+    async def task(index: int) -> None:
+        with span("test.task", index=index):
+            await asyncio.sleep(0)
+
+    async def main() -> None:
+        with span("test.gather"):
+            await asyncio.gather(task(0), task(1))
+
+    tracer.start()
+    try:
+        asyncio.run(main())
+    finally:
+        records = tracer.stop()
+    gather = next(r for r in records if r.name == "test.gather")
+    tasks = [r for r in records if r.name == "test.task"]
+    require(
+        len(tasks) == 2 and all(r.parent_id == gather.span_id for r in tasks),
+        "Expected asyncio tasks to inherit the active span",
+    )
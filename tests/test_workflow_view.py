@@ -0,0 +1,105 @@
+"""Validation tests governed by deterministic agent scope per AGENTS.md §9."""
+
+import copy
+import json
+import pickle
+
+from ai_recursive.merge_engine import merge_variants
+from ai_recursive.variant_generator import generate_variants
+from generator.workflow_view import CowDict, cow_copy, is_view, to_plain
+from tests.assertions import require
+
+
+def _workflow() -> dict:
+    return {
+        "workflow_id": "wf",
+        "metadata": {"title": "Base"},
+        "phases": [
+            {"id": "p1", "tasks": [{"id": "t1", "description": "first"}]},
+            {"id": "p2", "tasks": [{"id": "t2", "description": "second"}]},
+        ],
+        "modules": [{"module_id": "m1", "description": "module"}],
+    }
+
+
+def test_cow_copy_never_mutates_source_and_shares_untouched() -> None:
+    source = _workflow()
+    snapshot = copy.deepcopy(source)
+
+    view = cow_copy(source)
+    view["phases"][0]["tasks"][0]["description"] = "changed"
+    view["phases"][1]["tasks"].append({"id": "t3"})
+    view.setdefault("evaluation", {})["quality"] = 1.0
+    view["metadata"].update({"title": "New"})
+
+    require(source == snapshot, "Expected source to be untouched")
+    require(isinstance(view, dict) and is_view(view), "Expected dict-compatible view")
+    require(view["phases"][0]["tasks"][0]["description"] == "changed", "Write kept")
+    require(
+        dict.__getitem__(view, "modules") is source["modules"],
+        "Expected untouched modules to stay shared",
+    )
+    require(json.loads(json.dumps(view))["metadata"]["title"] == "New", "JSON view")
+
+
+def test_fork_isolates_both_sides() -> None:
+    parent = cow_copy(_workflow())
+    parent["phases"][0]["tasks"][0]["description"] = "parent"
+    child = cow_copy(parent)
+
+    child["phases"][0]["tasks"][0]["description"] = "child"
+    parent["phases"][1]["id"] = "parent-p2"
+
+    require(
+        parent["phases"][0]["tasks"][0]["description"] == "parent",
+        "Expected child write to stay in child",
+    )
+    require(child["phases"][1]["id"] == "p2", "Expected parent write to stay in parent")
+
+
+def test_setdefault_reference_stays_live() -> None:
+    view = CowDict({"a": 1})
+    evaluation = view.setdefault("evaluation", {})
+    view["evaluation"]["x"] = 1
+    evaluation["y"] = 2
+    require(view["evaluation"] == {"x": 1, "y": 2}, "Expected aliasing preserved")
+
+
+def test_pickle_deepcopy_and_to_plain_return_plain_data() -> None:
+    view = cow_copy(_workflow())
+    view["phases"][0]["id"] = "x"
+    for result in (pickle.loads(pickle.dumps(view)), copy.deepcopy(view)):
+        require(type(result) is dict, "Expected plain dict")
+        require(type(result["phases"][0]) is dict, "Expected plain nested dict")
+        require(result == view, "Expected equal content")
+    require(type(to_plain(view)["phases"]) is list, "Expected plain list")
+
+
+def test_variants_and_merge_leave_base_untouched() -> None:
+    base = _workflow()
+    snapshot = copy.deepcopy(base)
+    variants = generate_variants(base, num_variants=3)
+    merged = merge_variants(base, variants)
+
+    require(base == snapshot, "Expected base workflow to be untouched")
+    require(
+        variants[2]["metadata"]["title"] == "Base (variant 3)",
+        "Expected per-variant edits",
+    )
+    require(
+        merged["modules"][0]["description"] == "module [variant 1]",
+        "Expected merge to pick the longest text",
+    )
+
+
+def test_mutating_merged_output_leaves_inputs_untouched() -> None:
+    base = {"modules": [{"module_id": "m", "inputs": ["a"], "description": "x"}]}
+    variant = {"modules": [{"module_id": "m", "outputs": ["b"], "description": "y"}]}
+    snapshots = copy.deepcopy((base, variant))
+
+    merged = merge_variants(base, [variant])
+    merged["modules"][0]["inputs"].append("MUT")
+    merged["modules"][0]["outputs"].append("MUT")
+
+    require((base, variant) == snapshots, "Expected merge inputs to be untouched")
+    require(merged["modules"][0]["inputs"] == ["a", "MUT"], "Expected write kept")